@@ -9,12 +9,15 @@ from pCore             import logFile, LogFileActive, Selection, YAMLUnpickle
 from pMolecule         import System
 
 from Error             import ContinuumElectrostaticsError
-from Constants         import TERM_REMOVE, PROTEIN_RESIDUES, NEXT_RESIDUE_GLY, NEXT_RESIDUE_PRO, NEXT_RESIDUE, PREV_RESIDUE, REMOVE_RESIDUES
+from Constants         import PRUNING_TOLERANCE, PAIR_LIMIT, TERM_REMOVE, PROTEIN_RESIDUES, NEXT_RESIDUE_GLY, NEXT_RESIDUE_PRO, NEXT_RESIDUE, PREV_RESIDUE, REMOVE_RESIDUES
 from EnergyModel       import EnergyModel
 from InputFileWriter   import WriteInputFile
 from TemplatesLibrary  import TemplatesLibrary
 from MCModelGMCT       import MCModelGMCT
 from MCModelDefault    import MCModelDefault
+from JunctionTreeModel import JunctionTreeModel
+from MeanFieldModel    import MeanFieldModel
+from WangLandauModel   import WangLandauModel
 
 import os
 
@@ -40,6 +43,8 @@ class CEModel (object):
         "focusingSteps"    :   _DEFAULT_FOCUSING_STEPS   ,
         "epsilonWater"     :   _DEFAULT_EPSILON_WATER    ,
         "epsilonProtein"   :   _DEFAULT_EPSILON_PROTEIN  ,
+        "pruning"          :   False                     ,
+        "pruningTolerance" :   PRUNING_TOLERANCE         ,
         }
 
     defaultAttributeNames = {
@@ -52,6 +57,8 @@ class CEModel (object):
         "Focusing Steps"        :   "focusingSteps"   ,
         "Water   Diel. Const."  :   "epsilonWater"    ,
         "Protein Diel. Const."  :   "epsilonProtein"  ,
+        "Pruning"               :   "pruning"         ,
+        "Pruning Tolerance"     :   "pruningTolerance",
         }
 
     @property
@@ -444,8 +451,11 @@ class CEModel (object):
         if sampler is not None:
             # . Perform initial checks
             checks = (
-                isinstance (sampler, MCModelDefault) ,
-                isinstance (sampler, MCModelGMCT)    ,)
+                isinstance (sampler, MCModelDefault)    ,
+                isinstance (sampler, MCModelGMCT)       ,
+                isinstance (sampler, JunctionTreeModel) ,
+                isinstance (sampler, MeanFieldModel)    ,
+                isinstance (sampler, WangLandauModel)   ,)
             if not any (checks):
                 raise ContinuumElectrostaticsError ("Cannot define MC model.")
 
@@ -463,26 +473,48 @@ class CEModel (object):
 
 
     #-------------------------------------------------------------------------------
-    def CalculateProbabilities (self, pH=7.0, unfolded=False, isCalculateCurves=False, logFrequency=-1, trajectoryFilename="", log=logFile):
+    def CalculateProbabilities (self, pH=7.0, unfolded=False, isCalculateCurves=False, logFrequency=-1, trajectoryFilename="", trajectoryFormat="text", warmStart=False, checkpointFilename="", log=logFile):
         """Calculate probabilities.
 
-        Setting |trajectoryFilename| will cause writing energies of sampled states to a file."""
+        Setting |trajectoryFilename| will cause writing energies of sampled states to a file.
+        With |trajectoryFormat| "binary", the default Monte Carlo model also writes sampled states.
+
+        With |warmStart|, the default Monte Carlo model continues from its state vector of the previous run.
+
+        With |checkpointFilename|, the default Monte Carlo model writes checkpoints of its production
+        to this file, or continues from it if it exists.
+
+        Without a sampler, the attribute |pruning| enables enumeration that skips states whose
+        weight relative to the partition function is below |pruningTolerance|.
+
+        Joint probabilities of the pairs of sites chosen with SelectPairs are calculated at the same time."""
         nstates = -1
         sites   = None
 
-        if       hasattr (self, "sampler")  and     unfolded:
-            raise ContinuumElectrostaticsError ("Monte Carlo sampling of unfolded proteins unsupported.")
-        elif     hasattr (self, "sampler")  and not unfolded:
-            self.sampler.CalculateOwnerProbabilities (pH=pH, logFrequency=logFrequency, trajectoryFilename=trajectoryFilename, log=log)
-        elif not hasattr (self, "sampler")  and     unfolded:
+        if unfolded:
+            # . Sites of unfolded proteins are independent, so sampling is never needed
             if (trajectoryFilename != ""):
                 raise ContinuumElectrostaticsError ("Writing trajectories of unfolded proteins unsupported.")
-            nstates = self.energyModel.CalculateProbabilitiesAnalyticallyUnfolded (pH=pH)
-        elif not hasattr (self, "sampler")  and not unfolded:
+            self.energyModel.CalculateProbabilitiesAnalyticallyUnfolded (pH=pH)
+        elif hasattr (self, "sampler"):
+            options = {}
+            if isinstance (self.sampler, MCModelDefault):
+                options = {"warmStart" : warmStart, "trajectoryFormat" : trajectoryFormat, "checkpointFilename" : checkpointFilename}
+            elif trajectoryFormat != "text":
+                raise ContinuumElectrostaticsError ("Binary trajectories are only written by the default Monte Carlo model.")
+            elif checkpointFilename != "":
+                raise ContinuumElectrostaticsError ("Checkpoints are only written by the default Monte Carlo model.")
+            if (self.energyModel.npairs > 0) and not isinstance (self.sampler, MCModelDefault):
+                raise ContinuumElectrostaticsError ("Joint probabilities of pairs are only calculated analytically or by the default Monte Carlo model.")
+            self.sampler.CalculateOwnerProbabilities (pH=pH, logFrequency=logFrequency, trajectoryFilename=trajectoryFilename, log=log, **options)
+        else:
             # TODO !!!
             if (trajectoryFilename != ""):
                 raise ContinuumElectrostaticsError ("Writing trajectories unsupported.")
-            nstates = self.energyModel.CalculateProbabilitiesAnalytically (pH=pH)
+            if self.pruning:
+                (nstates, logZ) = self.energyModel.CalculateProbabilitiesPruned (pH=pH, tolerance=self.pruningTolerance)
+            else:
+                nstates = self.energyModel.CalculateProbabilitiesAnalytically (pH=pH)
 
         if isCalculateCurves:
             sites = []
@@ -499,6 +531,58 @@ class CEModel (object):
         return sites
 
 
+    #-------------------------------------------------------------------------------
+    def SelectPairs (self, pairs=None, limit=PAIR_LIMIT, log=logFile):
+        """Select pairs of sites for which joint probabilities of instances are calculated.
+
+        |pairs| is a sequence of pairs of indices of sites. By default, pairs of sites whose
+        maximum interaction energy (kcal/mol) is at least |limit| are selected. All pairs of
+        sites are only selected with an explicit zero limit."""
+        if not self.isCalculated:
+            raise ContinuumElectrostaticsError ("First calculate electrostatic energies.")
+        npairs = self.energyModel.SelectPairs (pairs=pairs, limit=limit)
+        if LogFileActive (log):
+            log.Text ("\nSelected %d pairs of sites for joint probabilities.\n" % npairs)
+
+
+    #-------------------------------------------------------------------------------
+    def PairProbabilities (self):
+        """Get joint probabilities of instances of the selected pairs of sites.
+
+        Returns a dictionary whose keys are pairs of indices of sites. Each value is a list
+        with a row of joint probabilities for each instance of the first site."""
+        if not self.isProbability:
+            raise ContinuumElectrostaticsError ("First calculate probabilities.")
+        pairs = {}
+        for indexPair in range (self.energyModel.npairs):
+            indexSiteA, indexSiteB = self.energyModel.GetPair (indexPair)
+            pairs[(indexSiteA, indexSiteB)] = self._PairTable (indexPair)
+        return pairs
+
+
+    def PairProbability (self, indexSiteA, indexSiteB):
+        """Get joint probabilities of instances of a selected pair of sites.
+
+        Returns a list with a row of joint probabilities for each instance of site |indexSiteA|."""
+        if not self.isProbability:
+            raise ContinuumElectrostaticsError ("First calculate probabilities.")
+        indexPair = self.energyModel.FindPair (indexSiteA, indexSiteB)
+        if indexPair is None:
+            raise ContinuumElectrostaticsError ("Pair of sites %d and %d not selected." % (indexSiteA, indexSiteB))
+        table = self._PairTable (indexPair)
+        if self.energyModel.GetPair (indexPair)[0] != indexSiteA:
+            table = map (list, zip (*table))
+        return table
+
+
+    def _PairTable (self, indexPair):
+        """Joint probabilities of instances of a selected pair, in the order of its sites."""
+        energyModel = self.energyModel
+        indexSiteA, indexSiteB = energyModel.GetPair (indexPair)
+        siteA, siteB = self.sites[indexSiteA], self.sites[indexSiteB]
+        return [[energyModel.GetPairProbability (indexPair, instanceA._instIndexGlobal, instanceB._instIndexGlobal) for instanceB in siteB.instances] for instanceA in siteA.instances]
+
+
     #-------------------------------------------------------------------------------
     def _GetResidueInfo (self, residue):
         system        = self.owner
@@ -24,6 +24,12 @@ YAMLPATHIN       = os.path.join (os.getenv ("PDYNAMO_PCETK"), "parameters")
 ANALYTIC_SITES   = 26
 ANALYTIC_STATES  = 2**ANALYTIC_SITES
 
+# . Default tolerance for enumeration with pruning of states of negligible weight
+PRUNING_TOLERANCE = 1e-8
+
+# . Default limit of the maximum interaction energy (kcal/mol) of pairs of sites selected for joint probabilities
+PAIR_LIMIT        = 2.
+
 PREV_RESIDUE     = ("C", "O")
 NEXT_RESIDUE     = ("N", "H",  "CA", "HA")
 NEXT_RESIDUE_PRO = ("N", "CA", "HA", "CD",  "HD1", "HD2")
@@ -78,18 +78,13 @@ class MCModelGMCT (object):
         self.owner   = meadModel
 
 
-    def CalculateOwnerProbabilities (self, pH=7.0, dryRun=False, logFrequency=None, log=logFile):
-        """Calculate probabilities of the owner."""
+    def _PrepareCalculation (self, pH):
+        """Prepare input files and directories for GMCT and return the directory of the calculation."""
         owner       = self.owner
-        if not owner.isCalculated:
-            raise ContinuumElectrostaticsError ("First calculate electrostatic energies.")
-
-        sites       = None
         project     = "job"
         potential   = -CONSTANT_MOLAR_GAS_KCAL_MOL * owner.temperature * CONSTANT_LN10 * pH
         fileContent = _DefaultSetupGMCT % (self.tripleFlip, self.productionScans, owner.temperature, self.doubleFlip, self.equilibrationScans, potential, potential)
 
-        # Prepare input files and directories for GMCT
         dirConf   = os.path.join ( owner.pathScratch , "gmct" , "conf"       )
         dirCalc   = os.path.join ( owner.pathScratch , "gmct" , "%s" % pH    )
         fileGint  = os.path.join ( dirConf ,           "%s.gint"  % project  )
@@ -104,34 +99,60 @@ class MCModelGMCT (object):
         if not os.path.exists ( fileConf  ): WriteInputFile   ( fileConf  , ["conf  0.0  0.0  0.0\n"] )
         if not os.path.exists ( fileSetup ): WriteInputFile   ( fileSetup , fileContent  )
         if not os.path.exists ( linkname  ): os.symlink       ( "../conf" , linkname     )
+        return dirCalc
+
+
+    def CalculateWorkspaceProbabilities (self, pH=7.0):
+        """Run GMCT at the given pH and return probabilities of instances ordered by their global indices.
+
+        The owner is not modified, so that calculations at different pH-values can run in
+        separate threads once the input files have been prepared (for example, by a dry run)."""
+        owner   = self.owner
+        project = "job"
+        dirCalc = self._PrepareCalculation (pH)
+        output  = os.path.join (dirCalc, "%s.gmct-out" % project)
+        error   = os.path.join (dirCalc, "%s.gmct-err" % project)
+
+        if os.path.exists (os.path.join (dirCalc, output)):
+            pass
+        else:
+            command = [os.path.join (self.pathGMCT, "gmct"), project]
+            try:
+                out = open (output, "w")
+                err = open (error,  "w")
+                subprocess.check_call (command, stderr=err, stdout=out, cwd=dirCalc)
+                out.close ()
+                err.close ()
+            except:
+                raise ContinuumElectrostaticsError ("Failed running command: %s" % " ".join (command))
+
+        # Read probabilities from the output file
+        reader = GMCTOutputFileReader (output)
+        reader.Parse (temperature=owner.temperature)
+
+        probabilities = [0.] * sum ([len (site.instances) for site in owner.sites])
+        for site in owner.sites:
+            for instance in site.instances:
+                key = "conf_%s_%s%d_%s" % (site.segName, site.resName, site.resSerial, instance.label)
+                probabilities[instance._instIndexGlobal] = reader.probabilities[key][0]
+        return probabilities
+
+
+    def CalculateOwnerProbabilities (self, pH=7.0, dryRun=False, logFrequency=None, log=logFile):
+        """Calculate probabilities of the owner."""
+        owner       = self.owner
+        if not owner.isCalculated:
+            raise ContinuumElectrostaticsError ("First calculate electrostatic energies.")
+
+        if dryRun:
+            self._PrepareCalculation (pH)
+        else:
+            probabilities = self.CalculateWorkspaceProbabilities (pH=pH)
 
-        if not dryRun:
-            output = os.path.join (dirCalc, "%s.gmct-out" % project)
-            error  = os.path.join (dirCalc, "%s.gmct-err" % project)
-
-            if os.path.exists (os.path.join (dirCalc, output)):
-                pass
-            else:
-                command = [os.path.join (self.pathGMCT, "gmct"), project]
-                try:
-                    out = open (output, "w")
-                    err = open (error,  "w")
-                    subprocess.check_call (command, stderr=err, stdout=out, cwd=dirCalc)
-                    out.close ()
-                    err.close ()
-                except:
-                    raise ContinuumElectrostaticsError ("Failed running command: %s" % " ".join (command))
-
-            # Read probabilities from the output file
-            reader = GMCTOutputFileReader (output)
-            reader.Parse (temperature=owner.temperature)
-
-            # Copy probabilities from the reader to the owner
+            # Copy probabilities to the owner
             for site in owner.sites:
                 for instance in site.instances:
-                    key                  = "conf_%s_%s%d_%s" % (site.segName, site.resName, site.resSerial, instance.label)
-                    probability          = reader.probabilities[key][0]
-                    instance.probability = probability
+                    instance.probability = probabilities[instance._instIndexGlobal]
 
 
 #===============================================================================
@@ -0,0 +1,178 @@
+#-------------------------------------------------------------------------------
+# . File      : ProtonReweighting.py
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+"""ProtonReweighting is a class for reweighting Monte Carlo samples to other pH-values."""
+
+__lastchanged__ = "$Id$"
+
+
+from   pCore      import logFile, LogFileActive
+from   Error      import ContinuumElectrostaticsError
+from   Constants  import CONSTANT_LN10
+import numpy
+
+_DefaultTolerance     = 1e-7
+_DefaultMaxIterations = 100000
+
+
+class ProtonReweighting (object):
+    """Reweighting of probabilities of instances to other pH-values.
+
+    The energy of a protonation state depends on pH only through its number of bound
+    protons, so that the weight of a state sampled at pH0 changes at pH by a factor of
+    10^(-n (pH - pH0)). Runs at several pH-values are combined by the multiple histogram
+    method (WHAM) in the number of protons. Because the reduced energies depend only on
+    the number of protons, this is equivalent to MBAR. With a single run, it reduces to
+    single histogram reweighting.
+
+    Reweighting is unreliable at pH-values where the important numbers of protons were
+    rarely or never sampled. This is measured by the effective number of samples and by
+    an estimate of the probability of the numbers of protons that were never sampled.
+    The effective number of samples includes the uncertainty of the free energies of runs,
+    which is large when runs barely overlap."""
+
+    def __init__ (self):
+        """Constructor."""
+        self.pHs          = []
+        self.counts       = []
+        self.instances    = []
+        self.logDensity   = None
+        self.freeEnergies = None
+        self.covariance   = None
+        self.fractions    = None
+        self.isSolved     = False
+
+
+    def AddRun (self, pH, counts, instances):
+        """Add a run at the given pH.
+
+        |counts| are the numbers of samples with each number of protons and |instances| are,
+        for each number of protons, the counts of instances."""
+        counts    = numpy.array (counts, dtype=numpy.float64)
+        instances = numpy.array (instances, dtype=numpy.float64)
+        if self.counts and ((counts.shape != self.counts[0].shape) or (instances.shape != self.instances[0].shape)):
+            raise ContinuumElectrostaticsError ("Histograms of runs do not match.")
+        if instances.shape[0] != counts.shape[0]:
+            raise ContinuumElectrostaticsError ("Histograms of protons and instances do not match.")
+        self.pHs.append (pH)
+        self.counts.append (counts)
+        self.instances.append (instances)
+        self.isSolved = False
+
+
+    def AddSampler (self, sampler, pH):
+        """Add the last run of the default Monte Carlo model, which was done at the given pH."""
+        counts, instances = sampler.ProtonHistogram ()
+        self.AddRun (pH, counts, instances)
+
+
+    def Solve (self, tolerance=_DefaultTolerance, maxIterations=_DefaultMaxIterations, log=logFile):
+        """Solve the WHAM equations for the density of states in the number of protons.
+
+        Returns the number of iterations."""
+        if not self.counts:
+            raise ContinuumElectrostaticsError ("No runs to reweight.")
+        pHs      = numpy.array (self.pHs)
+        counts   = numpy.array (self.counts)
+        nsamples = counts.sum (axis=1)
+        total    = counts.sum (axis=0)
+        sampled  = total > 0.
+        protons  = numpy.arange (counts.shape[1])[sampled]
+        # . Reduced energies of each number of protons in each run (runs x protons)
+        energies = CONSTANT_LN10 * pHs[:, numpy.newaxis] * protons[numpy.newaxis, :]
+        logTotal = numpy.log (total[sampled])
+        logRuns  = numpy.log (nsamples)
+
+        # . Iterate the free energies of runs (relative to the first run) and the logarithm of the density of states
+        freeEnergies = numpy.zeros (len (pHs))
+        isConverged  = False
+        for iteration in range (1, maxIterations + 1):
+            exponent     = logRuns[:, numpy.newaxis] + freeEnergies[:, numpy.newaxis] - energies
+            maximum      = exponent.max (axis=0)
+            logDensity   = logTotal - maximum - numpy.log (numpy.exp (exponent - maximum).sum (axis=0))
+            exponent     = logDensity[numpy.newaxis, :] - energies
+            maximum      = exponent.max (axis=1)
+            updated      = -(maximum + numpy.log (numpy.exp (exponent - maximum[:, numpy.newaxis]).sum (axis=1)))
+            updated     -= updated[0]
+            change       = numpy.abs (updated - freeEnergies).max ()
+            freeEnergies = updated
+            if change < tolerance:
+                isConverged = True
+                break
+
+        # . Numbers of protons that were never sampled have zero density
+        self.logDensity          = numpy.empty (counts.shape[1])
+        self.logDensity[:]       = -numpy.inf
+        self.logDensity[sampled] = logDensity
+        self.freeEnergies        = freeEnergies
+
+        # . Asymptotic covariance of the free energies of runs (MBAR), from the weights of
+        # . samples W (samples x runs) with equal rows for samples with equal numbers of protons
+        weights    = numpy.exp (freeEnergies[:, numpy.newaxis] - energies + (logDensity - logTotal)[numpy.newaxis, :])
+        squares    = numpy.dot (weights * total[sampled], weights.T)
+        (eigenvalues, vectors) = numpy.linalg.eigh (squares)
+        sigma      = numpy.diag (numpy.sqrt (numpy.maximum (eigenvalues, 0.)))
+        inner      = numpy.identity (len (pHs)) - numpy.dot (numpy.dot (sigma, numpy.dot (vectors.T * nsamples, vectors)), sigma)
+        projection = numpy.dot (vectors, sigma)
+        self.covariance = numpy.dot (numpy.dot (projection, numpy.linalg.pinv (inner)), projection.T)
+        # . Fractions of the density of each number of protons that come from each run
+        self.fractions             = numpy.zeros ((len (pHs), counts.shape[1]))
+        self.fractions[:, sampled] = weights * nsamples[:, numpy.newaxis]
+        self.isSolved              = True
+        if LogFileActive (log):
+            log.Text ("\nReweighting of %d run%s %s after %d iterations.\n" % (len (pHs), "s" if len (pHs) > 1 else "", "converged" if isConverged else "did not converge", iteration))
+        return iteration
+
+
+    def CalculateProbabilities (self, pH):
+        """Calculate probabilities of instances at the given pH.
+
+        Returns an array of probabilities of instances (ordered by their global indices),
+        the effective number of samples and an estimate of the probability of numbers of
+        protons that were never sampled.
+
+        A number of protons not sampled in a run of N samples has a probability below
+        about 1/N in that run, which bounds its density of states. Reweighting is reliable
+        when the effective number of samples is large and the unsampled probability small.
+
+        The effective number of samples is that of a probability of one half with the same
+        variance as the least certain probability of an instance. The variance includes the
+        uncertainty of the free energies of runs, propagated through the density of states."""
+        if not self.isSolved:
+            self.Solve (log=None)
+        pHs       = numpy.array (self.pHs)
+        counts    = numpy.array (self.counts)
+        total     = counts.sum (axis=0)
+        instances = numpy.sum (self.instances, axis=0)
+        sampled   = total > 0.
+        protons   = numpy.arange (len (total))
+
+        # . Bounds for the density of states of numbers of protons that were never sampled
+        energies   = CONSTANT_LN10 * pHs[:, numpy.newaxis] * protons[numpy.newaxis, :]
+        bounds     = energies - self.freeEnergies[:, numpy.newaxis] - numpy.log (counts.sum (axis=1))[:, numpy.newaxis]
+        logDensity = numpy.where (sampled, self.logDensity, bounds.min (axis=0))
+
+        exponent  = logDensity - CONSTANT_LN10 * pH * protons
+        weights   = numpy.exp (exponent - exponent.max ())
+        weights  /= weights.sum ()
+        unsampled = weights[~sampled].sum ()
+        # . Each sample of a number of protons has the weight of that number divided by its count
+        weights   = weights[sampled]
+        weights  /= weights.sum ()
+        probabilities = numpy.dot (weights / total[sampled], instances[sampled])
+        # . Variance of probabilities from the free energies of runs
+        deviations    = instances[sampled] / total[sampled][:, numpy.newaxis] - probabilities[numpy.newaxis, :]
+        gradients     = numpy.dot (deviations.T, weights[:, numpy.newaxis] * self.fractions[:, sampled].T)
+        variances     = (numpy.dot (gradients, self.covariance) * gradients).sum (axis=1)
+        effective     = 1. / ((weights * weights / total[sampled]).sum () + 4. * max (variances.max (), 0.))
+        return (probabilities, effective, unsampled)
+
+
+#===============================================================================
+# Testing
+#===============================================================================
+if __name__ == "__main__": pass
@@ -0,0 +1,163 @@
+#-------------------------------------------------------------------------------
+# . File      : StabilityCurves.py
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+"""StabilityCurves is a class for calculating the pH-dependence of the folding free energy."""
+
+__lastchanged__ = "$Id$"
+
+
+from   pCore           import logFile, LogFileActive
+from   Error           import ContinuumElectrostaticsError
+from   Constants       import CONSTANT_MOLAR_GAS_KCAL_MOL, CONSTANT_LN10, ANALYTIC_STATES
+from   InputFileWriter import WriteInputFile
+import numpy
+
+_DefaultFilename   = "stability.dat"
+_DefaultSampling   =   .5
+_DefaultStart      =  0.
+_DefaultStop       = 14.
+
+
+class StabilityCurves (object):
+    """Electrostatic contribution to the folding free energy as a function of pH.
+
+    With the analytic method, the binding polynomials of the folded and unfolded protein
+    are calculated once and evaluated at all pH-steps. With the linkage method, used if
+    a sampler is defined or for larger systems with pruning, the difference in the number of bound protons
+    between the folded and unfolded protein is integrated over pH. The curve is then relative
+    to its first point."""
+
+    defaultAttributes = {
+        "curveSampling"  :  _DefaultSampling  ,
+        "curveStart"     :  _DefaultStart     ,
+        "curveStop"      :  _DefaultStop      ,
+            }
+
+    def __init__ (self, meadModel, log=logFile, *arguments, **keywordArguments):
+        """Constructor."""
+        for (key, value) in self.__class__.defaultAttributes.iteritems (): setattr (self, key, value)
+        for (key, value) in                 keywordArguments.iteritems (): setattr (self, key, value)
+
+        if not meadModel.isCalculated:
+            raise ContinuumElectrostaticsError ("First calculate electrostatic energies.")
+        self.owner            =  meadModel
+        self.nsteps           =  int ((self.curveStop - self.curveStart) / self.curveSampling + 1)
+        self.pH               =  self.curveStart + self.curveSampling * numpy.arange (self.nsteps)
+        self.Gfolded          =  None
+        self.Gunfolded        =  None
+        self.stability        =  None
+        self.protonsFolded    =  None
+        self.protonsUnfolded  =  None
+        self.method           =  None
+        self.isRelative       =  False
+        self.isCalculated     =  False
+
+
+    #===============================================================================
+    def _EvaluatePolynomial (self, logTerms):
+        """Evaluate the logarithm of a binding polynomial and the mean number of protons at each pH-step."""
+        logTerms = numpy.array (logTerms)
+        protons  = numpy.arange (len (logTerms))
+        exponent = logTerms[numpy.newaxis, :] - CONSTANT_LN10 * self.pH[:, numpy.newaxis] * protons[numpy.newaxis, :]
+        maximum  = exponent.max (axis=1)
+        weights  = numpy.exp (exponent - maximum[:, numpy.newaxis])
+        total    = weights.sum (axis=1)
+        return (maximum + numpy.log (total), (weights * protons).sum (axis=1) / total)
+
+
+    def _MeanProtons (self):
+        """Calculate the mean number of bound protons from the current probabilities."""
+        meadModel   = self.owner
+        energyModel = meadModel.energyModel
+        protons     = 0.
+        for site in meadModel.sites:
+            for instance in site.instances:
+                protons += energyModel.GetProbability (instance._instIndexGlobal) * energyModel.GetProtons (instance._instIndexGlobal)
+        return protons
+
+
+    #===============================================================================
+    def CalculateCurves (self, method=None, log=logFile):
+        """Calculate stability curves.
+
+        |method| is "analytic" or "linkage". By default, the analytic method is used if the
+        model has no sampler and the number of states allows for enumeration. Systems with
+        more states need the linkage method with a sampler or pruning.
+
+        Returns the pH-steps and the folding free energies (kcal/mol) as arrays."""
+        owner = self.owner
+        RT    = CONSTANT_MOLAR_GAS_KCAL_MOL * owner.temperature
+
+        nstates = 1
+        for site in owner.sites:
+            nstates = nstates * site.ninstances
+        isSolver = hasattr (owner, "sampler") or owner.pruning
+        if method is None:
+            method  = "linkage" if (hasattr (owner, "sampler") or (nstates > ANALYTIC_STATES)) else "analytic"
+        if method not in ("analytic", "linkage"):
+            raise ContinuumElectrostaticsError ("Unknown method: %s" % method)
+        if (nstates > ANALYTIC_STATES) and not ((method == "linkage") and isSolver):
+            raise ContinuumElectrostaticsError ("Too many protonation states (%d) for enumeration. Define a sampler or enable pruning." % nstates)
+
+        # . The unfolded protein is always treated analytically
+        logZunfolded, protonsUnfolded = self._EvaluatePolynomial (owner.energyModel.CalculateBindingPolynomial (unfolded=True))
+
+        if method == "analytic":
+            logZfolded, protonsFolded = self._EvaluatePolynomial (owner.energyModel.CalculateBindingPolynomial (unfolded=False))
+            self.Gfolded    = -RT * logZfolded
+            self.isRelative = False
+        else:
+            restore = owner.isProbability
+            if restore:
+                probabilities = [owner.energyModel.GetProbability (index) for index in range (owner.ninstances)]
+            protonsFolded = numpy.zeros (self.nsteps)
+            for step, pH in enumerate (self.pH):
+                owner.CalculateProbabilities (pH=pH, log=None)
+                protonsFolded[step] = self._MeanProtons ()
+            if restore:
+                for index, probability in enumerate (probabilities):
+                    owner.energyModel.SetProbability (index, probability)
+            else:
+                owner.isProbability = False
+
+            # . Integrate dG/dpH = RT ln10 (<n>folded - <n>unfolded) using the trapezoidal rule
+            slope     = RT * CONSTANT_LN10 * (protonsFolded - protonsUnfolded)
+            stability = numpy.zeros (self.nsteps)
+            stability[1:] = numpy.cumsum (.5 * (slope[1:] + slope[:-1]) * numpy.diff (self.pH))
+            self.Gfolded    = -RT * logZunfolded + stability
+            self.isRelative = True
+
+        self.Gunfolded        =  -RT * logZunfolded
+        self.stability        =  self.Gfolded - self.Gunfolded
+        self.protonsFolded    =  protonsFolded
+        self.protonsUnfolded  =  protonsUnfolded
+        self.method           =  method
+        self.isCalculated     =  True
+
+        if LogFileActive (log):
+            log.Text ("\nCalculating stability curves (%s method) complete.\n" % method)
+        return (self.pH, self.stability)
+
+
+    #===============================================================================
+    def WriteCurves (self, filename=_DefaultFilename, log=logFile):
+        """Write calculated curves to a file."""
+        if self.isCalculated:
+            lines = ["# Method: %s%s\n" % (self.method, " (relative to the first pH-step)" if self.isRelative else ""),
+                     "# %6s %14s %14s %14s %10s %10s\n" % ("pH", "Gfolded", "Gunfolded", "dGfold", "<n>fold", "<n>unfold")]
+            for step in range (self.nsteps):
+                lines.append ("%8.2f %14.4f %14.4f %14.4f %10.4f %10.4f\n" % (self.pH[step], self.Gfolded[step], self.Gunfolded[step], self.stability[step], self.protonsFolded[step], self.protonsUnfolded[step]))
+            WriteInputFile (filename, lines)
+
+            if LogFileActive (log):
+                log.Text ("\nWriting stability curves complete.\n")
+
+
+#===============================================================================
+# Testing
+#===============================================================================
+if __name__ == "__main__": pass
@@ -0,0 +1,145 @@
+#-------------------------------------------------------------------------------
+# . File      : StateTrajectoryFileReader.py
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+"""Reading binary trajectories of state vectors written by the default Monte Carlo model."""
+
+__lastchanged__ = "$Id$"
+
+from pCore  import logFile, LogFileActive
+from Error  import ContinuumElectrostaticsError
+import numpy
+
+_Magic      = "PCETRAJ1"
+_Padding    = 8
+_Integer    = numpy.dtype (numpy.int32)
+_Cardinal   = numpy.dtype (numpy.uint32)
+_Real       = numpy.dtype (numpy.float64)
+
+
+def _Padded (nbytes):
+    return ((nbytes + _Padding - 1) // _Padding) * _Padding
+
+
+class StateTrajectoryFileReader (object):
+    """A class for reading binary trajectories of state vectors.
+
+    The file is memory-mapped, so that only the blocks of requested scans are read.
+    States are returned as local indices of instances of sites (scans x sites)."""
+
+    def __init__ (self, name):
+        """Constructor."""
+        self.name     = name
+        self.QPARSED  = False
+
+
+    def Parse (self, log=logFile):
+        """Parse the data on the file."""
+        if not self.QPARSED:
+            data = numpy.memmap (self.name, dtype=numpy.uint8, mode="r")
+            if data[:8].tostring () != _Magic:
+                raise ContinuumElectrostaticsError ("File %s is not a trajectory of state vectors." % self.name)
+            nsites, blockSize, nscans, nblocks = numpy.frombuffer (data, dtype=_Integer, count=4, offset=8)
+
+            # . Locate sections of each block
+            blocks = []
+            offset = 8 + 4 * _Integer.itemsize
+            first  = 0
+            for block in range (nblocks):
+                bscans, nchanges = numpy.frombuffer (data, dtype=_Integer, count=2, offset=offset)
+                offset   += 2 * _Integer.itemsize
+                energies  = offset
+                offset   += bscans * _Real.itemsize
+                protons   = offset
+                offset   += bscans * _Integer.itemsize
+                counts    = offset
+                offset   += bscans * _Integer.itemsize
+                keyframe  = offset
+                offset   += _Padded (nsites)
+                changes   = offset
+                offset   += _Padded (nchanges * _Cardinal.itemsize)
+                blocks.append ((first, bscans, nchanges, energies, protons, counts, keyframe, changes))
+                first    += bscans
+            if first != nscans:
+                raise ContinuumElectrostaticsError ("Trajectory file %s is incomplete." % self.name)
+
+            self.data     = data
+            self.nsites   = int (nsites)
+            self.nscans   = int (nscans)
+            self.blocks   = blocks
+            self.QPARSED  = True
+            if LogFileActive (log):
+                log.Text ("\nRead trajectory of %d scans of %d sites in %d blocks.\n" % (self.nscans, self.nsites, len (blocks)))
+
+
+    def _Blocks (self, start, stop):
+        """Iterate over blocks overlapping with scans from |start| to |stop|."""
+        for block in self.blocks:
+            first, bscans = block[:2]
+            if (first + bscans > start) and (first < stop):
+                yield block
+
+
+    def _Range (self, start, stop):
+        if stop is None or stop > self.nscans:
+            stop = self.nscans
+        return (max (start, 0), stop)
+
+
+    def Energies (self, start=0, stop=None):
+        """Return energies of scans as an array."""
+        start, stop = self._Range (start, stop)
+        parts = []
+        for (first, bscans, nchanges, energies, protons, counts, keyframe, changes) in self._Blocks (start, stop):
+            values = numpy.frombuffer (self.data, dtype=_Real, count=bscans, offset=energies)
+            parts.append (values[max (start - first, 0) : stop - first])
+        return numpy.concatenate (parts) if parts else numpy.zeros (0, dtype=_Real)
+
+
+    def Protons (self, start=0, stop=None):
+        """Return numbers of protons of scans as an array."""
+        start, stop = self._Range (start, stop)
+        parts = []
+        for (first, bscans, nchanges, energies, protons, counts, keyframe, changes) in self._Blocks (start, stop):
+            values = numpy.frombuffer (self.data, dtype=_Integer, count=bscans, offset=protons)
+            parts.append (values[max (start - first, 0) : stop - first])
+        return numpy.concatenate (parts) if parts else numpy.zeros (0, dtype=_Integer)
+
+
+    def States (self, start=0, stop=None):
+        """Return state vectors of scans as an array of local indices of instances (scans x sites)."""
+        start, stop = self._Range (start, stop)
+        parts = []
+        for (first, bscans, nchanges, energies, protons, counts, keyframe, changes) in self._Blocks (start, stop):
+            # . Write each change at its scan and site, then carry the last change forward along scans
+            states = numpy.full ((bscans, self.nsites), -1, dtype=numpy.int32)
+            states[0] = numpy.frombuffer (self.data, dtype=numpy.uint8, count=self.nsites, offset=keyframe)
+            if nchanges > 0:
+                packed  = numpy.frombuffer (self.data, dtype=_Cardinal, count=nchanges, offset=changes)
+                scans   = numpy.repeat (numpy.arange (bscans), numpy.frombuffer (self.data, dtype=_Integer, count=bscans, offset=counts))
+                states[scans, packed >> 8] = packed & 0xff
+            latest = numpy.where (states >= 0, numpy.arange (bscans)[:, numpy.newaxis], 0)
+            numpy.maximum.accumulate (latest, axis=0, out=latest)
+            states = states[latest, numpy.arange (self.nsites)[numpy.newaxis, :]]
+            parts.append (states[max (start - first, 0) : stop - first])
+        return numpy.concatenate (parts) if parts else numpy.zeros ((0, self.nsites), dtype=numpy.int32)
+
+
+    def Probabilities (self, instances, start=0, stop=None):
+        """Return probabilities of instances, given the numbers of instances of sites."""
+        start, stop = self._Range (start, stop)
+        offsets  = numpy.concatenate (([0], numpy.cumsum (instances)[:-1]))
+        counts   = numpy.zeros (sum (instances))
+        for first in range (start, stop, 65536):
+            states = self.States (first, min (first + 65536, stop))
+            counts += numpy.bincount ((states + offsets[numpy.newaxis, :]).ravel (), minlength=len (counts))
+        return counts / max (stop - start, 1)
+
+
+#===============================================================================
+# . Main program
+#===============================================================================
+if __name__ == "__main__": pass
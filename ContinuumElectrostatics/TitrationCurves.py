@@ -7,7 +7,9 @@
 #-------------------------------------------------------------------------------
 """TitrationCurves is a class for calculating titration curves.
 
-CurveThread is a class for running parallel calculations of titration curves."""
+CurveThread is a class for running parallel calculations of titration curves.
+
+Titration curves can also be calculated in a pool of worker processes (see |nprocesses|)."""
 
 __lastchanged__ = "$Id$"
 
@@ -15,40 +17,87 @@ __lastchanged__ = "$Id$"
 from   pCore           import logFile, LogFileActive
 from   Error           import ContinuumElectrostaticsError
 from   MCModelGMCT     import MCModelGMCT
+from   MCModelDefault  import MCModelDefault
+from   ProtonReweighting import ProtonReweighting
 from   InputFileWriter import WriteInputFile
-import os, threading
+import os, threading, multiprocessing, numpy
 
 _DefaultDirectory  = "curves"
 _DefaultSampling   =   .5
 _DefaultStart      =  0.
 _DefaultStop       = 14.
+_DefaultFrequency  = 10
+_DefaultMinimumSamples = 100.
+_DefaultMaximumUnsampled = .01
+_DefaultMinimumFraction  = .01
+_DefaultMaximumDeviation = .05
 
 
 class CurveThread (threading.Thread):
-    """Calculate each pH-step in a separate thread."""
+    """Calculate each pH-step in a separate thread.
+
+    Probabilities are calculated in a private |workspace| of the default Monte Carlo model,
+    or analytically in a workspace of the energy model, without modifying the owner and
+    without holding the GIL. Other calculations modify the owner and are serialized by |lock|.
+
+    An exception raised by the calculations is kept in |error|, to be raised again by the caller."""
 
-    def __init__ (self, curves, pH):
+    def __init__ (self, curves, pH, workspace=None, lock=None):
         threading.Thread.__init__ (self)
-        self.curves = curves
-        self.sites  = None
-        self.pH     = pH
+        self.curves    = curves
+        self.sites     = None
+        self.error     = None
+        self.pH        = pH
+        self.workspace = workspace
+        self.lock      = lock
 
     def run (self):
         """The method that runs the calculations."""
-        curves     = self.curves
-        model      = curves.owner
-        self.sites = model.CalculateProbabilities (pH=self.pH, log=None, isCalculateCurves=True, unfolded=curves.unfolded)
+        try:
+            self._Calculate ()
+        except Exception as error:
+            self.error = error
+
+    def _Calculate (self):
+        """Calculate probabilities of instances at the pH of the thread."""
+        curves  = self.curves
+        model   = curves.owner
+        sampler = getattr (model, "sampler", None)
+        if curves.unfolded:
+            probabilities = model.energyModel.CalculateWorkspaceProbabilities (pH=self.pH, unfolded=True)
+        elif self.workspace is not None:
+            probabilities = self.workspace.CalculateWorkspaceProbabilities (pH=self.pH)
+        elif isinstance (sampler, MCModelGMCT):
+            probabilities = sampler.CalculateWorkspaceProbabilities (pH=self.pH)
+        elif (sampler is None) and (not model.pruning):
+            probabilities = model.energyModel.CalculateWorkspaceProbabilities (pH=self.pH)
+        else:
+            with self.lock:
+                self.sites = model.CalculateProbabilities (pH=self.pH, log=None, isCalculateCurves=True, unfolded=curves.unfolded)
+            return
+        self.sites = [[probabilities[instance._instIndexGlobal] for instance in site.instances] for site in model.sites]
 
 
 #-------------------------------------------------------------------------------
 class TitrationCurves (object):
-    """Titration curves."""
+    """Titration curves.
+
+    Curves are kept in |curves|, an array of probabilities of instances (pH-steps x instances,
+    instances ordered by their global indices), at the pH-values in |pHs|. |steps| is a view
+    of the curves as lists of probabilities of instances of sites at each pH-step."""
 
     defaultAttributes = {
-        "curveSampling"  :  _DefaultSampling  ,
-        "curveStart"     :  _DefaultStart     ,
-        "curveStop"      :  _DefaultStop      ,
-        "unfolded"       :  False             ,
+        "curveSampling"     :  _DefaultSampling   ,
+        "curveStart"        :  _DefaultStart      ,
+        "curveStop"         :  _DefaultStop       ,
+        "unfolded"          :  False              ,
+        "replicaExchange"   :  False              ,
+        "exchangeFrequency" :  _DefaultFrequency  ,
+        "warmStart"         :  False              ,
+        "reweightingSteps"  :  0                  ,
+        "minimumSamples"    :  _DefaultMinimumSamples ,
+        "maximumUnsampled"  :  _DefaultMaximumUnsampled ,
+        "nprocesses"        :  0                  ,
             }
 
     def __init__ (self, meadModel, log=logFile, *arguments, **keywordArguments):
@@ -60,12 +109,34 @@ class TitrationCurves (object):
             raise ContinuumElectrostaticsError ("First calculate electrostatic energies.")
         self.owner         =  meadModel
         self.nsteps        =  int ((self.curveStop - self.curveStart) / self.curveSampling + 1)
+        self.pHs           =  numpy.array ([self.curveStart + step * self.curveSampling for step in range (self.nsteps)])
         self.steps         =  None
         self.halves        =  None
+        self.samples       =  None
+        self.fits          =  None
         self.isHalves      =  False
+        self.isFits        =  False
         self.isCalculated  =  False
 
 
+    @property
+    def steps (self):
+        """Probabilities of instances of sites at each pH-step."""
+        if (self._steps is None) and (self.curves is not None):
+            self._steps = [[[row[instance._instIndexGlobal] for instance in site.instances] for site in self.owner.sites] for row in self.curves.tolist ()]
+        return self._steps
+
+    @steps.setter
+    def steps (self, value):
+        self._steps = None
+        if (value is None) or isinstance (value, numpy.ndarray):
+            self.curves = value
+        else:
+            indices     = [instance._instIndexGlobal for site in self.owner.sites for instance in site.instances]
+            self.curves = numpy.zeros ((len (value), self.owner.ninstances))
+            self.curves[:, indices] = [[probability for site in sites for probability in site] for sites in value]
+
+
     #===============================================================================
     def _ProbabilitiesSave (self):
         """Backup the probabilities existing in the model."""
@@ -89,21 +160,172 @@ class TitrationCurves (object):
                 energyModel.SetProbability (instance._instIndexGlobal, probabilities[instance._instIndexGlobal])
 
 
+    #===============================================================================
+    def _CalculateCurvesReplicaExchange (self, log=logFile):
+        """Calculate titration curves in a single run of replica exchange."""
+        owner   = self.owner
+        sampler = getattr (owner, "sampler", None)
+        if not isinstance (sampler, MCModelDefault):
+            raise ContinuumElectrostaticsError ("Replica exchange needs the default Monte Carlo model.")
+        if self.unfolded:
+            raise ContinuumElectrostaticsError ("Replica exchange is not needed for unfolded proteins.")
+        if LogFileActive (log):
+            log.Text ("\nStarting replica exchange with %d replicas.\n" % self.nsteps)
+        pHs = [self.curveStart + step * self.curveSampling for step in range (self.nsteps)]
+        return sampler.CalculateOwnerCurves (pHs, frequency=self.exchangeFrequency, log=log)
+
+
+    def _IsWarmStart (self, pH, previous):
+        """Decide if a run at |pH| can continue from the previous run at |previous|, which has to be an adjacent pH-step."""
+        return self.warmStart and (previous is not None) and (abs (pH - previous) <= self.curveSampling * (1. + 1e-6))
+
+
+    def _CalculateCurvesReweighting (self, log=logFile):
+        """Calculate titration curves by reweighting a few runs of the default Monte Carlo model.
+
+        pH-steps where the effective number of samples drops below |minimumSamples|, or where the
+        probability of numbers of protons that were never sampled exceeds |maximumUnsampled|,
+        are calculated directly."""
+        owner   = self.owner
+        sampler = getattr (owner, "sampler", None)
+        if not isinstance (sampler, MCModelDefault):
+            raise ContinuumElectrostaticsError ("Reweighting needs the default Monte Carlo model.")
+        if not sampler.reweighting:
+            raise ContinuumElectrostaticsError ("Reweighting has to be enabled in the default Monte Carlo model.")
+        if self.unfolded:
+            raise ContinuumElectrostaticsError ("Reweighting is not needed for unfolded proteins.")
+        nruns = min (self.reweightingSteps, self.nsteps)
+        if nruns < 2:
+            pHs = [.5 * (self.curveStart + self.curveStop)]
+        else:
+            pHs = [self.curveStart + run * (self.curveStop - self.curveStart) / float (nruns - 1) for run in range (nruns)]
+        if LogFileActive (log):
+            log.Text ("\nStarting reweighting of %d run%s.\n" % (len (pHs), "s" if len (pHs) > 1 else ""))
+
+        reweighting = ProtonReweighting ()
+        previous    = None
+        for pH in pHs:
+            owner.CalculateProbabilities (pH=pH, log=None, warmStart=self._IsWarmStart (pH, previous))
+            reweighting.AddSampler (sampler, pH)
+            previous = pH
+        reweighting.Solve (log=log)
+
+        steps   = []
+        samples = []
+        direct  = []
+        for step in range (self.nsteps):
+            pH = self.curveStart + step * self.curveSampling
+            (probabilities, effective, unsampled) = reweighting.CalculateProbabilities (pH)
+            if (effective < self.minimumSamples) or (unsampled > self.maximumUnsampled):
+                sites    = owner.CalculateProbabilities (pH=pH, log=None, isCalculateCurves=True, warmStart=self._IsWarmStart (pH, previous))
+                previous = pH
+                direct.append (pH)
+            else:
+                sites = [[probabilities[instance._instIndexGlobal] for instance in site.instances] for site in owner.sites]
+            steps.append (sites)
+            samples.append (effective)
+        if LogFileActive (log):
+            if direct:
+                log.Text ("\nCalculated directly %d pH-step%s with poor overlap: %s\n" % (len (direct), "s" if len (direct) > 1 else "", " ".join (["%.2f" % pH for pH in direct])))
+            log.Text ("\nLowest effective number of samples is %.1f.\n" % min (samples))
+        self.samples = samples
+        return steps
+
+
+    def _CalculateBlock (self, block, workspace, output):
+        """Calculate a block of pH-steps in a worker process.
+
+        Probabilities of instances are written to the shared |output| array (pH-steps x instances)."""
+        owner      = self.owner
+        ninstances = owner.ninstances
+        for (position, step) in enumerate (block):
+            pH   = self.curveStart + step * self.curveSampling
+            warm = self.warmStart and (position > 0)
+            if workspace is not None:
+                probabilities = workspace.CalculateWorkspaceProbabilities (pH=pH, warmStart=warm)
+            else:
+                owner.CalculateProbabilities (pH=pH, log=None, unfolded=self.unfolded, warmStart=warm)
+                probabilities = self._ProbabilitiesSave ()
+            output[step * ninstances : (step + 1) * ninstances] = probabilities
+
+
+    def _CalculateCurvesProcesses (self, nprocesses):
+        """Calculate titration curves in a pool of worker processes.
+
+        Workers are forked from the current process, so that they share the energy model of the
+        owner (intrinsic energies, protons and interactions) without copying it. Each worker
+        calculates a block of consecutive pH-steps, with its own workspace of the default Monte
+        Carlo model, and writes probabilities of instances to an array in shared memory.
+
+        Returns the array of curves."""
+        owner      = self.owner
+        sampler    = getattr (owner, "sampler", None)
+        ninstances = owner.ninstances
+        if isinstance (sampler, MCModelGMCT):
+            for step in range (self.nsteps):
+                sampler.CalculateOwnerProbabilities (pH=(self.curveStart + step * self.curveSampling), dryRun=True, log=None)
+        # . Workspaces are created before forking, so that options they cannot honor are reported here
+        workspaces = [None] * nprocesses
+        if isinstance (sampler, MCModelDefault) and not self.unfolded:
+            workspaces = [sampler.Workspace (index=index) for index in range (nprocesses)]
+
+        output    = multiprocessing.RawArray ("d", self.nsteps * ninstances)
+        processes = []
+        for index in range (nprocesses):
+            block   = range ((index * self.nsteps) // nprocesses, ((index + 1) * self.nsteps) // nprocesses)
+            process = multiprocessing.Process (target=self._CalculateBlock, args=(block, workspaces[index], output))
+            process.start ()
+            processes.append (process)
+        for process in processes:
+            process.join ()
+        if any ([process.exitcode != 0 for process in processes]):
+            raise ContinuumElectrostaticsError ("Calculating titration curves in worker processes failed.")
+
+        return numpy.frombuffer (output).reshape ((self.nsteps, ninstances)).copy ()
+
+
     #===============================================================================
     def CalculateCurves (self, forceSerial=True, printTable=False, log=logFile):
-        """Calculate titration curves."""
+        """Calculate titration curves.
+
+        With |replicaExchange|, all pH-steps are sampled together by the default Monte Carlo model.
+
+        With |warmStart| (off by default), the default Monte Carlo model in a serial run continues
+        each pH-step from the final state vector of the previous step. Its equilibration is then
+        reduced from |nequil| to |nequilWarm| scans of the model, except at the first pH-step.
+
+        With |reweightingSteps|, the default Monte Carlo model is run only at this many pH-values
+        evenly spread over the curves and the remaining pH-steps are reweighted (see ProtonReweighting).
+        The effective numbers of samples of pH-steps are kept in |samples|.
+
+        In a parallel run (|forceSerial| off), the default Monte Carlo model samples the pH-steps
+        of a batch in private workspaces (see MCModelDefault.Workspace). Options of the model
+        that workspaces cannot honor, such as multiple chains, raise an error.
+
+        With |nprocesses|, pH-steps are calculated in blocks by this many worker processes
+        (or by one process per CPU, if negative), regardless of |forceSerial|."""
+        if not self.isCalculated and self.replicaExchange:
+            self.steps        = self._CalculateCurvesReplicaExchange (log=log)
+            self.isCalculated = True
+            if LogFileActive (log):
+                log.Text ("\nCalculating titration curves complete.\n")
+
         if not self.isCalculated:
             owner   = self.owner
             restore = False
             if owner.isProbability:
                 probabilities  = self._ProbabilitiesSave ()
                 restore        = True
-            nthreads  =  owner.nthreads
-            steps     =  []
-            tab       =  None
-
-            if LogFileActive (log):
-                if nthreads < 2 or forceSerial:
+            nthreads   =  owner.nthreads
+            nprocesses =  self.nprocesses if (self.nprocesses >= 0) else multiprocessing.cpu_count ()
+            nprocesses =  min (nprocesses, self.nsteps)
+            steps      =  []
+            tab        =  None
+
+            if LogFileActive (log) and (self.reweightingSteps < 1):
+                if nprocesses > 0:
+                    log.Text ("\nStarting parallel run on %d processes.\n" % nprocesses)
+                elif nthreads < 2 or forceSerial:
                     log.Text ("\nStarting serial run.\n")
                 else:
                     log.Text ("\nStarting parallel run on %d CPUs.\n" % nthreads)
@@ -114,38 +336,58 @@ class TitrationCurves (object):
                     tab.Heading ("Step")
                     tab.Heading ("pH")
 
+            # Reweighting?
+            if self.reweightingSteps > 0:
+                steps = self._CalculateCurvesReweighting (log=log)
+            # Process pool?
+            elif nprocesses > 0:
+                steps = self._CalculateCurvesProcesses (nprocesses)
+                if tab:
+                    for step in range (self.nsteps):
+                        tab.Entry ("%10d"   % step)
+                        tab.Entry ("%10.2f" % (self.curveStart + step * self.curveSampling))
             # Serial run?
-            if nthreads < 2 or forceSerial:
+            elif nthreads < 2 or forceSerial:
                 for step in range (self.nsteps):
-                    sites = owner.CalculateProbabilities (pH=(self.curveStart + step * self.curveSampling), log=None, isCalculateCurves=True, unfolded=self.unfolded)
+                    pH    = self.curveStart + step * self.curveSampling
+                    sites = owner.CalculateProbabilities (pH=pH, log=None, isCalculateCurves=True, unfolded=self.unfolded, warmStart=(self.warmStart and (step > 0)))
                     steps.append (sites)
                     if tab:
                         tab.Entry ("%10d"   % step)
                         tab.Entry ("%10.2f" % pH)
             # Parallel run?
             else:
+                # If GMCT is to be used, first perform a dry run in serial mode to create directories and files
+                owner      = self.owner
+                sampler    = getattr (owner, "sampler", None)
+                workspaces = None
+                lock       = threading.Lock ()
+                if isinstance (sampler, MCModelGMCT):
+                    for step in range (self.nsteps):
+                        sampler.CalculateOwnerProbabilities (pH=(self.curveStart + step * self.curveSampling), dryRun=True, log=None)
+                # The default Monte Carlo model runs each thread of a batch in its own workspace
+                elif isinstance (sampler, MCModelDefault) and not self.unfolded:
+                    workspaces = [sampler.Workspace (index=index) for index in range (nthreads)]
+
                 limit   = nthreads - 1
                 batches = []
                 batch   = []
                 for step in range (self.nsteps):
-                    batch.append (CurveThread (self, self.curveStart + step * self.curveSampling))
+                    workspace = workspaces[len (batch)] if workspaces else None
+                    batch.append (CurveThread (self, self.curveStart + step * self.curveSampling, workspace=workspace, lock=lock))
                     if len (batch) > limit:
                         batches.append (batch)
                         batch = []
                 if batch:
                     batches.append (batch)
 
-                # If GMCT is to be used, first perform a dry run in serial mode to create directories and files
-                owner   = self.owner
-                sampler = owner.sampler
-                if isinstance (sampler, MCModelGMCT):
-                    for step in range (self.nsteps):
-                        sampler.CalculateOwnerProbabilities (pH=(self.curveStart + step * self.curveSampling), dryRun=True, log=None)
-
                 step = 0
                 for batch in batches:
                     for thread in batch: thread.start ()
                     for thread in batch: thread.join ()
+                    for thread in batch:
+                        if thread.error is not None:
+                            raise thread.error
                     for thread in batch:
                         steps.append (thread.sites)
                         if tab:
@@ -167,7 +409,7 @@ class TitrationCurves (object):
 
     #===============================================================================
     def WriteCurves (self, directory=_DefaultDirectory, log=logFile):
-        """Write calculated curves to a directory."""
+        """Write calculated curves to a directory, in a file for each instance (see also WriteCurvesFile)."""
         if self.isCalculated:
             # Initialize output directory
             if not os.path.exists (directory):
@@ -178,14 +420,13 @@ class TitrationCurves (object):
 
             # For each instance of each site, write a curve file
             meadModel = self.owner
-            phdata    = self.steps
+            pHs       = self.pHs.tolist ()
 
             for site in meadModel.sites:
                 for instance in site.instances:
                     # Collect instance data
-                    lines = []
-                    for step in range (self.nsteps):
-                        lines.append ("%f %f\n" % (self.curveStart + step * self.curveSampling, phdata[step][site.siteIndex][instance.instIndex]))
+                    curve = self.curves[:, instance._instIndexGlobal].tolist ()
+                    lines = ["%f %f\n" % (pH, probability) for (pH, probability) in zip (pHs, curve)]
                     # Write instance data
                     filename = os.path.join (directory, "%s_%s.dat" % (site.label, instance.label))
                     WriteInputFile (filename, lines)
@@ -194,32 +435,186 @@ class TitrationCurves (object):
                 log.Text ("\nWriting curve files complete.\n")
 
 
+    def WriteCurvesFile (self, filename, fileFormat=None, log=logFile):
+        """Write calculated curves to a single file.
+
+        |fileFormat| is "text" or "npz" (by default, deduced from the extension of |filename|).
+
+        A text file has a header indexing the columns of instances, followed by rows of the
+        pH-value and the probabilities of instances. An NPZ file keeps the pH-values ("pH"),
+        the curves ("curves", pH-steps x instances) and for each column, the segment, residue
+        name, residue serial number and label of the instance ("segNames", "resNames",
+        "resSerials", "labels")."""
+        if self.isCalculated:
+            if fileFormat is None:
+                fileFormat = "npz" if filename.endswith (".npz") else "text"
+            meadModel = self.owner
+            columns   = [(site, instance) for site in meadModel.sites for instance in site.instances]
+            indices   = [instance._instIndexGlobal for (site, instance) in columns]
+            curves    = self.curves[:, indices]
+
+            if fileFormat == "npz":
+                numpy.savez (filename, pH=self.pHs, curves=curves,
+                    segNames   = numpy.array ([site.segName   for (site, instance) in columns]) ,
+                    resNames   = numpy.array ([site.resName   for (site, instance) in columns]) ,
+                    resSerials = numpy.array ([site.resSerial for (site, instance) in columns]) ,
+                    labels     = numpy.array ([instance.label for (site, instance) in columns]) )
+            elif fileFormat == "text":
+                lines = ["# Titration curves of %d instances at %d pH-values\n" % (len (columns), self.nsteps), "# Column  Segment  Residue  Serial  Instance\n"]
+                for (column, (site, instance)) in enumerate (columns):
+                    lines.append ("# %6d  %7s  %7s  %6d  %8s\n" % (column + 2, site.segName, site.resName, site.resSerial, instance.label))
+                for (pH, row) in zip (self.pHs.tolist (), curves.tolist ()):
+                    lines.append ("%f %s\n" % (pH, " ".join (["%f" % probability for probability in row])))
+                WriteInputFile (filename, lines)
+            else:
+                raise ContinuumElectrostaticsError ("Unknown format of curves: %s" % fileFormat)
+
+            if LogFileActive (log):
+                log.Text ("\nWriting curves to file %s complete.\n" % filename)
+
+
     #===============================================================================
-    def CalculateHalfpKs (self):
-        """Scan the calculated curves to find pK1/2 values."""
+    def CalculateHalfpKs (self, tolerance=0., log=logFile):
+        """Scan the calculated curves to find pK1/2 values.
+
+        By default, pK1/2 values are interpolated linearly between pH-steps. With a positive
+        |tolerance|, each pH-step where a curve crosses 1/2 is refined by bisection on new
+        calculations of probabilities, until the crossing is bracketed by pH-values closer than
+        |tolerance|. Calculations are shared between instances crossing in the same pH-step,
+        so that a coarse |curveSampling| gives accurate pK1/2 values in few calculations."""
         if self.isCalculated:
             owner   =  self.owner
-            data    =  self.steps
-            nsteps  =  self.nsteps
-            halves  =  []
+            curves  =  self.curves
+            pHs     =  self.pHs
+            refined =  {}
+            restore =  False
+            if (tolerance > 0.) and owner.isProbability:
+                probabilities = self._ProbabilitiesSave ()
+                restore       = True
+
+            # . Find pH-steps where curves cross 1/2, ordered by instances and then by pH-steps
+            crossings        = ((curves[:-1] - .5) * (curves[1:] - .5)) < 0.
+            (indices, steps) = numpy.nonzero (crossings.T)
+            a   = pHs[steps]
+            b   = pHs[steps + 1]
+            pa  = curves[steps, indices]
+            pb  = curves[steps + 1, indices]
+            pKs = a + (.5 - pa) * (b - a) / (pb - pa)
+
+            found = [[] for index in range (curves.shape[1])]
+            if tolerance > 0.:
+                instances = dict ([(instance._instIndexGlobal, (site, instance)) for site in owner.sites for instance in site.instances])
+                for crossing in range (len (pKs)):
+                    (site, instance) = instances[indices[crossing]]
+                    pK = self._RefineHalfpK (site, instance, a[crossing], b[crossing], pa[crossing], pb[crossing], tolerance, refined)
+                    found[indices[crossing]].append (float (pK))
+            else:
+                for (index, pK) in zip (indices, pKs):
+                    found[index].append (float (pK))
+            halves = [[found[instance._instIndexGlobal] for instance in site.instances] for site in owner.sites]
+
+            if tolerance > 0.:
+                if restore : self._ProbabilitiesRestore (probabilities)
+                else       : owner.isProbability = False
+                if LogFileActive (log):
+                    log.Text ("\nRefining pK1/2 values needed %d calculations of probabilities.\n" % len (refined))
+            self.halves   = halves
+            self.isHalves = True
+
+
+    def _RefineHalfpK (self, site, instance, a, b, pa, pb, tolerance, refined):
+        """Refine a pK1/2 value bracketed by pH-values |a| and |b| by bisection.
+
+        |refined| keeps the probabilities calculated at each pH-value."""
+        owner = self.owner
+        while (b - a) > tolerance:
+            pH = .5 * (a + b)
+            if pH not in refined:
+                refined[pH] = owner.CalculateProbabilities (pH=pH, log=None, isCalculateCurves=True, unfolded=self.unfolded)
+            p = refined[pH][site.siteIndex][instance.instIndex]
+            if p == .5:
+                return pH
+            if ((pa - .5) * (p - .5)) < 0.:
+                (b, pb) = (pH, p)
+            else:
+                (a, pa) = (pH, p)
+        return a + (.5 - pa) * (b - a) / (pb - pa)
+
+
+    #===============================================================================
+    def FitCurves (self, minimumFraction=_DefaultMinimumFraction, maximumDeviation=_DefaultMaximumDeviation):
+        """Fit the Hill and Henderson-Hasselbalch equations to the curves of all sites.
+
+        The protonated fraction of a site is its average number of protons, scaled between the
+        least and the most protonated instances. Linearized equations are fitted to all sites
+        together by weighted least squares, using pH-steps where the fraction lies between
+        |minimumFraction| and 1 - |minimumFraction|.
+
+        For each site, |fits| keeps the apparent pKa and the Hill coefficient, the pKa of the
+        Henderson-Hasselbalch equation, the root-mean-square deviation of the Hill curve from
+        the fraction and whether the site has multiple transitions. These are sites whose
+        fraction crosses 1/2 more than once or deviates from the Hill curve by more than
+        |maximumDeviation|. Sites that do not titrate within the curves have no fits."""
+        if self.isCalculated:
+            owner   = self.owner
+            nsites  = len (owner.sites)
+            pHs     = self.pHs[:, numpy.newaxis]
+            protons = numpy.zeros ((owner.ninstances, nsites))
+            members = numpy.zeros ((owner.ninstances, nsites), dtype=numpy.bool_)
             for site in owner.sites:
-                instances = []
                 for instance in site.instances:
-                    pa  = data[0][site.siteIndex][instance.instIndex]
-                    pKs = []
-                    for step in range (1, nsteps):
-                        pb = data[step][site.siteIndex][instance.instIndex]
-                        if ((pa - .5) * (pb - .5)) < 0.:
-                            a  = self.curveStart + (step - 1) * self.curveSampling
-                            b  = self.curveStart + (step    ) * self.curveSampling
-                            pK = a + (.5 - pa) * (b - a) / (pb - pa)
-                            pKs.append (pK)
-                        pa = pb
-                    instances.append (pKs)
-                halves.append (instances)
+                    protons[instance._instIndexGlobal, site.siteIndex] = instance.protons
+                    members[instance._instIndexGlobal, site.siteIndex] = True
+            lowest  = numpy.where (members, protons,  numpy.inf).min (axis=0)
+            highest = numpy.where (members, protons, -numpy.inf).max (axis=0)
+            span    = numpy.where (highest > lowest, highest - lowest, 1.)
+
+            # . Protonated fractions of sites (pH-steps x sites)
+            fractions = (numpy.dot (self.curves, protons) - lowest) / span
+            fractions = numpy.clip (fractions, 0., 1.)
+
+            # . Fit log10 (f / (1 - f)) = n (pKa - pH) with weights f (1 - f)
+            inside    = (fractions > minimumFraction) & (fractions < (1. - minimumFraction))
+            clipped   = numpy.clip (fractions, minimumFraction, 1. - minimumFraction)
+            logits    = numpy.log10 (clipped / (1. - clipped))
+            weights   = numpy.where (inside, clipped * (1. - clipped), 0.)
+            npoints   = inside.sum (axis=0)
+            sw        = weights.sum (axis=0)
+            sw        = numpy.where (sw > 0., sw, 1.)
+            mx        = (weights * pHs).sum (axis=0) / sw
+            my        = (weights * logits).sum (axis=0) / sw
+            sxx       = (weights * (pHs - mx) ** 2).sum (axis=0)
+            sxy       = (weights * (pHs - mx) * (logits - my)).sum (axis=0)
+            slopes    = sxy / numpy.where (sxx > 0., sxx, 1.)
+            hills     = -slopes
+            valid     = (highest > lowest) & (npoints > 1) & (hills > 0.)
+            hills     = numpy.where (valid, hills, 1.)
+            pKas      = mx + my / hills
+            pKasHH    = mx + my
+
+            # . Deviations of fractions from the Hill curves
+            fitted    = 1. / (1. + 10. ** numpy.clip (hills * (pHs - pKas), -100., 100.))
+            rmsds     = numpy.sqrt (((fractions - fitted) ** 2).mean (axis=0))
+            crossings = (((fractions[:-1] - .5) * (fractions[1:] - .5)) < 0.).sum (axis=0)
+            multiple  = (crossings > 1) | (rmsds > maximumDeviation)
+
+            fits = []
+            for index in range (nsites):
+                if valid[index]:
+                    fits.append ((float (pKas[index]), float (hills[index]), float (pKasHH[index]), float (rmsds[index]), bool (multiple[index])))
+                else:
+                    fits.append (None)
+            self.fits   = fits
+            self.isFits = True
 
-            self.halves   = halves
-            self.isHalves = True
+
+    def _GetFitEntry (self, site, decimalPlaces=2):
+        fit = self.fits[site.siteIndex] if self.isFits else None
+        if fit is None:
+            return "%7s%7s%7s%7s%6s" % ("n/a", "n/a", "n/a", "n/a", "")
+        (pKa, hill, pKaHH, rmsd, multiple) = fit
+        form = "%%7.%df%%7.2f%%7.%df%%7.3f%%6s" % (decimalPlaces, decimalPlaces)
+        return form % (pKa, hill, pKaHH, rmsd, "multi" if multiple else "")
 
 
     #===============================================================================
@@ -239,8 +634,12 @@ class TitrationCurves (object):
 
 
     #===============================================================================
-    def PrintHalfpKs (self, decimalPlaces=2, sortSites=False, log=logFile):
-        """Print pK1/2 values."""
+    def PrintHalfpKs (self, decimalPlaces=2, sortSites=False, printFits=False, log=logFile):
+        """Print pK1/2 values.
+
+        With |printFits|, also print the fits of the Hill and Henderson-Hasselbalch equations
+        (see FitCurves): pKa and coefficient of Hill, pKa of Henderson-Hasselbalch, deviation
+        of the fit and a mark for sites with multiple transitions."""
         if LogFileActive (log):
             if self.isCalculated:
                 owner    =  self.owner
@@ -248,6 +647,8 @@ class TitrationCurves (object):
                 longest  =  0
                 if not self.isHalves:
                     self.CalculateHalfpKs ()
+                if printFits and not self.isFits:
+                    self.FitCurves ()
 
                 for site in owner.sites:
                     entry  = self._GetEntry (site, decimalPlaces)
@@ -255,23 +656,31 @@ class TitrationCurves (object):
                     length = len (entry)
                     if length > longest: longest = length
 
-                tab = log.GetTable (columns=[6, 6, 6, longest])
+                columns = [6, 6, 6, longest]
+                if printFits:
+                    columns.append (34)
+                tab = log.GetTable (columns=columns)
                 tab.Start ()
                 tab.Heading ("Site", columnSpan=3)
                 tab.Heading ("pK1/2 values of instances".center (longest))
+                if printFits:
+                    tab.Heading ("%7s%7s%7s%7s%6s" % ("pKa", "Hill", "pKaHH", "RMSD", ""))
                 form = "%%-%ds" % longest
 
                 table = []
                 for site, entry in zip (owner.sites, entries):
-                    table.append ([site.segName, site.resName, site.resSerial, entry])
+                    fit = self._GetFitEntry (site, decimalPlaces) if printFits else None
+                    table.append ([site.segName, site.resName, site.resSerial, entry, fit])
                 if sortSites:
                     table.sort (key=lambda k: (k[0], k[1], k[2]))
 
-                for segName, resName, resSerial, entry in table:
+                for segName, resName, resSerial, entry, fit in table:
                     tab.Entry ("%6s" % segName)
                     tab.Entry ("%6s" % resName)
                     tab.Entry ("%6d" % resSerial)
                     tab.Entry (form  % entry)
+                    if printFits:
+                        tab.Entry (fit)
                 tab.Stop ()
 
 
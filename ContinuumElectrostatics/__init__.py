@@ -12,7 +12,13 @@ from CEModelMEAD       import CEModelMEAD
 from CEModelDefault    import CEModelDefault
 from MCModelGMCT       import MCModelGMCT
 from MCModelDefault    import MCModelDefault
+from JunctionTreeModel import JunctionTreeModel
+from MeanFieldModel    import MeanFieldModel
+from WangLandauModel   import WangLandauModel
 from StateVector       import StateVector
 from Substate          import StateVector_FromProbabilities, Substate, MEADSubstate
 from Constants         import CONSTANT_MOLAR_GAS_KCAL_MOL, CONSTANT_LN10
 from TitrationCurves   import TitrationCurves
+from StabilityCurves   import StabilityCurves
+from StateTrajectoryFileReader import StateTrajectoryFileReader
+from ProtonReweighting import ProtonReweighting
@@ -8,6 +8,10 @@
 #ifndef _ENERGYMODEL
 #define _ENERGYMODEL
 
+/* Needed for fabs */
+#include <math.h>
+#include <stdlib.h>
+
 /* Data types */
 #include "Real.h"
 #include "Boolean.h"
@@ -34,8 +38,26 @@
 /* Macros */
 #define EnergyModel_RowPointer(self, i) (&self->symmetricmatrix->data[(i * (i + 1) >> 1)])
 
+#define EnergyModel_GetGmodelAtpH(self, i, potential) (Real1DArray_Item (self->models, i) - Integer1DArray_Item (self->protons, i) * potential)
+
 #define EnergyModel_GetW(self, i, j) (i >= j ? self->symmetricmatrix->data[(i * (i + 1) >> 1) + j] : self->symmetricmatrix->data[(j * (j + 1) >> 1) + i])
 
+/* Access to the dense layout of interactions, used by the computationally intensive kernels */
+#define EnergyModel_DenseRow(self, i) (&self->rows[(i) * self->stride])
+
+#define EnergyModel_GetWdense(self, i, j) (self->rows[(i) * self->stride + (j)])
+
+/* Rows of the dense layout are padded to a multiple of this number of items and aligned to its size in bytes */
+#define ENERGYMODEL_ROW_ALIGN 4
+
+typedef struct {
+    /* Indices of both sites of the pair */
+    Integer  indexSiteA;
+    Integer  indexSiteB;
+    /* Joint probabilities of instances of both sites, a row of instances of the second site for each instance of the first site */
+    Real    *probabilities;
+} PairProbability;
+
 typedef struct {
     /* Number of bound protons of each instance */
     Integer1DArray   *protons;
@@ -47,8 +69,17 @@ typedef struct {
     Real2DArray      *interactions;
     /* Symmetrized interactions */
     SymmetricMatrix  *symmetricmatrix;
+    /* Symmetrized interactions in a dense layout, one aligned row for each instance */
+    Real             *rows;
+    Real             *rowsData;
+    Integer           stride;
     /* Probability of occurrence of each instance */
     Real1DArray      *probabilities;
+    /* Selected pairs of sites, for which joint probabilities of instances are calculated */
+    PairProbability  *pairs;
+    Integer           npairs;
+    /* Index map of the pairs, ordered by their lower index of site: pairs of site i are pairFirst[i] to pairFirst[i + 1] - 1 */
+    Integer          *pairFirst;
     /* Private state vector of the energy model */
     StateVector      *vector;
     /* Total number of possible protonation states, no greater than ANALYTIC_STATES */
@@ -59,6 +90,14 @@ typedef struct {
     Real              temperature;
 } EnergyModel;
 
+/* Private workspace for calculations that leave the energy model unchanged, so that several can run in parallel */
+typedef struct {
+    /* State vector, Boltzmann factors of states (nstates, only for folded proteins) and probabilities of instances */
+    StateVector  *vector;
+    Real         *bfactors;
+    Real         *probabilities;
+} EnergyModelWorkspace;
+
 
 /* Allocation and deallocation */
 extern EnergyModel *EnergyModel_Allocate (const Integer nsites, const Integer ninstances, Status *status);
@@ -70,6 +109,20 @@ extern Boolean EnergyModel_CheckInteractionsSymmetric   (const EnergyModel *self
 extern void    EnergyModel_ResetInteractions            (const EnergyModel *self);
 extern void    EnergyModel_ScaleInteractions            (const EnergyModel *self, Real scale);
 extern void    EnergyModel_StateVectorFromProbabilities (const EnergyModel *self, StateVector *vector, Status *status);
+extern Real    EnergyModel_FindMaxInteraction           (const EnergyModel *self, const TitrSite *site, const TitrSite *other);
+
+/* Joint probabilities of instances of pairs of sites */
+extern void    EnergyModel_AllocatePairs                (EnergyModel *self, const Integer npairs, Status *status);
+extern void    EnergyModel_DeallocatePairs              (EnergyModel *self);
+extern void    EnergyModel_SetPair                      (const EnergyModel *self, const Integer indexPair, const Integer indexSiteA, const Integer indexSiteB, Status *status);
+extern void    EnergyModel_GetPair                      (const EnergyModel *self, const Integer indexPair, Integer *indexSiteA, Integer *indexSiteB, Status *status);
+extern Integer EnergyModel_FindPairs                    (EnergyModel *self, const Real limit, const Integer npairs, Status *status);
+extern void    EnergyModel_IndexPairs                   (EnergyModel *self, Status *status);
+extern Integer EnergyModel_FindPair                     (const EnergyModel *self, const Integer indexSiteA, const Integer indexSiteB);
+extern void    EnergyModel_ResetPairProbabilities       (const EnergyModel *self);
+extern void    EnergyModel_UpdatePairProbabilities      (const EnergyModel *self, const StateVector *vector, const Real weight);
+extern void    EnergyModel_ScalePairProbabilities       (const EnergyModel *self, const Real scale);
+extern Real    EnergyModel_GetPairProbability           (const EnergyModel *self, const Integer indexPair, const Integer instIndexGlobalA, const Integer instIndexGlobalB);
 
 /* Calculation of energies */
 extern Real EnergyModel_CalculateMicrostateEnergy         (const EnergyModel *self, const StateVector *vector, const Real pH);
@@ -79,11 +132,19 @@ extern Real EnergyModel_CalculateMicrostateEnergyUnfolded (const EnergyModel *se
 extern Real EnergyModel_CalculateZ (const EnergyModel *self, Real (*EnergyFunction)(const EnergyModel*, const StateVector*, const Real), const Real pH, const Real Gzero, Real1DArray *bfactors);
 extern Real EnergyModel_CalculateZunfolded (const EnergyModel *self, const Real pH, const Real Gzero, Status *status);
 extern Real EnergyModel_CalculateZfolded (const EnergyModel *self, const Real pH, const Real Gzero, Status *status);
+extern void EnergyModel_CalculateBindingPolynomial (const EnergyModel *self, const Boolean unfolded, Real1DArray *logTerms, Status *status);
 
 /* Calculation of probabilities */
 extern void EnergyModel_CalculateProbabilitiesFromZ (const EnergyModel *self, const Real Z, const Real1DArray *bfactors);
 extern void EnergyModel_CalculateProbabilitiesAnalytically (const EnergyModel *self, const Real pH, Status *status);
 extern void EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (const EnergyModel *self, const Real pH, Status *status);
+extern Integer EnergyModel_CalculateProbabilitiesPruned (const EnergyModel *self, const Real pH, const Real tolerance, Real *logZ, Status *status);
+
+/* Calculation of probabilities in private workspaces, without changing the energy model */
+extern EnergyModelWorkspace *EnergyModel_AllocateWorkspace   (const EnergyModel *self, const Boolean unfolded, Status *status);
+extern void                  EnergyModel_DeallocateWorkspace (EnergyModelWorkspace *workspace);
+extern void EnergyModel_CalculateWorkspaceProbabilities         (const EnergyModel *self, const Real pH, const EnergyModelWorkspace *workspace);
+extern void EnergyModel_CalculateWorkspaceProbabilitiesUnfolded (const EnergyModel *self, const Real pH, const EnergyModelWorkspace *workspace);
 
 /* Functions for accessing items */
 extern Real    EnergyModel_GetGmodel         (const EnergyModel *self, const Integer instIndexGlobal);
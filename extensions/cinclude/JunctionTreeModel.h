@@ -0,0 +1,92 @@
+/*------------------------------------------------------------------------------
+! . File      : JunctionTreeModel.h
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#ifndef _JUNCTIONTREEMODEL
+#define _JUNCTIONTREEMODEL
+
+/* Needed for exp and log */
+#include <math.h>
+
+/* Needed for memcpy */
+#include <string.h>
+
+/* Data types */
+#include "Real.h"
+#include "Boolean.h"
+#include "Integer.h"
+#include "Cardinal.h"
+
+/* Arrays */
+#include "Real1DArray.h"
+#include "Integer1DArray.h"
+#include "SymmetricMatrix.h"
+
+/* Other */
+#include "Memory.h"
+#include "Status.h"
+
+/* Own modules */
+#include "StateVector.h"
+#include "EnergyModel.h"
+
+
+typedef struct {
+    /* Number of sites in the clique, the first one is the eliminated site */
+    Integer   nsites;
+    /* Indices of sites, the remaining ones make up the separator */
+    Integer  *sites;
+    /* Number of instances of each site */
+    Integer  *radix;
+    /* Table size, i.e. the product of radices */
+    Integer   size;
+    /* Index of the parent clique (-1 for a root) */
+    Integer   parent;
+    /* Sites coupled to the eliminated site by the original graph */
+    Boolean  *coupled;
+    /* Tables in log-space: belief and message to the parent */
+    Real     *belief;
+    Real     *message;
+} Clique;
+
+typedef struct {
+    /* Interactions below this limit are neglected (kcal/mol) */
+    Real         cutoff;
+    /* Maximum number of states in a clique */
+    Integer      maxStates;
+    /* Treewidth of the decomposition */
+    Integer      width;
+    /* Number of states in the largest clique */
+    Integer      largest;
+    /* Number of pairs of sites coupled in the graph */
+    Integer      nedges;
+    /* Number of cliques, equal to the number of sites */
+    Integer      ncliques;
+    /* Logarithm of the partition function from the last calculation */
+    Real         logZ;
+    /* Decomposition was successful */
+    Boolean      isTractable;
+    /* Order of elimination of sites */
+    Integer     *order;
+    /* One clique per eliminated site, indexed by site */
+    Clique      *cliques;
+    /* Workspace for the projection and marginalization of tables */
+    Integer     *indices, *counters, *strides;
+    Real        *work;
+    /* Pointer to the energy model */
+    EnergyModel *energyModel;
+} JunctionTreeModel;
+
+
+/* Allocation and deallocation */
+extern JunctionTreeModel *JunctionTreeModel_Allocate          (const Real cutoff, const Integer maxStates, Status *status);
+extern void               JunctionTreeModel_Deallocate        (JunctionTreeModel *self);
+extern Boolean            JunctionTreeModel_LinkToEnergyModel (JunctionTreeModel *self, EnergyModel *energyModel, Status *status);
+
+/* Calculation of probabilities */
+extern Real               JunctionTreeModel_CalculateProbabilities (JunctionTreeModel *self, const Real pH);
+
+#endif
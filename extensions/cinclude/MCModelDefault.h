@@ -10,8 +10,16 @@
 
 /* Needed for random seed */
 #include <time.h>
-/* Needed for exp */
+/* Needed for exp and sqrt */
 #include <math.h>
+/* Needed for checkpoint files */
+#include <stdio.h>
+#include <string.h>
+
+/* Independent chains are run in parallel if OpenMP is available */
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 /* Data types */
 #include "Real.h"
@@ -33,41 +41,160 @@
 /* Own modules */
 #include "StateVector.h"
 #include "EnergyModel.h"
+#include "MicrostateHistogram.h"
 
 
 /* Taken from GMCT */
 #define TOO_SMALL -500.0
 
-typedef struct {
+/* Maximum number of states of a cluster, which are enumerated in each cluster move */
+#define MCMODELDEFAULT_MAX_CLUSTER_STATES 4096
+
+/* Convergence-based stopping: number of scans in the initial block, maximum number of blocks
+   (after which pairs of blocks are merged) and minimum number of blocks used for probabilities */
+#define MCMODELDEFAULT_BLOCK_SCANS  10
+#define MCMODELDEFAULT_MAX_BLOCKS   64
+#define MCMODELDEFAULT_MIN_BLOCKS   16
+
+/* Identifier of the format of checkpoint files, written at the beginning of the file */
+#define MCMODELDEFAULT_CHECKPOINT_MAGIC "PCECHKP1"
+
+/*
+ * Layout of checkpoint files:
+ *
+ *   Header : magic (8 bytes), ninstances, nsites, npairs, nprod, number of scans done,
+ *            size of the state of the generator in bytes, number of pairs of the energy model
+ *            (0 if their joint probabilities are not accumulated), maxProtons + 1 (0 without
+ *            reweighting), 1 if there is a histogram of microstates (Integer), pH (Real)
+ *   Body   : global indices of "active" instances (nsites x Integer)
+ *            indices of sites of pairs for double moves (npairs x 2 x Integer)
+ *            state of the generator
+ *            field and counts of "active" instances (2 x ninstances x Real)
+ *            joint counts of instances of pairs of the energy model (optional)
+ *            histogram of numbers of protons (optional)
+ *            histogram of microstates (optional)
+ */
+
+typedef struct MCModelDefault {
     /* Energy limit for double moves */
     Real                   limit;
     /* Number of equlibration scans */
     Integer                nequil;
     /* Number of production scans */
     Integer                nprod;
+    /* Number of equilibration scans when continuing from the state vector of the previous run */
+    Integer                nequilWarm;
     /* Pointer to the energy model */
     EnergyModel           *energyModel;
     /* Private state vector of the Monte Carlo model */
     StateVector           *vector;
-    /* Mersenne Twister generator */
+    /* Interactions of each instance with the "active" instances of the state vector */
+    Real                  *field;
+    /* Mersenne Twister generator and its seed */
     RandomNumberGenerator *generator;
+    Cardinal               seed;
+    /* Counts of "active" instances, either the probabilities of the energy model or a row of chainProbabilities */
+    Real                  *probabilities;
+    /* Number of independent chains and number of threads to run them (0 means the OpenMP default) */
+    Integer                nchains;
+    Integer                nthreads;
+    /* Independent chains, each with its own state vector, field and generator */
+    struct MCModelDefault **chains;
+    /* Probabilities from each chain (nchains x ninstances) */
+    Real                  *chainProbabilities;
+    /* Convergence diagnostics for each instance: potential scale reduction factors and standard errors */
+    Real                  *rhat;
+    Real                  *errors;
+    /* Advance all chains together in a single thread instead of running them in parallel */
+    Boolean                lockstep;
+    /* Lockstep workspace: "active" instances (nsites x nchains), fields (nchains x ninstances)
+       and old and new instances of the changed sites (2 x nchains) */
+    Integer               *actives;
+    Real                  *fields;
+    Integer               *instancesOld;
+    Integer               *instancesNew;
+    /* Replica exchange: numbers of attempted and accepted swaps between neighbouring pH-values (nchains - 1) */
+    Integer               *swapsAttempted;
+    Integer               *swapsAccepted;
+    /* Sample the new instance of a site from its conditional distribution instead of using Metropolis */
+    Boolean                heatBath;
+    /* Accumulate conditional probabilities of instances instead of counts of "active" instances */
+    Boolean                raoBlackwell;
+    /* Conditional probabilities of instances, used in heat-bath moves and Rao-Blackwellized accumulation */
+    Real                  *weights;
+    /* Energy limit for clusters of strongly coupled sites and maximum number of sites in a cluster (less than 2 disables clusters) */
+    Real                   clusterLimit;
+    Integer                maxClusterSize;
+    /* Clusters: indices of their sites, one cluster after another, and offsets of clusters (nclusters + 1) */
+    Integer                nclusters;
+    Integer               *clusterSites;
+    Integer               *clusterOffsets;
+    /* Cluster workspace: energies and probabilities of states (2 x MCMODELDEFAULT_MAX_CLUSTER_STATES)
+       and current and drawn instances of sites (2 x maxClusterSize) */
+    Real                  *clusterStates;
+    Integer               *clusterInstances;
+    /* Convergence-based stopping: target standard error of probabilities (0 disables) and maximum number of production scans */
+    Real                   targetError;
+    Integer                maxScans;
+    /* Blocks of production scans: counts of instances (MCMODELDEFAULT_MAX_BLOCKS x ninstances) and sums of energies */
+    Real                  *blockCounts;
+    Real                  *blockEnergies;
+    /* From the last convergence-based run: scans discarded as equilibration and scans used for probabilities */
+    Integer                nscansDiscarded;
+    Integer                nscansUsed;
+    /* Accumulate joint probabilities of the pairs of sites selected in the energy model (only in runs of a single chain) */
+    Boolean                accumulatePairs;
+    /* Histogram of microstates sampled in runs of a single chain and its maximum number of microstates (0 disables) */
+    MicrostateHistogram   *microstates;
+    Integer                maxMicrostates;
+    /* Reweighting to other pH-values: histogram of numbers of protons of production scans (maxProtons + 1)
+       and counts of "active" instances at each number of protons ((maxProtons + 1) x ninstances) */
+    Boolean                reweighting;
+    Integer                maxProtons;
+    Real                  *protonCounts;
+    Real                  *protonInstances;
+    /* Number of production scans between checkpoints (0 disables checkpoints) */
+    Integer                checkpointFrequency;
+    /* Private counts of "active" instances of a workspace, used instead of the probabilities of the energy model */
+    Real                  *privateProbabilities;
 } MCModelDefault;
 
 
 /* Allocation and deallocation */
-extern MCModelDefault *MCModelDefault_Allocate          (const Real limit, const Integer nequil, const Integer nprod, const Integer randomSeed, Status *status);
+extern MCModelDefault *MCModelDefault_Allocate          (const Real limit, const Integer nequil, const Integer nprod, const Integer randomSeed, const Integer nchains, const Integer nthreads, Status *status);
 extern void            MCModelDefault_Deallocate        (MCModelDefault *self);
 extern void            MCModelDefault_LinkToEnergyModel (MCModelDefault *self, EnergyModel *energyModel, Status *status);
+extern void            MCModelDefault_LinkChains        (MCModelDefault *self, Status *status);
 
 /* Monte Carlo-related functions */
 extern Boolean MCModelDefault_Metropolis             (const Real GdeltaRT, const RandomNumberGenerator *generator);
 extern Boolean MCModelDefault_Move                   (const MCModelDefault *self, const Real pH, const Real G, Real *Gnew);
 extern Boolean MCModelDefault_DoubleMove             (const MCModelDefault *self, const Real pH, const Real G, Real *Gnew);
+extern Boolean MCModelDefault_HeatBathMove           (const MCModelDefault *self, const Real pH, const Real G, Real *Gnew);
+extern Boolean MCModelDefault_ClusterMove            (const MCModelDefault *self, const Real pH, const Real G, Real *Gnew);
 extern Real    MCModelDefault_MCScan                 (const MCModelDefault *self, const Real pH, Integer nmoves, Integer *movesDone, Integer *movesAccepted, Integer *flipsDone, Integer *flipsAccepted);
-extern void    MCModelDefault_UpdateProbabilities    (const MCModelDefault *self);
+extern void    MCModelDefault_UpdateProbabilities    (const MCModelDefault *self, const Real pH);
+extern Integer MCModelDefault_CountProtons           (const MCModelDefault *self);
+extern void    MCModelDefault_ResetProtonHistogram   (const MCModelDefault *self);
+extern void    MCModelDefault_UpdateProtonHistogram  (const MCModelDefault *self);
+extern void    MCModelDefault_CalculateField         (const MCModelDefault *self);
 extern Real    MCModelDefault_FindMaxInteraction     (const MCModelDefault *self, const TitrSite *site, const TitrSite *other);
 extern Integer MCModelDefault_FindPairs              (const MCModelDefault *self, const Integer npairs, Status *status);
+extern Integer MCModelDefault_FindClusters           (MCModelDefault *self, Status *status);
 extern void    MCModelDefault_Equilibration          (const MCModelDefault *self, const Real pH);
+extern void    MCModelDefault_WarmEquilibration      (const MCModelDefault *self, const Real pH);
 extern void    MCModelDefault_Production             (const MCModelDefault *self, const Real pH);
+extern Boolean MCModelDefault_ConvergedProduction    (MCModelDefault *self, const Real pH);
+extern void    MCModelDefault_RunChains              (const MCModelDefault *self, const Real pH);
+extern void    MCModelDefault_ReplicaExchange        (const MCModelDefault *self, const Real1DArray *pHs, const Integer frequency, Status *status);
+
+/* Workspaces, which run in parallel on a shared energy model */
+extern void    MCModelDefault_AllocatePrivateProbabilities (MCModelDefault *self, Status *status);
+extern void    MCModelDefault_CalculateProbabilities       (const MCModelDefault *self, const Real pH, const Boolean warmStart);
+
+/* Checkpointing of productions */
+extern Boolean MCModelDefault_WriteCheckpoint        (const MCModelDefault *self, const char *filename, const Real pH, const Integer nscans);
+extern Integer MCModelDefault_ReadCheckpoint         (const MCModelDefault *self, const char *filename, const Real pH, Status *status);
+extern Boolean MCModelDefault_CheckpointedProduction (const MCModelDefault *self, const Real pH, const Integer nscans, const char *filename);
 
 #endif
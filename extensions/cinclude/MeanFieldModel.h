@@ -0,0 +1,61 @@
+/*------------------------------------------------------------------------------
+! . File      : MeanFieldModel.h
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#ifndef _MEANFIELDMODEL
+#define _MEANFIELDMODEL
+
+/* Needed for exp and fabs */
+#include <math.h>
+
+/* Data types */
+#include "Real.h"
+#include "Boolean.h"
+#include "Integer.h"
+#include "Cardinal.h"
+
+/* Arrays */
+#include "Real1DArray.h"
+#include "Integer1DArray.h"
+#include "SymmetricMatrix.h"
+
+/* Other */
+#include "Memory.h"
+#include "Status.h"
+
+/* Own modules */
+#include "StateVector.h"
+#include "EnergyModel.h"
+
+
+typedef struct {
+    /* Fraction of old probabilities kept in each iteration */
+    Real         damping;
+    /* Convergence criterion for the change of probabilities */
+    Real         tolerance;
+    /* Maximum number of iterations */
+    Integer      maxIterations;
+    /* Number of iterations and the largest change of probabilities in the last calculation */
+    Integer      niterations;
+    Real         deviation;
+    /* Average interactions of instances with other sites */
+    Real        *field;
+    /* Pointer to the energy model */
+    EnergyModel *energyModel;
+} MeanFieldModel;
+
+
+/* Allocation and deallocation */
+extern MeanFieldModel *MeanFieldModel_Allocate          (const Real damping, const Real tolerance, const Integer maxIterations, Status *status);
+extern void            MeanFieldModel_Deallocate        (MeanFieldModel *self);
+extern void            MeanFieldModel_LinkToEnergyModel (MeanFieldModel *self, EnergyModel *energyModel, Status *status);
+
+/* Self-consistent iterations */
+extern void    MeanFieldModel_Reset                  (const MeanFieldModel *self);
+extern Real    MeanFieldModel_Iterate                (const MeanFieldModel *self, const Real pH);
+extern Boolean MeanFieldModel_CalculateProbabilities (MeanFieldModel *self, const Real pH);
+
+#endif
@@ -0,0 +1,98 @@
+/*------------------------------------------------------------------------------
+! . File      : MicrostateHistogram.h
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#ifndef _MICROSTATEHISTOGRAM
+#define _MICROSTATEHISTOGRAM
+
+/* Needed for qsort */
+#include <stdlib.h>
+/* Needed for checkpoint files */
+#include <stdio.h>
+
+/* Data types */
+#include "Real.h"
+#include "Boolean.h"
+#include "Integer.h"
+#include "Cardinal.h"
+
+/* Other */
+#include "Memory.h"
+#include "Status.h"
+
+/* Own modules */
+#include "StateVector.h"
+
+
+/* Keys are 128-bit numbers, stored as digits in base 2^16 starting from the least significant one */
+#define MICROSTATEHISTOGRAM_KEY_DIGITS  8
+#define MICROSTATEHISTOGRAM_DIGIT_BITS  16
+#define MICROSTATEHISTOGRAM_DIGIT_MASK  0xffff
+
+/* Default maximum number of microstates kept in the histogram */
+#define MICROSTATEHISTOGRAM_MAX_STATES  4096
+
+typedef struct {
+    Cardinal digits[MICROSTATEHISTOGRAM_KEY_DIGITS];
+} MicrostateKey;
+
+/* Used for ordering microstates by their counts */
+typedef struct {
+    Real    count;
+    Integer index;
+} MicrostateRank;
+
+/*
+ * If the number of protonation states fits into 128 bits, the key of a state is its index
+ * in the mixed radix system, whose radices are the numbers of instances of sites. Otherwise,
+ * the key is a 128-bit hash of the state and equal keys are confirmed by comparing the states.
+ *
+ * The histogram is a hash table with open addressing. When it is full, the rarer half of
+ * the microstates is evicted to make room for new ones.
+ */
+typedef struct {
+    /* Number of sites and the number of instances of each site */
+    Integer          nsites;
+    Integer         *radices;
+    /* Keys are indices in the mixed radix system instead of hashes */
+    Boolean          isExact;
+    /* Maximum number of microstates, number of slots of the hash table (a power of two, at least twice the maximum) */
+    Integer          maxStates;
+    Integer          nslots;
+    /* Number of microstates currently in the histogram */
+    Integer          nstates;
+    /* Index of the microstate in each slot, -1 for empty slots */
+    Integer         *slots;
+    /* Keys, counts, energies and numbers of protons of microstates */
+    MicrostateKey   *keys;
+    Real            *counts;
+    Real            *energies;
+    Integer         *protons;
+    /* Local indices of "active" instances of microstates (maxStates x nsites) */
+    Integer         *instances;
+    /* Workspace for ordering microstates by their counts during eviction (maxStates) */
+    MicrostateRank  *ranks;
+    /* Total number of recorded samples, number of samples of evicted microstates and number of evictions */
+    Real             nsamples;
+    Real             nevicted;
+    Integer          nevictions;
+} MicrostateHistogram;
+
+
+/* Allocation and deallocation */
+extern MicrostateHistogram *MicrostateHistogram_Allocate   (const StateVector *vector, const Integer maxStates, Status *status);
+extern void                 MicrostateHistogram_Deallocate (MicrostateHistogram *self);
+extern void                 MicrostateHistogram_Reset      (MicrostateHistogram *self);
+
+/* Recording of microstates */
+extern void MicrostateHistogram_Encode (const MicrostateHistogram *self, const StateVector *vector, MicrostateKey *key);
+extern void MicrostateHistogram_Record (MicrostateHistogram *self, const StateVector *vector, const Real G, const Integer nprotons);
+
+/* Checkpointing */
+extern Boolean MicrostateHistogram_Write (const MicrostateHistogram *self, FILE *file);
+extern Boolean MicrostateHistogram_Read  (MicrostateHistogram *self, FILE *file);
+
+#endif
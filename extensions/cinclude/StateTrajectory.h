@@ -0,0 +1,85 @@
+/*------------------------------------------------------------------------------
+! . File      : StateTrajectory.h
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#ifndef _STATETRAJECTORY
+#define _STATETRAJECTORY
+
+/* Needed for file output */
+#include <stdio.h>
+#include <string.h>
+
+/* Data types */
+#include "Real.h"
+#include "Boolean.h"
+#include "Integer.h"
+#include "Cardinal.h"
+
+/* Other */
+#include "Memory.h"
+#include "Status.h"
+
+/* Own modules */
+#include "StateVector.h"
+
+
+/* Identifier of the file format, written at the beginning of the file */
+#define STATETRAJECTORY_MAGIC "PCETRAJ1"
+
+/* Default number of scans in a block */
+#define STATETRAJECTORY_BLOCK_SCANS 1024
+
+/* Local indices of instances are packed into one byte */
+#define STATETRAJECTORY_MAX_INSTANCES 256
+
+/* Sections of a block are padded to multiples of this number of bytes */
+#define STATETRAJECTORY_PADDING 8
+
+/*
+ * Layout of the file:
+ *
+ *   Header : magic (8 bytes), nsites, blockSize, nscans, nblocks (Integer)
+ *   Blocks : nscans, nchanges (Integer)
+ *            energies of scans (nscans x Real)
+ *            numbers of protons of scans (nscans x Integer)
+ *            numbers of sites changed since the previous scan (nscans x Integer)
+ *            keyframe, i.e. local indices of instances in the first scan (nsites x unsigned char, padded)
+ *            changes, each packed as (index of site << 8) | local index of instance (nchanges x Cardinal, padded)
+ */
+typedef struct {
+    /* Output file */
+    FILE          *file;
+    /* Number of sites and maximum number of scans in a block */
+    Integer        nsites;
+    Integer        blockSize;
+    /* Numbers of scans and changes in the current block */
+    Integer        nscans;
+    Integer        nchanges;
+    /* Total numbers of scans and blocks written */
+    Integer        ntotal;
+    Integer        nblocks;
+    /* Local indices of "active" instances in the previous scan */
+    Integer       *previous;
+    /* Local indices of "active" instances in the first scan of the block */
+    unsigned char *keyframe;
+    /* Energies, numbers of protons and numbers of changed sites of scans in the block */
+    Real          *energies;
+    Integer       *protons;
+    Integer       *counts;
+    /* Packed changes of the block */
+    Cardinal      *changes;
+} StateTrajectory;
+
+
+/* Opening and closing */
+extern StateTrajectory *StateTrajectory_Open  (const char *filename, const StateVector *vector, const Integer blockSize, Status *status);
+extern Boolean          StateTrajectory_Close (StateTrajectory *self);
+
+/* Writing */
+extern Boolean StateTrajectory_Write (StateTrajectory *self, const StateVector *vector, const Integer nprotons, const Real G);
+extern Boolean StateTrajectory_Flush (StateTrajectory *self);
+
+#endif
@@ -0,0 +1,95 @@
+/*------------------------------------------------------------------------------
+! . File      : WangLandauModel.h
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#ifndef _WANGLANDAUMODEL
+#define _WANGLANDAUMODEL
+
+/* Needed for random seed */
+#include <time.h>
+/* Needed for exp and log */
+#include <math.h>
+
+/* Data types */
+#include "Real.h"
+#include "Boolean.h"
+#include "Integer.h"
+#include "Cardinal.h"
+
+/* Arrays */
+#include "Real1DArray.h"
+#include "Integer1DArray.h"
+#include "SymmetricMatrix.h"
+
+/* Other */
+#include "Memory.h"
+#include "Status.h"
+#include "RandomNumberGenerator.h"
+
+/* Own modules */
+#include "StateVector.h"
+#include "EnergyModel.h"
+
+
+/* Number of scans between checks of the flatness of the histogram */
+#define WANGLANDAU_CHECK_SCANS 100
+
+typedef struct {
+    /* Number of energy bins */
+    Integer                nbins;
+    /* Flatness criterion, i.e. the minimum ratio of the smallest to the average entry of the histogram */
+    Real                   flatness;
+    /* Final value of the logarithm of the modification factor */
+    Real                   lnfFinal;
+    /* Number of exploratory scans at each pH, done to find the ranges of energies and protons */
+    Integer                nequil;
+    /* Number of production scans with a fixed density of states */
+    Integer                nprod;
+    /* Maximum number of Wang-Landau scans */
+    Integer                maxScans;
+    /* Number of Wang-Landau scans done */
+    Integer                nscans;
+    /* Ranges of pH-independent energies and numbers of protons */
+    Real                   Emin, Emax, width;
+    Integer                nprotonsMin, nprotons;
+    /* Current pH-independent energy and number of protons of the state vector */
+    Real                   E;
+    Integer                nprotonsActive;
+    /* Density of states is converged */
+    Boolean                isConverged;
+    /* Logarithm of the density of states and histogram (nprotons x nbins) */
+    Real                  *lng;
+    Real                  *histogram;
+    Boolean               *visited;
+    /* Temperature of the production */
+    Real                   temperature;
+    /* From the production: counts of states, sums of Boltzmann factors relative to the centre of the bin
+       and the same sums for states with each instance (nprotons x nbins x ninstances) in each bin */
+    Real                  *counts;
+    Real                  *weights;
+    Real                  *instances;
+    /* Interactions of each instance with the "active" instances of the state vector */
+    Real                  *field;
+    /* Private state vector */
+    StateVector           *vector;
+    /* Mersenne Twister generator */
+    RandomNumberGenerator *generator;
+    /* Pointer to the energy model */
+    EnergyModel           *energyModel;
+} WangLandauModel;
+
+
+/* Allocation and deallocation */
+extern WangLandauModel *WangLandauModel_Allocate          (const Integer nbins, const Real flatness, const Real lnfFinal, const Integer nequil, const Integer nprod, const Integer maxScans, const Integer randomSeed, Status *status);
+extern void             WangLandauModel_Deallocate        (WangLandauModel *self);
+extern void             WangLandauModel_LinkToEnergyModel (WangLandauModel *self, EnergyModel *energyModel, Status *status);
+
+/* Estimation of the density of states and reconstruction of probabilities */
+extern Boolean WangLandauModel_CalculateDensity       (WangLandauModel *self, Status *status);
+extern void    WangLandauModel_Production             (WangLandauModel *self, const Real temperature);
+extern Real    WangLandauModel_CalculateProbabilities (const WangLandauModel *self, const Real pH);
+
+#endif
@@ -13,6 +13,7 @@
  */
 EnergyModel *EnergyModel_Allocate (const Integer nsites, const Integer ninstances, Status *status) {
     EnergyModel *self = NULL;
+    Integer      i;
 
     MEMORY_ALLOCATE (self, EnergyModel);
     if (self == NULL) {
@@ -25,6 +26,12 @@ EnergyModel *EnergyModel_Allocate (const Integer nsites, const Integer ninstance
     self->interactions     =  NULL  ;
     self->probabilities    =  NULL  ;
     self->symmetricmatrix  =  NULL  ;
+    self->rows             =  NULL  ;
+    self->rowsData         =  NULL  ;
+    self->stride           =  0     ;
+    self->pairs            =  NULL  ;
+    self->npairs           =  0     ;
+    self->pairFirst        =  NULL  ;
 
     if (nsites > 0) {
         self->vector = StateVector_Allocate (nsites, status);
@@ -45,6 +52,15 @@ EnergyModel *EnergyModel_Allocate (const Integer nsites, const Integer ninstance
         if (self->symmetricmatrix == NULL) {
             goto failSetDealloc;
         }
+        self->stride = (ninstances + ENERGYMODEL_ROW_ALIGN - 1) / ENERGYMODEL_ROW_ALIGN * ENERGYMODEL_ROW_ALIGN;
+        MEMORY_ALLOCATEARRAY (self->rowsData, ninstances * self->stride + ENERGYMODEL_ROW_ALIGN, Real);
+        if (self->rowsData == NULL) {
+            goto failSetDealloc;
+        }
+        self->rows = (Real *) (((size_t) self->rowsData + ENERGYMODEL_ROW_ALIGN * sizeof (Real) - 1) & ~((size_t) (ENERGYMODEL_ROW_ALIGN * sizeof (Real) - 1)));
+        for (i = 0; i < ninstances * self->stride; i++) {
+            self->rows[i] = 0.0f;
+        }
     }
     return self;
 
@@ -62,7 +78,9 @@ failSet:
  * Deallocate the energy model.
  */
 void EnergyModel_Deallocate (EnergyModel *self) {
+    if ( self->pairs           != NULL)  EnergyModel_DeallocatePairs (  self                  ) ;
     if ( self->symmetricmatrix != NULL)  SymmetricMatrix_Deallocate ( &self->symmetricmatrix ) ;
+    if ( self->rowsData        != NULL)  MEMORY_DEALLOCATE          (  self->rowsData        ) ;
     if ( self->probabilities   != NULL)  Real1DArray_Deallocate     ( &self->probabilities   ) ;
     if ( self->interactions    != NULL)  Real2DArray_Deallocate     ( &self->interactions    ) ;
     if ( self->intrinsic       != NULL)  Real1DArray_Deallocate     ( &self->intrinsic       ) ;
@@ -81,23 +99,47 @@ Boolean EnergyModel_CheckInteractionsSymmetric (const EnergyModel *self, Real to
 
 /*
  * Symmetrize the array of interactions into a symmetric matrix.
+ * The dense layout of interactions is built from the symmetric matrix.
  */
 void EnergyModel_SymmetrizeInteractions (const EnergyModel *self, Status *status) {
+    Integer  i, j;
+    Real    *row, W;
+
     SymmetricMatrix_CopyFromReal2DArray (self->symmetricmatrix, self->interactions, status);
+    for (i = 0; i < self->ninstances; i++) {
+        row = EnergyModel_DenseRow (self, i);
+        for (j = 0; j <= i; j++) {
+            W = EnergyModel_GetW (self, i, j);
+            row[j] = W;
+            EnergyModel_GetWdense (self, j, i) = W;
+        }
+    }
 }
 
 /*
  * Set all interactions to zero.
  */
 void EnergyModel_ResetInteractions (const EnergyModel *self) {
+    Integer i, size;
+
     SymmetricMatrix_Set (self->symmetricmatrix, 0.0f);
+    size = self->ninstances * self->stride;
+    for (i = 0; i < size; i++) {
+        self->rows[i] = 0.0f;
+    }
 }
 
 /*
  * Scale interactions.
  */
 void EnergyModel_ScaleInteractions (const EnergyModel *self, Real scale) {
+    Integer i, size;
+
     SymmetricMatrix_Scale (self->symmetricmatrix, scale);
+    size = self->ninstances * self->stride;
+    for (i = 0; i < size; i++) {
+        self->rows[i] *= scale;
+    }
 }
 
 /*
@@ -139,6 +181,304 @@ fail:
     Status_Set (status, Status_ArrayNonConformableSizes);
 }
 
+/*
+ * Find maximum absolute interaction energy between two sites.
+ */
+Real EnergyModel_FindMaxInteraction (const EnergyModel *self, const TitrSite *site, const TitrSite *other) {
+    Integer index, indexOther;
+    Real W, Wmax, *row;
+
+    Wmax  = 0.0f;
+    index = site->indexFirst;
+    for (; index <= site->indexLast; index++) {
+        row        = EnergyModel_DenseRow (self, index);
+        indexOther = other->indexFirst;
+        for (; indexOther <= other->indexLast; indexOther++) {
+            W = fabs (row[indexOther]);
+            if (W > Wmax) {
+                Wmax = W;
+            }
+        }
+    }
+    return Wmax;
+}
+
+/*
+ * Allocate pairs of sites for joint probabilities of their instances.
+ * Previously selected pairs are discarded.
+ */
+void EnergyModel_AllocatePairs (EnergyModel *self, const Integer npairs, Status *status) {
+    Integer i;
+
+    EnergyModel_DeallocatePairs (self);
+    if (npairs > 0) {
+        MEMORY_ALLOCATEARRAY (self->pairs, npairs, PairProbability);
+        if (self->pairs == NULL) {
+            Status_Set (status, Status_MemoryAllocationFailure);
+            return;
+        }
+        for (i = 0; i < npairs; i++) {
+            self->pairs[i].indexSiteA    = -1;
+            self->pairs[i].indexSiteB    = -1;
+            self->pairs[i].probabilities = NULL;
+        }
+        self->npairs = npairs;
+    }
+}
+
+/*
+ * Deallocate pairs of sites.
+ */
+void EnergyModel_DeallocatePairs (EnergyModel *self) {
+    Integer i;
+
+    if (self->pairs != NULL) {
+        for (i = 0; i < self->npairs; i++) {
+            if (self->pairs[i].probabilities != NULL) MEMORY_DEALLOCATE (self->pairs[i].probabilities);
+        }
+        MEMORY_DEALLOCATE (self->pairs);
+    }
+    if (self->pairFirst != NULL) MEMORY_DEALLOCATE (self->pairFirst);
+    self->pairs     = NULL;
+    self->npairs    = 0;
+    self->pairFirst = NULL;
+}
+
+/*
+ * Set a pair of sites and allocate joint probabilities of their instances.
+ */
+void EnergyModel_SetPair (const EnergyModel *self, const Integer indexPair, const Integer indexSiteA, const Integer indexSiteB, Status *status) {
+    PairProbability *pair;
+    TitrSite        *siteA, *siteB;
+    Integer          i, nitems;
+
+    if ((indexPair < 0) || (indexPair >= self->npairs) || (indexSiteA < 0) || (indexSiteA >= self->vector->nsites) || (indexSiteB < 0) || (indexSiteB >= self->vector->nsites) || (indexSiteA == indexSiteB)) {
+        Status_Set (status, Status_IndexOutOfRange);
+        return;
+    }
+    pair   = &self->pairs[indexPair];
+    siteA  = &self->vector->sites[indexSiteA];
+    siteB  = &self->vector->sites[indexSiteB];
+    nitems = (siteA->indexLast - siteA->indexFirst + 1) * (siteB->indexLast - siteB->indexFirst + 1);
+
+    if (pair->probabilities != NULL) MEMORY_DEALLOCATE (pair->probabilities);
+    MEMORY_ALLOCATEARRAY (pair->probabilities, nitems, Real);
+    if (pair->probabilities == NULL) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        return;
+    }
+    for (i = 0; i < nitems; i++) {
+        pair->probabilities[i] = 0.0f;
+    }
+    pair->indexSiteA = indexSiteA;
+    pair->indexSiteB = indexSiteB;
+}
+
+/*
+ * Get indices of sites of a pair.
+ */
+void EnergyModel_GetPair (const EnergyModel *self, const Integer indexPair, Integer *indexSiteA, Integer *indexSiteB, Status *status) {
+    if ((indexPair < 0) || (indexPair >= self->npairs)) {
+        Status_Set (status, Status_IndexOutOfRange);
+    }
+    else {
+        *indexSiteA = self->pairs[indexPair].indexSiteA;
+        *indexSiteB = self->pairs[indexPair].indexSiteB;
+    }
+}
+
+/*
+ * Compare pairs of sites by their lower and higher indices of sites.
+ */
+static int EnergyModel_ComparePairs (const void *a, const void *b) {
+    const PairProbability *pa = (const PairProbability *) a, *pb = (const PairProbability *) b;
+    Integer                la, ha, lb, hb;
+
+    la = (pa->indexSiteA < pa->indexSiteB) ? pa->indexSiteA : pa->indexSiteB;
+    ha = (pa->indexSiteA < pa->indexSiteB) ? pa->indexSiteB : pa->indexSiteA;
+    lb = (pb->indexSiteA < pb->indexSiteB) ? pb->indexSiteA : pb->indexSiteB;
+    hb = (pb->indexSiteA < pb->indexSiteB) ? pb->indexSiteB : pb->indexSiteA;
+    if (la != lb) return (la < lb) ? -1 : 1;
+    return (ha < hb) ? -1 : (ha > hb);
+}
+
+/*
+ * Order the selected pairs by their lower index of site and build the index map of pairs.
+ * Each pair keeps the order of its sites. Repeated pairs are rejected with Status_ValueError.
+ */
+void EnergyModel_IndexPairs (EnergyModel *self, Status *status) {
+    PairProbability *pair;
+    Integer          i, nsites, lower;
+
+    if (self->pairFirst != NULL) MEMORY_DEALLOCATE (self->pairFirst);
+    self->pairFirst = NULL;
+    if (self->npairs < 1) {
+        return;
+    }
+    nsites = self->vector->nsites;
+    MEMORY_ALLOCATEARRAY (self->pairFirst, nsites + 1, Integer);
+    if (self->pairFirst == NULL) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        return;
+    }
+    qsort (self->pairs, (size_t) self->npairs, sizeof (PairProbability), EnergyModel_ComparePairs);
+
+    for (i = 0; i <= nsites; i++) {
+        self->pairFirst[i] = 0;
+    }
+    for (i = 0, pair = self->pairs; i < self->npairs; i++, pair++) {
+        if ((i > 0) && (EnergyModel_ComparePairs (pair - 1, pair) == 0)) {
+            Status_Set (status, Status_ValueError);
+            return;
+        }
+        lower = (pair->indexSiteA < pair->indexSiteB) ? pair->indexSiteA : pair->indexSiteB;
+        self->pairFirst[lower + 1]++;
+    }
+    for (i = 0; i < nsites; i++) {
+        self->pairFirst[i + 1] += self->pairFirst[i];
+    }
+}
+
+/*
+ * Find the index of the selected pair of two sites, in either order of the sites.
+ * Returns -1 if the pair is not selected.
+ */
+Integer EnergyModel_FindPair (const EnergyModel *self, const Integer indexSiteA, const Integer indexSiteB) {
+    PairProbability *pair;
+    Integer          lower, higher, first, last, middle, other;
+
+    if ((self->pairFirst == NULL) || (indexSiteA < 0) || (indexSiteA >= self->vector->nsites) || (indexSiteB < 0) || (indexSiteB >= self->vector->nsites)) {
+        return -1;
+    }
+    lower  = (indexSiteA < indexSiteB) ? indexSiteA : indexSiteB;
+    higher = (indexSiteA < indexSiteB) ? indexSiteB : indexSiteA;
+    first  = self->pairFirst[lower];
+    last   = self->pairFirst[lower + 1] - 1;
+    while (first <= last) {
+        middle = (first + last) / 2;
+        pair   = &self->pairs[middle];
+        other  = (pair->indexSiteA == lower) ? pair->indexSiteB : pair->indexSiteA;
+        if (other == higher) {
+            return middle;
+        }
+        if (other < higher) {
+            first = middle + 1;
+        }
+        else {
+            last  = middle - 1;
+        }
+    }
+    return -1;
+}
+
+/*
+ * Select pairs of sites whose maximum interaction energy is at least the given limit.
+ * With a zero limit, all pairs of sites are selected.
+ *
+ * If npairs < 1, dry run is assumed and only nfound is returned.
+ * The value of npairs is used in the second run to allocate and set the pairs.
+ */
+Integer EnergyModel_FindPairs (EnergyModel *self, const Real limit, const Integer npairs, Status *status) {
+    TitrSite *site, *other;
+    Integer   i, j, nfound;
+
+    if (npairs > 0) {
+        EnergyModel_AllocatePairs (self, npairs, status);
+        if (*status != Status_Continue) {
+            return -1;
+        }
+    }
+    nfound = 0;
+    site   = self->vector->sites;
+    for (i = 0; i < self->vector->nsites; i++, site++) {
+        other = &self->vector->sites[i + 1];
+        for (j = i + 1; j < self->vector->nsites; j++, other++) {
+            if (EnergyModel_FindMaxInteraction (self, site, other) >= limit) {
+                if ((npairs > 0) && (nfound < npairs)) {
+                    EnergyModel_SetPair (self, nfound, i, j, status);
+                    if (*status != Status_Continue) {
+                        return -1;
+                    }
+                }
+                nfound++;
+            }
+        }
+    }
+    return nfound;
+}
+
+/*
+ * Set joint probabilities of all pairs to zero.
+ */
+void EnergyModel_ResetPairProbabilities (const EnergyModel *self) {
+    PairProbability *pair;
+    TitrSite        *siteA, *siteB;
+    Integer          i, j, nitems;
+
+    for (i = 0, pair = self->pairs; i < self->npairs; i++, pair++) {
+        if (pair->probabilities != NULL) {
+            siteA  = &self->vector->sites[pair->indexSiteA];
+            siteB  = &self->vector->sites[pair->indexSiteB];
+            nitems = (siteA->indexLast - siteA->indexFirst + 1) * (siteB->indexLast - siteB->indexFirst + 1);
+            for (j = 0; j < nitems; j++) {
+                pair->probabilities[j] = 0.0f;
+            }
+        }
+    }
+}
+
+/*
+ * Add the weight of a state to the joint probabilities of the "active" instances of each pair.
+ *
+ * The state vector does not have to be the private vector of the energy model,
+ * but its sites have to cover the same instances.
+ */
+void EnergyModel_UpdatePairProbabilities (const EnergyModel *self, const StateVector *vector, const Real weight) {
+    PairProbability *pair;
+    TitrSite        *siteA, *siteB;
+    Integer          i;
+
+    for (i = 0, pair = self->pairs; i < self->npairs; i++, pair++) {
+        if (pair->probabilities != NULL) {
+            siteA = &vector->sites[pair->indexSiteA];
+            siteB = &vector->sites[pair->indexSiteB];
+            pair->probabilities[(siteA->indexActive - siteA->indexFirst) * (siteB->indexLast - siteB->indexFirst + 1) + (siteB->indexActive - siteB->indexFirst)] += weight;
+        }
+    }
+}
+
+/*
+ * Scale joint probabilities of all pairs.
+ */
+void EnergyModel_ScalePairProbabilities (const EnergyModel *self, const Real scale) {
+    PairProbability *pair;
+    TitrSite        *siteA, *siteB;
+    Integer          i, j, nitems;
+
+    for (i = 0, pair = self->pairs; i < self->npairs; i++, pair++) {
+        if (pair->probabilities != NULL) {
+            siteA  = &self->vector->sites[pair->indexSiteA];
+            siteB  = &self->vector->sites[pair->indexSiteB];
+            nitems = (siteA->indexLast - siteA->indexFirst + 1) * (siteB->indexLast - siteB->indexFirst + 1);
+            for (j = 0; j < nitems; j++) {
+                pair->probabilities[j] *= scale;
+            }
+        }
+    }
+}
+
+/*
+ * Get the joint probability of two instances of a pair of sites.
+ * Instances are given by their global indices and have to belong to the first and second site, respectively.
+ */
+Real EnergyModel_GetPairProbability (const EnergyModel *self, const Integer indexPair, const Integer instIndexGlobalA, const Integer instIndexGlobalB) {
+    PairProbability *pair  = &self->pairs[indexPair];
+    TitrSite        *siteA = &self->vector->sites[pair->indexSiteA];
+    TitrSite        *siteB = &self->vector->sites[pair->indexSiteB];
+
+    return pair->probabilities[(instIndexGlobalA - siteA->indexFirst) * (siteB->indexLast - siteB->indexFirst + 1) + (instIndexGlobalB - siteB->indexFirst)];
+}
+
 /*
  * Getters.
  */
@@ -214,7 +554,7 @@ Real EnergyModel_CalculateMicrostateEnergy (const EnergyModel *self, const State
         Gintr     +=    Real1DArray_Item (self->intrinsic , site->indexActive);
         nprotons  += Integer1DArray_Item (self->protons   , site->indexActive);
 
-        interact   = EnergyModel_RowPointer (self, site->indexActive);
+        interact   = EnergyModel_DenseRow (self, site->indexActive);
         siteInner  = vector->sites;
         for (j = 0; j < i; j++, siteInner++) {
             W += *(interact + (siteInner->indexActive));
@@ -282,17 +622,32 @@ Real EnergyModel_CalculateZ (const EnergyModel *self,
 
 /*
  * Calculate the statistical mechanical partition function of an unfolded protein.
+ *
+ * Since there are no interactions in the unfolded state, the partition function
+ * is a product of partition functions of single sites. As in EnergyModel_CalculateZ,
+ * it is calculated relative to the lowest energy state.
  */
 Real EnergyModel_CalculateZunfolded (const EnergyModel *self, const Real pH, const Real Gzero, Status *status) {
-    Real1DArray *bfactors;
-    Real Z;
+    TitrSite *site;
+    Integer   i, index;
+    Real      G, Gmin, Zsite, Z, beta, potential;
 
-    bfactors = Real1DArray_Allocate (self->nstates, status);
-    if (*status != Status_Continue) {
-        return -1.0f;
+    beta      = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature);
+    potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature * CONSTANT_LN10 * pH;
+    Z         = 1.0f;
+    site      = self->vector->sites;
+    for (i = 0; i < self->vector->nsites; i++, site++) {
+        Gmin = EnergyModel_GetGmodelAtpH (self, site->indexFirst, potential);
+        for (index = site->indexFirst + 1; index <= site->indexLast; index++) {
+            G = EnergyModel_GetGmodelAtpH (self, index, potential);
+            if (G < Gmin) Gmin = G;
+        }
+        Zsite = 0.0f;
+        for (index = site->indexFirst; index <= site->indexLast; index++) {
+            Zsite += exp (-beta * (EnergyModel_GetGmodelAtpH (self, index, potential) - Gmin));
+        }
+        Z *= Zsite;
     }
-    Z = EnergyModel_CalculateZ (self, EnergyModel_CalculateMicrostateEnergyUnfolded, pH, Gzero, bfactors);
-    Real1DArray_Deallocate (&bfactors);
     return Z;
 }
 
@@ -321,6 +676,7 @@ void EnergyModel_CalculateProbabilitiesFromZ (const EnergyModel *self, const Rea
     TitrSite  *ts;
 
     Real1DArray_Set (self->probabilities, 0.0f);
+    EnergyModel_ResetPairProbabilities (self);
     StateVector_Reset (self->vector);
 
     i = self->nstates;
@@ -331,9 +687,13 @@ void EnergyModel_CalculateProbabilitiesFromZ (const EnergyModel *self, const Rea
         for (; j > 0; j--, ts++) {
             Real1DArray_Item (self->probabilities, ts->indexActive) += *bfactor;
         }
+        if (self->npairs > 0) {
+            EnergyModel_UpdatePairProbabilities (self, self->vector, *bfactor);
+        }
         StateVector_Increment (self->vector);
     }
     Real1DArray_Scale (self->probabilities, 1.0f / Z);
+    EnergyModel_ScalePairProbabilities (self, 1.0f / Z);
 }
 
 /*
@@ -353,19 +713,435 @@ void EnergyModel_CalculateProbabilitiesAnalytically (const EnergyModel *self, co
     Real1DArray_Deallocate (&bfactors);
 }
 
+/*
+ * Calculate probabilities of instances of an unfolded protein site by site.
+ */
+static void EnergyModel_ProbabilitiesUnfolded (const EnergyModel *self, const Real pH, Real *probabilities) {
+    TitrSite  *site;
+    Integer    i, index;
+    Real       G, Gmin, Zsite, beta, potential;
+
+    beta      = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature);
+    potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature * CONSTANT_LN10 * pH;
+    site      = self->vector->sites;
+    for (i = 0; i < self->vector->nsites; i++, site++) {
+        Gmin = EnergyModel_GetGmodelAtpH (self, site->indexFirst, potential);
+        for (index = site->indexFirst + 1; index <= site->indexLast; index++) {
+            G = EnergyModel_GetGmodelAtpH (self, index, potential);
+            if (G < Gmin) Gmin = G;
+        }
+        Zsite = 0.0f;
+        for (index = site->indexFirst; index <= site->indexLast; index++) {
+            G = exp (-beta * (EnergyModel_GetGmodelAtpH (self, index, potential) - Gmin));
+            probabilities[index] = G;
+            Zsite += G;
+        }
+        for (index = site->indexFirst; index <= site->indexLast; index++) {
+            probabilities[index] /= Zsite;
+        }
+    }
+}
+
 /*
  * Analytic evaluation of protonation state probabilities (unfolded protein).
+ *
+ * Sites are independent in the unfolded state, so probabilities are calculated site by site.
  */
 void EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (const EnergyModel *self, const Real pH, Status *status) {
-    Real1DArray *bfactors;
-    Real         Z;
+    PairProbability *pair;
+    TitrSite        *site, *other;
+    Integer          i, index, indexOther;
+    Real            *entry;
 
-    bfactors = Real1DArray_Allocate (self->nstates, status);
+    EnergyModel_ProbabilitiesUnfolded (self, pH, Real1DArray_Data (self->probabilities));
+
+    /* Joint probabilities of independent sites are products of probabilities */
+    for (i = 0, pair = self->pairs; i < self->npairs; i++, pair++) {
+        if (pair->probabilities != NULL) {
+            site  = &self->vector->sites[pair->indexSiteA];
+            other = &self->vector->sites[pair->indexSiteB];
+            entry = pair->probabilities;
+            for (index = site->indexFirst; index <= site->indexLast; index++) {
+                for (indexOther = other->indexFirst; indexOther <= other->indexLast; indexOther++, entry++) {
+                    *entry = Real1DArray_Item (self->probabilities, index) * Real1DArray_Item (self->probabilities, indexOther);
+                }
+            }
+        }
+    }
+}
+
+/*
+ * Allocate a private workspace for calculations of probabilities.
+ *
+ * Boltzmann factors of all states are only needed for folded proteins.
+ */
+EnergyModelWorkspace *EnergyModel_AllocateWorkspace (const EnergyModel *self, const Boolean unfolded, Status *status) {
+    EnergyModelWorkspace *workspace = NULL;
+
+    MEMORY_ALLOCATE (workspace, EnergyModelWorkspace);
+    if (workspace == NULL) {
+        goto failSet;
+    }
+    workspace->bfactors      = NULL ;
+    workspace->probabilities = NULL ;
+    workspace->vector        = StateVector_Clone (self->vector, status);
     if (*status != Status_Continue) {
+        EnergyModel_DeallocateWorkspace (workspace);
+        return NULL;
+    }
+    MEMORY_ALLOCATEARRAY (workspace->probabilities, self->ninstances, Real);
+    if (!unfolded) {
+        MEMORY_ALLOCATEARRAY (workspace->bfactors, self->nstates, Real);
+    }
+    if ((workspace->probabilities == NULL) || ((!unfolded) && (workspace->bfactors == NULL))) {
+        EnergyModel_DeallocateWorkspace (workspace);
+        goto failSet;
+    }
+    return workspace;
+
+failSet:
+    Status_Set (status, Status_MemoryAllocationFailure);
+    return NULL;
+}
+
+/*
+ * Deallocate a workspace.
+ */
+void EnergyModel_DeallocateWorkspace (EnergyModelWorkspace *workspace) {
+    if ( workspace->vector        != NULL)  StateVector_Deallocate (  workspace->vector        ) ;
+    if ( workspace->bfactors      != NULL)  MEMORY_DEALLOCATE      (  workspace->bfactors      ) ;
+    if ( workspace->probabilities != NULL)  MEMORY_DEALLOCATE      (  workspace->probabilities ) ;
+    if (workspace != NULL) MEMORY_DEALLOCATE (workspace);
+}
+
+/*
+ * Analytic evaluation of protonation state probabilities in a private workspace.
+ *
+ * Only the state vector, Boltzmann factors and probabilities of the workspace are written,
+ * so that calculations at several pH-values can share the energy model and run in parallel.
+ * Joint probabilities of pairs are not calculated.
+ */
+void EnergyModel_CalculateWorkspaceProbabilities (const EnergyModel *self, const Real pH, const EnergyModelWorkspace *workspace) {
+    StateVector *vector = workspace->vector;
+    TitrSite    *ts;
+    Real        *bfactor, G, Gmin, Z, scale;
+    Integer      i, j;
+
+    StateVector_Reset (vector);
+    bfactor = workspace->bfactors;
+    Gmin    = EnergyModel_CalculateMicrostateEnergy (self, vector, pH);
+    for (i = 0; i < self->nstates; i++, bfactor++) {
+        G = EnergyModel_CalculateMicrostateEnergy (self, vector, pH);
+        if (G < Gmin) {
+            Gmin = G;
+        }
+        *bfactor = G;
+        StateVector_Increment (vector);
+    }
+    scale   = -1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature);
+    Z       = 0.0f;
+    bfactor = workspace->bfactors;
+    for (i = 0; i < self->nstates; i++, bfactor++) {
+        *bfactor = exp ((*bfactor - Gmin) * scale);
+        Z += *bfactor;
+    }
+
+    for (i = 0; i < self->ninstances; i++) {
+        workspace->probabilities[i] = 0.0f;
+    }
+    StateVector_Reset (vector);
+    bfactor = workspace->bfactors;
+    for (i = 0; i < self->nstates; i++, bfactor++) {
+        for (j = 0, ts = vector->sites; j < vector->nsites; j++, ts++) {
+            workspace->probabilities[ts->indexActive] += *bfactor;
+        }
+        StateVector_Increment (vector);
+    }
+    for (i = 0; i < self->ninstances; i++) {
+        workspace->probabilities[i] /= Z;
+    }
+}
+
+/*
+ * Analytic evaluation of protonation state probabilities of an unfolded protein in a private workspace.
+ */
+void EnergyModel_CalculateWorkspaceProbabilitiesUnfolded (const EnergyModel *self, const Real pH, const EnergyModelWorkspace *workspace) {
+    EnergyModel_ProbabilitiesUnfolded (self, pH, workspace->probabilities);
+}
+
+/*
+ * Calculate the binding polynomial, i.e. the partition function at pH 0 split by the number of bound protons.
+ *
+ * The partition function at any pH is then Z(pH) = sum_n exp (logTerms[n]) * 10^(-n pH).
+ * Terms that have no states are set to -HUGE_VAL.
+ *
+ * For a folded protein, all states are enumerated once. For an unfolded protein, the polynomial
+ * is a product of polynomials of independent sites.
+ *
+ * Note: logTerms should be allocated beforehand, with a length of at least the maximum number of protons plus one.
+ */
+void EnergyModel_CalculateBindingPolynomial (const EnergyModel *self, const Boolean unfolded, Real1DArray *logTerms, Status *status) {
+    StateVector *vector = self->vector;
+    TitrSite    *site;
+    Real        *maxima = NULL, *sums = NULL, beta, value;
+    Integer      nterms, nprotons, i, j, n, index;
+
+    nterms = 1;
+    for (i = 0, site = vector->sites; i < vector->nsites; i++, site++) {
+        nprotons = 0;
+        for (index = site->indexFirst; index <= site->indexLast; index++) {
+            if (Integer1DArray_Item (self->protons, index) > nprotons) nprotons = Integer1DArray_Item (self->protons, index);
+        }
+        nterms += nprotons;
+    }
+    if (Real1DArray_Length (logTerms) < nterms) {
+        Status_Set (status, Status_ArrayNonConformableSizes);
         return;
     }
-    Z = EnergyModel_CalculateZ (self, EnergyModel_CalculateMicrostateEnergyUnfolded, pH, 0.0f, bfactors);
-    EnergyModel_CalculateProbabilitiesFromZ (self, Z, bfactors);
+    MEMORY_ALLOCATEARRAY (maxima , nterms , Real);
+    MEMORY_ALLOCATEARRAY (sums   , nterms , Real);
+    if ((maxima == NULL) || (sums == NULL)) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        goto finish;
+    }
+    beta = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature);
+    Real1DArray_Set (logTerms, -HUGE_VAL);
 
-    Real1DArray_Deallocate (&bfactors);
+    if (unfolded) {
+        /* Multiply polynomials of sites */
+        Real1DArray_Item (logTerms, 0) = 0.0f;
+        nterms = 1;
+        for (i = 0, site = vector->sites; i < vector->nsites; i++, site++) {
+            nprotons = 0;
+            for (index = site->indexFirst; index <= site->indexLast; index++) {
+                if (Integer1DArray_Item (self->protons, index) > nprotons) nprotons = Integer1DArray_Item (self->protons, index);
+            }
+            for (n = 0; n < nterms + nprotons; n++) {
+                maxima[n] = -HUGE_VAL;
+                sums  [n] = 0.0f;
+            }
+            for (j = 0; j < nterms; j++) {
+                if (Real1DArray_Item (logTerms, j) == -HUGE_VAL) continue;
+                for (index = site->indexFirst; index <= site->indexLast; index++) {
+                    n     = j + Integer1DArray_Item (self->protons, index);
+                    value = Real1DArray_Item (logTerms, j) - beta * Real1DArray_Item (self->models, index);
+                    if (value > maxima[n]) {
+                        sums  [n] = sums[n] * exp (maxima[n] - value) + 1.0f;
+                        maxima[n] = value;
+                    }
+                    else {
+                        sums  [n] += exp (value - maxima[n]);
+                    }
+                }
+            }
+            nterms += nprotons;
+            for (n = 0; n < nterms; n++) {
+                Real1DArray_Item (logTerms, n) = (sums[n] > 0.0f) ? (maxima[n] + log (sums[n])) : -HUGE_VAL;
+            }
+        }
+    }
+    else {
+        /* Enumerate all states at pH 0 */
+        for (n = 0; n < nterms; n++) {
+            maxima[n] = -HUGE_VAL;
+            sums  [n] = 0.0f;
+        }
+        StateVector_Reset (vector);
+        for (i = self->nstates; i > 0; i--) {
+            value = -beta * EnergyModel_CalculateMicrostateEnergy (self, vector, 0.0f);
+            n     = 0;
+            for (j = 0, site = vector->sites; j < vector->nsites; j++, site++) {
+                n += Integer1DArray_Item (self->protons, site->indexActive);
+            }
+            if (value > maxima[n]) {
+                sums  [n] = sums[n] * exp (maxima[n] - value) + 1.0f;
+                maxima[n] = value;
+            }
+            else {
+                sums  [n] += exp (value - maxima[n]);
+            }
+            StateVector_Increment (vector);
+        }
+        for (n = 0; n < nterms; n++) {
+            if (sums[n] > 0.0f) Real1DArray_Item (logTerms, n) = maxima[n] + log (sums[n]);
+        }
+    }
+
+finish:
+    if (maxima != NULL) MEMORY_DEALLOCATE (maxima);
+    if (sums   != NULL) MEMORY_DEALLOCATE (sums);
+}
+
+/*
+ * Workspace of the pruned enumeration.
+ */
+typedef struct {
+    /* Energies of instances at the given pH (Gintr and the proton term) */
+    Real    *energies;
+    /* Interactions of instances with the sites assigned so far */
+    Real    *field;
+    /* Lower bounds of interactions of instances with the sites following them */
+    Real    *tails;
+    /* Order in which instances of each site are visited */
+    Integer *order;
+    /* Inverse temperature, logarithm of the tolerance */
+    Real     beta, logTolerance;
+    /* Reference energy and the partition function relative to it */
+    Real     Gref, Z;
+    /* Number of visited states */
+    Integer  nvisited;
+} PruningWorkspace;
+
+/*
+ * Visit all instances of the site at the given depth, and descend to the next site.
+ *
+ * A branch is cut when an upper bound of its contribution is less than the tolerance times
+ * the current partition function. The bound is obtained by replacing interactions between
+ * sites that remain to be assigned with their lowest values, so that these sites become independent.
+ */
+static void EnergyModel_Branch (const EnergyModel *self, PruningWorkspace *work, const Integer depth, const Real G) {
+    StateVector *vector = self->vector;
+    TitrSite    *site, *other;
+    Integer      i, j, a, b, k;
+    Real        *probability, *row, lower, bound, scale, w;
+
+    if (depth >= vector->nsites) {
+        if (work->nvisited < 1) {
+            work->Gref = G;
+        }
+        else if (G < work->Gref) {
+            scale = exp (-work->beta * (work->Gref - G));
+            work->Z *= scale;
+            Real1DArray_Scale (self->probabilities, scale);
+            EnergyModel_ScalePairProbabilities (self, scale);
+            work->Gref = G;
+        }
+        w = exp (-work->beta * (G - work->Gref));
+        work->Z += w;
+        probability = Real1DArray_Data (self->probabilities);
+        for (i = 0, site = vector->sites; i < vector->nsites; i++, site++) {
+            probability[site->indexActive] += w;
+        }
+        if (self->npairs > 0) {
+            EnergyModel_UpdatePairProbabilities (self, vector, w);
+        }
+        work->nvisited++;
+        return;
+    }
+
+    /* Estimate the largest possible contribution of the branch, treating remaining sites as independent */
+    if (work->nvisited > 0) {
+        bound = -work->beta * (G - work->Gref);
+        for (i = depth, other = &vector->sites[depth]; i < vector->nsites; i++, other++) {
+            lower = work->energies[other->indexFirst] + work->field[other->indexFirst] + work->tails[other->indexFirst];
+            for (b = other->indexFirst + 1; b <= other->indexLast; b++) {
+                w = work->energies[b] + work->field[b] + work->tails[b];
+                if (w < lower) lower = w;
+            }
+            scale = 0.0f;
+            for (b = other->indexFirst; b <= other->indexLast; b++) {
+                scale += exp (-work->beta * (work->energies[b] + work->field[b] + work->tails[b] - lower));
+            }
+            bound += log (scale) - work->beta * lower;
+        }
+        if (bound < work->logTolerance + log (work->Z)) {
+            return;
+        }
+    }
+
+    /* Visit instances starting from the lowest in energy */
+    site = &vector->sites[depth];
+    for (a = site->indexFirst; a <= site->indexLast; a++) {
+        w = work->energies[a] + work->field[a];
+        for (k = a; k > site->indexFirst; k--) {
+            j = work->order[k - 1];
+            if (work->energies[j] + work->field[j] <= w) break;
+            work->order[k] = j;
+        }
+        work->order[k] = a;
+    }
+    for (k = site->indexFirst; k <= site->indexLast; k++) {
+        a = work->order[k];
+        site->indexActive = a;
+        w = G + work->energies[a] + work->field[a];
+        row = EnergyModel_DenseRow (self, a);
+        for (b = site->indexLast + 1; b < self->ninstances; b++) {
+            work->field[b] += row[b];
+        }
+        EnergyModel_Branch (self, work, depth + 1, w);
+        for (b = site->indexLast + 1; b < self->ninstances; b++) {
+            work->field[b] -= row[b];
+        }
+    }
+}
+
+/*
+ * Evaluate protonation state probabilities by depth-first enumeration with pruning of negligible states.
+ *
+ * Sites are assumed to occupy consecutive ranges of instances in the order of the state vector.
+ * With zero tolerance, the enumeration is complete and the results are exact.
+ *
+ * Returns the number of visited states. The logarithm of the partition function is written to logZ.
+ */
+Integer EnergyModel_CalculateProbabilitiesPruned (const EnergyModel *self, const Real pH, const Real tolerance, Real *logZ, Status *status) {
+    PruningWorkspace  work;
+    StateVector      *vector = self->vector;
+    TitrSite         *site, *other;
+    Integer           i, j, a, b, nsites = vector->nsites;
+    Real              potential, lower;
+
+    work.nvisited = 0;
+    work.energies = NULL;
+    work.field    = NULL;
+    work.tails    = NULL;
+    work.order    = NULL;
+    MEMORY_ALLOCATEARRAY (work.energies , self->ninstances , Real);
+    MEMORY_ALLOCATEARRAY (work.field    , self->ninstances , Real);
+    MEMORY_ALLOCATEARRAY (work.order    , self->ninstances , Integer);
+    MEMORY_ALLOCATEARRAY (work.tails    , self->ninstances , Real);
+    if ((work.energies == NULL) || (work.field == NULL) || (work.order == NULL) || (work.tails == NULL)) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        goto finish;
+    }
+
+    potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature * CONSTANT_LN10 * pH;
+    for (a = 0; a < self->ninstances; a++) {
+        work.energies[a] = Real1DArray_Item (self->intrinsic, a) - Integer1DArray_Item (self->protons, a) * potential;
+        work.field[a]    = 0.0f;
+    }
+
+    /* Lower bounds of interactions of each instance with the following sites */
+    for (i = 0, site = vector->sites; i < nsites; i++, site++) {
+        for (a = site->indexFirst; a <= site->indexLast; a++) {
+            work.tails[a] = 0.0f;
+            for (j = i + 1, other = &vector->sites[i + 1]; j < nsites; j++, other++) {
+                lower = EnergyModel_GetWdense (self, a, other->indexFirst);
+                for (b = other->indexFirst + 1; b <= other->indexLast; b++) {
+                    if (EnergyModel_GetWdense (self, a, b) < lower) lower = EnergyModel_GetWdense (self, a, b);
+                }
+                work.tails[a] += lower;
+            }
+        }
+    }
+
+    work.beta         = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature);
+    work.logTolerance = (tolerance > 0.0f) ? log (tolerance) : -HUGE_VAL;
+    work.Gref         = 0.0f;
+    work.Z            = 0.0f;
+    work.nvisited     = 0;
+    Real1DArray_Set (self->probabilities, 0.0f);
+    EnergyModel_ResetPairProbabilities (self);
+
+    EnergyModel_Branch (self, &work, 0, 0.0f);
+
+    Real1DArray_Scale (self->probabilities, 1.0f / work.Z);
+    EnergyModel_ScalePairProbabilities (self, 1.0f / work.Z);
+    *logZ = log (work.Z) - work.beta * work.Gref;
+
+finish:
+    if (work.energies != NULL) MEMORY_DEALLOCATE (work.energies);
+    if (work.field    != NULL) MEMORY_DEALLOCATE (work.field);
+    if (work.order    != NULL) MEMORY_DEALLOCATE (work.order);
+    if (work.tails    != NULL) MEMORY_DEALLOCATE (work.tails);
+    return work.nvisited;
 }
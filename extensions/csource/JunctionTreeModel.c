@@ -0,0 +1,450 @@
+/*------------------------------------------------------------------------------
+! . File      : JunctionTreeModel.c
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#include "JunctionTreeModel.h"
+
+#define TitrSite_Count(site) ((site)->indexLast - (site)->indexFirst + 1)
+
+
+/*
+ * Allocate the junction tree model.
+ * The decomposition itself is done after linking to the energy model.
+ */
+JunctionTreeModel *JunctionTreeModel_Allocate (const Real cutoff, const Integer maxStates, Status *status) {
+    JunctionTreeModel *self = NULL;
+
+    MEMORY_ALLOCATE (self, JunctionTreeModel);
+    if (self == NULL) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        return NULL;
+    }
+    self->cutoff      = cutoff    ;
+    self->maxStates   = maxStates ;
+    self->width       = -1        ;
+    self->largest     = 0         ;
+    self->nedges      = 0         ;
+    self->ncliques    = 0         ;
+    self->logZ        = 0.0f      ;
+    self->isTractable = False     ;
+    self->order       = NULL      ;
+    self->cliques     = NULL      ;
+    self->indices     = NULL      ;
+    self->counters    = NULL      ;
+    self->strides     = NULL      ;
+    self->work        = NULL      ;
+    self->energyModel = NULL      ;
+    return self;
+}
+
+/*
+ * Deallocate the tables and cliques of the tree.
+ */
+static void JunctionTreeModel_DeallocateTree (JunctionTreeModel *self) {
+    Clique  *clique;
+    Integer  i;
+
+    if (self->cliques != NULL) {
+        clique = self->cliques;
+        for (i = 0; i < self->ncliques; i++, clique++) {
+            if (clique->sites   != NULL) MEMORY_DEALLOCATE (clique->sites   );
+            if (clique->radix   != NULL) MEMORY_DEALLOCATE (clique->radix   );
+            if (clique->coupled != NULL) MEMORY_DEALLOCATE (clique->coupled );
+            if (clique->belief  != NULL) MEMORY_DEALLOCATE (clique->belief  );
+            if (clique->message != NULL) MEMORY_DEALLOCATE (clique->message );
+        }
+        MEMORY_DEALLOCATE (self->cliques);
+    }
+    if (self->order    != NULL) MEMORY_DEALLOCATE (self->order    );
+    if (self->indices  != NULL) MEMORY_DEALLOCATE (self->indices  );
+    if (self->counters != NULL) MEMORY_DEALLOCATE (self->counters );
+    if (self->strides  != NULL) MEMORY_DEALLOCATE (self->strides  );
+    if (self->work     != NULL) MEMORY_DEALLOCATE (self->work     );
+    self->ncliques    = 0;
+    self->isTractable = False;
+}
+
+/*
+ * Deallocate the junction tree model, including its cliques.
+ */
+void JunctionTreeModel_Deallocate (JunctionTreeModel *self) {
+    if (self != NULL) {
+        JunctionTreeModel_DeallocateTree (self);
+        MEMORY_DEALLOCATE (self);
+    }
+}
+
+/*
+ * Link the junction tree and energy models, and decompose the graph of sites.
+ *
+ * Two sites are connected in the graph if their maximum absolute interaction exceeds the cutoff.
+ * Sites are eliminated greedily by the minimum fill-in heuristic, ties are broken by the number
+ * of states of the resulting clique. Each eliminated site gives a clique made of the site and
+ * its remaining neighbours. The parent of a clique is the clique of the first eliminated site
+ * of its separator.
+ *
+ * False is returned if any clique exceeds maxStates. In this case, the tree cannot be used.
+ */
+Boolean JunctionTreeModel_LinkToEnergyModel (JunctionTreeModel *self, EnergyModel *energyModel, Status *status) {
+    StateVector *vector = energyModel->vector;
+    TitrSite    *sites  = vector->sites;
+    Integer      nsites = vector->nsites;
+    Boolean     *graph = NULL, *coupled = NULL, *eliminated = NULL;
+    Integer     *position = NULL;
+    Integer      step, i, j, k, v, a, b, fill, states, best, bestFill, bestStates, first;
+    Clique      *clique;
+
+    JunctionTreeModel_DeallocateTree (self);
+    self->energyModel = energyModel;
+    if (nsites < 1) {
+        return False;
+    }
+    MEMORY_ALLOCATEARRAY (graph      , nsites * nsites , Boolean);
+    MEMORY_ALLOCATEARRAY (coupled    , nsites * nsites , Boolean);
+    MEMORY_ALLOCATEARRAY (eliminated , nsites          , Boolean);
+    MEMORY_ALLOCATEARRAY (position   , nsites          , Integer);
+    MEMORY_ALLOCATEARRAY (self->order    , nsites , Integer);
+    MEMORY_ALLOCATEARRAY (self->cliques  , nsites , Clique );
+    MEMORY_ALLOCATEARRAY (self->counters , nsites , Integer);
+    MEMORY_ALLOCATEARRAY (self->strides  , nsites , Integer);
+    if ((graph == NULL) || (coupled == NULL) || (eliminated == NULL) || (position == NULL) ||
+            (self->order == NULL) || (self->cliques == NULL) || (self->counters == NULL) || (self->strides == NULL)) {
+        goto failSet;
+    }
+    self->ncliques = nsites;
+    for (i = 0, clique = self->cliques; i < nsites; i++, clique++) {
+        clique->nsites  = 0;
+        clique->sites   = NULL;
+        clique->radix   = NULL;
+        clique->coupled = NULL;
+        clique->belief  = NULL;
+        clique->message = NULL;
+    }
+
+    /* Build the graph of strongly interacting sites */
+    self->nedges = 0;
+    for (i = 0; i < nsites; i++) {
+        eliminated[i] = False;
+        for (j = 0; j < i; j++) {
+            if (EnergyModel_FindMaxInteraction (energyModel, &sites[i], &sites[j]) > self->cutoff) {
+                graph[i * nsites + j] = graph[j * nsites + i] = True;
+                self->nedges++;
+            }
+            else {
+                graph[i * nsites + j] = graph[j * nsites + i] = False;
+            }
+        }
+        graph[i * nsites + i] = False;
+    }
+    memcpy (coupled, graph, nsites * nsites * sizeof (Boolean));
+
+    /* Eliminate sites */
+    self->width   = 0;
+    self->largest = 0;
+    for (step = 0; step < nsites; step++) {
+        best       = -1;
+        bestFill   = 0;
+        bestStates = 0;
+        for (v = 0; v < nsites; v++) {
+            if (eliminated[v]) continue;
+            fill   = 0;
+            states = TitrSite_Count (&sites[v]);
+            for (a = 0; a < nsites; a++) {
+                if (eliminated[a] || (!graph[v * nsites + a])) continue;
+                states = (states > self->maxStates) ? states : states * TitrSite_Count (&sites[a]);
+                for (b = 0; b < a; b++) {
+                    if (eliminated[b] || (!graph[v * nsites + b])) continue;
+                    if (!graph[a * nsites + b]) fill++;
+                }
+            }
+            if ((best < 0) || (fill < bestFill) || ((fill == bestFill) && (states < bestStates))) {
+                best       = v;
+                bestFill   = fill;
+                bestStates = states;
+            }
+        }
+        if (bestStates > self->maxStates) {
+            goto failDealloc;
+        }
+        v = best;
+        self->order[step] = v;
+        position[v]       = step;
+        eliminated[v]     = True;
+
+        /* Create the clique of the eliminated site */
+        clique = &self->cliques[v];
+        clique->nsites = 1;
+        for (a = 0; a < nsites; a++) {
+            if ((!eliminated[a]) && graph[v * nsites + a]) clique->nsites++;
+        }
+        MEMORY_ALLOCATEARRAY (clique->sites   , clique->nsites , Integer);
+        MEMORY_ALLOCATEARRAY (clique->radix   , clique->nsites , Integer);
+        MEMORY_ALLOCATEARRAY (clique->coupled , clique->nsites , Boolean);
+        if ((clique->sites == NULL) || (clique->radix == NULL) || (clique->coupled == NULL)) {
+            goto failSet;
+        }
+        clique->sites   [0] = v;
+        clique->radix   [0] = TitrSite_Count (&sites[v]);
+        clique->coupled [0] = False;
+        for (a = 0, k = 1; a < nsites; a++) {
+            if ((!eliminated[a]) && graph[v * nsites + a]) {
+                clique->sites   [k] = a;
+                clique->radix   [k] = TitrSite_Count (&sites[a]);
+                clique->coupled [k] = coupled[v * nsites + a];
+                k++;
+            }
+        }
+        clique->size = bestStates;
+        if (clique->size > self->largest)    self->largest = clique->size;
+        if (clique->nsites - 1 > self->width) self->width   = clique->nsites - 1;
+
+        /* Connect the remaining neighbours (fill-in) */
+        for (j = 1; j < clique->nsites; j++) {
+            for (k = 1; k < j; k++) {
+                a = clique->sites[j];
+                b = clique->sites[k];
+                graph[a * nsites + b] = graph[b * nsites + a] = True;
+            }
+        }
+    }
+
+    /* Set up parents and allocate tables */
+    for (v = 0; v < nsites; v++) {
+        clique = &self->cliques[v];
+        clique->parent = -1;
+        first = nsites;
+        for (k = 1; k < clique->nsites; k++) {
+            if (position[clique->sites[k]] < first) {
+                first = position[clique->sites[k]];
+                clique->parent = clique->sites[k];
+            }
+        }
+        MEMORY_ALLOCATEARRAY (clique->belief  , clique->size                    , Real);
+        MEMORY_ALLOCATEARRAY (clique->message , clique->size / clique->radix[0] , Real);
+        if ((clique->belief == NULL) || (clique->message == NULL)) {
+            goto failSet;
+        }
+    }
+    MEMORY_ALLOCATEARRAY (self->indices , self->largest     , Integer);
+    MEMORY_ALLOCATEARRAY (self->work    , self->largest * 3 , Real);
+    if ((self->indices == NULL) || (self->work == NULL)) {
+        goto failSet;
+    }
+    self->isTractable = True;
+
+    MEMORY_DEALLOCATE (graph);
+    MEMORY_DEALLOCATE (coupled);
+    MEMORY_DEALLOCATE (eliminated);
+    MEMORY_DEALLOCATE (position);
+    return True;
+
+failSet:
+    Status_Set (status, Status_MemoryAllocationFailure);
+failDealloc:
+    if (graph      != NULL) MEMORY_DEALLOCATE (graph);
+    if (coupled    != NULL) MEMORY_DEALLOCATE (coupled);
+    if (eliminated != NULL) MEMORY_DEALLOCATE (eliminated);
+    if (position   != NULL) MEMORY_DEALLOCATE (position);
+    return False;
+}
+
+/*
+ * For each entry of the clique table, find the corresponding entry of a table
+ * defined over a subset of sites of the clique. The subset table is laid out
+ * in the order of the subset, with the first site changing fastest.
+ */
+static void JunctionTreeModel_Project (const JunctionTreeModel *self, const Clique *clique,
+                                       const Integer nsubset, const Integer *subset, const Integer *radix) {
+    Integer *counters = self->counters, *strides = self->strides, *indices = self->indices;
+    Integer  i, k, m, stride, index;
+
+    for (k = 0; k < clique->nsites; k++) {
+        counters[k] = 0;
+        strides [k] = 0;
+    }
+    stride = 1;
+    for (m = 0; m < nsubset; m++) {
+        for (k = 0; k < clique->nsites; k++) {
+            if (clique->sites[k] == subset[m]) {
+                strides[k] = stride;
+                break;
+            }
+        }
+        stride *= radix[m];
+    }
+    index = 0;
+    for (i = 0; i < clique->size; i++) {
+        indices[i] = index;
+        for (k = 0; k < clique->nsites; k++) {
+            counters[k]++;
+            index += strides[k];
+            if (counters[k] < clique->radix[k]) break;
+            index -= strides[k] * clique->radix[k];
+            counters[k] = 0;
+        }
+    }
+}
+
+/*
+ * Marginalize a clique table onto a subset of its sites in log-space, optionally
+ * subtracting a table defined over the same subset.
+ *
+ * The projection has to be done beforehand.
+ */
+static void JunctionTreeModel_Marginalize (const JunctionTreeModel *self, const Clique *clique,
+                                           const Integer length, const Real *subtract, Real *marginal) {
+    Real    *maxima = self->work, *sums = &self->work[length];
+    Integer *indices = self->indices;
+    Integer  i, s;
+    Real     value;
+
+    for (s = 0; s < length; s++) {
+        maxima[s] = -HUGE_VAL;
+        sums  [s] = 0.0f;
+    }
+    for (i = 0; i < clique->size; i++) {
+        s     = indices[i];
+        value = clique->belief[i];
+        if (subtract != NULL) value -= subtract[s];
+        if (value > maxima[s]) {
+            sums  [s] = sums[s] * exp (maxima[s] - value) + 1.0f;
+            maxima[s] = value;
+        }
+        else {
+            sums  [s] += exp (value - maxima[s]);
+        }
+    }
+    for (s = 0; s < length; s++) {
+        marginal[s] = maxima[s] + log (sums[s]);
+    }
+}
+
+/*
+ * Set the clique belief to its potential, i.e. the intrinsic energy of the eliminated
+ * site and its interactions with the coupled sites of the separator (in units of -RT).
+ */
+static void JunctionTreeModel_SetPotential (const JunctionTreeModel *self, Clique *clique, const Real pH) {
+    EnergyModel *energyModel = self->energyModel;
+    TitrSite    *sites = energyModel->vector->sites;
+    Integer     *counters = self->counters;
+    Integer      i, k, instance, other;
+    Real         G, beta, potential;
+
+    beta      = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * energyModel->temperature);
+    potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * energyModel->temperature * CONSTANT_LN10 * pH;
+
+    for (k = 0; k < clique->nsites; k++) {
+        counters[k] = 0;
+    }
+    for (i = 0; i < clique->size; i++) {
+        instance = sites[clique->sites[0]].indexFirst + counters[0];
+        G = Real1DArray_Item (energyModel->intrinsic, instance) - Integer1DArray_Item (energyModel->protons, instance) * potential;
+        for (k = 1; k < clique->nsites; k++) {
+            if (clique->coupled[k]) {
+                other = sites[clique->sites[k]].indexFirst + counters[k];
+                G += EnergyModel_GetWdense (energyModel, instance, other);
+            }
+        }
+        clique->belief[i] = -beta * G;
+
+        for (k = 0; k < clique->nsites; k++) {
+            if (++counters[k] < clique->radix[k]) break;
+            counters[k] = 0;
+        }
+    }
+}
+
+/*
+ * Calculate the partition function and probabilities of instances by message passing.
+ *
+ * Messages are first collected from the leaves to the roots, in the order of elimination,
+ * and then distributed back to the leaves. The probabilities of instances of each site
+ * are obtained from the belief of its clique.
+ *
+ * The logarithm of the partition function is returned.
+ */
+Real JunctionTreeModel_CalculateProbabilities (JunctionTreeModel *self, const Real pH) {
+    EnergyModel *energyModel = self->energyModel;
+    TitrSite    *site;
+    Clique      *clique, *parent;
+    Integer      step, i, s, a, nmessage, radix;
+    Real        *belief, maximum, total, logZ;
+
+    for (i = 0; i < self->ncliques; i++) {
+        JunctionTreeModel_SetPotential (self, &self->cliques[i], pH);
+    }
+
+    /* Collect messages */
+    logZ = 0.0f;
+    for (step = 0; step < self->ncliques; step++) {
+        clique   = &self->cliques[self->order[step]];
+        radix    = clique->radix[0];
+        nmessage = clique->size / radix;
+        belief   = clique->belief;
+        for (s = 0; s < nmessage; s++, belief += radix) {
+            maximum = belief[0];
+            for (a = 1; a < radix; a++) {
+                if (belief[a] > maximum) maximum = belief[a];
+            }
+            total = 0.0f;
+            for (a = 0; a < radix; a++) {
+                total += exp (belief[a] - maximum);
+            }
+            clique->message[s] = maximum + log (total);
+        }
+        if (clique->parent < 0) {
+            logZ += clique->message[0];
+        }
+        else {
+            parent = &self->cliques[clique->parent];
+            JunctionTreeModel_Project (self, parent, clique->nsites - 1, &clique->sites[1], &clique->radix[1]);
+            for (i = 0; i < parent->size; i++) {
+                parent->belief[i] += clique->message[self->indices[i]];
+            }
+        }
+    }
+
+    /* Distribute messages */
+    for (step = self->ncliques - 1; step >= 0; step--) {
+        clique = &self->cliques[self->order[step]];
+        if (clique->parent >= 0) {
+            parent   = &self->cliques[clique->parent];
+            radix    = clique->radix[0];
+            nmessage = clique->size / radix;
+            JunctionTreeModel_Project (self, parent, clique->nsites - 1, &clique->sites[1], &clique->radix[1]);
+            /* The message from the parent replaces the message to the parent */
+            JunctionTreeModel_Marginalize (self, parent, nmessage, clique->message, clique->message);
+            for (i = 0; i < clique->size; i++) {
+                clique->belief[i] += clique->message[i / radix];
+            }
+        }
+    }
+
+    /* Calculate probabilities of instances */
+    for (i = 0; i < self->ncliques; i++) {
+        clique = &self->cliques[i];
+        site   = &energyModel->vector->sites[i];
+        radix  = clique->radix[0];
+        for (s = 0; s < clique->size; s++) {
+            self->indices[s] = s % radix;
+        }
+        belief = &self->work[2 * self->largest];
+        JunctionTreeModel_Marginalize (self, clique, radix, NULL, belief);
+        maximum = belief[0];
+        for (a = 1; a < radix; a++) {
+            if (belief[a] > maximum) maximum = belief[a];
+        }
+        total = 0.0f;
+        for (a = 0; a < radix; a++) {
+            total += exp (belief[a] - maximum);
+        }
+        for (a = 0; a < radix; a++) {
+            Real1DArray_Item (energyModel->probabilities, site->indexFirst + a) = exp (belief[a] - maximum) / total;
+        }
+    }
+    self->logZ = logZ;
+    return logZ;
+}
@@ -12,6 +12,7 @@
  */
 MCModelDefault *MCModelDefault_Allocate (const Real limit, const Integer nequil, 
                                          const Integer nprod, const Integer randomSeed, 
+                                         const Integer nchains, const Integer nthreads, 
                                          Status *status) {
     MCModelDefault *self = NULL;
 
@@ -22,19 +23,61 @@ MCModelDefault *MCModelDefault_Allocate (const Real limit, const Integer nequil,
     self->limit       = limit  ;
     self->nprod       = nprod  ;
     self->nequil      = nequil ;
+    self->nequilWarm  = nequil ;
+    self->field       = NULL   ;
     self->vector      = NULL   ;
     self->energyModel = NULL   ;
+    self->nchains     = nchains  > 1 ? nchains  : 1 ;
+    self->nthreads    = nthreads > 0 ? nthreads : 0 ;
+    self->chains             = NULL ;
+    self->probabilities      = NULL ;
+    self->chainProbabilities = NULL ;
+    self->rhat               = NULL ;
+    self->errors             = NULL ;
+    self->lockstep           = False;
+    self->actives            = NULL ;
+    self->fields             = NULL ;
+    self->instancesOld       = NULL ;
+    self->instancesNew       = NULL ;
+    self->swapsAttempted     = NULL ;
+    self->swapsAccepted      = NULL ;
+    self->heatBath           = False;
+    self->raoBlackwell       = False;
+    self->weights            = NULL ;
+    self->clusterLimit       = limit;
+    self->maxClusterSize     = 0    ;
+    self->nclusters          = 0    ;
+    self->clusterSites       = NULL ;
+    self->clusterOffsets     = NULL ;
+    self->clusterStates      = NULL ;
+    self->clusterInstances   = NULL ;
+    self->targetError        = 0.0f ;
+    self->maxScans           = 0    ;
+    self->blockCounts        = NULL ;
+    self->blockEnergies      = NULL ;
+    self->nscansDiscarded    = 0    ;
+    self->nscansUsed         = 0    ;
+    self->accumulatePairs    = False;
+    self->microstates        = NULL ;
+    self->maxMicrostates     = 0    ;
+    self->reweighting        = False;
+    self->maxProtons         = 0    ;
+    self->protonCounts       = NULL ;
+    self->protonInstances    = NULL ;
+    self->checkpointFrequency = 0   ;
+    self->privateProbabilities = NULL ;
 
     self->generator   = RandomNumberGenerator_Allocate (RandomNumberGeneratorType_MersenneTwister);
     if (self->generator == NULL) {
         goto failSetDealloc;
     }
     if (randomSeed <= 0) {
-        RandomNumberGenerator_SetSeed (self->generator, (Cardinal) time (NULL));
+        self->seed = (Cardinal) time (NULL);
     }
     else {
-        RandomNumberGenerator_SetSeed (self->generator, (Cardinal) randomSeed);
+        self->seed = (Cardinal) randomSeed;
     }
+    RandomNumberGenerator_SetSeed (self->generator, self->seed);
     return self;
 
 failSetDealloc:
@@ -49,8 +92,37 @@ failSet:
  * Deallocate Monte Carlo model.
  */
 void MCModelDefault_Deallocate (MCModelDefault *self) {
+    Integer k;
+
+    if (self->chains != NULL) {
+        for (k = 0; k < self->nchains; k++) {
+            if (self->chains[k] != NULL) MCModelDefault_Deallocate (self->chains[k]);
+        }
+        MEMORY_DEALLOCATE (self->chains);
+    }
+    if ( self->chainProbabilities != NULL)  MEMORY_DEALLOCATE                (  self->chainProbabilities ) ;
+    if ( self->actives         != NULL)  MEMORY_DEALLOCATE                (  self->actives      ) ;
+    if ( self->fields          != NULL)  MEMORY_DEALLOCATE                (  self->fields       ) ;
+    if ( self->instancesOld    != NULL)  MEMORY_DEALLOCATE                (  self->instancesOld ) ;
+    if ( self->instancesNew    != NULL)  MEMORY_DEALLOCATE                (  self->instancesNew ) ;
+    if ( self->swapsAttempted  != NULL)  MEMORY_DEALLOCATE                (  self->swapsAttempted ) ;
+    if ( self->swapsAccepted   != NULL)  MEMORY_DEALLOCATE                (  self->swapsAccepted  ) ;
+    if ( self->weights         != NULL)  MEMORY_DEALLOCATE                (  self->weights   ) ;
+    if ( self->blockCounts     != NULL)  MEMORY_DEALLOCATE                (  self->blockCounts   ) ;
+    if ( self->blockEnergies   != NULL)  MEMORY_DEALLOCATE                (  self->blockEnergies ) ;
+    if ( self->clusterSites    != NULL)  MEMORY_DEALLOCATE                (  self->clusterSites     ) ;
+    if ( self->clusterOffsets  != NULL)  MEMORY_DEALLOCATE                (  self->clusterOffsets   ) ;
+    if ( self->clusterStates   != NULL)  MEMORY_DEALLOCATE                (  self->clusterStates    ) ;
+    if ( self->clusterInstances != NULL) MEMORY_DEALLOCATE                (  self->clusterInstances ) ;
+    if ( self->microstates     != NULL)  MicrostateHistogram_Deallocate   (  self->microstates ) ;
+    if ( self->protonCounts    != NULL)  MEMORY_DEALLOCATE                (  self->protonCounts    ) ;
+    if ( self->protonInstances != NULL)  MEMORY_DEALLOCATE                (  self->protonInstances ) ;
+    if ( self->privateProbabilities != NULL) MEMORY_DEALLOCATE            (  self->privateProbabilities ) ;
+    if ( self->rhat            != NULL)  MEMORY_DEALLOCATE                (  self->rhat      ) ;
+    if ( self->errors          != NULL)  MEMORY_DEALLOCATE                (  self->errors    ) ;
     if ( self->generator       != NULL)  RandomNumberGenerator_Deallocate ( &self->generator ) ;
     if ( self->vector          != NULL)  StateVector_Deallocate           (  self->vector    ) ;
+    if ( self->field           != NULL)  MEMORY_DEALLOCATE                (  self->field     ) ;
     if (self != NULL) MEMORY_DEALLOCATE (self);
 }
 
@@ -59,8 +131,313 @@ void MCModelDefault_Deallocate (MCModelDefault *self) {
  */
 void MCModelDefault_LinkToEnergyModel (MCModelDefault *self, EnergyModel *energyModel, 
                                        Status *status) {
+    TitrSite *ts;
+    Integer   i, a, nprotons;
+
     self->energyModel = energyModel;
     self->vector      = StateVector_Clone (energyModel->vector, status);
+    if (*status != Status_Continue) {
+        return;
+    }
+    MEMORY_ALLOCATEARRAY (self->field   , energyModel->ninstances, Real);
+    MEMORY_ALLOCATEARRAY (self->weights , energyModel->ninstances, Real);
+    if ((self->field == NULL) || (self->weights == NULL)) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        return;
+    }
+    self->probabilities = Real1DArray_Data (energyModel->probabilities);
+    if (self->targetError > 0.0f) {
+        MEMORY_ALLOCATEARRAY (self->blockCounts   , MCMODELDEFAULT_MAX_BLOCKS * energyModel->ninstances , Real) ;
+        MEMORY_ALLOCATEARRAY (self->blockEnergies , MCMODELDEFAULT_MAX_BLOCKS                           , Real) ;
+        MEMORY_ALLOCATEARRAY (self->errors        , energyModel->ninstances                             , Real) ;
+        if ((self->blockCounts == NULL) || (self->blockEnergies == NULL) || (self->errors == NULL)) {
+            Status_Set (status, Status_MemoryAllocationFailure);
+            return;
+        }
+    }
+    if (self->reweighting) {
+        self->maxProtons = 0;
+        for (i = 0, ts = self->vector->sites; i < self->vector->nsites; i++, ts++) {
+            nprotons = 0;
+            for (a = ts->indexFirst; a <= ts->indexLast; a++) {
+                if (Integer1DArray_Item (energyModel->protons, a) > nprotons) nprotons = Integer1DArray_Item (energyModel->protons, a);
+            }
+            self->maxProtons += nprotons;
+        }
+        MEMORY_ALLOCATEARRAY (self->protonCounts    , self->maxProtons + 1                             , Real) ;
+        MEMORY_ALLOCATEARRAY (self->protonInstances , (self->maxProtons + 1) * energyModel->ninstances , Real) ;
+        if ((self->protonCounts == NULL) || (self->protonInstances == NULL)) {
+            Status_Set (status, Status_MemoryAllocationFailure);
+            return;
+        }
+        MCModelDefault_ResetProtonHistogram (self);
+    }
+}
+
+/*
+ * Set up independent chains after the model has been linked and its pairs found.
+ *
+ * Each chain is a Monte Carlo model of its own. Chains use consecutive seeds
+ * starting from the seed of the parent model, so that runs are reproducible.
+ */
+void MCModelDefault_LinkChains (MCModelDefault *self, Status *status) {
+    MCModelDefault *chain;
+    Integer         k, npairs, ninstances;
+
+    if (self->nchains < 2) {
+        return;
+    }
+    ninstances = self->energyModel->ninstances;
+    MEMORY_ALLOCATEARRAY (self->chains             , self->nchains              , MCModelDefault *) ;
+    MEMORY_ALLOCATEARRAY (self->chainProbabilities , self->nchains * ninstances , Real) ;
+    MEMORY_ALLOCATEARRAY (self->rhat               , ninstances                 , Real) ;
+    if (self->errors == NULL) {
+        MEMORY_ALLOCATEARRAY (self->errors         , ninstances                 , Real) ;
+    }
+    MEMORY_ALLOCATEARRAY (self->swapsAttempted     , self->nchains              , Integer) ;
+    MEMORY_ALLOCATEARRAY (self->swapsAccepted      , self->nchains              , Integer) ;
+    if ((self->chains == NULL) || (self->chainProbabilities == NULL) || (self->rhat == NULL) || (self->errors == NULL) || (self->swapsAttempted == NULL) || (self->swapsAccepted == NULL)) {
+        goto failSet;
+    }
+    for (k = 0; k < self->nchains; k++) {
+        self->chains[k] = NULL;
+    }
+    for (k = 0; k < self->nchains; k++) {
+        chain = MCModelDefault_Allocate (self->limit, self->nequil, self->nprod, (Integer) (self->seed + k), 1, 1, status);
+        if (*status != Status_Continue) {
+            return;
+        }
+        self->chains[k] = chain;
+        chain->heatBath       = self->heatBath;
+        chain->raoBlackwell   = self->raoBlackwell;
+        chain->clusterLimit   = self->clusterLimit;
+        chain->maxClusterSize = self->maxClusterSize;
+        MCModelDefault_LinkToEnergyModel (chain, self->energyModel, status);
+        if (*status != Status_Continue) {
+            return;
+        }
+        npairs = MCModelDefault_FindPairs (chain, -1, status);
+        if (npairs > 0) {
+            MCModelDefault_FindPairs (chain, npairs, status);
+            if (*status != Status_Continue) {
+                return;
+            }
+        }
+        MCModelDefault_FindClusters (chain, status);
+        if (*status != Status_Continue) {
+            return;
+        }
+        chain->probabilities = &self->chainProbabilities[k * ninstances];
+    }
+    if (self->lockstep) {
+        MEMORY_ALLOCATEARRAY (self->actives      , self->vector->nsites * self->nchains , Integer) ;
+        MEMORY_ALLOCATEARRAY (self->fields       , ninstances * self->nchains           , Real)    ;
+        MEMORY_ALLOCATEARRAY (self->instancesOld , 2 * self->nchains                    , Integer) ;
+        MEMORY_ALLOCATEARRAY (self->instancesNew , 2 * self->nchains                    , Integer) ;
+        if ((self->actives == NULL) || (self->fields == NULL) || (self->instancesOld == NULL) || (self->instancesNew == NULL)) {
+            goto failSet;
+        }
+    }
+    return;
+
+failSet:
+    Status_Set (status, Status_MemoryAllocationFailure);
+}
+
+/*
+ * Calculate the interactions of each instance with the "active" instances of all sites.
+ * The field has to be recalculated whenever the state vector is changed outside of Monte Carlo moves.
+ */
+void MCModelDefault_CalculateField (const MCModelDefault *self) {
+    Integer    a, i;
+    TitrSite  *ts;
+    Real       W;
+
+    for (a = 0; a < self->energyModel->ninstances; a++) {
+        W  = 0.0f;
+        ts = self->vector->sites;
+        for (i = 0; i < self->vector->nsites; i++, ts++) {
+            W += EnergyModel_GetWdense (self->energyModel, a, ts->indexActive);
+        }
+        self->field[a] = W;
+    }
+}
+
+/*
+ * Update the field after the "active" instance of a site has changed.
+ */
+static void MCModelDefault_UpdateField (const MCModelDefault *self, const Integer instanceOld, const Integer instanceNew) {
+    Integer  a;
+    Real    *field = self->field, *rowOld, *rowNew;
+
+    rowOld = EnergyModel_DenseRow (self->energyModel, instanceOld);
+    rowNew = EnergyModel_DenseRow (self->energyModel, instanceNew);
+    for (a = 0; a < self->energyModel->ninstances; a++) {
+        field[a] += rowNew[a] - rowOld[a];
+    }
+}
+
+/*
+ * Calculate the energy of the current state vector from the field.
+ */
+static Real MCModelDefault_CalculateEnergy (const MCModelDefault *self, const Real pH) {
+    Integer    nprotons, i;
+    TitrSite  *ts;
+    Real       Gintr, W;
+
+    Gintr    = 0.0f;
+    W        = 0.0f;
+    nprotons = 0;
+    ts       = self->vector->sites;
+    for (i = 0; i < self->vector->nsites; i++, ts++) {
+        Gintr    +=    Real1DArray_Item (self->energyModel->intrinsic , ts->indexActive);
+        nprotons += Integer1DArray_Item (self->energyModel->protons   , ts->indexActive);
+        W        += self->field[ts->indexActive] - EnergyModel_GetWdense (self->energyModel, ts->indexActive, ts->indexActive);
+    }
+    return (Gintr - nprotons * (-CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature * CONSTANT_LN10 * pH) + 0.5f * W);
+}
+
+/*
+ * Calculate the energy of an instance of a site relative to the rest of the state vector.
+ *
+ * |active| is the "active" instance of the site, whose interactions are subtracted from the field.
+ */
+static Real MCModelDefault_LocalEnergy (const EnergyModel *energyModel, const Real *field, 
+                                        const Integer instance, const Integer active, const Real potential) {
+    return (Real1DArray_Item (energyModel->intrinsic, instance) - Integer1DArray_Item (energyModel->protons, instance) * potential
+            + field[instance] - EnergyModel_GetWdense (energyModel, instance, active));
+}
+
+/*
+ * Calculate the probabilities of instances of a site, conditional on the "active" instances of other sites.
+ * The probabilities are written to the weights at the global indices of instances.
+ */
+static void MCModelDefault_Conditional (const EnergyModel *energyModel, const Real *field, 
+                                        const TitrSite *ts, const Integer active, 
+                                        const Real potential, const Real beta, Real *weights) {
+    Integer  a;
+    Real     G, Gmin, total;
+
+    Gmin = 0.0f;
+    for (a = ts->indexFirst; a <= ts->indexLast; a++) {
+        G = MCModelDefault_LocalEnergy (energyModel, field, a, active, potential);
+        weights[a] = G;
+        if ((a == ts->indexFirst) || (G < Gmin)) {
+            Gmin = G;
+        }
+    }
+    total = 0.0f;
+    for (a = ts->indexFirst; a <= ts->indexLast; a++) {
+        weights[a] = exp (-beta * (weights[a] - Gmin));
+        total     += weights[a];
+    }
+    for (a = ts->indexFirst; a <= ts->indexLast; a++) {
+        weights[a] /= total;
+    }
+}
+
+/*
+ * Draw an instance of a site from its conditional probabilities.
+ */
+static Integer MCModelDefault_DrawInstance (const TitrSite *ts, const Real *weights, 
+                                            const RandomNumberGenerator *generator) {
+    Integer  a;
+    Real     random;
+
+    random = RandomNumberGenerator_NextReal (generator);
+    for (a = ts->indexFirst; a < ts->indexLast; a++) {
+        random -= weights[a];
+        if (random < 0.0f) {
+            break;
+        }
+    }
+    return a;
+}
+
+/*
+ * Decode the instances of sites of a cluster from the index of its state (in mixed radix).
+ */
+static void MCModelDefault_DecodeCluster (const MCModelDefault *self, const Integer *members, 
+                                          const Integer size, Integer state, Integer *instances) {
+    Integer   i, n;
+    TitrSite *ts;
+
+    for (i = 0; i < size; i++) {
+        ts           = &self->vector->sites[members[i]];
+        n            = ts->indexLast - ts->indexFirst + 1;
+        instances[i] = ts->indexFirst + state % n;
+        state       /= n;
+    }
+}
+
+/*
+ * Draw new instances of the sites of a cluster from their joint distribution,
+ * conditional on the "active" instances of sites outside of the cluster.
+ *
+ * All states of the cluster are enumerated. Interactions with sites outside of the cluster
+ * are taken from the field, after removing the interactions with the |current| instances
+ * of the cluster. The drawn instances are written to |drawn|. Returns the change of energy.
+ */
+static Real MCModelDefault_SampleCluster (const MCModelDefault *self, const Integer cluster, 
+                                          const Real *field, const Integer *current, Integer *drawn, 
+                                          const Real potential, const Real beta, 
+                                          const RandomNumberGenerator *generator) {
+    const EnergyModel *energyModel = self->energyModel;
+    Integer   *members, size, nstates, state, stateCurrent, multiplier, i, j, a;
+    Real      *external = self->weights, *energies = self->clusterStates, *probabilities, G, Gmin, total, random;
+    TitrSite  *ts;
+
+    members       = &self->clusterSites[self->clusterOffsets[cluster]];
+    size          = self->clusterOffsets[cluster + 1] - self->clusterOffsets[cluster];
+    probabilities = &self->clusterStates[MCMODELDEFAULT_MAX_CLUSTER_STATES];
+
+    /* Energies of instances, without interactions within the cluster */
+    nstates      = 1;
+    stateCurrent = 0;
+    for (i = 0; i < size; i++) {
+        ts = &self->vector->sites[members[i]];
+        for (a = ts->indexFirst; a <= ts->indexLast; a++) {
+            G = Real1DArray_Item (energyModel->intrinsic, a) - Integer1DArray_Item (energyModel->protons, a) * potential + field[a];
+            for (j = 0; j < size; j++) {
+                G -= EnergyModel_GetWdense (energyModel, a, current[j]);
+            }
+            external[a] = G;
+        }
+        multiplier    = nstates;
+        nstates      *= ts->indexLast - ts->indexFirst + 1;
+        stateCurrent += (current[i] - ts->indexFirst) * multiplier;
+    }
+
+    Gmin = 0.0f;
+    for (state = 0; state < nstates; state++) {
+        MCModelDefault_DecodeCluster (self, members, size, state, drawn);
+        G = 0.0f;
+        for (i = 0; i < size; i++) {
+            G += external[drawn[i]];
+            for (j = 0; j < i; j++) {
+                G += EnergyModel_GetWdense (energyModel, drawn[i], drawn[j]);
+            }
+        }
+        energies[state] = G;
+        if ((state == 0) || (G < Gmin)) {
+            Gmin = G;
+        }
+    }
+    total = 0.0f;
+    for (state = 0; state < nstates; state++) {
+        probabilities[state] = exp (-beta * (energies[state] - Gmin));
+        total += probabilities[state];
+    }
+
+    random = RandomNumberGenerator_NextReal (generator) * total;
+    for (state = 0; state < nstates - 1; state++) {
+        random -= probabilities[state];
+        if (random < 0.0f) {
+            break;
+        }
+    }
+    MCModelDefault_DecodeCluster (self, members, size, state, drawn);
+    return (energies[state] - energies[stateCurrent]);
 }
 
 /*
@@ -86,12 +463,15 @@ Boolean MCModelDefault_Metropolis (const Real GdeltaRT,
 
 /*
  * Choose a random site and change its "active" instance.
+ *
+ * The change of interactions is taken from the field, so that a move costs O(1).
+ * The field is updated only if the move is accepted.
  */
 Boolean MCModelDefault_Move (const MCModelDefault *self, const Real pH, 
                              const Real G, Real *Gnew) {
-    Integer    site, instance, nprotons, i;
+    Integer    site, instance, nprotons;
     Real       Gintr, W, Gdelta, GdeltaRT, beta;
-    TitrSite  *ts, *tsOther;
+    TitrSite  *ts;
     Boolean    accept;
 
     site = RandomNumberGenerator_NextCardinal (self->generator) % self->vector->nsites;
@@ -103,32 +483,98 @@ Boolean MCModelDefault_Move (const MCModelDefault *self, const Real pH,
     Gintr    =    Real1DArray_Item (self->energyModel->intrinsic , instance) -    Real1DArray_Item (self->energyModel->intrinsic , ts->indexActive);
     nprotons = Integer1DArray_Item (self->energyModel->protons   , instance) - Integer1DArray_Item (self->energyModel->protons   , ts->indexActive);
 
-    W       = 0.0f;
-    i       = self->vector->nsites ;
-    tsOther = self->vector->sites  ;
-    for (; i > 0; i--, tsOther++) {
-        W += (EnergyModel_GetW (self->energyModel, instance, tsOther->indexActive) - EnergyModel_GetW (self->energyModel, ts->indexActive, tsOther->indexActive));
-    }
+    /* Interactions within the site do not contribute */
+    W = (self->field[instance]        - EnergyModel_GetWdense (self->energyModel, instance, ts->indexActive))
+      - (self->field[ts->indexActive] - EnergyModel_GetWdense (self->energyModel, ts->indexActive, ts->indexActive));
 
     Gdelta   = Gintr - nprotons * (-CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature * CONSTANT_LN10 * pH) + W;
     beta     = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature);
     GdeltaRT = Gdelta * beta;
     accept   = MCModelDefault_Metropolis (GdeltaRT, self->generator);
     if (accept) {
+        MCModelDefault_UpdateField (self, ts->indexActive, instance);
         ts->indexActive = instance;
         *Gnew = G + Gdelta;
     }
     return accept;
 }
 
+/*
+ * Choose a random site and draw its new "active" instance from the conditional distribution
+ * given the "active" instances of other sites (heat-bath or Gibbs move).
+ *
+ * Unlike in the Metropolis move, the current instance can be drawn again. For sites
+ * with more than two instances, fewer trials are wasted. Returns True if the instance changed.
+ */
+Boolean MCModelDefault_HeatBathMove (const MCModelDefault *self, const Real pH, 
+                                     const Real G, Real *Gnew) {
+    Integer    site, instance;
+    Real       potential, beta;
+    TitrSite  *ts;
+
+    site      = RandomNumberGenerator_NextCardinal (self->generator) % self->vector->nsites;
+    ts        = &self->vector->sites[site];
+    potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature * CONSTANT_LN10 * pH;
+    beta      = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature);
+
+    MCModelDefault_Conditional (self->energyModel, self->field, ts, ts->indexActive, potential, beta, self->weights);
+    instance = MCModelDefault_DrawInstance (ts, self->weights, self->generator);
+    if (instance == ts->indexActive) {
+        return False;
+    }
+    *Gnew = G + MCModelDefault_LocalEnergy (self->energyModel, self->field, instance, ts->indexActive, potential)
+              - MCModelDefault_LocalEnergy (self->energyModel, self->field, ts->indexActive, ts->indexActive, potential);
+    MCModelDefault_UpdateField (self, ts->indexActive, instance);
+    ts->indexActive = instance;
+    return True;
+}
+
+/*
+ * Choose a random cluster of sites and draw their new "active" instances from
+ * the exact conditional distribution of the cluster. Returns True if any instance changed.
+ */
+Boolean MCModelDefault_ClusterMove (const MCModelDefault *self, const Real pH, 
+                                    const Real G, Real *Gnew) {
+    Integer    cluster, size, i, *members, *current, *drawn;
+    Real       potential, beta, Gdelta;
+    TitrSite  *ts;
+    Boolean    changed;
+
+    cluster   = RandomNumberGenerator_NextCardinal (self->generator) % self->nclusters;
+    members   = &self->clusterSites[self->clusterOffsets[cluster]];
+    size      = self->clusterOffsets[cluster + 1] - self->clusterOffsets[cluster];
+    current   = self->clusterInstances;
+    drawn     = &self->clusterInstances[self->maxClusterSize];
+    potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature * CONSTANT_LN10 * pH;
+    beta      = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature);
+
+    for (i = 0; i < size; i++) {
+        current[i] = self->vector->sites[members[i]].indexActive;
+    }
+    Gdelta  = MCModelDefault_SampleCluster (self, cluster, self->field, current, drawn, potential, beta, self->generator);
+    changed = False;
+    for (i = 0; i < size; i++) {
+        if (drawn[i] != current[i]) {
+            ts = &self->vector->sites[members[i]];
+            MCModelDefault_UpdateField (self, current[i], drawn[i]);
+            ts->indexActive = drawn[i];
+            changed = True;
+        }
+    }
+    if (changed) {
+        *Gnew = G + Gdelta;
+    }
+    return changed;
+}
+
 /*
  * Choose a random pair of sites and change their "active" instances.
  */
 Boolean MCModelDefault_DoubleMove (const MCModelDefault *self, const Real pH, 
                                    const Real G, Real *Gnew) {
-    Integer    newPair, indexSa, indexSb, nprotons, i;
+    Integer    newPair, indexSa, indexSb, nprotons;
     Real       Gintr, W, Gdelta, GdeltaRT, beta;
-    TitrSite  *sa, *sb, *tsOther;
+    TitrSite  *sa, *sb;
     PairSite  *pair;
     Boolean    accept;
 
@@ -149,14 +595,12 @@ Boolean MCModelDefault_DoubleMove (const MCModelDefault *self, const Real pH,
     nprotons =  Integer1DArray_Item (self->energyModel->protons   , indexSa) - Integer1DArray_Item (self->energyModel->protons   , sa->indexActive)
               + Integer1DArray_Item (self->energyModel->protons   , indexSb) - Integer1DArray_Item (self->energyModel->protons   , sb->indexActive);
 
-    W       = EnergyModel_GetW (self->energyModel, indexSa, indexSb) - EnergyModel_GetW (self->energyModel, sa->indexActive, sb->indexActive);
-    tsOther = self->vector->sites;
-    for (i = 0; i < self->vector->nsites; i++, tsOther++) {
-        if (i != sa->indexSite && i != sb->indexSite) {
-            W +=  EnergyModel_GetW (self->energyModel, indexSa, tsOther->indexActive) - EnergyModel_GetW (self->energyModel, sa->indexActive, tsOther->indexActive)
-                + EnergyModel_GetW (self->energyModel, indexSb, tsOther->indexActive) - EnergyModel_GetW (self->energyModel, sb->indexActive, tsOther->indexActive);
-        }
-    }
+    /* Take the interactions with other sites from the field, then add the interaction within the pair */
+    W =   (self->field[indexSa] - EnergyModel_GetWdense (self->energyModel, indexSa, sa->indexActive) - EnergyModel_GetWdense (self->energyModel, indexSa, sb->indexActive))
+        - (self->field[sa->indexActive] - EnergyModel_GetWdense (self->energyModel, sa->indexActive, sa->indexActive) - EnergyModel_GetWdense (self->energyModel, sa->indexActive, sb->indexActive))
+        + (self->field[indexSb] - EnergyModel_GetWdense (self->energyModel, indexSb, sb->indexActive) - EnergyModel_GetWdense (self->energyModel, indexSb, sa->indexActive))
+        - (self->field[sb->indexActive] - EnergyModel_GetWdense (self->energyModel, sb->indexActive, sb->indexActive) - EnergyModel_GetWdense (self->energyModel, sb->indexActive, sa->indexActive))
+        + EnergyModel_GetWdense (self->energyModel, indexSa, indexSb) - EnergyModel_GetWdense (self->energyModel, sa->indexActive, sb->indexActive);
 
     Gdelta   = Gintr - nprotons * (-CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature * CONSTANT_LN10 * pH) + W;
     beta     = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature);
@@ -164,6 +608,8 @@ Boolean MCModelDefault_DoubleMove (const MCModelDefault *self, const Real pH,
     accept   = MCModelDefault_Metropolis (GdeltaRT, self->generator);
 
     if (accept) {
+        MCModelDefault_UpdateField (self, sa->indexActive, indexSa);
+        MCModelDefault_UpdateField (self, sb->indexActive, indexSb);
         sa->indexActive = indexSa;
         sb->indexActive = indexSb;
         *Gnew = G + Gdelta;
@@ -174,6 +620,8 @@ Boolean MCModelDefault_DoubleMove (const MCModelDefault *self, const Real pH,
 /*
  * Generate a state vector representing a low-energy, statistically relevant protonation state.
  * The energy of the vector is returned only for information.
+ *
+ * Cluster moves are counted together with double moves (flips).
  */
 Real MCModelDefault_MCScan (const MCModelDefault *self, const Real pH, Integer nmoves, 
                             Integer *movesDone, Integer *movesAccepted, Integer *flipsDone, 
@@ -182,15 +630,20 @@ Real MCModelDefault_MCScan (const MCModelDefault *self, const Real pH, Integer n
     Real     G, Gnew;
     Boolean  accept, move;
 
-    G = EnergyModel_CalculateMicrostateEnergy (self->energyModel, self->vector, pH);
-    selection = self->vector->nsites + self->vector->npairs;
+    G = MCModelDefault_CalculateEnergy (self, pH);
+    selection = self->vector->nsites + self->vector->npairs + self->nclusters;
 
     for (; nmoves > 0; nmoves--) {
         select = RandomNumberGenerator_NextCardinal (self->generator) % selection;
         move   = select < self->vector->nsites;
         if (move) {
             (*movesDone)++;
-            accept = MCModelDefault_Move (self, pH, G, &Gnew);
+            if (self->heatBath) {
+                accept = MCModelDefault_HeatBathMove (self, pH, G, &Gnew);
+            }
+            else {
+                accept = MCModelDefault_Move (self, pH, G, &Gnew);
+            }
             if (accept) {
                 (*movesAccepted)++;
                 G = Gnew;
@@ -198,7 +651,12 @@ Real MCModelDefault_MCScan (const MCModelDefault *self, const Real pH, Integer n
         }
         else {
             (*flipsDone)++;
-            accept = MCModelDefault_DoubleMove (self, pH, G, &Gnew);
+            if (select < self->vector->nsites + self->vector->npairs) {
+                accept = MCModelDefault_DoubleMove (self, pH, G, &Gnew);
+            }
+            else {
+                accept = MCModelDefault_ClusterMove (self, pH, G, &Gnew);
+            }
             if (accept) {
                 (*flipsAccepted)++;
                 G = Gnew;
@@ -211,17 +669,38 @@ Real MCModelDefault_MCScan (const MCModelDefault *self, const Real pH, Integer n
 /*
  * Increase the counts of "active" instances.
  * These counts, after scaling, will give the probabilities of occurrence of instances.
+ *
+ * With Rao-Blackwellization, the conditional probabilities of all instances of each site,
+ * given the "active" instances of other sites, are added instead of 0/1 counts. The
+ * estimate is unbiased and its variance is lower, at the cost of O(ninstances) per scan.
+ *
+ * If pairs are accumulated, counts of pairs of "active" instances are added to the joint
+ * probabilities of the energy model. These are always plain counts.
  */
-void MCModelDefault_UpdateProbabilities (const MCModelDefault *self) {
-    Real     *counter;
+void MCModelDefault_UpdateProbabilities (const MCModelDefault *self, const Real pH) {
     TitrSite *ts;
-    Integer   i;
+    Integer   i, a;
+    Real      potential, beta;
     ts = self->vector->sites  ;
     i  = self->vector->nsites ;
 
-    for (; i > 0; i--, ts++) {
-        counter = Real1DArray_ItemPointer (self->energyModel->probabilities, ts->indexActive);
-        (*counter)++;
+    if (self->raoBlackwell) {
+        potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature * CONSTANT_LN10 * pH;
+        beta      = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature);
+        for (; i > 0; i--, ts++) {
+            MCModelDefault_Conditional (self->energyModel, self->field, ts, ts->indexActive, potential, beta, self->weights);
+            for (a = ts->indexFirst; a <= ts->indexLast; a++) {
+                self->probabilities[a] += self->weights[a];
+            }
+        }
+    }
+    else {
+        for (; i > 0; i--, ts++) {
+            self->probabilities[ts->indexActive]++;
+        }
+    }
+    if (self->accumulatePairs) {
+        EnergyModel_UpdatePairProbabilities (self->energyModel, self->vector, 1.0f);
     }
 }
 
@@ -230,21 +709,7 @@ void MCModelDefault_UpdateProbabilities (const MCModelDefault *self) {
  */
 Real MCModelDefault_FindMaxInteraction (const MCModelDefault *self, 
                                         const TitrSite *site, const TitrSite *other) {
-    Integer index, indexOther;
-    Real W, Wmax;
-
-    Wmax  = 0.0f;
-    index = site->indexFirst;
-    for (; index <= site->indexLast; index++) {
-        indexOther = other->indexFirst;
-        for (; indexOther <= other->indexLast; indexOther++) {
-            W = fabs (EnergyModel_GetW (self->energyModel, index, indexOther));
-            if (W > Wmax) {
-                Wmax = W;
-            }
-        }
-    }
-    return Wmax;
+    return EnergyModel_FindMaxInteraction (self->energyModel, site, other);
 }
 
 /*
@@ -287,28 +752,539 @@ Integer MCModelDefault_FindPairs (const MCModelDefault *self, const Integer npai
     return nfound;
 }
 
+/*
+ * Find clusters of strongly coupled sites.
+ *
+ * Clusters are grown greedily. Starting from the first site that is not yet in a cluster,
+ * the site most strongly coupled to any site of the cluster is added, as long as the coupling
+ * is at least clusterLimit, the cluster has fewer than maxClusterSize sites and the number of
+ * its states does not exceed MCMODELDEFAULT_MAX_CLUSTER_STATES. Each site belongs to at most
+ * one cluster. Returns the number of clusters.
+ */
+Integer MCModelDefault_FindClusters (MCModelDefault *self, Status *status) {
+    Integer   nsites = self->vector->nsites, i, j, c, best, size, nstates, nmembers, n;
+    Integer  *assigned = NULL;
+    Real     *couplings = NULL, coupling, Wbest;
+    TitrSite *sites = self->vector->sites;
+
+    if ( self->clusterSites     != NULL)  MEMORY_DEALLOCATE (self->clusterSites    ) ;
+    if ( self->clusterOffsets   != NULL)  MEMORY_DEALLOCATE (self->clusterOffsets  ) ;
+    if ( self->clusterStates    != NULL)  MEMORY_DEALLOCATE (self->clusterStates   ) ;
+    if ( self->clusterInstances != NULL)  MEMORY_DEALLOCATE (self->clusterInstances) ;
+    self->nclusters = 0;
+    if ((self->maxClusterSize < 2) || (nsites < 2)) {
+        return 0;
+    }
+    MEMORY_ALLOCATEARRAY (self->clusterSites     , nsites                                , Integer) ;
+    MEMORY_ALLOCATEARRAY (self->clusterOffsets   , nsites + 1                            , Integer) ;
+    MEMORY_ALLOCATEARRAY (self->clusterStates    , 2 * MCMODELDEFAULT_MAX_CLUSTER_STATES , Real)    ;
+    MEMORY_ALLOCATEARRAY (self->clusterInstances , 2 * self->maxClusterSize              , Integer) ;
+    MEMORY_ALLOCATEARRAY (couplings              , nsites * nsites                       , Real)    ;
+    MEMORY_ALLOCATEARRAY (assigned               , nsites                                , Integer) ;
+    if ((self->clusterSites == NULL) || (self->clusterOffsets == NULL) || (self->clusterStates == NULL) || (self->clusterInstances == NULL) || (couplings == NULL) || (assigned == NULL)) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        goto finalize;
+    }
+    for (i = 0; i < nsites; i++) {
+        assigned[i] = False;
+        couplings[i * nsites + i] = 0.0f;
+        for (j = 0; j < i; j++) {
+            coupling = MCModelDefault_FindMaxInteraction (self, &sites[i], &sites[j]);
+            couplings[i * nsites + j] = coupling;
+            couplings[j * nsites + i] = coupling;
+        }
+    }
+
+    nmembers = 0;
+    for (i = 0; i < nsites; i++) {
+        if (assigned[i]) {
+            continue;
+        }
+        self->clusterOffsets[self->nclusters] = nmembers;
+        self->clusterSites[nmembers] = i;
+        assigned[i] = True;
+        size    = 1;
+        nstates = sites[i].indexLast - sites[i].indexFirst + 1;
+
+        while (size < self->maxClusterSize) {
+            best  = -1;
+            Wbest = 0.0f;
+            for (j = 0; j < nsites; j++) {
+                n = sites[j].indexLast - sites[j].indexFirst + 1;
+                if (assigned[j] || (nstates * n > MCMODELDEFAULT_MAX_CLUSTER_STATES)) {
+                    continue;
+                }
+                coupling = 0.0f;
+                for (c = 0; c < size; c++) {
+                    if (couplings[self->clusterSites[nmembers + c] * nsites + j] > coupling) {
+                        coupling = couplings[self->clusterSites[nmembers + c] * nsites + j];
+                    }
+                }
+                if ((coupling >= self->clusterLimit) && ((best < 0) || (coupling > Wbest))) {
+                    best  = j;
+                    Wbest = coupling;
+                }
+            }
+            if (best < 0) {
+                break;
+            }
+            self->clusterSites[nmembers + size] = best;
+            assigned[best] = True;
+            nstates *= sites[best].indexLast - sites[best].indexFirst + 1;
+            size++;
+        }
+        /* A single site is left for single moves, but it can still join a later cluster */
+        if (size > 1) {
+            nmembers += size;
+            self->nclusters++;
+        }
+        else {
+            assigned[i] = False;
+        }
+    }
+    self->clusterOffsets[self->nclusters] = nmembers;
+
+finalize:
+    if (couplings != NULL) MEMORY_DEALLOCATE (couplings);
+    if (assigned  != NULL) MEMORY_DEALLOCATE (assigned);
+    return self->nclusters;
+}
+
 /*
  * Run a Monte Carlo production.
  *
  * The number of moves during each scan is proportional to the number of sites and pairs.
  *
  * The resulting state vectors are not accumulated. Instead, they are immediately 
- * used to update the probabilities.
+ * used to update the probabilities and, if it is allocated, the histogram of microstates.
  */
 void MCModelDefault_Production (const MCModelDefault *self, const Real pH) {
-    Integer  nmoves, nscans, moves, movesAcc, flips, flipsAcc;
+    MCModelDefault_CheckpointedProduction (self, pH, 0, NULL);
+}
+
+/*
+ * Run a Monte Carlo production, which may continue after |nscans| scans restored from a checkpoint.
+ *
+ * If |filename| is given, a checkpoint is written after every checkpointFrequency scans
+ * and after the last scan. Restoring the field, the generator and the unscaled counts
+ * makes a continued run identical to one that was never interrupted.
+ *
+ * Returns False if a checkpoint cannot be written. In that case, the production is stopped.
+ */
+Boolean MCModelDefault_CheckpointedProduction (const MCModelDefault *self, const Real pH, const Integer nscans, const char *filename) {
+    Integer  nmoves, scan, moves, movesAcc, flips, flipsAcc, a;
     Real     scale, Gfinal;
+    Boolean  writing;
 
-    Real1DArray_Set (self->energyModel->probabilities, 0.0f);
-    nmoves = self->vector->nsites + self->vector->npairs;
-    nscans = self->nprod;
+    if (nscans <= 0) {
+        for (a = 0; a < self->energyModel->ninstances; a++) {
+            self->probabilities[a] = 0.0f;
+        }
+        if (self->accumulatePairs) {
+            EnergyModel_ResetPairProbabilities (self->energyModel);
+        }
+        if (self->microstates != NULL) {
+            MicrostateHistogram_Reset (self->microstates);
+        }
+        if (self->reweighting) {
+            MCModelDefault_ResetProtonHistogram (self);
+        }
+        MCModelDefault_CalculateField (self);
+    }
+    nmoves  = self->vector->nsites + self->vector->npairs + self->nclusters;
+    writing = ((filename != NULL) && (self->checkpointFrequency > 0)) ? True : False;
 
-    for (; nscans > 0; nscans--) {
+    for (scan = (nscans > 0 ? nscans : 0); scan < self->nprod; ) {
         Gfinal = MCModelDefault_MCScan (self, pH, nmoves, &moves, &movesAcc, &flips, &flipsAcc);
-        MCModelDefault_UpdateProbabilities (self);
+        MCModelDefault_UpdateProbabilities (self, pH);
+        if (self->microstates != NULL) {
+            MicrostateHistogram_Record (self->microstates, self->vector, Gfinal, MCModelDefault_CountProtons (self));
+        }
+        if (self->reweighting) {
+            MCModelDefault_UpdateProtonHistogram (self);
+        }
+        scan++;
+        if (writing && (((scan % self->checkpointFrequency) == 0) || (scan == self->nprod))) {
+            if (!MCModelDefault_WriteCheckpoint (self, filename, pH, scan)) {
+                return False;
+            }
+        }
     }
     scale = 1.0f / self->nprod;
-    Real1DArray_Scale (self->energyModel->probabilities, scale);
+    for (a = 0; a < self->energyModel->ninstances; a++) {
+        self->probabilities[a] *= scale;
+    }
+    if (self->accumulatePairs) {
+        EnergyModel_ScalePairProbabilities (self->energyModel, scale);
+    }
+    return True;
+}
+
+/*
+ * Number of joint counts of instances of a pair of sites of the energy model.
+ */
+static Integer MCModelDefault_PairItems (const MCModelDefault *self, const PairProbability *pair) {
+    TitrSite *siteA, *siteB;
+
+    siteA = &self->energyModel->vector->sites[pair->indexSiteA];
+    siteB = &self->energyModel->vector->sites[pair->indexSiteB];
+    return (siteA->indexLast - siteA->indexFirst + 1) * (siteB->indexLast - siteB->indexFirst + 1);
+}
+
+/*
+ * Write the header and body of a checkpoint to an open file.
+ */
+static Boolean MCModelDefault_WriteCheckpointFile (const MCModelDefault *self, FILE *file, const Real pH, const Integer nscans) {
+    PairProbability *pair;
+    TitrSite        *ts;
+    PairSite        *ps;
+    Integer          values[9], i, indices[2], ninstances = self->energyModel->ninstances, nprotons;
+    size_t           size;
+
+    nprotons  = self->reweighting ? (self->maxProtons + 1) : 0;
+    size      = self->generator->type->size;
+    values[0] = ninstances ;
+    values[1] = self->vector->nsites ;
+    values[2] = self->vector->npairs ;
+    values[3] = self->nprod ;
+    values[4] = nscans ;
+    values[5] = (Integer) size ;
+    values[6] = self->accumulatePairs ? self->energyModel->npairs : 0 ;
+    values[7] = nprotons ;
+    values[8] = (self->microstates != NULL) ? 1 : 0 ;
+    if ((fwrite (MCMODELDEFAULT_CHECKPOINT_MAGIC, sizeof (char), 8, file) != 8) || (fwrite (values, sizeof (Integer), 9, file) != 9) || (fwrite (&pH, sizeof (Real), 1, file) != 1)) {
+        return False;
+    }
+    for (i = 0, ts = self->vector->sites; i < self->vector->nsites; i++, ts++) {
+        if (fwrite (&ts->indexActive, sizeof (Integer), 1, file) != 1) {
+            return False;
+        }
+    }
+    for (i = 0, ps = self->vector->pairs; i < self->vector->npairs; i++, ps++) {
+        indices[0] = ps->a->indexSite;
+        indices[1] = ps->b->indexSite;
+        if (fwrite (indices, sizeof (Integer), 2, file) != 2) {
+            return False;
+        }
+    }
+    if ((fwrite (self->generator->state , 1            , size                , file) != size) ||
+        (fwrite (self->field            , sizeof (Real), (size_t) ninstances , file) != (size_t) ninstances) ||
+        (fwrite (self->probabilities    , sizeof (Real), (size_t) ninstances , file) != (size_t) ninstances)) {
+        return False;
+    }
+    if (self->accumulatePairs) {
+        for (i = 0, pair = self->energyModel->pairs; i < self->energyModel->npairs; i++, pair++) {
+            if (fwrite (pair->probabilities, sizeof (Real), (size_t) MCModelDefault_PairItems (self, pair), file) != (size_t) MCModelDefault_PairItems (self, pair)) {
+                return False;
+            }
+        }
+    }
+    if (self->reweighting) {
+        if ((fwrite (self->protonCounts    , sizeof (Real), (size_t) nprotons              , file) != (size_t) nprotons) ||
+            (fwrite (self->protonInstances , sizeof (Real), (size_t) nprotons * ninstances , file) != (size_t) nprotons * ninstances)) {
+            return False;
+        }
+    }
+    if (self->microstates != NULL) {
+        return MicrostateHistogram_Write (self->microstates, file);
+    }
+    return True;
+}
+
+/*
+ * Write a checkpoint of the production after |nscans| scans.
+ *
+ * The checkpoint is first written to a temporary file, which then replaces the previous
+ * checkpoint. A run killed while writing leaves the previous checkpoint intact.
+ */
+Boolean MCModelDefault_WriteCheckpoint (const MCModelDefault *self, const char *filename, const Real pH, const Integer nscans) {
+    FILE    *file;
+    char    *temporary;
+    Boolean  isWritten;
+
+    MEMORY_ALLOCATEARRAY (temporary, strlen (filename) + 5, char);
+    if (temporary == NULL) {
+        return False;
+    }
+    strcpy (temporary, filename);
+    strcat (temporary, ".tmp");
+    file = fopen (temporary, "wb");
+    if (file == NULL) {
+        MEMORY_DEALLOCATE (temporary);
+        return False;
+    }
+    isWritten = MCModelDefault_WriteCheckpointFile (self, file, pH, nscans);
+    if (fclose (file) != 0) {
+        isWritten = False;
+    }
+    if (isWritten) {
+        isWritten = (rename (temporary, filename) == 0) ? True : False;
+    }
+    if (!isWritten) {
+        remove (temporary);
+    }
+    MEMORY_DEALLOCATE (temporary);
+    return isWritten;
+}
+
+/*
+ * Read the body of a checkpoint from an open file, after its header has been checked.
+ */
+static Boolean MCModelDefault_ReadCheckpointFile (const MCModelDefault *self, FILE *file) {
+    PairProbability *pair;
+    TitrSite        *ts;
+    PairSite        *ps;
+    Integer          i, indices[2], ninstances = self->energyModel->ninstances, nprotons;
+    size_t           size;
+
+    nprotons = self->maxProtons + 1;
+    size     = self->generator->type->size;
+    for (i = 0, ts = self->vector->sites; i < self->vector->nsites; i++, ts++) {
+        if ((fread (&ts->indexActive, sizeof (Integer), 1, file) != 1) || (ts->indexActive < ts->indexFirst) || (ts->indexActive > ts->indexLast)) {
+            return False;
+        }
+    }
+    for (i = 0, ps = self->vector->pairs; i < self->vector->npairs; i++, ps++) {
+        if ((fread (indices, sizeof (Integer), 2, file) != 2) || (indices[0] != ps->a->indexSite) || (indices[1] != ps->b->indexSite)) {
+            return False;
+        }
+    }
+    if ((fread (self->generator->state , 1            , size                , file) != size) ||
+        (fread (self->field            , sizeof (Real), (size_t) ninstances , file) != (size_t) ninstances) ||
+        (fread (self->probabilities    , sizeof (Real), (size_t) ninstances , file) != (size_t) ninstances)) {
+        return False;
+    }
+    if (self->accumulatePairs) {
+        for (i = 0, pair = self->energyModel->pairs; i < self->energyModel->npairs; i++, pair++) {
+            if (fread (pair->probabilities, sizeof (Real), (size_t) MCModelDefault_PairItems (self, pair), file) != (size_t) MCModelDefault_PairItems (self, pair)) {
+                return False;
+            }
+        }
+    }
+    if (self->reweighting) {
+        if ((fread (self->protonCounts    , sizeof (Real), (size_t) nprotons              , file) != (size_t) nprotons) ||
+            (fread (self->protonInstances , sizeof (Real), (size_t) nprotons * ninstances , file) != (size_t) nprotons * ninstances)) {
+            return False;
+        }
+    }
+    if (self->microstates != NULL) {
+        return MicrostateHistogram_Read (self->microstates, file);
+    }
+    return True;
+}
+
+/*
+ * Restore the production from a checkpoint.
+ *
+ * Returns the number of scans done or -1 if the file cannot be opened. If the checkpoint
+ * was written for a different model, pH or number of production scans, or if it is damaged,
+ * the status is set to a value error. The model is then left in an undefined state until
+ * the next equilibration.
+ */
+Integer MCModelDefault_ReadCheckpoint (const MCModelDefault *self, const char *filename, const Real pH, Status *status) {
+    FILE    *file;
+    char     magic[8];
+    Integer  values[9];
+    Real     pHsaved;
+
+    file = fopen (filename, "rb");
+    if (file == NULL) {
+        return -1;
+    }
+    if ((fread (magic, sizeof (char), 8, file) != 8) || (memcmp (magic, MCMODELDEFAULT_CHECKPOINT_MAGIC, 8) != 0) ||
+        (fread (values, sizeof (Integer), 9, file) != 9) || (fread (&pHsaved, sizeof (Real), 1, file) != 1)) {
+        goto fail;
+    }
+    if ((values[0] != self->energyModel->ninstances) || (values[1] != self->vector->nsites) || (values[2] != self->vector->npairs) ||
+        (values[3] != self->nprod) || (values[4] < 1) || (values[4] > self->nprod) || (values[5] != (Integer) self->generator->type->size) ||
+        (values[6] != (self->accumulatePairs ? self->energyModel->npairs : 0)) || (values[7] != (self->reweighting ? (self->maxProtons + 1) : 0)) ||
+        (values[8] != ((self->microstates != NULL) ? 1 : 0)) || (pHsaved != pH)) {
+        goto fail;
+    }
+    if (!MCModelDefault_ReadCheckpointFile (self, file)) {
+        goto fail;
+    }
+    fclose (file);
+    return values[4];
+
+fail:
+    fclose (file);
+    Status_Set (status, Status_ValueError);
+    return -1;
+}
+
+/*
+ * Calculate the statistical inefficiency of a time series, i.e. the number of
+ * correlated samples that are worth one independent sample.
+ */
+static Real MCModelDefault_Inefficiency (const Real *series, const Integer n) {
+    Integer  i, t;
+    Real     mean, variance, C, g;
+
+    if (n < 2) {
+        return 1.0f;
+    }
+    mean = 0.0f;
+    for (i = 0; i < n; i++) {
+        mean += series[i];
+    }
+    mean /= n;
+    variance = 0.0f;
+    for (i = 0; i < n; i++) {
+        variance += (series[i] - mean) * (series[i] - mean);
+    }
+    variance /= n;
+    if (variance <= 0.0f) {
+        return 1.0f;
+    }
+    g = 1.0f;
+    for (t = 1; t < n - 1; t++) {
+        C = 0.0f;
+        for (i = 0; i < n - t; i++) {
+            C += (series[i] - mean) * (series[i + t] - mean);
+        }
+        C /= (n - t) * variance;
+        if (C <= 0.0f) {
+            break;
+        }
+        g += 2.0f * C * (1.0f - (Real) t / n);
+    }
+    return (g < 1.0f) ? 1.0f : g;
+}
+
+/*
+ * Run a Monte Carlo production until the probabilities of all instances are converged.
+ *
+ * Scans are grouped into blocks, which keep the counts of instances and the mean energy.
+ * When the number of blocks reaches MCMODELDEFAULT_MAX_BLOCKS, pairs of neighbouring blocks
+ * are merged and the size of blocks is doubled.
+ *
+ * Whenever a block is completed, the beginning of the equilibrated region is found by
+ * maximizing the number of uncorrelated samples of the energy after discarding the leading
+ * blocks (Chodera). The standard errors of probabilities are then estimated by block
+ * averaging over the remaining blocks. Errors are bounded from below by the binomial error
+ * of the equilibrated scans, so that instances not yet visited do not appear converged.
+ * The run stops when all errors fall below targetError or before the number of scans
+ * would exceed maxScans (at least one block is always done).
+ * maxScans has to allow for MCMODELDEFAULT_MIN_BLOCKS initial blocks, otherwise no errors
+ * are estimated (this is checked when the model is created).
+ * Returns True if the probabilities are converged.
+ */
+Boolean MCModelDefault_ConvergedProduction (MCModelDefault *self, const Real pH) {
+    Integer  ninstances = self->energyModel->ninstances, nblocks, blockSize, nscans, scan, start, first, b, a;
+    Integer  moves, movesAcc, flips, flipsAcc, nmoves;
+    Real     G, Neff, NeffBest, mean, deviation, variance, largest, nsamples, smoothed, bound, *row, *other;
+    Boolean  isConverged = False;
+
+    MCModelDefault_CalculateField (self);
+    nmoves    = self->vector->nsites + self->vector->npairs + self->nclusters;
+    nblocks   = 0;
+    nscans    = 0;
+    blockSize = MCMODELDEFAULT_BLOCK_SCANS;
+    first     = 0;
+    for (a = 0; a < ninstances; a++) {
+        self->blockCounts[a] = 0.0f;
+    }
+    self->blockEnergies[0] = 0.0f;
+
+    for (;;) {
+        /* Counts of the current block are accumulated directly in its row */
+        self->probabilities = &self->blockCounts[nblocks * ninstances];
+        for (scan = 0; scan < blockSize; scan++) {
+            G = MCModelDefault_MCScan (self, pH, nmoves, &moves, &movesAcc, &flips, &flipsAcc);
+            MCModelDefault_UpdateProbabilities (self, pH);
+            self->blockEnergies[nblocks] += G;
+        }
+        nscans += blockSize;
+        for (a = 0; a < ninstances; a++) {
+            self->probabilities[a] /= blockSize;
+        }
+        self->blockEnergies[nblocks] /= blockSize;
+        nblocks++;
+
+        if (nblocks >= MCMODELDEFAULT_MIN_BLOCKS) {
+            /* Find the first equilibrated block, at most half of the blocks are discarded */
+            NeffBest = 0.0f;
+            for (start = 0; start <= nblocks / 2; start++) {
+                Neff = (nblocks - start) / MCModelDefault_Inefficiency (&self->blockEnergies[start], nblocks - start);
+                if (Neff > NeffBest) {
+                    NeffBest = Neff;
+                    first    = start;
+                }
+            }
+            /* Block averaging of probabilities */
+            largest = 0.0f;
+            for (a = 0; a < ninstances; a++) {
+                mean = 0.0f;
+                for (b = first; b < nblocks; b++) {
+                    mean += self->blockCounts[b * ninstances + a];
+                }
+                mean /= (nblocks - first);
+                variance = 0.0f;
+                for (b = first; b < nblocks; b++) {
+                    deviation = self->blockCounts[b * ninstances + a] - mean;
+                    variance += deviation * deviation;
+                }
+                self->errors[a] = sqrt (variance / ((nblocks - first) * (nblocks - first - 1)));
+                /* Binomial lower bound with the Laplace estimate of the probability,
+                   an instance not visited in any block cannot have a zero error */
+                nsamples = (nblocks - first) * blockSize;
+                smoothed = (mean * nsamples + 1.0f) / (nsamples + 2.0f);
+                bound    = sqrt (smoothed * (1.0f - smoothed) / nsamples);
+                if (self->errors[a] < bound) {
+                    self->errors[a] = bound;
+                }
+                if (self->errors[a] > largest) {
+                    largest = self->errors[a];
+                }
+            }
+            if ((nblocks - first >= MCMODELDEFAULT_MIN_BLOCKS) && (largest < self->targetError)) {
+                isConverged = True;
+                break;
+            }
+        }
+        /* Do not start a block that would exceed the maximum number of scans */
+        if (nscans + ((nblocks >= MCMODELDEFAULT_MAX_BLOCKS) ? 2 * blockSize : blockSize) > self->maxScans) {
+            break;
+        }
+        /* Merge pairs of blocks */
+        if (nblocks >= MCMODELDEFAULT_MAX_BLOCKS) {
+            for (b = 0; b < nblocks / 2; b++) {
+                row   = &self->blockCounts[b * ninstances];
+                other = &self->blockCounts[2 * b * ninstances];
+                for (a = 0; a < ninstances; a++) {
+                    row[a] = 0.5f * (other[a] + other[a + ninstances]);
+                }
+                self->blockEnergies[b] = 0.5f * (self->blockEnergies[2 * b] + self->blockEnergies[2 * b + 1]);
+            }
+            nblocks   /= 2;
+            blockSize *= 2;
+        }
+        row = &self->blockCounts[nblocks * ninstances];
+        for (a = 0; a < ninstances; a++) {
+            row[a] = 0.0f;
+        }
+        self->blockEnergies[nblocks] = 0.0f;
+    }
+
+    /* Probabilities are the averages over equilibrated blocks */
+    self->probabilities = Real1DArray_Data (self->energyModel->probabilities);
+    if (nblocks < MCMODELDEFAULT_MIN_BLOCKS) {
+        first = 0;
+        for (a = 0; a < ninstances; a++) {
+            self->errors[a] = 0.0f;
+        }
+    }
+    for (a = 0; a < ninstances; a++) {
+        mean = 0.0f;
+        for (b = first; b < nblocks; b++) {
+            mean += self->blockCounts[b * ninstances + a];
+        }
+        self->probabilities[a] = mean / (nblocks - first);
+    }
+    self->nscansDiscarded = first * blockSize;
+    self->nscansUsed      = (nblocks - first) * blockSize;
+    return isConverged;
 }
 
 /*
@@ -318,10 +1294,512 @@ void MCModelDefault_Equilibration (const MCModelDefault *self, const Real pH) {
     Integer  nmoves, nscans, moves, movesAcc, flips, flipsAcc;
 
     StateVector_Randomize (self->vector, self->generator);
-    nmoves = self->vector->nsites + self->vector->npairs;
+    MCModelDefault_CalculateField (self);
+    nmoves = self->vector->nsites + self->vector->npairs + self->nclusters;
     nscans = self->nequil;
 
     for (; nscans > 0; nscans--) {
         MCModelDefault_MCScan (self, pH, nmoves, &moves, &movesAcc, &flips, &flipsAcc);
     }
 }
+
+/*
+ * Run a short Monte Carlo equilibration, starting from the state vector of the previous run.
+ *
+ * Used for neighbouring pH-steps of titration curves, where the previous state
+ * is already close to equilibrium.
+ */
+void MCModelDefault_WarmEquilibration (const MCModelDefault *self, const Real pH) {
+    Integer  nmoves, nscans, moves, movesAcc, flips, flipsAcc;
+
+    MCModelDefault_CalculateField (self);
+    nmoves = self->vector->nsites + self->vector->npairs + self->nclusters;
+    nscans = self->nequilWarm;
+
+    for (; nscans > 0; nscans--) {
+        MCModelDefault_MCScan (self, pH, nmoves, &moves, &movesAcc, &flips, &flipsAcc);
+    }
+}
+
+/*
+ * Turn a linked model into a workspace, which accumulates probabilities in its own buffer
+ * instead of the probabilities of the energy model.
+ */
+void MCModelDefault_AllocatePrivateProbabilities (MCModelDefault *self, Status *status) {
+    if (self->privateProbabilities == NULL) {
+        MEMORY_ALLOCATEARRAY (self->privateProbabilities, self->energyModel->ninstances, Real);
+        if (self->privateProbabilities == NULL) {
+            Status_Set (status, Status_MemoryAllocationFailure);
+            return;
+        }
+    }
+    self->probabilities = self->privateProbabilities;
+}
+
+/*
+ * Calculate probabilities of instances by an equilibration and a production.
+ *
+ * A workspace only reads the energy model and writes its own state vector, field, generator
+ * and probabilities, so that workspaces linked to the same energy model can run in parallel.
+ * Joint probabilities of pairs and histograms are not accumulated.
+ */
+void MCModelDefault_CalculateProbabilities (const MCModelDefault *self, const Real pH, const Boolean warmStart) {
+    if (warmStart) {
+        MCModelDefault_WarmEquilibration (self, pH);
+    }
+    else {
+        MCModelDefault_Equilibration (self, pH);
+    }
+    MCModelDefault_Production (self, pH);
+}
+
+/*
+ * Update the fields of chains after the "active" instance of one site has changed.
+ * Chains that rejected the move have equal old and new instances and are skipped.
+ *
+ * All chains change the same site, so the rows of its instances stay in cache.
+ *
+ * Fields are kept per chain. An interleaved layout (instance-major, chain-minor), updated
+ * for all chains in one vectorized pass, was slower: the pass covers every chain even when
+ * few chains accepted the move, which is the usual case for larger systems.
+ */
+static void MCModelDefault_LockstepUpdateFields (const MCModelDefault *self, const Integer *old, const Integer *new) {
+    Integer  a, k, ninstances = self->energyModel->ninstances;
+    Real    *rowOld, *rowNew, *field;
+
+    for (k = 0; k < self->nchains; k++) {
+        if (old[k] != new[k]) {
+            rowOld = EnergyModel_DenseRow (self->energyModel, old[k]);
+            rowNew = EnergyModel_DenseRow (self->energyModel, new[k]);
+            field  = &self->fields[k * ninstances];
+            for (a = 0; a < ninstances; a++) {
+                field[a] += rowNew[a] - rowOld[a];
+            }
+        }
+    }
+}
+
+/*
+ * Randomize the state vectors of all chains and calculate their fields.
+ */
+static void MCModelDefault_LockstepRandomize (const MCModelDefault *self) {
+    Integer   a, i, k, nchains = self->nchains, ninstances = self->energyModel->ninstances;
+    Real     *row, *field;
+    TitrSite *ts;
+
+    for (k = 0; k < nchains; k++) {
+        StateVector_Randomize (self->chains[k]->vector, self->chains[k]->generator);
+        field = &self->fields[k * ninstances];
+        for (a = 0; a < ninstances; a++) {
+            field[a] = 0.0f;
+        }
+        ts = self->chains[k]->vector->sites;
+        for (i = 0; i < self->vector->nsites; i++, ts++) {
+            self->actives[i * nchains + k] = ts->indexActive;
+            row = EnergyModel_DenseRow (self->energyModel, ts->indexActive);
+            for (a = 0; a < ninstances; a++) {
+                field[a] += row[a];
+            }
+        }
+    }
+}
+
+/*
+ * Change the "active" instance of a site in all chains.
+ *
+ * The site is common to all chains, while the new instances and the Metropolis tests
+ * (or heat-bath draws) come from the generators of the chains. Returns the number of accepted moves.
+ */
+static Integer MCModelDefault_LockstepMove (const MCModelDefault *self, const TitrSite *ts, 
+                                            const Real potential, const Real beta) {
+    Integer  k, nchains = self->nchains, ninstances, old, new, nprotons, naccepted = 0;
+    Integer *active = &self->actives[ts->indexSite * nchains];
+    Real     Gdelta, *field;
+    const RandomNumberGenerator *generator;
+
+    ninstances = ts->indexLast - ts->indexFirst + 1;
+    for (k = 0; k < nchains; k++) {
+        generator = self->chains[k]->generator;
+        field     = &self->fields[k * self->energyModel->ninstances];
+        old       = active[k];
+        self->instancesOld[k] = old;
+        if (self->heatBath) {
+            MCModelDefault_Conditional (self->energyModel, field, ts, old, potential, beta, self->weights);
+            new = MCModelDefault_DrawInstance (ts, self->weights, generator);
+            if (new != old) {
+                active[k] = new;
+                naccepted++;
+            }
+        }
+        else {
+            do {
+                new = RandomNumberGenerator_NextCardinal (generator) % ninstances + ts->indexFirst;
+            } while (new == old);
+
+            nprotons = Integer1DArray_Item (self->energyModel->protons, new) - Integer1DArray_Item (self->energyModel->protons, old);
+            Gdelta   = Real1DArray_Item (self->energyModel->intrinsic, new) - Real1DArray_Item (self->energyModel->intrinsic, old) - nprotons * potential
+                     + (field[new] - EnergyModel_GetWdense (self->energyModel, new, old))
+                     - (field[old] - EnergyModel_GetWdense (self->energyModel, old, old));
+
+            if (MCModelDefault_Metropolis (Gdelta * beta, generator)) {
+                active[k] = new;
+                naccepted++;
+            }
+        }
+        self->instancesNew[k] = active[k];
+    }
+    if (naccepted > 0) {
+        MCModelDefault_LockstepUpdateFields (self, self->instancesOld, self->instancesNew);
+    }
+    return naccepted;
+}
+
+/*
+ * Change the "active" instances of a pair of sites in all chains.
+ */
+static Integer MCModelDefault_LockstepDoubleMove (const MCModelDefault *self, const PairSite *pair, 
+                                                  const Real potential, const Real beta) {
+    Integer   k, nchains = self->nchains, oldA, oldB, newA, newB, nprotons, naccepted = 0;
+    Integer  *activeA, *activeB, *old = self->instancesOld, *new = self->instancesNew;
+    Real      Gdelta, *field;
+    TitrSite *sa = pair->a, *sb = pair->b;
+    const RandomNumberGenerator *generator;
+    const EnergyModel *energyModel = self->energyModel;
+
+    activeA = &self->actives[sa->indexSite * nchains];
+    activeB = &self->actives[sb->indexSite * nchains];
+    for (k = 0; k < nchains; k++) {
+        generator = self->chains[k]->generator;
+        field     = &self->fields[k * self->energyModel->ninstances];
+        oldA      = activeA[k];
+        oldB      = activeB[k];
+        do {
+            newA = RandomNumberGenerator_NextCardinal (generator) % (sa->indexLast - sa->indexFirst + 1) + sa->indexFirst;
+        } while (newA == oldA);
+        do {
+            newB = RandomNumberGenerator_NextCardinal (generator) % (sb->indexLast - sb->indexFirst + 1) + sb->indexFirst;
+        } while (newB == oldB);
+
+        nprotons = Integer1DArray_Item (energyModel->protons, newA) - Integer1DArray_Item (energyModel->protons, oldA)
+                 + Integer1DArray_Item (energyModel->protons, newB) - Integer1DArray_Item (energyModel->protons, oldB);
+        Gdelta   = Real1DArray_Item (energyModel->intrinsic, newA) - Real1DArray_Item (energyModel->intrinsic, oldA)
+                 + Real1DArray_Item (energyModel->intrinsic, newB) - Real1DArray_Item (energyModel->intrinsic, oldB) - nprotons * potential
+                 + (field[newA] - EnergyModel_GetWdense (energyModel, newA, oldA) - EnergyModel_GetWdense (energyModel, newA, oldB))
+                 - (field[oldA] - EnergyModel_GetWdense (energyModel, oldA, oldA) - EnergyModel_GetWdense (energyModel, oldA, oldB))
+                 + (field[newB] - EnergyModel_GetWdense (energyModel, newB, oldB) - EnergyModel_GetWdense (energyModel, newB, oldA))
+                 - (field[oldB] - EnergyModel_GetWdense (energyModel, oldB, oldB) - EnergyModel_GetWdense (energyModel, oldB, oldA))
+                 + EnergyModel_GetWdense (energyModel, newA, newB) - EnergyModel_GetWdense (energyModel, oldA, oldB);
+
+        old[k]           = oldA;
+        old[k + nchains] = oldB;
+        if (MCModelDefault_Metropolis (Gdelta * beta, generator)) {
+            activeA[k] = newA;
+            activeB[k] = newB;
+            naccepted++;
+        }
+        new[k]           = activeA[k];
+        new[k + nchains] = activeB[k];
+    }
+    if (naccepted > 0) {
+        /* Update the fields in two passes, one for each site of the pair */
+        MCModelDefault_LockstepUpdateFields (self, old, new);
+        MCModelDefault_LockstepUpdateFields (self, &old[nchains], &new[nchains]);
+    }
+    return naccepted;
+}
+
+/*
+ * Draw new instances of the sites of a cluster in all chains.
+ */
+static Integer MCModelDefault_LockstepClusterMove (const MCModelDefault *self, const Integer cluster, 
+                                                   const Real potential, const Real beta) {
+    Integer  a, i, k, size, nchains = self->nchains, ninstances = self->energyModel->ninstances, naccepted = 0;
+    Integer *members, *current, *drawn, *active;
+    Real    *field, *rowOld, *rowNew;
+    Boolean  changed;
+
+    members = &self->clusterSites[self->clusterOffsets[cluster]];
+    size    = self->clusterOffsets[cluster + 1] - self->clusterOffsets[cluster];
+    current = self->clusterInstances;
+    drawn   = &self->clusterInstances[self->maxClusterSize];
+    for (k = 0; k < nchains; k++) {
+        field = &self->fields[k * ninstances];
+        for (i = 0; i < size; i++) {
+            current[i] = self->actives[members[i] * nchains + k];
+        }
+        MCModelDefault_SampleCluster (self, cluster, field, current, drawn, potential, beta, self->chains[k]->generator);
+        changed = False;
+        for (i = 0; i < size; i++) {
+            if (drawn[i] != current[i]) {
+                rowOld = EnergyModel_DenseRow (self->energyModel, current[i]);
+                rowNew = EnergyModel_DenseRow (self->energyModel, drawn[i]);
+                for (a = 0; a < ninstances; a++) {
+                    field[a] += rowNew[a] - rowOld[a];
+                }
+                active  = &self->actives[members[i] * nchains + k];
+                *active = drawn[i];
+                changed = True;
+            }
+        }
+        if (changed) {
+            naccepted++;
+        }
+    }
+    return naccepted;
+}
+
+/*
+ * Run a number of scans of all chains in lockstep, optionally accumulating counts of "active" instances.
+ *
+ * Each move is applied to the same site or pair of sites in all chains.
+ */
+static void MCModelDefault_LockstepScans (const MCModelDefault *self, const Real pH, 
+                                          Integer nscans, const Boolean accumulate) {
+    Integer   select, selection, i, k, a, nchains = self->nchains, ninstances = self->energyModel->ninstances;
+    Integer  *active;
+    Real      potential, beta, *row;
+    TitrSite *ts;
+
+    potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature * CONSTANT_LN10 * pH;
+    beta      = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature);
+    selection = self->vector->nsites + self->vector->npairs + self->nclusters;
+
+    for (; nscans > 0; nscans--) {
+        for (i = 0; i < selection; i++) {
+            select = RandomNumberGenerator_NextCardinal (self->generator) % selection;
+            if (select < self->vector->nsites) {
+                MCModelDefault_LockstepMove (self, &self->vector->sites[select], potential, beta);
+            }
+            else if (select < self->vector->nsites + self->vector->npairs) {
+                MCModelDefault_LockstepDoubleMove (self, &self->vector->pairs[select - self->vector->nsites], potential, beta);
+            }
+            else {
+                MCModelDefault_LockstepClusterMove (self, select - self->vector->nsites - self->vector->npairs, potential, beta);
+            }
+        }
+        if (accumulate) {
+            ts = self->vector->sites;
+            for (i = 0; i < self->vector->nsites; i++, ts++) {
+                active = &self->actives[i * nchains];
+                for (k = 0; k < nchains; k++) {
+                    row = &self->chainProbabilities[k * ninstances];
+                    if (self->raoBlackwell) {
+                        MCModelDefault_Conditional (self->energyModel, &self->fields[k * ninstances], ts, active[k], potential, beta, self->weights);
+                        for (a = ts->indexFirst; a <= ts->indexLast; a++) {
+                            row[a] += self->weights[a];
+                        }
+                    }
+                    else {
+                        row[active[k]]++;
+                    }
+                }
+            }
+        }
+    }
+}
+
+/*
+ * Run independent chains, in parallel if possible, and merge their probabilities.
+ * In the lockstep mode, chains are advanced together in a single thread.
+ *
+ * For each instance, the potential scale reduction factor is calculated from the
+ * between-chain and within-chain variances of its occupancy (Gelman and Rubin).
+ * The standard error of the merged probability is estimated from the spread of
+ * probabilities between chains, which also accounts for the correlation of samples.
+ * The within-chain variance assumes 0/1 counts, so with Rao-Blackwellization it
+ * is an upper bound and R-hat is somewhat underestimated.
+ */
+void MCModelDefault_RunChains (const MCModelDefault *self, const Real pH) {
+    MCModelDefault *chain;
+    Integer         k, a, ninstances;
+    Real            mean, p, B, W, V, n;
+#ifdef _OPENMP
+    Integer         nthreads;
+#endif
+
+    ninstances = self->energyModel->ninstances;
+    if (self->lockstep) {
+        MCModelDefault_LockstepRandomize (self);
+        MCModelDefault_LockstepScans (self, pH, self->nequil, False);
+        for (a = 0; a < self->nchains * ninstances; a++) {
+            self->chainProbabilities[a] = 0.0f;
+        }
+        MCModelDefault_LockstepScans (self, pH, self->nprod, True);
+        for (a = 0; a < self->nchains * ninstances; a++) {
+            self->chainProbabilities[a] /= self->nprod;
+        }
+    }
+    else {
+#ifdef _OPENMP
+        nthreads = (self->nthreads > 0) ? self->nthreads : omp_get_max_threads ();
+        #pragma omp parallel for private (chain) schedule (dynamic, 1) num_threads (nthreads)
+#endif
+        for (k = 0; k < self->nchains; k++) {
+            chain = self->chains[k];
+            MCModelDefault_Equilibration (chain, pH);
+            MCModelDefault_Production    (chain, pH);
+        }
+    }
+
+    n = (Real) self->nprod;
+    for (a = 0; a < ninstances; a++) {
+        mean = 0.0f;
+        W    = 0.0f;
+        for (k = 0; k < self->nchains; k++) {
+            p     = self->chainProbabilities[k * ninstances + a];
+            mean += p;
+            W    += p * (1.0f - p);
+        }
+        mean /= self->nchains;
+        W    *= n / ((n - 1.0f) * self->nchains);
+
+        /* B is the between-chain variance of probabilities, i.e. B/n in the notation of Gelman and Rubin */
+        B = 0.0f;
+        for (k = 0; k < self->nchains; k++) {
+            p  = self->chainProbabilities[k * ninstances + a] - mean;
+            B += p * p;
+        }
+        B /= (self->nchains - 1);
+        V  = (n - 1.0f) / n * W + B;
+
+        Real1DArray_Item (self->energyModel->probabilities, a) = mean;
+        self->errors[a] = sqrt (B / self->nchains);
+        if (W > 0.0f) {
+            self->rhat[a] = sqrt (V / W);
+        }
+        else {
+            self->rhat[a] = (B > 0.0f) ? HUGE_VAL : 1.0f;
+        }
+    }
+}
+
+/*
+ * Count the protons bound in the current state vector.
+ */
+Integer MCModelDefault_CountProtons (const MCModelDefault *self) {
+    TitrSite *ts = self->vector->sites;
+    Integer   i, nprotons = 0;
+
+    for (i = 0; i < self->vector->nsites; i++, ts++) {
+        nprotons += Integer1DArray_Item (self->energyModel->protons, ts->indexActive);
+    }
+    return nprotons;
+}
+
+/*
+ * Clear the histogram of numbers of protons.
+ */
+void MCModelDefault_ResetProtonHistogram (const MCModelDefault *self) {
+    Integer i;
+
+    for (i = 0; i <= self->maxProtons; i++) {
+        self->protonCounts[i] = 0.0f;
+    }
+    for (i = 0; i < (self->maxProtons + 1) * self->energyModel->ninstances; i++) {
+        self->protonInstances[i] = 0.0f;
+    }
+}
+
+/*
+ * Add the current state vector to the histogram of numbers of protons.
+ *
+ * The energy of a state depends on pH only through its number of protons, so that these counts
+ * are sufficient to reweight probabilities of instances to other pH-values.
+ */
+void MCModelDefault_UpdateProtonHistogram (const MCModelDefault *self) {
+    TitrSite *ts;
+    Integer   i, nprotons;
+    Real     *counts;
+
+    nprotons = MCModelDefault_CountProtons (self);
+    self->protonCounts[nprotons] += 1.0f;
+    counts = &self->protonInstances[nprotons * self->energyModel->ninstances];
+    for (i = 0, ts = self->vector->sites; i < self->vector->nsites; i++, ts++) {
+        counts[ts->indexActive] += 1.0f;
+    }
+}
+
+/*
+ * Run replica exchange, where each chain is a replica simulated at a different pH.
+ *
+ * After every |frequency| production scans, swaps of replicas between neighbouring
+ * pH-values are attempted, alternately for even and odd pairs. Since only the term
+ * with the chemical potential of protons depends on pH, the swap criterion depends
+ * only on the difference in the numbers of bound protons.
+ *
+ * Probabilities of instances at each pH are accumulated in the rows of chainProbabilities,
+ * whichever replica is currently simulated at that pH.
+ */
+void MCModelDefault_ReplicaExchange (const MCModelDefault *self, const Real1DArray *pHs, 
+                                     const Integer frequency, Status *status) {
+    MCModelDefault *chain, *other;
+    Integer        *order = NULL, j, a, nscans, done, parity, swap, ninstances, nmoves, moves, movesAcc, flips, flipsAcc;
+    Real            pH, GdeltaRT;
+#ifdef _OPENMP
+    Integer         nthreads;
+#endif
+
+    if (Real1DArray_Length (pHs) != self->nchains) {
+        Status_Set (status, Status_ArrayNonConformableSizes);
+        return;
+    }
+    /* order[j] is the index of the replica simulated at the j-th pH-value */
+    MEMORY_ALLOCATEARRAY (order, self->nchains, Integer);
+    if (order == NULL) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        return;
+    }
+    for (j = 0; j < self->nchains; j++) {
+        order[j] = j;
+        self->swapsAttempted[j] = 0;
+        self->swapsAccepted[j]  = 0;
+    }
+    ninstances = self->energyModel->ninstances;
+    nmoves     = self->vector->nsites + self->vector->npairs + self->nclusters;
+#ifdef _OPENMP
+    nthreads = (self->nthreads > 0) ? self->nthreads : omp_get_max_threads ();
+    #pragma omp parallel for private (chain) schedule (dynamic, 1) num_threads (nthreads)
+#endif
+    for (j = 0; j < self->nchains; j++) {
+        chain = self->chains[j];
+        MCModelDefault_Equilibration (chain, Real1DArray_Item (pHs, j));
+    }
+    for (a = 0; a < self->nchains * ninstances; a++) {
+        self->chainProbabilities[a] = 0.0f;
+    }
+
+    for (done = 0, parity = 0; done < self->nprod; done += nscans, parity = 1 - parity) {
+        nscans = (self->nprod - done < frequency) ? (self->nprod - done) : frequency;
+#ifdef _OPENMP
+        #pragma omp parallel for private (chain, pH, a, moves, movesAcc, flips, flipsAcc) schedule (dynamic, 1) num_threads (nthreads)
+#endif
+        for (j = 0; j < self->nchains; j++) {
+            chain = self->chains[order[j]];
+            pH    = Real1DArray_Item (pHs, j);
+            chain->probabilities = &self->chainProbabilities[j * ninstances];
+            for (a = 0; a < nscans; a++) {
+                MCModelDefault_MCScan (chain, pH, nmoves, &moves, &movesAcc, &flips, &flipsAcc);
+                MCModelDefault_UpdateProbabilities (chain, pH);
+            }
+        }
+        for (j = parity; j < self->nchains - 1; j += 2) {
+            chain    = self->chains[order[j]];
+            other    = self->chains[order[j + 1]];
+            GdeltaRT = CONSTANT_LN10 * (MCModelDefault_CountProtons (chain) - MCModelDefault_CountProtons (other)) * (Real1DArray_Item (pHs, j + 1) - Real1DArray_Item (pHs, j));
+            self->swapsAttempted[j]++;
+            if (MCModelDefault_Metropolis (GdeltaRT, self->generator)) {
+                swap         = order[j];
+                order[j]     = order[j + 1];
+                order[j + 1] = swap;
+                self->swapsAccepted[j]++;
+            }
+        }
+    }
+    for (a = 0; a < self->nchains * ninstances; a++) {
+        self->chainProbabilities[a] /= self->nprod;
+    }
+    for (j = 0; j < self->nchains; j++) {
+        self->chains[j]->probabilities = &self->chainProbabilities[j * ninstances];
+    }
+    MEMORY_DEALLOCATE (order);
+}
@@ -0,0 +1,148 @@
+/*------------------------------------------------------------------------------
+! . File      : MeanFieldModel.c
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#include "MeanFieldModel.h"
+
+/*
+ * Allocate the mean-field model.
+ */
+MeanFieldModel *MeanFieldModel_Allocate (const Real damping, const Real tolerance, const Integer maxIterations, Status *status) {
+    MeanFieldModel *self = NULL;
+
+    MEMORY_ALLOCATE (self, MeanFieldModel);
+    if (self == NULL) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        return NULL;
+    }
+    self->damping       = damping       ;
+    self->tolerance     = tolerance     ;
+    self->maxIterations = maxIterations ;
+    self->niterations   = 0             ;
+    self->deviation     = 0.0f          ;
+    self->field         = NULL          ;
+    self->energyModel   = NULL          ;
+    return self;
+}
+
+/*
+ * Deallocate the mean-field model.
+ */
+void MeanFieldModel_Deallocate (MeanFieldModel *self) {
+    if (self != NULL) {
+        if (self->field != NULL) MEMORY_DEALLOCATE (self->field);
+        MEMORY_DEALLOCATE (self);
+    }
+}
+
+/*
+ * Link mean-field and energy models.
+ */
+void MeanFieldModel_LinkToEnergyModel (MeanFieldModel *self, EnergyModel *energyModel, Status *status) {
+    if (self->field != NULL) MEMORY_DEALLOCATE (self->field);
+    MEMORY_ALLOCATEARRAY (self->field, energyModel->ninstances, Real);
+    if (self->field == NULL) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+        return;
+    }
+    self->energyModel = energyModel;
+}
+
+/*
+ * Set probabilities of instances of each site to be equal.
+ */
+void MeanFieldModel_Reset (const MeanFieldModel *self) {
+    EnergyModel *energyModel = self->energyModel;
+    TitrSite    *site;
+    Integer      i, index;
+    Real         probability;
+
+    site = energyModel->vector->sites;
+    for (i = 0; i < energyModel->vector->nsites; i++, site++) {
+        probability = 1.0f / (site->indexLast - site->indexFirst + 1);
+        for (index = site->indexFirst; index <= site->indexLast; index++) {
+            Real1DArray_Item (energyModel->probabilities, index) = probability;
+        }
+    }
+}
+
+/*
+ * Do one iteration. The average field of other sites is calculated from the current probabilities,
+ * and new probabilities of each site are obtained from the Boltzmann distribution in this field.
+ * The new probabilities are mixed with the old ones according to the damping factor.
+ *
+ * Sites are assumed to occupy consecutive ranges of instances in the order of the state vector.
+ *
+ * Returns the largest change of probability.
+ */
+Real MeanFieldModel_Iterate (const MeanFieldModel *self, const Real pH) {
+    EnergyModel *energyModel = self->energyModel;
+    TitrSite    *site;
+    Integer      i, a, b;
+    Real        *probabilities, *field = self->field, *row, Gmin, G, Z, beta, potential, probability, change, deviation;
+
+    probabilities = Real1DArray_Data (energyModel->probabilities);
+    beta          = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * energyModel->temperature);
+    potential     = -CONSTANT_MOLAR_GAS_KCAL_MOL * energyModel->temperature * CONSTANT_LN10 * pH;
+
+    /* Go over the rows of the interaction matrix, skipping instances of the same site */
+    site = energyModel->vector->sites;
+    for (i = 0; i < energyModel->vector->nsites; i++, site++) {
+        for (a = site->indexFirst; a <= site->indexLast; a++) {
+            row = EnergyModel_DenseRow (energyModel, a);
+            G   = 0.0f;
+            for (b = 0; b < site->indexFirst; b++) {
+                G += row[b] * probabilities[b];
+            }
+            for (b = site->indexLast + 1; b < energyModel->ninstances; b++) {
+                G += row[b] * probabilities[b];
+            }
+            field[a] = G;
+        }
+    }
+
+    /* Update probabilities */
+    deviation = 0.0f;
+    site = energyModel->vector->sites;
+    for (i = 0; i < energyModel->vector->nsites; i++, site++) {
+        Gmin = Real1DArray_Item (energyModel->intrinsic, site->indexFirst) - Integer1DArray_Item (energyModel->protons, site->indexFirst) * potential + field[site->indexFirst];
+        for (a = site->indexFirst; a <= site->indexLast; a++) {
+            field[a] += Real1DArray_Item (energyModel->intrinsic, a) - Integer1DArray_Item (energyModel->protons, a) * potential;
+            if (field[a] < Gmin) Gmin = field[a];
+        }
+        Z = 0.0f;
+        for (a = site->indexFirst; a <= site->indexLast; a++) {
+            G = exp (-beta * (field[a] - Gmin));
+            field[a] = G;
+            Z += G;
+        }
+        for (a = site->indexFirst; a <= site->indexLast; a++) {
+            probability = self->damping * probabilities[a] + (1.0f - self->damping) * field[a] / Z;
+            change = fabs (probability - probabilities[a]);
+            if (change > deviation) deviation = change;
+            probabilities[a] = probability;
+        }
+    }
+    return deviation;
+}
+
+/*
+ * Iterate until the largest change of probability is below the tolerance.
+ * Iterations start from equal probabilities of instances of each site.
+ *
+ * Returns True if the calculation converged.
+ */
+Boolean MeanFieldModel_CalculateProbabilities (MeanFieldModel *self, const Real pH) {
+    MeanFieldModel_Reset (self);
+    for (self->niterations = 1; self->niterations <= self->maxIterations; self->niterations++) {
+        self->deviation = MeanFieldModel_Iterate (self, pH);
+        if (self->deviation < self->tolerance) {
+            return True;
+        }
+    }
+    self->niterations = self->maxIterations;
+    return False;
+}
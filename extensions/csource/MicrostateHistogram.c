@@ -0,0 +1,383 @@
+/*------------------------------------------------------------------------------
+! . File      : MicrostateHistogram.c
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#include "MicrostateHistogram.h"
+
+
+/*
+ * Multiply a key by a factor and add a term. Both are less than 2^16.
+ *
+ * Returns False if the result does not fit into the key.
+ */
+static Boolean MicrostateHistogram_MultiplyAdd (MicrostateKey *key, const Cardinal factor, const Cardinal term) {
+    Cardinal carry = term, value;
+    Integer  i;
+
+    for (i = 0; i < MICROSTATEHISTOGRAM_KEY_DIGITS; i++) {
+        value          = key->digits[i] * factor + carry;
+        key->digits[i] = value & MICROSTATEHISTOGRAM_DIGIT_MASK;
+        carry          = value >> MICROSTATEHISTOGRAM_DIGIT_BITS;
+    }
+    return (carry == 0);
+}
+
+/*
+ * Final mixing step of MurmurHash3, used to spread keys over the slots.
+ */
+static Cardinal MicrostateHistogram_Mix (Cardinal h) {
+    h ^= h >> 16;
+    h *= 0x85ebca6bU;
+    h ^= h >> 13;
+    h *= 0xc2b2ae35U;
+    h ^= h >> 16;
+    return h;
+}
+
+/*
+ * Find the first slot of a key.
+ */
+static Integer MicrostateHistogram_Slot (const MicrostateHistogram *self, const MicrostateKey *key) {
+    Cardinal h = 0;
+    Integer  i;
+
+    for (i = 0; i < MICROSTATEHISTOGRAM_KEY_DIGITS; i++) {
+        h = MicrostateHistogram_Mix (h ^ key->digits[i]);
+    }
+    return (Integer) (h & (Cardinal) (self->nslots - 1));
+}
+
+/*
+ * Compare microstates by their counts (descending) and indices (ascending).
+ */
+static int MicrostateHistogram_CompareCounts (const void *a, const void *b) {
+    const MicrostateRank *ra = (const MicrostateRank *) a, *rb = (const MicrostateRank *) b;
+
+    if (ra->count > rb->count) return -1;
+    if (ra->count < rb->count) return  1;
+    return (ra->index < rb->index) ? -1 : (ra->index > rb->index);
+}
+
+/*
+ * Compare microstates by their indices.
+ */
+static int MicrostateHistogram_CompareIndices (const void *a, const void *b) {
+    const MicrostateRank *ra = (const MicrostateRank *) a, *rb = (const MicrostateRank *) b;
+
+    return (ra->index < rb->index) ? -1 : (ra->index > rb->index);
+}
+
+/*
+ * Allocate a histogram of microstates of the given state vector.
+ */
+MicrostateHistogram *MicrostateHistogram_Allocate (const StateVector *vector, const Integer maxStates, Status *status) {
+    MicrostateHistogram *self = NULL;
+    MicrostateKey        key;
+    TitrSite            *ts;
+    Integer              i;
+
+    MEMORY_ALLOCATE (self, MicrostateHistogram);
+    if (self == NULL) {
+        goto failSet;
+    }
+    self->nsites     = vector->nsites ;
+    self->maxStates  = (maxStates > 1) ? maxStates : MICROSTATEHISTOGRAM_MAX_STATES ;
+    self->nstates    = 0    ;
+    self->radices    = NULL ;
+    self->slots      = NULL ;
+    self->keys       = NULL ;
+    self->counts     = NULL ;
+    self->energies   = NULL ;
+    self->protons    = NULL ;
+    self->instances  = NULL ;
+    self->ranks      = NULL ;
+    self->nsamples   = 0.0f ;
+    self->nevicted   = 0.0f ;
+    self->nevictions = 0    ;
+    self->nslots     = 1    ;
+    while (self->nslots < 2 * self->maxStates) {
+        self->nslots <<= 1;
+    }
+
+    MEMORY_ALLOCATEARRAY (self->radices   , self->nsites                   , Integer)        ;
+    MEMORY_ALLOCATEARRAY (self->slots     , self->nslots                   , Integer)        ;
+    MEMORY_ALLOCATEARRAY (self->keys      , self->maxStates                , MicrostateKey)  ;
+    MEMORY_ALLOCATEARRAY (self->counts    , self->maxStates                , Real)           ;
+    MEMORY_ALLOCATEARRAY (self->energies  , self->maxStates                , Real)           ;
+    MEMORY_ALLOCATEARRAY (self->protons   , self->maxStates                , Integer)        ;
+    MEMORY_ALLOCATEARRAY (self->instances , self->maxStates * self->nsites , Integer)        ;
+    MEMORY_ALLOCATEARRAY (self->ranks     , self->maxStates                , MicrostateRank) ;
+    if ((self->radices == NULL) || (self->slots == NULL) || (self->keys == NULL) || (self->counts == NULL) || (self->energies == NULL) || (self->protons == NULL) || (self->instances == NULL) || (self->ranks == NULL)) {
+        goto failSetDealloc;
+    }
+
+    /* Keys are exact if the total number of states fits into a key */
+    self->isExact = True;
+    for (i = 0; i < MICROSTATEHISTOGRAM_KEY_DIGITS; i++) {
+        key.digits[i] = 0;
+    }
+    key.digits[0] = 1;
+    for (i = 0, ts = vector->sites; i < self->nsites; i++, ts++) {
+        self->radices[i] = ts->indexLast - ts->indexFirst + 1;
+        if (self->isExact) {
+            if ((self->radices[i] > MICROSTATEHISTOGRAM_DIGIT_MASK) || (!MicrostateHistogram_MultiplyAdd (&key, (Cardinal) self->radices[i], 0))) {
+                self->isExact = False;
+            }
+        }
+    }
+    MicrostateHistogram_Reset (self);
+    return self;
+
+failSetDealloc:
+    MicrostateHistogram_Deallocate (self);
+failSet:
+    Status_Set (status, Status_MemoryAllocationFailure);
+    return NULL;
+}
+
+/*
+ * Deallocate the histogram.
+ */
+void MicrostateHistogram_Deallocate (MicrostateHistogram *self) {
+    if (self != NULL) {
+        if ( self->radices   != NULL)  MEMORY_DEALLOCATE ( self->radices   ) ;
+        if ( self->slots     != NULL)  MEMORY_DEALLOCATE ( self->slots     ) ;
+        if ( self->keys      != NULL)  MEMORY_DEALLOCATE ( self->keys      ) ;
+        if ( self->counts    != NULL)  MEMORY_DEALLOCATE ( self->counts    ) ;
+        if ( self->energies  != NULL)  MEMORY_DEALLOCATE ( self->energies  ) ;
+        if ( self->protons   != NULL)  MEMORY_DEALLOCATE ( self->protons   ) ;
+        if ( self->instances != NULL)  MEMORY_DEALLOCATE ( self->instances ) ;
+        if ( self->ranks     != NULL)  MEMORY_DEALLOCATE ( self->ranks     ) ;
+        MEMORY_DEALLOCATE (self);
+    }
+}
+
+/*
+ * Remove all microstates from the histogram.
+ */
+void MicrostateHistogram_Reset (MicrostateHistogram *self) {
+    Integer i;
+
+    for (i = 0; i < self->nslots; i++) {
+        self->slots[i] = -1;
+    }
+    self->nstates    = 0    ;
+    self->nsamples   = 0.0f ;
+    self->nevicted   = 0.0f ;
+    self->nevictions = 0    ;
+}
+
+/*
+ * Encode the state vector as a key.
+ *
+ * Exact keys are calculated by Horner's scheme, so that the local index of the instance
+ * of the first site is the least significant digit of the mixed radix number. Hashes
+ * are made of four independent 32-bit hashes of the local indices of instances.
+ */
+void MicrostateHistogram_Encode (const MicrostateHistogram *self, const StateVector *vector, MicrostateKey *key) {
+    static const Cardinal multipliers[4] = { 0x01000193U, 0x9e3779b1U, 0x85ebca6bU, 0xc2b2ae35U };
+    Cardinal  h[4];
+    TitrSite *ts;
+    Integer   i, k;
+
+    for (k = 0; k < MICROSTATEHISTOGRAM_KEY_DIGITS; k++) {
+        key->digits[k] = 0;
+    }
+    if (self->isExact) {
+        for (i = self->nsites - 1; i >= 0; i--) {
+            ts = &vector->sites[i];
+            MicrostateHistogram_MultiplyAdd (key, (Cardinal) self->radices[i], (Cardinal) (ts->indexActive - ts->indexFirst));
+        }
+    }
+    else {
+        for (k = 0; k < 4; k++) {
+            h[k] = 0x811c9dc5U + (Cardinal) k;
+        }
+        for (i = 0, ts = vector->sites; i < self->nsites; i++, ts++) {
+            for (k = 0; k < 4; k++) {
+                h[k] = (h[k] ^ (Cardinal) (ts->indexActive - ts->indexFirst)) * multipliers[k];
+                h[k] ^= h[k] >> 15;
+            }
+        }
+        for (k = 0; k < 4; k++) {
+            h[k] = MicrostateHistogram_Mix (h[k]);
+            key->digits[2 * k    ] = h[k] & MICROSTATEHISTOGRAM_DIGIT_MASK;
+            key->digits[2 * k + 1] = h[k] >> MICROSTATEHISTOGRAM_DIGIT_BITS;
+        }
+    }
+}
+
+/*
+ * Check if a microstate of the histogram is the state of the vector.
+ */
+static Boolean MicrostateHistogram_IsState (const MicrostateHistogram *self, const Integer index, const MicrostateKey *key, const StateVector *vector) {
+    TitrSite *ts;
+    Integer   i, *instances;
+
+    for (i = 0; i < MICROSTATEHISTOGRAM_KEY_DIGITS; i++) {
+        if (self->keys[index].digits[i] != key->digits[i]) {
+            return False;
+        }
+    }
+    if (!self->isExact) {
+        instances = &self->instances[index * self->nsites];
+        for (i = 0, ts = vector->sites; i < self->nsites; i++, ts++) {
+            if (instances[i] != ts->indexActive - ts->indexFirst) {
+                return False;
+            }
+        }
+    }
+    return True;
+}
+
+/*
+ * Rebuild the hash table from the microstates, inserting them in the order of their indices.
+ */
+static void MicrostateHistogram_Rebuild (MicrostateHistogram *self) {
+    Integer  i, slot;
+
+    for (i = 0; i < self->nslots; i++) {
+        self->slots[i] = -1;
+    }
+    for (i = 0; i < self->nstates; i++) {
+        slot = MicrostateHistogram_Slot (self, &self->keys[i]);
+        while (self->slots[slot] >= 0) {
+            slot = (slot + 1) & (self->nslots - 1);
+        }
+        self->slots[slot] = i;
+    }
+}
+
+/*
+ * Evict the rarer half of microstates and rebuild the hash table.
+ */
+static void MicrostateHistogram_Evict (MicrostateHistogram *self) {
+    Integer  i, j, nkept, source;
+
+    for (i = 0; i < self->nstates; i++) {
+        self->ranks[i].count = self->counts[i];
+        self->ranks[i].index = i;
+    }
+    qsort (self->ranks, (size_t) self->nstates, sizeof (MicrostateRank), MicrostateHistogram_CompareCounts);
+    nkept = self->nstates / 2;
+    for (i = nkept; i < self->nstates; i++) {
+        self->nevicted += self->ranks[i].count;
+    }
+
+    /* Move the kept microstates to the front, in the order of their indices so that nothing is overwritten */
+    qsort (self->ranks, (size_t) nkept, sizeof (MicrostateRank), MicrostateHistogram_CompareIndices);
+    for (i = 0; i < nkept; i++) {
+        source = self->ranks[i].index;
+        if (source != i) {
+            self->keys    [i] = self->keys    [source];
+            self->counts  [i] = self->counts  [source];
+            self->energies[i] = self->energies[source];
+            self->protons [i] = self->protons [source];
+            for (j = 0; j < self->nsites; j++) {
+                self->instances[i * self->nsites + j] = self->instances[source * self->nsites + j];
+            }
+        }
+    }
+    self->nstates = nkept;
+    self->nevictions++;
+    MicrostateHistogram_Rebuild (self);
+}
+
+/*
+ * Record a sampled state vector with its energy and number of protons.
+ */
+void MicrostateHistogram_Record (MicrostateHistogram *self, const StateVector *vector, const Real G, const Integer nprotons) {
+    MicrostateKey  key;
+    TitrSite      *ts;
+    Integer        slot, index, i, *instances;
+
+    MicrostateHistogram_Encode (self, vector, &key);
+    self->nsamples += 1.0f;
+
+    slot = MicrostateHistogram_Slot (self, &key);
+    while ((index = self->slots[slot]) >= 0) {
+        if (MicrostateHistogram_IsState (self, index, &key, vector)) {
+            self->counts[index] += 1.0f;
+            return;
+        }
+        slot = (slot + 1) & (self->nslots - 1);
+    }
+
+    /* A new microstate */
+    if (self->nstates >= self->maxStates) {
+        MicrostateHistogram_Evict (self);
+        slot = MicrostateHistogram_Slot (self, &key);
+        while (self->slots[slot] >= 0) {
+            slot = (slot + 1) & (self->nslots - 1);
+        }
+    }
+    index = self->nstates++;
+    self->slots   [slot]  = index;
+    self->keys    [index] = key;
+    self->counts  [index] = 1.0f;
+    self->energies[index] = G;
+    self->protons [index] = nprotons;
+    instances = &self->instances[index * self->nsites];
+    for (i = 0, ts = vector->sites; i < self->nsites; i++, ts++) {
+        instances[i] = ts->indexActive - ts->indexFirst;
+    }
+}
+
+/*
+ * Write the microstates to a checkpoint file.
+ */
+Boolean MicrostateHistogram_Write (const MicrostateHistogram *self, FILE *file) {
+    Integer  values[4];
+    Real     totals[2];
+    size_t   n = (size_t) self->nstates;
+
+    values[0] = self->nsites     ;
+    values[1] = self->maxStates  ;
+    values[2] = self->nstates    ;
+    values[3] = self->nevictions ;
+    totals[0] = self->nsamples   ;
+    totals[1] = self->nevicted   ;
+    return ((fwrite (values          , sizeof (Integer)       , 4                , file) == 4) &&
+            (fwrite (totals          , sizeof (Real)          , 2                , file) == 2) &&
+            (fwrite (self->keys      , sizeof (MicrostateKey) , n                , file) == n) &&
+            (fwrite (self->counts    , sizeof (Real)          , n                , file) == n) &&
+            (fwrite (self->energies  , sizeof (Real)          , n                , file) == n) &&
+            (fwrite (self->protons   , sizeof (Integer)       , n                , file) == n) &&
+            (fwrite (self->instances , sizeof (Integer)       , n * self->nsites , file) == n * self->nsites));
+}
+
+/*
+ * Read the microstates from a checkpoint file, replacing those in the histogram.
+ *
+ * Returns False if the file is damaged or was written for a different histogram.
+ */
+Boolean MicrostateHistogram_Read (MicrostateHistogram *self, FILE *file) {
+    Integer  values[4];
+    Real     totals[2];
+    size_t   n;
+
+    if ((fread (values, sizeof (Integer), 4, file) != 4) || (fread (totals, sizeof (Real), 2, file) != 2)) {
+        return False;
+    }
+    if ((values[0] != self->nsites) || (values[1] != self->maxStates) || (values[2] < 0) || (values[2] > self->maxStates)) {
+        return False;
+    }
+    n = (size_t) values[2];
+    if ((fread (self->keys      , sizeof (MicrostateKey) , n                , file) != n) ||
+        (fread (self->counts    , sizeof (Real)          , n                , file) != n) ||
+        (fread (self->energies  , sizeof (Real)          , n                , file) != n) ||
+        (fread (self->protons   , sizeof (Integer)       , n                , file) != n) ||
+        (fread (self->instances , sizeof (Integer)       , n * self->nsites , file) != n * self->nsites)) {
+        MicrostateHistogram_Reset (self);
+        return False;
+    }
+    self->nstates    = values[2] ;
+    self->nevictions = values[3] ;
+    self->nsamples   = totals[0] ;
+    self->nevicted   = totals[1] ;
+    MicrostateHistogram_Rebuild (self);
+    return True;
+}
@@ -0,0 +1,196 @@
+/*------------------------------------------------------------------------------
+! . File      : StateTrajectory.c
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#include "StateTrajectory.h"
+
+
+/*
+ * Round up a number of bytes to a multiple of the padding.
+ */
+static Integer StateTrajectory_Padded (const Integer nbytes) {
+    return ((nbytes + STATETRAJECTORY_PADDING - 1) / STATETRAJECTORY_PADDING) * STATETRAJECTORY_PADDING;
+}
+
+/*
+ * Deallocate the buffers of a trajectory. The file has to be closed before.
+ */
+static void StateTrajectory_Deallocate (StateTrajectory *self) {
+    if ( self->previous != NULL)  MEMORY_DEALLOCATE ( self->previous ) ;
+    if ( self->keyframe != NULL)  MEMORY_DEALLOCATE ( self->keyframe ) ;
+    if ( self->energies != NULL)  MEMORY_DEALLOCATE ( self->energies ) ;
+    if ( self->protons  != NULL)  MEMORY_DEALLOCATE ( self->protons  ) ;
+    if ( self->counts   != NULL)  MEMORY_DEALLOCATE ( self->counts   ) ;
+    if ( self->changes  != NULL)  MEMORY_DEALLOCATE ( self->changes  ) ;
+    MEMORY_DEALLOCATE (self);
+}
+
+/*
+ * Write the header of the file. It is written again on closing, with the final numbers of scans and blocks.
+ */
+static Boolean StateTrajectory_WriteHeader (StateTrajectory *self) {
+    Integer  values[4];
+
+    values[0] = self->nsites    ;
+    values[1] = self->blockSize ;
+    values[2] = self->ntotal    ;
+    values[3] = self->nblocks   ;
+    if (fwrite (STATETRAJECTORY_MAGIC, sizeof (char), 8, self->file) != 8) {
+        return False;
+    }
+    return (fwrite (values, sizeof (Integer), 4, self->file) == 4);
+}
+
+/*
+ * Open a trajectory file for writing state vectors.
+ *
+ * Returns NULL if the file cannot be opened. In that case, the status is set only if
+ * buffers cannot be allocated or a site has too many instances to be packed.
+ */
+StateTrajectory *StateTrajectory_Open (const char *filename, const StateVector *vector, 
+                                       const Integer blockSize, Status *status) {
+    StateTrajectory *self = NULL;
+    TitrSite        *ts;
+    Integer          i, padded;
+
+    ts = vector->sites;
+    for (i = 0; i < vector->nsites; i++, ts++) {
+        if (ts->indexLast - ts->indexFirst + 1 > STATETRAJECTORY_MAX_INSTANCES) {
+            Status_Set (status, Status_ValueError);
+            return NULL;
+        }
+    }
+    MEMORY_ALLOCATE (self, StateTrajectory);
+    if (self == NULL) {
+        goto failSet;
+    }
+    self->file      = NULL ;
+    self->nsites    = vector->nsites ;
+    self->blockSize = (blockSize > 0) ? blockSize : STATETRAJECTORY_BLOCK_SCANS ;
+    self->nscans    = 0 ;
+    self->nchanges  = 0 ;
+    self->ntotal    = 0 ;
+    self->nblocks   = 0 ;
+    self->previous  = NULL ;
+    self->keyframe  = NULL ;
+    self->energies  = NULL ;
+    self->protons   = NULL ;
+    self->counts    = NULL ;
+    self->changes   = NULL ;
+
+    /* The buffer of changes is large enough for all sites changing in every scan */
+    padded = StateTrajectory_Padded (self->nsites);
+    MEMORY_ALLOCATEARRAY (self->previous , self->nsites                         , Integer)       ;
+    MEMORY_ALLOCATEARRAY (self->keyframe , padded                               , unsigned char) ;
+    MEMORY_ALLOCATEARRAY (self->energies , self->blockSize                      , Real)          ;
+    MEMORY_ALLOCATEARRAY (self->protons  , self->blockSize                      , Integer)       ;
+    MEMORY_ALLOCATEARRAY (self->counts   , self->blockSize                      , Integer)       ;
+    MEMORY_ALLOCATEARRAY (self->changes  , self->nsites * self->blockSize + 1   , Cardinal)      ;
+    if ((self->previous == NULL) || (self->keyframe == NULL) || (self->energies == NULL) || (self->protons == NULL) || (self->counts == NULL) || (self->changes == NULL)) {
+        goto failSetDealloc;
+    }
+    memset (self->keyframe, 0, padded);
+
+    self->file = fopen (filename, "wb");
+    if (self->file == NULL) {
+        StateTrajectory_Deallocate (self);
+        return NULL;
+    }
+    if (!StateTrajectory_WriteHeader (self)) {
+        fclose (self->file);
+        StateTrajectory_Deallocate (self);
+        return NULL;
+    }
+    return self;
+
+failSetDealloc:
+    StateTrajectory_Deallocate (self);
+failSet:
+    Status_Set (status, Status_MemoryAllocationFailure);
+    return NULL;
+}
+
+/*
+ * Add the current state vector to the trajectory.
+ *
+ * The first scan of a block is stored as a keyframe. Each following scan
+ * stores only the sites whose "active" instances have changed.
+ */
+Boolean StateTrajectory_Write (StateTrajectory *self, const StateVector *vector, 
+                               const Integer nprotons, const Real G) {
+    TitrSite *ts;
+    Integer   i, local, nchanged = 0;
+
+    ts = vector->sites;
+    for (i = 0; i < self->nsites; i++, ts++) {
+        local = ts->indexActive - ts->indexFirst;
+        if (self->nscans == 0) {
+            self->keyframe[i] = (unsigned char) local;
+        }
+        else if (local != self->previous[i]) {
+            self->changes[self->nchanges++] = ((Cardinal) i << 8) | (Cardinal) local;
+            nchanged++;
+        }
+        self->previous[i] = local;
+    }
+    self->energies [self->nscans] = G        ;
+    self->protons  [self->nscans] = nprotons ;
+    self->counts   [self->nscans] = nchanged ;
+    self->nscans++;
+    self->ntotal++;
+
+    if (self->nscans >= self->blockSize) {
+        return StateTrajectory_Flush (self);
+    }
+    return True;
+}
+
+/*
+ * Write the current block to the file.
+ */
+Boolean StateTrajectory_Flush (StateTrajectory *self) {
+    Integer  sizes[2], nchanges;
+
+    if (self->nscans < 1) {
+        return True;
+    }
+    /* Pad the changes with a zero entry if needed */
+    nchanges = StateTrajectory_Padded (self->nchanges * sizeof (Cardinal)) / sizeof (Cardinal);
+    if (nchanges > self->nchanges) {
+        self->changes[self->nchanges] = 0;
+    }
+    sizes[0] = self->nscans   ;
+    sizes[1] = self->nchanges ;
+    if ((fwrite (sizes          , sizeof (Integer)       , 2            , self->file) != 2) ||
+        (fwrite (self->energies , sizeof (Real)          , self->nscans , self->file) != (size_t) self->nscans) ||
+        (fwrite (self->protons  , sizeof (Integer)       , self->nscans , self->file) != (size_t) self->nscans) ||
+        (fwrite (self->counts   , sizeof (Integer)       , self->nscans , self->file) != (size_t) self->nscans) ||
+        (fwrite (self->keyframe , sizeof (unsigned char) , StateTrajectory_Padded (self->nsites) , self->file) != (size_t) StateTrajectory_Padded (self->nsites)) ||
+        (fwrite (self->changes  , sizeof (Cardinal)      , nchanges     , self->file) != (size_t) nchanges)) {
+        return False;
+    }
+    self->nscans   = 0;
+    self->nchanges = 0;
+    self->nblocks++;
+    return True;
+}
+
+/*
+ * Write the last block, update the header and close the file.
+ */
+Boolean StateTrajectory_Close (StateTrajectory *self) {
+    Boolean  success;
+
+    success = StateTrajectory_Flush (self);
+    if (success) {
+        success = (fseek (self->file, 0, SEEK_SET) == 0) && StateTrajectory_WriteHeader (self);
+    }
+    if (fclose (self->file) != 0) {
+        success = False;
+    }
+    StateTrajectory_Deallocate (self);
+    return success;
+}
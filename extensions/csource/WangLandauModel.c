@@ -0,0 +1,462 @@
+/*------------------------------------------------------------------------------
+! . File      : WangLandauModel.c
+! . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+! . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+!                          Mikolaj J. Feliks (2014-2018)
+! . License   : CeCILL French Free Software License     (http://www.cecill.info)
+!-----------------------------------------------------------------------------*/
+#include "WangLandauModel.h"
+
+/*
+ * The Wang-Landau model estimates the joint density of states g(E, n), where E is
+ * the pH-independent part of the energy (intrinsic energies and interactions) and n
+ * is the number of bound protons. The energy of a state at a given pH is then
+ * E - n * mu(pH), so that the partition function and probabilities of instances
+ * at any pH follow from a single calculation.
+ *
+ * With the density of states fixed, the production visits states uniformly within
+ * each bin. Each visit is weighted with its Boltzmann factor relative to the centre
+ * of the bin, so that the bins are reweighted without assuming that all their states
+ * have the same energy. These weights depend on the temperature, so that another
+ * temperature needs another production (but not another estimate of the density).
+ */
+
+/*
+ * Allocate the Wang-Landau model and initialize its random number generator.
+ */
+WangLandauModel *WangLandauModel_Allocate (const Integer nbins, const Real flatness, const Real lnfFinal,
+                                           const Integer nequil, const Integer nprod, const Integer maxScans,
+                                           const Integer randomSeed, Status *status) {
+    WangLandauModel *self = NULL;
+
+    MEMORY_ALLOCATE (self, WangLandauModel);
+    if (self == NULL) {
+        goto failSet;
+    }
+    self->nbins          = nbins    ;
+    self->flatness       = flatness ;
+    self->lnfFinal       = lnfFinal ;
+    self->nequil         = nequil   ;
+    self->nprod          = nprod    ;
+    self->maxScans       = maxScans ;
+    self->nscans         = 0        ;
+    self->nprotons       = 0        ;
+    self->temperature    = 0.0f     ;
+    self->isConverged    = False    ;
+    self->lng            = NULL     ;
+    self->histogram      = NULL     ;
+    self->visited        = NULL     ;
+    self->counts         = NULL     ;
+    self->weights        = NULL     ;
+    self->instances      = NULL     ;
+    self->field          = NULL     ;
+    self->vector         = NULL     ;
+    self->energyModel    = NULL     ;
+
+    self->generator = RandomNumberGenerator_Allocate (RandomNumberGeneratorType_MersenneTwister);
+    if (self->generator == NULL) {
+        goto failSetDealloc;
+    }
+    if (randomSeed <= 0) {
+        RandomNumberGenerator_SetSeed (self->generator, (Cardinal) time (NULL));
+    }
+    else {
+        RandomNumberGenerator_SetSeed (self->generator, (Cardinal) randomSeed);
+    }
+    return self;
+
+failSetDealloc:
+    WangLandauModel_Deallocate (self);
+failSet:
+    Status_Set (status, Status_MemoryAllocationFailure);
+    return NULL;
+}
+
+/*
+ * Deallocate the tables of the density of states.
+ */
+static void WangLandauModel_DeallocateTables (WangLandauModel *self) {
+    if ( self->lng       != NULL)  MEMORY_DEALLOCATE ( self->lng       ) ;
+    if ( self->histogram != NULL)  MEMORY_DEALLOCATE ( self->histogram ) ;
+    if ( self->visited   != NULL)  MEMORY_DEALLOCATE ( self->visited   ) ;
+    if ( self->counts    != NULL)  MEMORY_DEALLOCATE ( self->counts    ) ;
+    if ( self->weights   != NULL)  MEMORY_DEALLOCATE ( self->weights   ) ;
+    if ( self->instances != NULL)  MEMORY_DEALLOCATE ( self->instances ) ;
+}
+
+/*
+ * Deallocate the Wang-Landau model.
+ */
+void WangLandauModel_Deallocate (WangLandauModel *self) {
+    if (self != NULL) {
+        WangLandauModel_DeallocateTables (self);
+        if ( self->generator != NULL)  RandomNumberGenerator_Deallocate ( &self->generator ) ;
+        if ( self->vector    != NULL)  StateVector_Deallocate           (  self->vector    ) ;
+        if ( self->field     != NULL)  MEMORY_DEALLOCATE                (  self->field     ) ;
+        MEMORY_DEALLOCATE (self);
+    }
+}
+
+/*
+ * Link the Wang-Landau and energy models.
+ */
+void WangLandauModel_LinkToEnergyModel (WangLandauModel *self, EnergyModel *energyModel, Status *status) {
+    self->energyModel = energyModel;
+    self->vector      = StateVector_Clone (energyModel->vector, status);
+    if (*status != Status_Continue) {
+        return;
+    }
+    MEMORY_ALLOCATEARRAY (self->field, energyModel->ninstances, Real);
+    if (self->field == NULL) {
+        Status_Set (status, Status_MemoryAllocationFailure);
+    }
+}
+
+/*
+ * Calculate the field, the pH-independent energy and the number of protons of the state vector.
+ */
+static void WangLandauModel_CalculateState (WangLandauModel *self) {
+    EnergyModel *energyModel = self->energyModel;
+    TitrSite    *ts;
+    Integer      a, i;
+    Real        *row, W;
+
+    for (a = 0; a < energyModel->ninstances; a++) {
+        self->field[a] = 0.0f;
+    }
+    ts = self->vector->sites;
+    for (i = 0; i < self->vector->nsites; i++, ts++) {
+        row = EnergyModel_DenseRow (energyModel, ts->indexActive);
+        for (a = 0; a < energyModel->ninstances; a++) {
+            self->field[a] += row[a];
+        }
+    }
+    self->E              = 0.0f;
+    self->nprotonsActive = 0;
+    W                    = 0.0f;
+    ts = self->vector->sites;
+    for (i = 0; i < self->vector->nsites; i++, ts++) {
+        self->E              +=    Real1DArray_Item (energyModel->intrinsic , ts->indexActive);
+        self->nprotonsActive += Integer1DArray_Item (energyModel->protons   , ts->indexActive);
+        W                    += self->field[ts->indexActive] - EnergyModel_GetWdense (energyModel, ts->indexActive, ts->indexActive);
+    }
+    self->E += 0.5f * W;
+}
+
+/*
+ * Choose a random site and a new instance for it.
+ * Return the changes of the pH-independent energy and of the number of protons.
+ */
+static TitrSite *WangLandauModel_Propose (const WangLandauModel *self, Integer *instance, Real *Edelta, Integer *ndelta) {
+    EnergyModel *energyModel = self->energyModel;
+    TitrSite    *ts;
+    Integer      new, old;
+
+    ts  = &self->vector->sites[RandomNumberGenerator_NextCardinal (self->generator) % self->vector->nsites];
+    old = ts->indexActive;
+    do {
+        new = RandomNumberGenerator_NextCardinal (self->generator) % (ts->indexLast - ts->indexFirst + 1) + ts->indexFirst;
+    } while (new == old);
+
+    *instance = new;
+    *ndelta   = Integer1DArray_Item (energyModel->protons, new) - Integer1DArray_Item (energyModel->protons, old);
+    *Edelta   = Real1DArray_Item (energyModel->intrinsic, new) - Real1DArray_Item (energyModel->intrinsic, old)
+              + (self->field[new] - EnergyModel_GetWdense (energyModel, new, old))
+              - (self->field[old] - EnergyModel_GetWdense (energyModel, old, old));
+    return ts;
+}
+
+/*
+ * Make the proposed change of the state vector.
+ */
+static void WangLandauModel_Accept (WangLandauModel *self, TitrSite *ts, const Integer instance, const Real Edelta, const Integer ndelta) {
+    Integer  a;
+    Real    *rowOld, *rowNew;
+
+    rowOld = EnergyModel_DenseRow (self->energyModel, ts->indexActive);
+    rowNew = EnergyModel_DenseRow (self->energyModel, instance);
+    for (a = 0; a < self->energyModel->ninstances; a++) {
+        self->field[a] += rowNew[a] - rowOld[a];
+    }
+    ts->indexActive       = instance;
+    self->E              += Edelta;
+    self->nprotonsActive += ndelta;
+}
+
+/*
+ * Find the bin of a state, or return -1 if the state is out of range.
+ */
+static Integer WangLandauModel_Bin (const WangLandauModel *self, const Real E, const Integer nprotons) {
+    Integer bin, row;
+
+    if ((E < self->Emin) || (E >= self->Emax)) {
+        return -1;
+    }
+    row = nprotons - self->nprotonsMin;
+    if ((row < 0) || (row >= self->nprotons)) {
+        return -1;
+    }
+    bin = (Integer) ((E - self->Emin) / self->width);
+    if (bin >= self->nbins) {
+        bin = self->nbins - 1;
+    }
+    return (row * self->nbins + bin);
+}
+
+/*
+ * Explore the states with Metropolis scans at a given pH and extend the ranges of energies and protons.
+ */
+static void WangLandauModel_Explore (WangLandauModel *self, const Real pH, Real *Elower, Real *Eupper, Integer *nlower, Integer *nupper) {
+    TitrSite *ts;
+    Integer   nmoves, instance, ndelta;
+    Real      Edelta, GdeltaRT, beta, potential;
+
+    beta      = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature);
+    potential = -CONSTANT_MOLAR_GAS_KCAL_MOL * self->energyModel->temperature * CONSTANT_LN10 * pH;
+    nmoves    = self->nequil * self->vector->nsites;
+
+    for (; nmoves > 0; nmoves--) {
+        ts       = WangLandauModel_Propose (self, &instance, &Edelta, &ndelta);
+        GdeltaRT = (Edelta - ndelta * potential) * beta;
+        if ((GdeltaRT < 0.0f) || (RandomNumberGenerator_NextReal (self->generator) < exp (-GdeltaRT))) {
+            WangLandauModel_Accept (self, ts, instance, Edelta, ndelta);
+            if (self->E < *Elower) *Elower = self->E;
+            if (self->E > *Eupper) *Eupper = self->E;
+            if (self->nprotonsActive < *nlower) *nlower = self->nprotonsActive;
+            if (self->nprotonsActive > *nupper) *nupper = self->nprotonsActive;
+        }
+    }
+}
+
+/*
+ * Energy of the centre of a bin.
+ */
+static Real WangLandauModel_BinCentre (const WangLandauModel *self, const Integer bin) {
+    return (self->Emin + ((bin % self->nbins) + 0.5f) * self->width);
+}
+
+/*
+ * Make a Wang-Landau scan with the given logarithm of the modification factor.
+ * During the production (lnf equal to zero), the density of states is fixed and the states are
+ * accumulated with their Boltzmann factors at |beta| relative to the centre of their bin.
+ */
+static void WangLandauModel_Scan (WangLandauModel *self, const Real lnf, const Real beta) {
+    TitrSite *ts;
+    Integer   nmoves, instance, ndelta, bin, binNew, i, ninstances = self->energyModel->ninstances;
+    Real      Edelta, delta, weight;
+
+    bin = WangLandauModel_Bin (self, self->E, self->nprotonsActive);
+    for (nmoves = self->vector->nsites; nmoves > 0; nmoves--) {
+        ts     = WangLandauModel_Propose (self, &instance, &Edelta, &ndelta);
+        binNew = WangLandauModel_Bin (self, self->E + Edelta, self->nprotonsActive + ndelta);
+        if (binNew >= 0) {
+            delta = self->lng[bin] - self->lng[binNew];
+            if ((delta >= 0.0f) || (RandomNumberGenerator_NextReal (self->generator) < exp (delta))) {
+                WangLandauModel_Accept (self, ts, instance, Edelta, ndelta);
+                bin = binNew;
+            }
+        }
+        if (lnf > 0.0f) {
+            self->lng[bin]       += lnf;
+            self->histogram[bin] += 1.0f;
+            self->visited[bin]    = True;
+        }
+    }
+    if (lnf <= 0.0f) {
+        weight = exp (-beta * (self->E - WangLandauModel_BinCentre (self, bin)));
+        self->counts[bin]  += 1.0f;
+        self->weights[bin] += weight;
+        ts = self->vector->sites;
+        for (i = 0; i < self->vector->nsites; i++, ts++) {
+            self->instances[bin * ninstances + ts->indexActive] += weight;
+        }
+    }
+}
+
+/*
+ * Check if the histogram over the visited bins is flat.
+ */
+static Boolean WangLandauModel_IsFlat (const WangLandauModel *self) {
+    Integer bin, nvisited = 0, nbins = self->nbins * self->nprotons;
+    Real    lowest = -1.0f, mean = 0.0f;
+
+    for (bin = 0; bin < nbins; bin++) {
+        if (self->visited[bin]) {
+            nvisited++;
+            mean += self->histogram[bin];
+            if ((lowest < 0.0f) || (self->histogram[bin] < lowest)) lowest = self->histogram[bin];
+        }
+    }
+    if (nvisited < 1) {
+        return False;
+    }
+    mean /= nvisited;
+    return (lowest >= self->flatness * mean);
+}
+
+/*
+ * Estimate the density of states.
+ *
+ * First, the ranges of energies and protons are found from Metropolis scans at pH
+ * from 0 to 14. Then, the Wang-Landau iterations are run until the logarithm of the
+ * modification factor drops below lnfFinal. Finally, states are accumulated in a
+ * production at the temperature of the energy model. Returns True if converged.
+ */
+Boolean WangLandauModel_CalculateDensity (WangLandauModel *self, Status *status) {
+    EnergyModel *energyModel = self->energyModel;
+    TitrSite    *ts;
+    Integer      i, a, bin, nbins, nlower, nupper, nminimum, nmaximum, nprotons, scan;
+    Real         Elower, Eupper, pad, lnf, pH;
+
+    WangLandauModel_DeallocateTables (self);
+    self->isConverged = False;
+    self->nscans      = 0;
+
+    /* Physical limits of the number of protons */
+    nminimum = 0;
+    nmaximum = 0;
+    ts       = self->vector->sites;
+    for (i = 0; i < self->vector->nsites; i++, ts++) {
+        nlower = nupper = Integer1DArray_Item (energyModel->protons, ts->indexFirst);
+        for (a = ts->indexFirst + 1; a <= ts->indexLast; a++) {
+            nprotons = Integer1DArray_Item (energyModel->protons, a);
+            if (nprotons < nlower) nlower = nprotons;
+            if (nprotons > nupper) nupper = nprotons;
+        }
+        nminimum += nlower;
+        nmaximum += nupper;
+    }
+
+    /* Find the ranges of energies and protons */
+    StateVector_Randomize (self->vector, self->generator);
+    WangLandauModel_CalculateState (self);
+    Elower = Eupper = self->E;
+    nlower = nupper = self->nprotonsActive;
+    for (pH = 0.0f; pH <= 14.0f; pH += 2.0f) {
+        WangLandauModel_Explore (self, pH, &Elower, &Eupper, &nlower, &nupper);
+    }
+    pad               = 0.1f * (Eupper - Elower) + 1.0f;
+    self->Emin        = Elower - pad;
+    self->Emax        = Eupper + pad;
+    self->width       = (self->Emax - self->Emin) / self->nbins;
+    self->nprotonsMin = (nlower > nminimum) ? (nlower - 1) : nminimum;
+    self->nprotons    = ((nupper < nmaximum) ? (nupper + 1) : nmaximum) - self->nprotonsMin + 1;
+
+    nbins = self->nbins * self->nprotons;
+    MEMORY_ALLOCATEARRAY (self->lng       , nbins                          , Real)    ;
+    MEMORY_ALLOCATEARRAY (self->histogram , nbins                          , Real)    ;
+    MEMORY_ALLOCATEARRAY (self->visited   , nbins                          , Boolean) ;
+    MEMORY_ALLOCATEARRAY (self->counts    , nbins                          , Real)    ;
+    MEMORY_ALLOCATEARRAY (self->weights   , nbins                          , Real)    ;
+    MEMORY_ALLOCATEARRAY (self->instances , nbins * energyModel->ninstances , Real)    ;
+    if ((self->lng == NULL) || (self->histogram == NULL) || (self->visited == NULL) || (self->counts == NULL) || (self->weights == NULL) || (self->instances == NULL)) {
+        WangLandauModel_DeallocateTables (self);
+        Status_Set (status, Status_MemoryAllocationFailure);
+        return False;
+    }
+    for (bin = 0; bin < nbins; bin++) {
+        self->lng[bin]       = 0.0f;
+        self->histogram[bin] = 0.0f;
+        self->visited[bin]   = False;
+    }
+
+    /* Wang-Landau iterations */
+    lnf = 1.0f;
+    while (lnf > self->lnfFinal) {
+        for (scan = 0; scan < WANGLANDAU_CHECK_SCANS; scan++) {
+            WangLandauModel_Scan (self, lnf, 0.0f);
+        }
+        self->nscans += WANGLANDAU_CHECK_SCANS;
+        if (self->nscans >= self->maxScans) {
+            return False;
+        }
+        /* Prevent the accumulation of rounding errors */
+        WangLandauModel_CalculateState (self);
+
+        if (WangLandauModel_IsFlat (self)) {
+            lnf *= 0.5f;
+            for (bin = 0; bin < nbins; bin++) {
+                self->histogram[bin] = 0.0f;
+            }
+        }
+    }
+
+    self->isConverged = True;
+    WangLandauModel_Production (self, energyModel->temperature);
+    return True;
+}
+
+/*
+ * Accumulate states in a production with the fixed density of states at a given temperature.
+ */
+void WangLandauModel_Production (WangLandauModel *self, const Real temperature) {
+    Integer bin, nbins, scan;
+    Real    beta;
+
+    nbins = self->nbins * self->nprotons;
+    for (bin = 0; bin < nbins; bin++) {
+        self->counts[bin]  = 0.0f;
+        self->weights[bin] = 0.0f;
+    }
+    for (bin = 0; bin < nbins * self->energyModel->ninstances; bin++) {
+        self->instances[bin] = 0.0f;
+    }
+    beta = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * temperature);
+    for (scan = 0; scan < self->nprod; scan++) {
+        WangLandauModel_Scan (self, 0.0f, beta);
+    }
+    self->temperature = temperature;
+}
+
+/*
+ * Reconstruct the probabilities of instances at a given pH and the temperature of the production.
+ *
+ * The Boltzmann factor of a bin is that of its centre, multiplied by the mean of the
+ * Boltzmann factors of its states relative to the centre.
+ *
+ * Returns the logarithm of the partition function, up to a constant that depends
+ * on the normalization of the density of states.
+ */
+Real WangLandauModel_CalculateProbabilities (const WangLandauModel *self, const Real pH) {
+    EnergyModel *energyModel = self->energyModel;
+    Integer      bin, row, a, nbins, ninstances = energyModel->ninstances;
+    Real         beta, weight, largest, total, logZ, *probabilities;
+    Boolean      found;
+
+    nbins         = self->nbins * self->nprotons;
+    probabilities = Real1DArray_Data (energyModel->probabilities);
+    beta          = 1.0f / (CONSTANT_MOLAR_GAS_KCAL_MOL * self->temperature);
+
+    largest = 0.0f;
+    found   = False;
+    for (bin = 0; bin < nbins; bin++) {
+        if (self->counts[bin] > 0.0f) {
+            row    = bin / self->nbins + self->nprotonsMin;
+            weight = self->lng[bin] - beta * WangLandauModel_BinCentre (self, bin) + log (self->weights[bin] / self->counts[bin]) - row * CONSTANT_LN10 * pH;
+            if ((!found) || (weight > largest)) {
+                largest = weight;
+                found   = True;
+            }
+        }
+    }
+    for (a = 0; a < ninstances; a++) {
+        probabilities[a] = 0.0f;
+    }
+    total = 0.0f;
+    for (bin = 0; bin < nbins; bin++) {
+        if (self->counts[bin] > 0.0f) {
+            row     = bin / self->nbins + self->nprotonsMin;
+            weight  = exp (self->lng[bin] - beta * WangLandauModel_BinCentre (self, bin) + log (self->weights[bin] / self->counts[bin]) - row * CONSTANT_LN10 * pH - largest);
+            total  += weight;
+            weight /= self->weights[bin];
+            for (a = 0; a < ninstances; a++) {
+                probabilities[a] += weight * self->instances[bin * ninstances + a];
+            }
+        }
+    }
+    for (a = 0; a < ninstances; a++) {
+        probabilities[a] /= total;
+    }
+    logZ = largest + log (total);
+    return logZ;
+}
@@ -1,5639 +0,0 @@
-/* Generated by Cython 0.15.1 on Thu Jun  9 21:41:03 2016 */
-
-#define PY_SSIZE_T_CLEAN
-#include "Python.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#else
-
-#include <stddef.h> /* For offsetof */
-#ifndef offsetof
-#define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
-#endif
-
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#endif
-
-#ifndef DL_IMPORT
-  #define DL_IMPORT(t) t
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-
-#if PY_VERSION_HEX < 0x02040000
-  #define METH_COEXIST 0
-  #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
-  #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PY_FORMAT_SIZE_T ""
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)   __Pyx_PyInt_AsInt(o)
-  #define PyNumber_Index(o)    PyNumber_Int(o)
-  #define PyIndex_Check(o)     PyNumber_Check(o)
-  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
-  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
-  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
-  #define PyVarObject_HEAD_INIT(type, size) \
-          PyObject_HEAD_INIT(type) size,
-  #define PyType_Modified(t)
-
-  typedef struct {
-     void *buf;
-     PyObject *obj;
-     Py_ssize_t len;
-     Py_ssize_t itemsize;
-     int readonly;
-     int ndim;
-     char *format;
-     Py_ssize_t *shape;
-     Py_ssize_t *strides;
-     Py_ssize_t *suboffsets;
-     void *internal;
-  } Py_buffer;
-
-  #define PyBUF_SIMPLE 0
-  #define PyBUF_WRITABLE 0x0001
-  #define PyBUF_FORMAT 0x0004
-  #define PyBUF_ND 0x0008
-  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
-  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
-  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
-  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
-  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
-
-#endif
-
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define Py_TPFLAGS_CHECKTYPES 0
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-
-#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyStringObject               PyUnicodeObject
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_Check               PyUnicode_Check
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define PyBytesObject                PyStringObject
-  #define PyBytes_Type                 PyString_Type
-  #define PyBytes_Check                PyString_Check
-  #define PyBytes_CheckExact           PyString_CheckExact
-  #define PyBytes_FromString           PyString_FromString
-  #define PyBytes_FromStringAndSize    PyString_FromStringAndSize
-  #define PyBytes_FromFormat           PyString_FromFormat
-  #define PyBytes_DecodeEscape         PyString_DecodeEscape
-  #define PyBytes_AsString             PyString_AsString
-  #define PyBytes_AsStringAndSize      PyString_AsStringAndSize
-  #define PyBytes_Size                 PyString_Size
-  #define PyBytes_AS_STRING            PyString_AS_STRING
-  #define PyBytes_GET_SIZE             PyString_GET_SIZE
-  #define PyBytes_Repr                 PyString_Repr
-  #define PyBytes_Concat               PyString_Concat
-  #define PyBytes_ConcatAndDel         PyString_ConcatAndDel
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define PySet_Check(obj)             PyObject_TypeCheck(obj, &PySet_Type)
-  #define PyFrozenSet_Check(obj)       PyObject_TypeCheck(obj, &PyFrozenSet_Type)
-#endif
-#ifndef PySet_CheckExact
-  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
-#endif
-
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyIntObject                  PyLongObject
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyBoolObject                 PyLongObject
-#endif
-
-#if PY_VERSION_HEX < 0x03020000
-  typedef long Py_hash_t;
-  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
-#else
-  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
-#endif
-
-
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-#endif
-
-#if (PY_MAJOR_VERSION < 3) || (PY_VERSION_HEX >= 0x03010300)
-  #define __Pyx_PySequence_GetSlice(obj, a, b) PySequence_GetSlice(obj, a, b)
-  #define __Pyx_PySequence_SetSlice(obj, a, b, value) PySequence_SetSlice(obj, a, b, value)
-  #define __Pyx_PySequence_DelSlice(obj, a, b) PySequence_DelSlice(obj, a, b)
-#else
-  #define __Pyx_PySequence_GetSlice(obj, a, b) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), (PyObject*)0) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_GetSlice(obj, a, b)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object is unsliceable", (obj)->ob_type->tp_name), (PyObject*)0)))
-  #define __Pyx_PySequence_SetSlice(obj, a, b, value) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), -1) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_SetSlice(obj, a, b, value)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object doesn't support slice assignment", (obj)->ob_type->tp_name), -1)))
-  #define __Pyx_PySequence_DelSlice(obj, a, b) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), -1) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_DelSlice(obj, a, b)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object doesn't support slice deletion", (obj)->ob_type->tp_name), -1)))
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : PyInstanceMethod_New(func))
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
-#else
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_NAMESTR(n) ((char *)(n))
-  #define __Pyx_DOCSTR(n)  ((char *)(n))
-#else
-  #define __Pyx_NAMESTR(n) (n)
-  #define __Pyx_DOCSTR(n)  (n)
-#endif
-
-#ifndef __PYX_EXTERN_C
-  #ifdef __cplusplus
-    #define __PYX_EXTERN_C extern "C"
-  #else
-    #define __PYX_EXTERN_C extern
-  #endif
-#endif
-
-#if defined(WIN32) || defined(MS_WINDOWS)
-#define _USE_MATH_DEFINES
-#endif
-#include <math.h>
-#define __PYX_HAVE__ContinuumElectrostatics__EnergyModel
-#define __PYX_HAVE_API__ContinuumElectrostatics__EnergyModel
-#include "Definitions.h"
-#include "Boolean.h"
-#include "Cardinal.h"
-#include "Integer.h"
-#include "Real.h"
-#include "Status.h"
-#include "StatusHandler.h"
-#include "stdlib.h"
-#include "Memory.h"
-#include "Real1DArray.h"
-#include "RandomNumberGenerator.h"
-#include "StateVector.h"
-#include "EnergyModel.h"
-#ifdef _OPENMP
-#include <omp.h>
-#endif /* _OPENMP */
-
-#ifdef PYREX_WITHOUT_ASSERTIONS
-#define CYTHON_WITHOUT_ASSERTIONS
-#endif
-
-
-/* inline attribute */
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_INLINE inline
-  #else
-    #define CYTHON_INLINE
-  #endif
-#endif
-
-/* unused attribute */
-#ifndef CYTHON_UNUSED
-# if defined(__GNUC__)
-#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define CYTHON_UNUSED __attribute__ ((__unused__))
-#   else
-#     define CYTHON_UNUSED
-#   endif
-# elif defined(__ICC) || defined(__INTEL_COMPILER)
-#   define CYTHON_UNUSED __attribute__ ((__unused__))
-# else
-#   define CYTHON_UNUSED
-# endif
-#endif
-
-typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
-
-
-/* Type Conversion Predeclarations */
-
-#define __Pyx_PyBytes_FromUString(s) PyBytes_FromString((char*)s)
-#define __Pyx_PyBytes_AsUString(s)   ((unsigned char*) PyBytes_AsString(s))
-
-#define __Pyx_Owned_Py_None(b) (Py_INCREF(Py_None), Py_None)
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
-
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-
-
-#ifdef __GNUC__
-  /* Test for GCC > 2.95 */
-  #if __GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95))
-    #define likely(x)   __builtin_expect(!!(x), 1)
-    #define unlikely(x) __builtin_expect(!!(x), 0)
-  #else /* __GNUC__ > 2 ... */
-    #define likely(x)   (x)
-    #define unlikely(x) (x)
-  #endif /* __GNUC__ > 2 ... */
-#else /* __GNUC__ */
-  #define likely(x)   (x)
-  #define unlikely(x) (x)
-#endif /* __GNUC__ */
-    
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-
-
-static const char *__pyx_f[] = {
-  "ContinuumElectrostatics.EnergyModel.pyx",
-  "pCore.Real1DArray.pxd",
-  "pCore.RandomNumberGenerator.pxd",
-  "ContinuumElectrostatics.StateVector.pxd",
-};
-
-/*--- Type declarations ---*/
-struct __pyx_obj_5pCore_11Real1DArray_Real1DArray;
-struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel;
-struct __pyx_obj_5pCore_21RandomNumberGenerator_RandomNumberGenerator;
-struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector;
-struct __pyx_t_5pCore_6BPData_BPData;
-typedef struct __pyx_t_5pCore_6BPData_BPData __pyx_t_5pCore_6BPData_BPData;
-
-/* "/home/mikolaj/local/opt/pDynamo-1.9.0/pCore-1.9.0/extensions/pyrex/pCore.BPData.pxd":17
- * #===================================================================================================================================
- * # . The buffer type.
- * ctypedef struct BPData:             # <<<<<<<<<<<<<<
- *     void       *buf
- * #    PyObject   *obj
- */
-struct __pyx_t_5pCore_6BPData_BPData {
-  void *buf;
-  Py_ssize_t len;
-  Py_ssize_t itemsize;
-  int ndim;
-  char *format;
-  Py_ssize_t *shape;
-  Py_ssize_t *strides;
-  Py_ssize_t *suboffsets;
-};
-
-/* "/home/mikolaj/local/opt/pDynamo-1.9.0/pCore-1.9.0/extensions/pyrex/pCore.Real1DArray.pxd":64
- * # . Class.
- * #===================================================================================================================================
- * cdef class Real1DArray:             # <<<<<<<<<<<<<<
- * 
- *     cdef BPData        *bpData
- */
-struct __pyx_obj_5pCore_11Real1DArray_Real1DArray {
-  PyObject_HEAD
-  __pyx_t_5pCore_6BPData_BPData *bpData;
-  Real1DArray *cObject;
-  PyObject *isOwner;
-  PyObject *owner;
-};
-
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pxd":60
- * 
- * #-------------------------------------------------------------------------------
- * cdef class EnergyModel:             # <<<<<<<<<<<<<<
- *     cdef CEnergyModel  *cObject
- *     cdef public object  isOwner
- */
-struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel {
-  PyObject_HEAD
-  EnergyModel *cObject;
-  PyObject *isOwner;
-  PyObject *owner;
-};
-
-
-/* "/home/mikolaj/local/opt/pDynamo-1.9.0/pCore-1.9.0/extensions/pyrex/pCore.RandomNumberGenerator.pxd":38
- * # . Class.
- * #===================================================================================================================================
- * cdef class RandomNumberGenerator:             # <<<<<<<<<<<<<<
- * 
- *     cdef CRandomNumberGenerator *cObject
- */
-struct __pyx_obj_5pCore_21RandomNumberGenerator_RandomNumberGenerator {
-  PyObject_HEAD
-  RandomNumberGenerator *cObject;
-  PyObject *initialSeed;
-  PyObject *isOwner;
-  PyObject *owner;
-};
-
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pxd":69
- * 
- * #-------------------------------------------------------------------------------
- * cdef class StateVector:             # <<<<<<<<<<<<<<
- *     cdef CStateVector     *cObject
- *     cdef public object  isOwner
- */
-struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector {
-  PyObject_HEAD
-  StateVector *cObject;
-  PyObject *isOwner;
-  PyObject *owner;
-};
-
-
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname); /*proto*/
-  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
-  #define __Pyx_RefNannySetupContext(name)           __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-  #define __Pyx_RefNannyFinishContext()           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
-  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
-  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
-  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
-#else
-  #define __Pyx_RefNannyDeclarations
-  #define __Pyx_RefNannySetupContext(name)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XINCREF(r) Py_XINCREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-  #define __Pyx_XGOTREF(r)
-  #define __Pyx_XGIVEREF(r)
-#endif /* CYTHON_REFNANNY */
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name, PyObject* kw_name); /*proto*/
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause); /*proto*/
-
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-
-
-#define __Pyx_GetItemInt_List(o, i, size, to_py_func) (((size) <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_List_Fast(o, i) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i) {
-    if (likely(o != Py_None)) {
-        if (likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-            PyObject *r = PyList_GET_ITEM(o, i);
-            Py_INCREF(r);
-            return r;
-        }
-        else if ((-PyList_GET_SIZE(o) <= i) & (i < 0)) {
-            PyObject *r = PyList_GET_ITEM(o, PyList_GET_SIZE(o) + i);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-#define __Pyx_GetItemInt_Tuple(o, i, size, to_py_func) (((size) <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_Tuple_Fast(o, i) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i) {
-    if (likely(o != Py_None)) {
-        if (likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, i);
-            Py_INCREF(r);
-            return r;
-        }
-        else if ((-PyTuple_GET_SIZE(o) <= i) & (i < 0)) {
-            PyObject *r = PyTuple_GET_ITEM(o, PyTuple_GET_SIZE(o) + i);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-
-#define __Pyx_GetItemInt(o, i, size, to_py_func) (((size) <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_Fast(o, i) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i) {
-    PyObject *r;
-    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-        r = PyList_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (PyTuple_CheckExact(o) && ((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-        r = PyTuple_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_item && (likely(i >= 0))) {
-        r = PySequence_GetItem(o, i);
-    }
-    else {
-        r = __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-    }
-    return r;
-}
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact); /*proto*/
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level); /*proto*/
-
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_Integer(Integer);
-
-static CYTHON_INLINE Integer __Pyx_PyInt_from_py_Integer(PyObject *);
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
-
-static CYTHON_INLINE int __Pyx_PyInt_AsLongDouble(PyObject *);
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
-
-static int __Pyx_check_binary_version(void);
-
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, size_t size, int strict);  /*proto*/
-
-static PyObject *__Pyx_ImportModule(const char *name); /*proto*/
-
-static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**f)(void), const char *sig); /*proto*/
-
-static void __Pyx_AddTraceback(const char *funcname, int __pyx_clineno,
-                               int __pyx_lineno, const char *__pyx_filename); /*proto*/
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
-
-/* Module declarations from 'pCore.cDefinitions' */
-
-/* Module declarations from 'pCore.Status' */
-
-/* Module declarations from 'libc' */
-
-/* Module declarations from 'libc.stdlib' */
-
-/* Module declarations from 'pCore.Memory' */
-
-/* Module declarations from 'pCore.BPData' */
-static __pyx_t_5pCore_6BPData_BPData *(*__pyx_f_5pCore_6BPData_BPData_Allocate)(Integer); /*proto*/
-static void (*__pyx_f_5pCore_6BPData_BPData_CopyToView)(__pyx_t_5pCore_6BPData_BPData *, Py_buffer *); /*proto*/
-static __pyx_t_5pCore_6BPData_BPData *(*__pyx_f_5pCore_6BPData_BPData_Deallocate)(__pyx_t_5pCore_6BPData_BPData *); /*proto*/
-static void (*__pyx_f_5pCore_6BPData_BPData_InitializeView)(Py_buffer *, char *, Py_ssize_t); /*proto*/
-static void (*__pyx_f_5pCore_6BPData_BPData_Set)(__pyx_t_5pCore_6BPData_BPData *, void *, char *, Py_ssize_t, Py_ssize_t, Integer *, Integer *); /*proto*/
-
-/* Module declarations from 'pCore.Real1DArray' */
-static PyTypeObject *__pyx_ptype_5pCore_11Real1DArray_Real1DArray = 0;
-
-/* Module declarations from 'pCore.RandomNumberGenerator' */
-static PyTypeObject *__pyx_ptype_5pCore_21RandomNumberGenerator_RandomNumberGenerator = 0;
-
-/* Module declarations from 'ContinuumElectrostatics.StateVector' */
-static PyTypeObject *__pyx_ptype_23ContinuumElectrostatics_11StateVector_StateVector = 0;
-
-/* Module declarations from 'ContinuumElectrostatics.EnergyModel' */
-static PyTypeObject *__pyx_ptype_23ContinuumElectrostatics_11EnergyModel_EnergyModel = 0;
-#define __Pyx_MODULE_NAME "ContinuumElectrostatics.EnergyModel"
-int __pyx_module_is_main_ContinuumElectrostatics__EnergyModel = 0;
-
-/* Implementation of 'ContinuumElectrostatics.EnergyModel' */
-static char __pyx_k_1[] = "ContinuumElectrostatics.EnergyModel";
-static char __pyx_k_2[] = "Cannot allocate energy model.";
-static char __pyx_k_5[] = "\nSymmetrizing interactions complete.\n";
-static char __pyx_k_7[] = "First calculate electrostatic energies.";
-static char __pyx_k_9[] = "Maximum number of states for analytic treatment (%d) exceeded.";
-static char __pyx_k_11[] = "Cannot allocate Boltzmann factors.";
-static char __pyx_k_18[] = "$Id: $";
-static char __pyx_k__pH[] = "pH";
-static char __pyx_k__log[] = "log";
-static char __pyx_k__Text[] = "Text";
-static char __pyx_k__Gzero[] = "Gzero";
-static char __pyx_k__pCore[] = "pCore";
-static char __pyx_k__sites[] = "sites";
-static char __pyx_k__value[] = "value";
-static char __pyx_k__vector[] = "vector";
-static char __pyx_k__ceModel[] = "ceModel";
-static char __pyx_k__logFile[] = "logFile";
-static char __pyx_k____main__[] = "__main__";
-static char __pyx_k____test__[] = "__test__";
-static char __pyx_k__instances[] = "instances";
-static char __pyx_k__tolerance[] = "tolerance";
-static char __pyx_k__totalSites[] = "totalSites";
-static char __pyx_k__StateVector[] = "StateVector";
-static char __pyx_k__temperature[] = "temperature";
-static char __pyx_k__isCalculated[] = "isCalculated";
-static char __pyx_k__CLibraryError[] = "CLibraryError";
-static char __pyx_k__LogFileActive[] = "LogFileActive";
-static char __pyx_k__totalInstances[] = "totalInstances";
-static char __pyx_k____lastchanged__[] = "__lastchanged__";
-static char __pyx_k__instIndexGlobal[] = "instIndexGlobal";
-static char __pyx_k___instIndexGlobal[] = "_instIndexGlobal";
-static char __pyx_k__instIndexGlobalA[] = "instIndexGlobalA";
-static char __pyx_k__instIndexGlobalB[] = "instIndexGlobalB";
-static PyObject *__pyx_kp_s_1;
-static PyObject *__pyx_kp_s_11;
-static PyObject *__pyx_kp_s_18;
-static PyObject *__pyx_kp_s_2;
-static PyObject *__pyx_kp_s_5;
-static PyObject *__pyx_kp_s_7;
-static PyObject *__pyx_kp_s_9;
-static PyObject *__pyx_n_s__CLibraryError;
-static PyObject *__pyx_n_s__Gzero;
-static PyObject *__pyx_n_s__LogFileActive;
-static PyObject *__pyx_n_s__StateVector;
-static PyObject *__pyx_n_s__Text;
-static PyObject *__pyx_n_s____lastchanged__;
-static PyObject *__pyx_n_s____main__;
-static PyObject *__pyx_n_s____test__;
-static PyObject *__pyx_n_s___instIndexGlobal;
-static PyObject *__pyx_n_s__ceModel;
-static PyObject *__pyx_n_s__instIndexGlobal;
-static PyObject *__pyx_n_s__instIndexGlobalA;
-static PyObject *__pyx_n_s__instIndexGlobalB;
-static PyObject *__pyx_n_s__instances;
-static PyObject *__pyx_n_s__isCalculated;
-static PyObject *__pyx_n_s__log;
-static PyObject *__pyx_n_s__logFile;
-static PyObject *__pyx_n_s__pCore;
-static PyObject *__pyx_n_s__pH;
-static PyObject *__pyx_n_s__sites;
-static PyObject *__pyx_n_s__temperature;
-static PyObject *__pyx_n_s__tolerance;
-static PyObject *__pyx_n_s__totalInstances;
-static PyObject *__pyx_n_s__totalSites;
-static PyObject *__pyx_n_s__value;
-static PyObject *__pyx_n_s__vector;
-static PyObject *__pyx_int_67108864;
-static PyObject *__pyx_k_4;
-static PyObject *__pyx_k_tuple_3;
-static PyObject *__pyx_k_tuple_6;
-static PyObject *__pyx_k_tuple_8;
-static PyObject *__pyx_k_tuple_10;
-static PyObject *__pyx_k_tuple_12;
-static PyObject *__pyx_k_tuple_13;
-static PyObject *__pyx_k_tuple_14;
-static PyObject *__pyx_k_tuple_15;
-static PyObject *__pyx_k_tuple_16;
-static PyObject *__pyx_k_tuple_17;
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":18
- *     """A class defining the energy model."""
- * 
- *     def __getmodule__ (self):             # <<<<<<<<<<<<<<
- *         """Return the module name."""
- *         return "ContinuumElectrostatics.EnergyModel"
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel___getmodule__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel___getmodule__[] = "Return the module name.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel___getmodule__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__getmodule__");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":20
- *     def __getmodule__ (self):
- *         """Return the module name."""
- *         return "ContinuumElectrostatics.EnergyModel"             # <<<<<<<<<<<<<<
- * 
- *     def __dealloc__ (self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  __pyx_r = ((PyObject *)__pyx_kp_s_1);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":22
- *         return "ContinuumElectrostatics.EnergyModel"
- * 
- *     def __dealloc__ (self):             # <<<<<<<<<<<<<<
- *         """Deallocate."""
- *         EnergyModel_Deallocate (self.cObject)
- */
-
-static void __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_1__dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_1__dealloc__(PyObject *__pyx_v_self) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__dealloc__");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":24
- *     def __dealloc__ (self):
- *         """Deallocate."""
- *         EnergyModel_Deallocate (self.cObject)             # <<<<<<<<<<<<<<
- * 
- *     # Setters
- */
-  EnergyModel_Deallocate(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":27
- * 
- *     # Setters
- *     def SetGmodel (self, Integer instIndexGlobal, Real value):             # <<<<<<<<<<<<<<
- *         EnergyModel_SetGmodel (self.cObject, instIndexGlobal, value)
- * 
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_2SetGmodel(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_2SetGmodel(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_instIndexGlobal;
-  Real __pyx_v_value;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__instIndexGlobal,&__pyx_n_s__value,0};
-  __Pyx_RefNannySetupContext("SetGmodel");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobal);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__value);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("SetGmodel", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "SetGmodel") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_instIndexGlobal = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_instIndexGlobal == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_value = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_value == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("SetGmodel", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.SetGmodel", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":28
- *     # Setters
- *     def SetGmodel (self, Integer instIndexGlobal, Real value):
- *         EnergyModel_SetGmodel (self.cObject, instIndexGlobal, value)             # <<<<<<<<<<<<<<
- * 
- *     def SetGintr (self, Integer instIndexGlobal, Real value):
- */
-  EnergyModel_SetGmodel(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobal, __pyx_v_value);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":30
- *         EnergyModel_SetGmodel (self.cObject, instIndexGlobal, value)
- * 
- *     def SetGintr (self, Integer instIndexGlobal, Real value):             # <<<<<<<<<<<<<<
- *         EnergyModel_SetGintr (self.cObject, instIndexGlobal, value)
- * 
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_3SetGintr(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_3SetGintr(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_instIndexGlobal;
-  Real __pyx_v_value;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__instIndexGlobal,&__pyx_n_s__value,0};
-  __Pyx_RefNannySetupContext("SetGintr");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobal);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__value);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("SetGintr", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "SetGintr") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_instIndexGlobal = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_instIndexGlobal == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_value = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_value == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("SetGintr", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.SetGintr", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":31
- * 
- *     def SetGintr (self, Integer instIndexGlobal, Real value):
- *         EnergyModel_SetGintr (self.cObject, instIndexGlobal, value)             # <<<<<<<<<<<<<<
- * 
- *     def SetProtons (self, Integer instIndexGlobal, Integer value):
- */
-  EnergyModel_SetGintr(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobal, __pyx_v_value);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":33
- *         EnergyModel_SetGintr (self.cObject, instIndexGlobal, value)
- * 
- *     def SetProtons (self, Integer instIndexGlobal, Integer value):             # <<<<<<<<<<<<<<
- *         EnergyModel_SetProtons (self.cObject, instIndexGlobal, value)
- * 
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_4SetProtons(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_4SetProtons(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_instIndexGlobal;
-  Integer __pyx_v_value;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__instIndexGlobal,&__pyx_n_s__value,0};
-  __Pyx_RefNannySetupContext("SetProtons");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobal);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__value);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("SetProtons", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "SetProtons") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_instIndexGlobal = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_instIndexGlobal == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_value = __Pyx_PyInt_from_py_Integer(values[1]); if (unlikely((__pyx_v_value == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("SetProtons", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.SetProtons", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":34
- * 
- *     def SetProtons (self, Integer instIndexGlobal, Integer value):
- *         EnergyModel_SetProtons (self.cObject, instIndexGlobal, value)             # <<<<<<<<<<<<<<
- * 
- *     def SetProbability (self, Integer instIndexGlobal, Real value):
- */
-  EnergyModel_SetProtons(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobal, __pyx_v_value);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":36
- *         EnergyModel_SetProtons (self.cObject, instIndexGlobal, value)
- * 
- *     def SetProbability (self, Integer instIndexGlobal, Real value):             # <<<<<<<<<<<<<<
- *         EnergyModel_SetProbability (self.cObject, instIndexGlobal, value)
- * 
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5SetProbability(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5SetProbability(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_instIndexGlobal;
-  Real __pyx_v_value;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__instIndexGlobal,&__pyx_n_s__value,0};
-  __Pyx_RefNannySetupContext("SetProbability");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobal);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__value);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("SetProbability", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "SetProbability") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_instIndexGlobal = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_instIndexGlobal == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_value = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_value == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("SetProbability", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.SetProbability", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":37
- * 
- *     def SetProbability (self, Integer instIndexGlobal, Real value):
- *         EnergyModel_SetProbability (self.cObject, instIndexGlobal, value)             # <<<<<<<<<<<<<<
- * 
- *     def SetInteraction (self, Integer instIndexGlobalA, Integer instIndexGlobalB, Real value):
- */
-  EnergyModel_SetProbability(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobal, __pyx_v_value);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":39
- *         EnergyModel_SetProbability (self.cObject, instIndexGlobal, value)
- * 
- *     def SetInteraction (self, Integer instIndexGlobalA, Integer instIndexGlobalB, Real value):             # <<<<<<<<<<<<<<
- *         EnergyModel_SetInteraction (self.cObject, instIndexGlobalA, instIndexGlobalB, value)
- * 
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_6SetInteraction(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_6SetInteraction(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_instIndexGlobalA;
-  Integer __pyx_v_instIndexGlobalB;
-  Real __pyx_v_value;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__instIndexGlobalA,&__pyx_n_s__instIndexGlobalB,&__pyx_n_s__value,0};
-  __Pyx_RefNannySetupContext("SetInteraction");
-  {
-    PyObject* values[3] = {0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobalA);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobalB);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("SetInteraction", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  2:
-        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__value);
-        if (likely(values[2])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("SetInteraction", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "SetInteraction") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-    }
-    __pyx_v_instIndexGlobalA = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_instIndexGlobalA == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_instIndexGlobalB = __Pyx_PyInt_from_py_Integer(values[1]); if (unlikely((__pyx_v_instIndexGlobalB == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_value = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_value == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("SetInteraction", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.SetInteraction", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":40
- * 
- *     def SetInteraction (self, Integer instIndexGlobalA, Integer instIndexGlobalB, Real value):
- *         EnergyModel_SetInteraction (self.cObject, instIndexGlobalA, instIndexGlobalB, value)             # <<<<<<<<<<<<<<
- * 
- *     # Getters
- */
-  EnergyModel_SetInteraction(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobalA, __pyx_v_instIndexGlobalB, __pyx_v_value);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":43
- * 
- *     # Getters
- *     def GetGmodel (self, Integer instIndexGlobal):             # <<<<<<<<<<<<<<
- *         cdef Real Gmodel = EnergyModel_GetGmodel (self.cObject, instIndexGlobal)
- *         return Gmodel
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7GetGmodel(PyObject *__pyx_v_self, PyObject *__pyx_arg_instIndexGlobal); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7GetGmodel(PyObject *__pyx_v_self, PyObject *__pyx_arg_instIndexGlobal) {
-  Integer __pyx_v_instIndexGlobal;
-  Real __pyx_v_Gmodel;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("GetGmodel");
-  assert(__pyx_arg_instIndexGlobal); {
-    __pyx_v_instIndexGlobal = __Pyx_PyInt_from_py_Integer(__pyx_arg_instIndexGlobal); if (unlikely((__pyx_v_instIndexGlobal == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetGmodel", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":44
- *     # Getters
- *     def GetGmodel (self, Integer instIndexGlobal):
- *         cdef Real Gmodel = EnergyModel_GetGmodel (self.cObject, instIndexGlobal)             # <<<<<<<<<<<<<<
- *         return Gmodel
- * 
- */
-  __pyx_v_Gmodel = EnergyModel_GetGmodel(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobal);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":45
- *     def GetGmodel (self, Integer instIndexGlobal):
- *         cdef Real Gmodel = EnergyModel_GetGmodel (self.cObject, instIndexGlobal)
- *         return Gmodel             # <<<<<<<<<<<<<<
- * 
- *     def GetGintr (self, Integer instIndexGlobal):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_Gmodel); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetGmodel", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":47
- *         return Gmodel
- * 
- *     def GetGintr (self, Integer instIndexGlobal):             # <<<<<<<<<<<<<<
- *         cdef Real Gintr = EnergyModel_GetGintr (self.cObject, instIndexGlobal)
- *         return Gintr
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_8GetGintr(PyObject *__pyx_v_self, PyObject *__pyx_arg_instIndexGlobal); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_8GetGintr(PyObject *__pyx_v_self, PyObject *__pyx_arg_instIndexGlobal) {
-  Integer __pyx_v_instIndexGlobal;
-  Real __pyx_v_Gintr;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("GetGintr");
-  assert(__pyx_arg_instIndexGlobal); {
-    __pyx_v_instIndexGlobal = __Pyx_PyInt_from_py_Integer(__pyx_arg_instIndexGlobal); if (unlikely((__pyx_v_instIndexGlobal == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetGintr", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":48
- * 
- *     def GetGintr (self, Integer instIndexGlobal):
- *         cdef Real Gintr = EnergyModel_GetGintr (self.cObject, instIndexGlobal)             # <<<<<<<<<<<<<<
- *         return Gintr
- * 
- */
-  __pyx_v_Gintr = EnergyModel_GetGintr(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobal);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":49
- *     def GetGintr (self, Integer instIndexGlobal):
- *         cdef Real Gintr = EnergyModel_GetGintr (self.cObject, instIndexGlobal)
- *         return Gintr             # <<<<<<<<<<<<<<
- * 
- *     def GetProtons (self, Integer instIndexGlobal):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_Gintr); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetGintr", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":51
- *         return Gintr
- * 
- *     def GetProtons (self, Integer instIndexGlobal):             # <<<<<<<<<<<<<<
- *         cdef Integer protons = EnergyModel_GetProtons (self.cObject, instIndexGlobal)
- *         return protons
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_9GetProtons(PyObject *__pyx_v_self, PyObject *__pyx_arg_instIndexGlobal); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_9GetProtons(PyObject *__pyx_v_self, PyObject *__pyx_arg_instIndexGlobal) {
-  Integer __pyx_v_instIndexGlobal;
-  Integer __pyx_v_protons;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("GetProtons");
-  assert(__pyx_arg_instIndexGlobal); {
-    __pyx_v_instIndexGlobal = __Pyx_PyInt_from_py_Integer(__pyx_arg_instIndexGlobal); if (unlikely((__pyx_v_instIndexGlobal == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetProtons", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":52
- * 
- *     def GetProtons (self, Integer instIndexGlobal):
- *         cdef Integer protons = EnergyModel_GetProtons (self.cObject, instIndexGlobal)             # <<<<<<<<<<<<<<
- *         return protons
- * 
- */
-  __pyx_v_protons = EnergyModel_GetProtons(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobal);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":53
- *     def GetProtons (self, Integer instIndexGlobal):
- *         cdef Integer protons = EnergyModel_GetProtons (self.cObject, instIndexGlobal)
- *         return protons             # <<<<<<<<<<<<<<
- * 
- *     def GetProbability (self, Integer instIndexGlobal):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_to_py_Integer(__pyx_v_protons); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetProtons", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":55
- *         return protons
- * 
- *     def GetProbability (self, Integer instIndexGlobal):             # <<<<<<<<<<<<<<
- *         cdef Real prob = EnergyModel_GetProbability (self.cObject, instIndexGlobal)
- *         return prob
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_10GetProbability(PyObject *__pyx_v_self, PyObject *__pyx_arg_instIndexGlobal); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_10GetProbability(PyObject *__pyx_v_self, PyObject *__pyx_arg_instIndexGlobal) {
-  Integer __pyx_v_instIndexGlobal;
-  Real __pyx_v_prob;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("GetProbability");
-  assert(__pyx_arg_instIndexGlobal); {
-    __pyx_v_instIndexGlobal = __Pyx_PyInt_from_py_Integer(__pyx_arg_instIndexGlobal); if (unlikely((__pyx_v_instIndexGlobal == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetProbability", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":56
- * 
- *     def GetProbability (self, Integer instIndexGlobal):
- *         cdef Real prob = EnergyModel_GetProbability (self.cObject, instIndexGlobal)             # <<<<<<<<<<<<<<
- *         return prob
- * 
- */
-  __pyx_v_prob = EnergyModel_GetProbability(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobal);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":57
- *     def GetProbability (self, Integer instIndexGlobal):
- *         cdef Real prob = EnergyModel_GetProbability (self.cObject, instIndexGlobal)
- *         return prob             # <<<<<<<<<<<<<<
- * 
- *     def GetInteraction (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_prob); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetProbability", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":59
- *         return prob
- * 
- *     def GetInteraction (self, Integer instIndexGlobalA, Integer instIndexGlobalB):             # <<<<<<<<<<<<<<
- *         cdef Real interac = EnergyModel_GetInteraction (self.cObject, instIndexGlobalA, instIndexGlobalB)
- *         return interac
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_11GetInteraction(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_11GetInteraction(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_instIndexGlobalA;
-  Integer __pyx_v_instIndexGlobalB;
-  Real __pyx_v_interac;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__instIndexGlobalA,&__pyx_n_s__instIndexGlobalB,0};
-  __Pyx_RefNannySetupContext("GetInteraction");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobalA);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobalB);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("GetInteraction", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "GetInteraction") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_instIndexGlobalA = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_instIndexGlobalA == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_instIndexGlobalB = __Pyx_PyInt_from_py_Integer(values[1]); if (unlikely((__pyx_v_instIndexGlobalB == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("GetInteraction", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetInteraction", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":60
- * 
- *     def GetInteraction (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- *         cdef Real interac = EnergyModel_GetInteraction (self.cObject, instIndexGlobalA, instIndexGlobalB)             # <<<<<<<<<<<<<<
- *         return interac
- * 
- */
-  __pyx_v_interac = EnergyModel_GetInteraction(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobalA, __pyx_v_instIndexGlobalB);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":61
- *     def GetInteraction (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- *         cdef Real interac = EnergyModel_GetInteraction (self.cObject, instIndexGlobalA, instIndexGlobalB)
- *         return interac             # <<<<<<<<<<<<<<
- * 
- *     def GetInteractionSymmetric (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_interac); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetInteraction", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":63
- *         return interac
- * 
- *     def GetInteractionSymmetric (self, Integer instIndexGlobalA, Integer instIndexGlobalB):             # <<<<<<<<<<<<<<
- *         cdef Real interac = EnergyModel_GetInterSymmetric (self.cObject, instIndexGlobalA, instIndexGlobalB)
- *         return interac
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_12GetInteractionSymmetric(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_12GetInteractionSymmetric(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_instIndexGlobalA;
-  Integer __pyx_v_instIndexGlobalB;
-  Real __pyx_v_interac;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__instIndexGlobalA,&__pyx_n_s__instIndexGlobalB,0};
-  __Pyx_RefNannySetupContext("GetInteractionSymmetric");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobalA);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobalB);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("GetInteractionSymmetric", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "GetInteractionSymmetric") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_instIndexGlobalA = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_instIndexGlobalA == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_instIndexGlobalB = __Pyx_PyInt_from_py_Integer(values[1]); if (unlikely((__pyx_v_instIndexGlobalB == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("GetInteractionSymmetric", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetInteractionSymmetric", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":64
- * 
- *     def GetInteractionSymmetric (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- *         cdef Real interac = EnergyModel_GetInterSymmetric (self.cObject, instIndexGlobalA, instIndexGlobalB)             # <<<<<<<<<<<<<<
- *         return interac
- * 
- */
-  __pyx_v_interac = EnergyModel_GetInterSymmetric(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobalA, __pyx_v_instIndexGlobalB);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":65
- *     def GetInteractionSymmetric (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- *         cdef Real interac = EnergyModel_GetInterSymmetric (self.cObject, instIndexGlobalA, instIndexGlobalB)
- *         return interac             # <<<<<<<<<<<<<<
- * 
- *     def GetDeviation (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_interac); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetInteractionSymmetric", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":67
- *         return interac
- * 
- *     def GetDeviation (self, Integer instIndexGlobalA, Integer instIndexGlobalB):             # <<<<<<<<<<<<<<
- *         cdef Real deviate = EnergyModel_GetDeviation (self.cObject, instIndexGlobalA, instIndexGlobalB)
- *         return deviate
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_13GetDeviation(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_13GetDeviation(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_instIndexGlobalA;
-  Integer __pyx_v_instIndexGlobalB;
-  Real __pyx_v_deviate;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__instIndexGlobalA,&__pyx_n_s__instIndexGlobalB,0};
-  __Pyx_RefNannySetupContext("GetDeviation");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobalA);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__instIndexGlobalB);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("GetDeviation", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "GetDeviation") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_instIndexGlobalA = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_instIndexGlobalA == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_instIndexGlobalB = __Pyx_PyInt_from_py_Integer(values[1]); if (unlikely((__pyx_v_instIndexGlobalB == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("GetDeviation", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetDeviation", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":68
- * 
- *     def GetDeviation (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- *         cdef Real deviate = EnergyModel_GetDeviation (self.cObject, instIndexGlobalA, instIndexGlobalB)             # <<<<<<<<<<<<<<
- *         return deviate
- * 
- */
-  __pyx_v_deviate = EnergyModel_GetDeviation(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_instIndexGlobalA, __pyx_v_instIndexGlobalB);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":69
- *     def GetDeviation (self, Integer instIndexGlobalA, Integer instIndexGlobalB):
- *         cdef Real deviate = EnergyModel_GetDeviation (self.cObject, instIndexGlobalA, instIndexGlobalB)
- *         return deviate             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_deviate); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.GetDeviation", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":72
- * 
- * 
- *     def __init__ (self, ceModel, Integer totalSites, Integer totalInstances):             # <<<<<<<<<<<<<<
- *         """Constructor."""
- *         cdef Status  status
- */
-
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__[] = "Constructor.";
-struct wrapperbase __pyx_wrapperbase_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__;
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_ceModel = 0;
-  Integer __pyx_v_totalSites;
-  Integer __pyx_v_totalInstances;
-  Status __pyx_v_status;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Real __pyx_t_4;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__ceModel,&__pyx_n_s__totalSites,&__pyx_n_s__totalInstances,0};
-  __Pyx_RefNannySetupContext("__init__");
-  {
-    PyObject* values[3] = {0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__ceModel);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__totalSites);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  2:
-        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__totalInstances);
-        if (likely(values[2])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-    }
-    __pyx_v_ceModel = values[0];
-    __pyx_v_totalSites = __Pyx_PyInt_from_py_Integer(values[1]); if (unlikely((__pyx_v_totalSites == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_totalInstances = __Pyx_PyInt_from_py_Integer(values[2]); if (unlikely((__pyx_v_totalInstances == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":75
- *         """Constructor."""
- *         cdef Status  status
- *         status        = Status_Continue             # <<<<<<<<<<<<<<
- *         self.cObject  = EnergyModel_Allocate (totalSites, totalInstances, &status)
- *         if status != Status_Continue:
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":76
- *         cdef Status  status
- *         status        = Status_Continue
- *         self.cObject  = EnergyModel_Allocate (totalSites, totalInstances, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate energy model.")
- */
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject = EnergyModel_Allocate(__pyx_v_totalSites, __pyx_v_totalInstances, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":77
- *         status        = Status_Continue
- *         self.cObject  = EnergyModel_Allocate (totalSites, totalInstances, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Cannot allocate energy model.")
- * 
- */
-  __pyx_t_1 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":78
- *         self.cObject  = EnergyModel_Allocate (totalSites, totalInstances, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate energy model.")             # <<<<<<<<<<<<<<
- * 
- *         self.cObject.temperature = ceModel.temperature
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_k_tuple_3), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":80
- *             raise CLibraryError ("Cannot allocate energy model.")
- * 
- *         self.cObject.temperature = ceModel.temperature             # <<<<<<<<<<<<<<
- *         self.cObject.ninstances  = totalInstances
- *         self.isOwner             = False
- */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__temperature); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_4 == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->temperature = __pyx_t_4;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":81
- * 
- *         self.cObject.temperature = ceModel.temperature
- *         self.cObject.ninstances  = totalInstances             # <<<<<<<<<<<<<<
- *         self.isOwner             = False
- *         self.owner               = ceModel
- */
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->ninstances = __pyx_v_totalInstances;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":82
- *         self.cObject.temperature = ceModel.temperature
- *         self.cObject.ninstances  = totalInstances
- *         self.isOwner             = False             # <<<<<<<<<<<<<<
- *         self.owner               = ceModel
- * 
- */
-  __pyx_t_3 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 82; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":83
- *         self.cObject.ninstances  = totalInstances
- *         self.isOwner             = False
- *         self.owner               = ceModel             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_INCREF(__pyx_v_ceModel);
-  __Pyx_GIVEREF(__pyx_v_ceModel);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner = __pyx_v_ceModel;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":86
- * 
- * 
- *     def Initialize (self):             # <<<<<<<<<<<<<<
- *         """Set up sites and calculate the number of possible states."""
- *         cdef Integer nstates, ninstances, totalSites
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_15Initialize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_15Initialize[] = "Set up sites and calculate the number of possible states.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_15Initialize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  Integer __pyx_v_nstates;
-  Integer __pyx_v_ninstances;
-  Integer __pyx_v_totalSites;
-  Integer __pyx_v_indexSite;
-  Integer __pyx_v_indexDown;
-  Integer __pyx_v_indexUp;
-  Integer __pyx_v_index;
-  Status __pyx_v_status;
-  PyObject *__pyx_v_ceModel = NULL;
-  PyObject *__pyx_v_site = NULL;
-  PyObject *__pyx_v_instance = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  Integer __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *(*__pyx_t_5)(PyObject *);
-  Integer __pyx_t_6;
-  int __pyx_t_7;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("Initialize");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":91
- *         cdef Integer indexSite, indexDown, indexUp, index
- *         cdef Status  status
- *         totalSites = self.cObject.vector.nsites             # <<<<<<<<<<<<<<
- *         status     = Status_Continue
- *         ceModel    = self.owner
- */
-  __pyx_v_totalSites = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->vector->nsites;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":92
- *         cdef Status  status
- *         totalSites = self.cObject.vector.nsites
- *         status     = Status_Continue             # <<<<<<<<<<<<<<
- *         ceModel    = self.owner
- *         nstates    = 1
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":93
- *         totalSites = self.cObject.vector.nsites
- *         status     = Status_Continue
- *         ceModel    = self.owner             # <<<<<<<<<<<<<<
- *         nstates    = 1
- * 
- */
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __pyx_v_ceModel = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":94
- *         status     = Status_Continue
- *         ceModel    = self.owner
- *         nstates    = 1             # <<<<<<<<<<<<<<
- * 
- *         for indexSite from 0 <= indexSite < totalSites:
- */
-  __pyx_v_nstates = 1;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":96
- *         nstates    = 1
- * 
- *         for indexSite from 0 <= indexSite < totalSites:             # <<<<<<<<<<<<<<
- *             ninstances =  0
- *             indexUp    =  0
- */
-  __pyx_t_1 = __pyx_v_totalSites;
-  for (__pyx_v_indexSite = 0; __pyx_v_indexSite < __pyx_t_1; __pyx_v_indexSite++) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":97
- * 
- *         for indexSite from 0 <= indexSite < totalSites:
- *             ninstances =  0             # <<<<<<<<<<<<<<
- *             indexUp    =  0
- *             indexDown  =  9999
- */
-    __pyx_v_ninstances = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":98
- *         for indexSite from 0 <= indexSite < totalSites:
- *             ninstances =  0
- *             indexUp    =  0             # <<<<<<<<<<<<<<
- *             indexDown  =  9999
- *             site       =  ceModel.sites[indexSite]
- */
-    __pyx_v_indexUp = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":99
- *             ninstances =  0
- *             indexUp    =  0
- *             indexDown  =  9999             # <<<<<<<<<<<<<<
- *             site       =  ceModel.sites[indexSite]
- *             for instance in site.instances:
- */
-    __pyx_v_indexDown = 9999;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":100
- *             indexUp    =  0
- *             indexDown  =  9999
- *             site       =  ceModel.sites[indexSite]             # <<<<<<<<<<<<<<
- *             for instance in site.instances:
- *                 ninstances += 1
- */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__sites); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, __pyx_v_indexSite, sizeof(Integer), __Pyx_PyInt_to_py_Integer); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_v_site);
-    __pyx_v_site = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":101
- *             indexDown  =  9999
- *             site       =  ceModel.sites[indexSite]
- *             for instance in site.instances:             # <<<<<<<<<<<<<<
- *                 ninstances += 1
- *                 index = instance._instIndexGlobal
- */
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_site, __pyx_n_s__instances); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
-      __pyx_t_2 = __pyx_t_3; __Pyx_INCREF(__pyx_t_2); __pyx_t_4 = 0;
-      __pyx_t_5 = NULL;
-    } else {
-      __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_5 = Py_TYPE(__pyx_t_2)->tp_iternext;
-    }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    for (;;) {
-      if (PyList_CheckExact(__pyx_t_2)) {
-        if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_2)) break;
-        __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++;
-      } else if (PyTuple_CheckExact(__pyx_t_2)) {
-        if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
-        __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++;
-      } else {
-        __pyx_t_3 = __pyx_t_5(__pyx_t_2);
-        if (unlikely(!__pyx_t_3)) {
-          if (PyErr_Occurred()) {
-            if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) PyErr_Clear();
-            else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          }
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_3);
-      }
-      __Pyx_XDECREF(__pyx_v_instance);
-      __pyx_v_instance = __pyx_t_3;
-      __pyx_t_3 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":102
- *             site       =  ceModel.sites[indexSite]
- *             for instance in site.instances:
- *                 ninstances += 1             # <<<<<<<<<<<<<<
- *                 index = instance._instIndexGlobal
- *                 if index < indexDown : indexDown = index
- */
-      __pyx_v_ninstances = (__pyx_v_ninstances + 1);
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":103
- *             for instance in site.instances:
- *                 ninstances += 1
- *                 index = instance._instIndexGlobal             # <<<<<<<<<<<<<<
- *                 if index < indexDown : indexDown = index
- *                 if index > indexUp   : indexUp   = index
- */
-      __pyx_t_3 = PyObject_GetAttr(__pyx_v_instance, __pyx_n_s___instIndexGlobal); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = __Pyx_PyInt_from_py_Integer(__pyx_t_3); if (unlikely((__pyx_t_6 == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_v_index = __pyx_t_6;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":104
- *                 ninstances += 1
- *                 index = instance._instIndexGlobal
- *                 if index < indexDown : indexDown = index             # <<<<<<<<<<<<<<
- *                 if index > indexUp   : indexUp   = index
- *             StateVector_SetSite (self.cObject.vector, indexSite, indexDown, indexUp, &status)
- */
-      __pyx_t_7 = (__pyx_v_index < __pyx_v_indexDown);
-      if (__pyx_t_7) {
-        __pyx_v_indexDown = __pyx_v_index;
-        goto __pyx_L9;
-      }
-      __pyx_L9:;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":105
- *                 index = instance._instIndexGlobal
- *                 if index < indexDown : indexDown = index
- *                 if index > indexUp   : indexUp   = index             # <<<<<<<<<<<<<<
- *             StateVector_SetSite (self.cObject.vector, indexSite, indexDown, indexUp, &status)
- * 
- */
-      __pyx_t_7 = (__pyx_v_index > __pyx_v_indexUp);
-      if (__pyx_t_7) {
-        __pyx_v_indexUp = __pyx_v_index;
-        goto __pyx_L10;
-      }
-      __pyx_L10:;
-    }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":106
- *                 if index < indexDown : indexDown = index
- *                 if index > indexUp   : indexUp   = index
- *             StateVector_SetSite (self.cObject.vector, indexSite, indexDown, indexUp, &status)             # <<<<<<<<<<<<<<
- * 
- *             if nstates <= ANALYTIC_STATES:
- */
-    StateVector_SetSite(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->vector, __pyx_v_indexSite, __pyx_v_indexDown, __pyx_v_indexUp, (&__pyx_v_status));
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":108
- *             StateVector_SetSite (self.cObject.vector, indexSite, indexDown, indexUp, &status)
- * 
- *             if nstates <= ANALYTIC_STATES:             # <<<<<<<<<<<<<<
- *                 nstates = nstates * ninstances
- *         self.cObject.nstates = nstates
- */
-    __pyx_t_7 = (__pyx_v_nstates <= 67108864);
-    if (__pyx_t_7) {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":109
- * 
- *             if nstates <= ANALYTIC_STATES:
- *                 nstates = nstates * ninstances             # <<<<<<<<<<<<<<
- *         self.cObject.nstates = nstates
- * 
- */
-      __pyx_v_nstates = (__pyx_v_nstates * __pyx_v_ninstances);
-      goto __pyx_L11;
-    }
-    __pyx_L11:;
-  }
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":110
- *             if nstates <= ANALYTIC_STATES:
- *                 nstates = nstates * ninstances
- *         self.cObject.nstates = nstates             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->nstates = __pyx_v_nstates;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.Initialize", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ceModel);
-  __Pyx_XDECREF(__pyx_v_site);
-  __Pyx_XDECREF(__pyx_v_instance);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":113
- * 
- * 
- *     def CheckIfSymmetric (self, Real tolerance=0.05):             # <<<<<<<<<<<<<<
- *         """Check if the matrix of interactions is symmetric within the given threshold."""
- *         cdef Real    maxDeviation
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_16CheckIfSymmetric(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_16CheckIfSymmetric[] = "Check if the matrix of interactions is symmetric within the given threshold.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_16CheckIfSymmetric(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Real __pyx_v_tolerance;
-  Real __pyx_v_maxDeviation;
-  Boolean __pyx_v_isSymmetric;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__tolerance,0};
-  __Pyx_RefNannySetupContext("CheckIfSymmetric");
-  {
-    PyObject* values[1] = {0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__tolerance);
-          if (value) { values[0] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "CheckIfSymmetric") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    if (values[0]) {
-      __pyx_v_tolerance = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_tolerance == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_tolerance = ((Real)0.05);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("CheckIfSymmetric", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CheckIfSymmetric", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":117
- *         cdef Real    maxDeviation
- *         cdef Boolean isSymmetric
- *         isSymmetric = EnergyModel_CheckInteractionsSymmetric (self.cObject, tolerance, &maxDeviation)             # <<<<<<<<<<<<<<
- *         return (isSymmetric, maxDeviation)
- * 
- */
-  __pyx_v_isSymmetric = EnergyModel_CheckInteractionsSymmetric(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_tolerance, (&__pyx_v_maxDeviation));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":118
- *         cdef Boolean isSymmetric
- *         isSymmetric = EnergyModel_CheckInteractionsSymmetric (self.cObject, tolerance, &maxDeviation)
- *         return (isSymmetric, maxDeviation)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_isSymmetric); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_maxDeviation); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_r = ((PyObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CheckIfSymmetric", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":121
- * 
- * 
- *     def SymmetrizeInteractions (self, log=logFile):             # <<<<<<<<<<<<<<
- *         """Symmetrize the matrix of interactions."""
- *         cdef Status status = Status_Continue
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_17SymmetrizeInteractions(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_17SymmetrizeInteractions[] = "Symmetrize the matrix of interactions.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_17SymmetrizeInteractions(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_log = 0;
-  Status __pyx_v_status;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__log,0};
-  __Pyx_RefNannySetupContext("SymmetrizeInteractions");
-  {
-    PyObject* values[1] = {0};
-    values[0] = __pyx_k_4;
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__log);
-          if (value) { values[0] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "SymmetrizeInteractions") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_log = values[0];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("SymmetrizeInteractions", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.SymmetrizeInteractions", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":123
- *     def SymmetrizeInteractions (self, log=logFile):
- *         """Symmetrize the matrix of interactions."""
- *         cdef Status status = Status_Continue             # <<<<<<<<<<<<<<
- *         EnergyModel_SymmetrizeInteractions (self.cObject, &status)
- *         if LogFileActive (log):
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":124
- *         """Symmetrize the matrix of interactions."""
- *         cdef Status status = Status_Continue
- *         EnergyModel_SymmetrizeInteractions (self.cObject, &status)             # <<<<<<<<<<<<<<
- *         if LogFileActive (log):
- *             log.Text ("\nSymmetrizing interactions complete.\n")
- */
-  EnergyModel_SymmetrizeInteractions(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":125
- *         cdef Status status = Status_Continue
- *         EnergyModel_SymmetrizeInteractions (self.cObject, &status)
- *         if LogFileActive (log):             # <<<<<<<<<<<<<<
- *             log.Text ("\nSymmetrizing interactions complete.\n")
- * 
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__LogFileActive); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __Pyx_INCREF(__pyx_v_log);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_log);
-  __Pyx_GIVEREF(__pyx_v_log);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__pyx_t_4) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":126
- *         EnergyModel_SymmetrizeInteractions (self.cObject, &status)
- *         if LogFileActive (log):
- *             log.Text ("\nSymmetrizing interactions complete.\n")             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_log, __pyx_n_s__Text); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_k_tuple_6), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.SymmetrizeInteractions", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":129
- * 
- * 
- *     def ResetInteractions (self):             # <<<<<<<<<<<<<<
- *         """Set all interactions to zero."""
- *         EnergyModel_ResetInteractions (self.cObject)
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_18ResetInteractions(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_18ResetInteractions[] = "Set all interactions to zero.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_18ResetInteractions(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("ResetInteractions");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":131
- *     def ResetInteractions (self):
- *         """Set all interactions to zero."""
- *         EnergyModel_ResetInteractions (self.cObject)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  EnergyModel_ResetInteractions(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":134
- * 
- * 
- *     def ScaleInteractions (self, Real scale):             # <<<<<<<<<<<<<<
- *         """Scale interactions."""
- *         EnergyModel_ScaleInteractions (self.cObject, scale)
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_19ScaleInteractions(PyObject *__pyx_v_self, PyObject *__pyx_arg_scale); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_19ScaleInteractions[] = "Scale interactions.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_19ScaleInteractions(PyObject *__pyx_v_self, PyObject *__pyx_arg_scale) {
-  Real __pyx_v_scale;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("ScaleInteractions");
-  assert(__pyx_arg_scale); {
-    __pyx_v_scale = __pyx_PyFloat_AsDouble(__pyx_arg_scale); if (unlikely((__pyx_v_scale == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.ScaleInteractions", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":136
- *     def ScaleInteractions (self, Real scale):
- *         """Scale interactions."""
- *         EnergyModel_ScaleInteractions (self.cObject, scale)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  EnergyModel_ScaleInteractions(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_scale);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":139
- * 
- * 
- *     def CalculateMicrostateEnergy (self, StateVector vector, Real pH=7.0):             # <<<<<<<<<<<<<<
- *         """Calculate energy of a protonation state (=microstate)."""
- *         cdef Real Gmicro
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_20CalculateMicrostateEnergy(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_20CalculateMicrostateEnergy[] = "Calculate energy of a protonation state (=microstate).";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_20CalculateMicrostateEnergy(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *__pyx_v_vector = 0;
-  Real __pyx_v_pH;
-  Real __pyx_v_Gmicro;
-  PyObject *__pyx_v_ceModel = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__vector,&__pyx_n_s__pH,0};
-  __Pyx_RefNannySetupContext("CalculateMicrostateEnergy");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__vector);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pH);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "CalculateMicrostateEnergy") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_vector = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)values[0]);
-    if (values[1]) {
-      __pyx_v_pH = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_pH == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_pH = ((Real)7.0);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("CalculateMicrostateEnergy", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateMicrostateEnergy", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vector), __pyx_ptype_23ContinuumElectrostatics_11StateVector_StateVector, 1, "vector", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":142
- *         """Calculate energy of a protonation state (=microstate)."""
- *         cdef Real Gmicro
- *         ceModel = self.owner             # <<<<<<<<<<<<<<
- * 
- *         if not ceModel.isCalculated:
- */
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __pyx_v_ceModel = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":144
- *         ceModel = self.owner
- * 
- *         if not ceModel.isCalculated:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("First calculate electrostatic energies.")
- *         Gmicro = EnergyModel_CalculateMicrostateEnergy (self.cObject, vector.cObject, pH)
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__isCalculated); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (!__pyx_t_2);
-  if (__pyx_t_3) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":145
- * 
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")             # <<<<<<<<<<<<<<
- *         Gmicro = EnergyModel_CalculateMicrostateEnergy (self.cObject, vector.cObject, pH)
- *         return Gmicro
- */
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_k_tuple_8), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":146
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")
- *         Gmicro = EnergyModel_CalculateMicrostateEnergy (self.cObject, vector.cObject, pH)             # <<<<<<<<<<<<<<
- *         return Gmicro
- * 
- */
-  __pyx_v_Gmicro = EnergyModel_CalculateMicrostateEnergy(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_vector->cObject, __pyx_v_pH);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":147
- *             raise CLibraryError ("First calculate electrostatic energies.")
- *         Gmicro = EnergyModel_CalculateMicrostateEnergy (self.cObject, vector.cObject, pH)
- *         return Gmicro             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_Gmicro); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateMicrostateEnergy", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ceModel);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":150
- * 
- * 
- *     def CalculateProbabilitiesAnalytically (self, Real pH=7.0):             # <<<<<<<<<<<<<<
- *         """Calculate probabilities of protonation states analytically."""
- *         cdef Status status
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_21CalculateProbabilitiesAnalytically(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_21CalculateProbabilitiesAnalytically[] = "Calculate probabilities of protonation states analytically.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_21CalculateProbabilitiesAnalytically(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Real __pyx_v_pH;
-  Status __pyx_v_status;
-  PyObject *__pyx_v_ceModel = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__pH,0};
-  __Pyx_RefNannySetupContext("CalculateProbabilitiesAnalytically");
-  {
-    PyObject* values[1] = {0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pH);
-          if (value) { values[0] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "CalculateProbabilitiesAnalytically") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    if (values[0]) {
-      __pyx_v_pH = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_pH == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_pH = ((Real)7.0);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("CalculateProbabilitiesAnalytically", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateProbabilitiesAnalytically", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":153
- *         """Calculate probabilities of protonation states analytically."""
- *         cdef Status status
- *         status   = Status_Continue             # <<<<<<<<<<<<<<
- *         ceModel  = self.owner
- * 
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":154
- *         cdef Status status
- *         status   = Status_Continue
- *         ceModel  = self.owner             # <<<<<<<<<<<<<<
- * 
- *         if self.cObject.nstates > ANALYTIC_STATES:
- */
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __pyx_v_ceModel = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":156
- *         ceModel  = self.owner
- * 
- *         if self.cObject.nstates > ANALYTIC_STATES:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- *         if not ceModel.isCalculated:
- */
-  __pyx_t_1 = (((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->nstates > 67108864);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":157
- * 
- *         if self.cObject.nstates > ANALYTIC_STATES:
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)             # <<<<<<<<<<<<<<
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_int_67108864); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":158
- *         if self.cObject.nstates > ANALYTIC_STATES:
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- *         if not ceModel.isCalculated:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("First calculate electrostatic energies.")
- * 
- */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__isCalculated); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_5 = (!__pyx_t_1);
-  if (__pyx_t_5) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":159
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")             # <<<<<<<<<<<<<<
- * 
- *         EnergyModel_CalculateProbabilitiesAnalytically (self.cObject, pH, &status)
- */
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_k_tuple_10), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":161
- *             raise CLibraryError ("First calculate electrostatic energies.")
- * 
- *         EnergyModel_CalculateProbabilitiesAnalytically (self.cObject, pH, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- */
-  EnergyModel_CalculateProbabilitiesAnalytically(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_pH, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":162
- * 
- *         EnergyModel_CalculateProbabilitiesAnalytically (self.cObject, pH, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- *         return self.cObject.nstates
- */
-  __pyx_t_5 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_5) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":163
- *         EnergyModel_CalculateProbabilitiesAnalytically (self.cObject, pH, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")             # <<<<<<<<<<<<<<
- *         return self.cObject.nstates
- * 
- */
-    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_k_tuple_12), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L8;
-  }
-  __pyx_L8:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":164
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- *         return self.cObject.nstates             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyInt_to_py_Integer(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->nstates); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateProbabilitiesAnalytically", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ceModel);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":167
- * 
- * 
- *     def CalculateProbabilitiesAnalyticallyUnfolded (self, Real pH=7.0):             # <<<<<<<<<<<<<<
- *         """Calculate probabilities of protonation states analytically (unfolded protein)."""
- *         cdef Status status
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_22CalculateProbabilitiesAnalyticallyUnfolded(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_22CalculateProbabilitiesAnalyticallyUnfolded[] = "Calculate probabilities of protonation states analytically (unfolded protein).";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_22CalculateProbabilitiesAnalyticallyUnfolded(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Real __pyx_v_pH;
-  Status __pyx_v_status;
-  PyObject *__pyx_v_ceModel = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__pH,0};
-  __Pyx_RefNannySetupContext("CalculateProbabilitiesAnalyticallyUnfolded");
-  {
-    PyObject* values[1] = {0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pH);
-          if (value) { values[0] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "CalculateProbabilitiesAnalyticallyUnfolded") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    if (values[0]) {
-      __pyx_v_pH = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_pH == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_pH = ((Real)7.0);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("CalculateProbabilitiesAnalyticallyUnfolded", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateProbabilitiesAnalyticallyUnfolded", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":170
- *         """Calculate probabilities of protonation states analytically (unfolded protein)."""
- *         cdef Status status
- *         status   = Status_Continue             # <<<<<<<<<<<<<<
- *         ceModel  = self.owner
- * 
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":171
- *         cdef Status status
- *         status   = Status_Continue
- *         ceModel  = self.owner             # <<<<<<<<<<<<<<
- * 
- *         if self.cObject.nstates > ANALYTIC_STATES:
- */
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __pyx_v_ceModel = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":173
- *         ceModel  = self.owner
- * 
- *         if self.cObject.nstates > ANALYTIC_STATES:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- *         if not ceModel.isCalculated:
- */
-  __pyx_t_1 = (((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->nstates > 67108864);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":174
- * 
- *         if self.cObject.nstates > ANALYTIC_STATES:
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)             # <<<<<<<<<<<<<<
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_int_67108864); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":175
- *         if self.cObject.nstates > ANALYTIC_STATES:
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- *         if not ceModel.isCalculated:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("First calculate electrostatic energies.")
- * 
- */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__isCalculated); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_5 = (!__pyx_t_1);
-  if (__pyx_t_5) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":176
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")             # <<<<<<<<<<<<<<
- * 
- *         EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (self.cObject, pH, &status)
- */
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_k_tuple_13), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":178
- *             raise CLibraryError ("First calculate electrostatic energies.")
- * 
- *         EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (self.cObject, pH, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- */
-  EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_pH, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":179
- * 
- *         EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (self.cObject, pH, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- *         return self.cObject.nstates
- */
-  __pyx_t_5 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_5) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":180
- *         EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (self.cObject, pH, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")             # <<<<<<<<<<<<<<
- *         return self.cObject.nstates
- * 
- */
-    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_k_tuple_14), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L8;
-  }
-  __pyx_L8:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":181
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- *         return self.cObject.nstates             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyInt_to_py_Integer(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->nstates); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateProbabilitiesAnalyticallyUnfolded", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ceModel);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":184
- * 
- * 
- *     def CalculateMicrostateEnergyUnfolded (self, StateVector vector, Real pH=7.0):             # <<<<<<<<<<<<<<
- *         """Calculate energy of a protonation state (=microstate) in an unfolded protein."""
- *         cdef Real Gmicro
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_23CalculateMicrostateEnergyUnfolded(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_23CalculateMicrostateEnergyUnfolded[] = "Calculate energy of a protonation state (=microstate) in an unfolded protein.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_23CalculateMicrostateEnergyUnfolded(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *__pyx_v_vector = 0;
-  Real __pyx_v_pH;
-  Real __pyx_v_Gmicro;
-  PyObject *__pyx_v_ceModel = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__vector,&__pyx_n_s__pH,0};
-  __Pyx_RefNannySetupContext("CalculateMicrostateEnergyUnfolded");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__vector);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pH);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "CalculateMicrostateEnergyUnfolded") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_vector = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)values[0]);
-    if (values[1]) {
-      __pyx_v_pH = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_pH == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_pH = ((Real)7.0);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("CalculateMicrostateEnergyUnfolded", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateMicrostateEnergyUnfolded", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vector), __pyx_ptype_23ContinuumElectrostatics_11StateVector_StateVector, 1, "vector", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":187
- *         """Calculate energy of a protonation state (=microstate) in an unfolded protein."""
- *         cdef Real Gmicro
- *         ceModel = self.owner             # <<<<<<<<<<<<<<
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")
- */
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __pyx_v_ceModel = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":188
- *         cdef Real Gmicro
- *         ceModel = self.owner
- *         if not ceModel.isCalculated:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("First calculate electrostatic energies.")
- *         Gmicro = EnergyModel_CalculateMicrostateEnergyUnfolded (self.cObject, vector.cObject, pH)
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__isCalculated); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (!__pyx_t_2);
-  if (__pyx_t_3) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":189
- *         ceModel = self.owner
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")             # <<<<<<<<<<<<<<
- *         Gmicro = EnergyModel_CalculateMicrostateEnergyUnfolded (self.cObject, vector.cObject, pH)
- *         return Gmicro
- */
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_k_tuple_15), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":190
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")
- *         Gmicro = EnergyModel_CalculateMicrostateEnergyUnfolded (self.cObject, vector.cObject, pH)             # <<<<<<<<<<<<<<
- *         return Gmicro
- * 
- */
-  __pyx_v_Gmicro = EnergyModel_CalculateMicrostateEnergyUnfolded(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_vector->cObject, __pyx_v_pH);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":191
- *             raise CLibraryError ("First calculate electrostatic energies.")
- *         Gmicro = EnergyModel_CalculateMicrostateEnergyUnfolded (self.cObject, vector.cObject, pH)
- *         return Gmicro             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_Gmicro); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateMicrostateEnergyUnfolded", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ceModel);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":194
- * 
- * 
- *     def CalculateZfolded (self, Real Gzero=0.0, Real pH=7.0):             # <<<<<<<<<<<<<<
- *         """Calculate partition function of a folded protein."""
- *         cdef Status  status = Status_Continue
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_24CalculateZfolded(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_24CalculateZfolded[] = "Calculate partition function of a folded protein.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_24CalculateZfolded(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Real __pyx_v_Gzero;
-  Real __pyx_v_pH;
-  Status __pyx_v_status;
-  Real __pyx_v_Zfolded;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Gzero,&__pyx_n_s__pH,0};
-  __Pyx_RefNannySetupContext("CalculateZfolded");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Gzero);
-          if (value) { values[0] = value; kw_args--; }
-        }
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pH);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "CalculateZfolded") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    if (values[0]) {
-      __pyx_v_Gzero = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_Gzero == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_Gzero = ((Real)0.0);
-    }
-    if (values[1]) {
-      __pyx_v_pH = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_pH == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_pH = ((Real)7.0);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("CalculateZfolded", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateZfolded", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":196
- *     def CalculateZfolded (self, Real Gzero=0.0, Real pH=7.0):
- *         """Calculate partition function of a folded protein."""
- *         cdef Status  status = Status_Continue             # <<<<<<<<<<<<<<
- *         cdef Real    Zfolded
- *         if self.cObject.nstates > ANALYTIC_STATES:
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":198
- *         cdef Status  status = Status_Continue
- *         cdef Real    Zfolded
- *         if self.cObject.nstates > ANALYTIC_STATES:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- * 
- */
-  __pyx_t_1 = (((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->nstates > 67108864);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":199
- *         cdef Real    Zfolded
- *         if self.cObject.nstates > ANALYTIC_STATES:
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)             # <<<<<<<<<<<<<<
- * 
- *         Zfolded = EnergyModel_CalculateZfolded (self.cObject, pH, Gzero, &status)
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_int_67108864); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":201
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- * 
- *         Zfolded = EnergyModel_CalculateZfolded (self.cObject, pH, Gzero, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- */
-  __pyx_v_Zfolded = EnergyModel_CalculateZfolded(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_pH, __pyx_v_Gzero, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":202
- * 
- *         Zfolded = EnergyModel_CalculateZfolded (self.cObject, pH, Gzero, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- *         return Zfolded
- */
-  __pyx_t_1 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":203
- *         Zfolded = EnergyModel_CalculateZfolded (self.cObject, pH, Gzero, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")             # <<<<<<<<<<<<<<
- *         return Zfolded
- * 
- */
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_k_tuple_16), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":204
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- *         return Zfolded             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_Zfolded); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateZfolded", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":207
- * 
- * 
- *     def CalculateZunfolded (self, Real Gzero=0.0, Real pH=7.0):             # <<<<<<<<<<<<<<
- *         """Calculate partition function of an unfolded protein."""
- *         cdef Status  status = Status_Continue
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_25CalculateZunfolded(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_25CalculateZunfolded[] = "Calculate partition function of an unfolded protein.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_25CalculateZunfolded(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Real __pyx_v_Gzero;
-  Real __pyx_v_pH;
-  Status __pyx_v_status;
-  Real __pyx_v_Zunfolded;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Gzero,&__pyx_n_s__pH,0};
-  __Pyx_RefNannySetupContext("CalculateZunfolded");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Gzero);
-          if (value) { values[0] = value; kw_args--; }
-        }
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pH);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "CalculateZunfolded") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    if (values[0]) {
-      __pyx_v_Gzero = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_Gzero == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_Gzero = ((Real)0.0);
-    }
-    if (values[1]) {
-      __pyx_v_pH = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_pH == (Real)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_pH = ((Real)7.0);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("CalculateZunfolded", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateZunfolded", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":209
- *     def CalculateZunfolded (self, Real Gzero=0.0, Real pH=7.0):
- *         """Calculate partition function of an unfolded protein."""
- *         cdef Status  status = Status_Continue             # <<<<<<<<<<<<<<
- *         cdef Real    Zunfolded
- *         if self.cObject.nstates > ANALYTIC_STATES:
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":211
- *         cdef Status  status = Status_Continue
- *         cdef Real    Zunfolded
- *         if self.cObject.nstates > ANALYTIC_STATES:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- * 
- */
-  __pyx_t_1 = (((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject->nstates > 67108864);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":212
- *         cdef Real    Zunfolded
- *         if self.cObject.nstates > ANALYTIC_STATES:
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)             # <<<<<<<<<<<<<<
- * 
- *         Zunfolded = EnergyModel_CalculateZunfolded (self.cObject, pH, Gzero, &status)
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_int_67108864); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":214
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- * 
- *         Zunfolded = EnergyModel_CalculateZunfolded (self.cObject, pH, Gzero, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- */
-  __pyx_v_Zunfolded = EnergyModel_CalculateZunfolded(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->cObject, __pyx_v_pH, __pyx_v_Gzero, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":215
- * 
- *         Zunfolded = EnergyModel_CalculateZunfolded (self.cObject, pH, Gzero, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- *         return Zunfolded
- */
-  __pyx_t_1 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":216
- *         Zunfolded = EnergyModel_CalculateZunfolded (self.cObject, pH, Gzero, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")             # <<<<<<<<<<<<<<
- *         return Zunfolded
- */
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_k_tuple_17), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":217
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")
- *         return Zunfolded             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_Zunfolded); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.EnergyModel.EnergyModel.CalculateZunfolded", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pxd":62
- * cdef class EnergyModel:
- *     cdef CEnergyModel  *cObject
- *     cdef public object  isOwner             # <<<<<<<<<<<<<<
- *     cdef public object  owner
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__get__");
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner);
-  __pyx_r = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner_1__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner_1__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__set__");
-  __Pyx_INCREF(__pyx_v_value);
-  __Pyx_GIVEREF(__pyx_v_value);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner = __pyx_v_value;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner_2__del__(PyObject *__pyx_v_self); /*proto*/
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner_2__del__(PyObject *__pyx_v_self) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__del__");
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->isOwner = Py_None;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pxd":63
- *     cdef CEnergyModel  *cObject
- *     cdef public object  isOwner
- *     cdef public object  owner             # <<<<<<<<<<<<<<
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__get__");
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __pyx_r = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner_1__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner_1__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__set__");
-  __Pyx_INCREF(__pyx_v_value);
-  __Pyx_GIVEREF(__pyx_v_value);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner = __pyx_v_value;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner_2__del__(PyObject *__pyx_v_self); /*proto*/
-static int __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner_2__del__(PyObject *__pyx_v_self) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__del__");
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)__pyx_v_self)->owner = Py_None;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_tp_new_23ContinuumElectrostatics_11EnergyModel_EnergyModel(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)o);
-  p->isOwner = Py_None; Py_INCREF(Py_None);
-  p->owner = Py_None; Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_23ContinuumElectrostatics_11EnergyModel_EnergyModel(PyObject *o) {
-  struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *p = (struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)o;
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_1__dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_XDECREF(p->isOwner);
-  Py_XDECREF(p->owner);
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_23ContinuumElectrostatics_11EnergyModel_EnergyModel(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *p = (struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)o;
-  if (p->isOwner) {
-    e = (*v)(p->isOwner, a); if (e) return e;
-  }
-  if (p->owner) {
-    e = (*v)(p->owner, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_23ContinuumElectrostatics_11EnergyModel_EnergyModel(PyObject *o) {
-  struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *p = (struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->isOwner);
-  p->isOwner = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->owner);
-  p->owner = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static PyObject *__pyx_getprop_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_isOwner(PyObject *o, void *x) {
-  return __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner___get__(o);
-}
-
-static int __pyx_setprop_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_isOwner(PyObject *o, PyObject *v, void *x) {
-  if (v) {
-    return __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner_1__set__(o, v);
-  }
-  else {
-    return __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7isOwner_2__del__(o);
-  }
-}
-
-static PyObject *__pyx_getprop_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_owner(PyObject *o, void *x) {
-  return __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner___get__(o);
-}
-
-static int __pyx_setprop_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_owner(PyObject *o, PyObject *v, void *x) {
-  if (v) {
-    return __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner_1__set__(o, v);
-  }
-  else {
-    return __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5owner_2__del__(o);
-  }
-}
-
-static PyMethodDef __pyx_methods_23ContinuumElectrostatics_11EnergyModel_EnergyModel[] = {
-  {__Pyx_NAMESTR("__getmodule__"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel___getmodule__, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel___getmodule__)},
-  {__Pyx_NAMESTR("SetGmodel"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_2SetGmodel, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("SetGintr"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_3SetGintr, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("SetProtons"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_4SetProtons, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("SetProbability"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_5SetProbability, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("SetInteraction"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_6SetInteraction, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("GetGmodel"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_7GetGmodel, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("GetGintr"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_8GetGintr, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("GetProtons"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_9GetProtons, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("GetProbability"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_10GetProbability, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("GetInteraction"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_11GetInteraction, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("GetInteractionSymmetric"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_12GetInteractionSymmetric, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("GetDeviation"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_13GetDeviation, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("Initialize"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_15Initialize, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_15Initialize)},
-  {__Pyx_NAMESTR("CheckIfSymmetric"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_16CheckIfSymmetric, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_16CheckIfSymmetric)},
-  {__Pyx_NAMESTR("SymmetrizeInteractions"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_17SymmetrizeInteractions, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_17SymmetrizeInteractions)},
-  {__Pyx_NAMESTR("ResetInteractions"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_18ResetInteractions, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_18ResetInteractions)},
-  {__Pyx_NAMESTR("ScaleInteractions"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_19ScaleInteractions, METH_O, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_19ScaleInteractions)},
-  {__Pyx_NAMESTR("CalculateMicrostateEnergy"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_20CalculateMicrostateEnergy, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_20CalculateMicrostateEnergy)},
-  {__Pyx_NAMESTR("CalculateProbabilitiesAnalytically"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_21CalculateProbabilitiesAnalytically, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_21CalculateProbabilitiesAnalytically)},
-  {__Pyx_NAMESTR("CalculateProbabilitiesAnalyticallyUnfolded"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_22CalculateProbabilitiesAnalyticallyUnfolded, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_22CalculateProbabilitiesAnalyticallyUnfolded)},
-  {__Pyx_NAMESTR("CalculateMicrostateEnergyUnfolded"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_23CalculateMicrostateEnergyUnfolded, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_23CalculateMicrostateEnergyUnfolded)},
-  {__Pyx_NAMESTR("CalculateZfolded"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_24CalculateZfolded, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_24CalculateZfolded)},
-  {__Pyx_NAMESTR("CalculateZunfolded"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_25CalculateZunfolded, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_25CalculateZunfolded)},
-  {0, 0, 0, 0}
-};
-
-static struct PyGetSetDef __pyx_getsets_23ContinuumElectrostatics_11EnergyModel_EnergyModel[] = {
-  {(char *)"isOwner", __pyx_getprop_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_isOwner, __pyx_setprop_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_isOwner, 0, 0},
-  {(char *)"owner", __pyx_getprop_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_owner, __pyx_setprop_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_owner, 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_EnergyModel = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_long*/
-  #else
-  0, /*reserved*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if PY_VERSION_HEX >= 0x02050000
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_EnergyModel = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_EnergyModel = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_EnergyModel = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-static PyTypeObject __pyx_type_23ContinuumElectrostatics_11EnergyModel_EnergyModel = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ContinuumElectrostatics.EnergyModel.EnergyModel"), /*tp_name*/
-  sizeof(struct __pyx_obj_23ContinuumElectrostatics_11EnergyModel_EnergyModel), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_23ContinuumElectrostatics_11EnergyModel_EnergyModel, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #else
-  0, /*reserved*/
-  #endif
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_EnergyModel, /*tp_as_number*/
-  &__pyx_tp_as_sequence_EnergyModel, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_EnergyModel, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_EnergyModel, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  __Pyx_DOCSTR("A class defining the energy model."), /*tp_doc*/
-  __pyx_tp_traverse_23ContinuumElectrostatics_11EnergyModel_EnergyModel, /*tp_traverse*/
-  __pyx_tp_clear_23ContinuumElectrostatics_11EnergyModel_EnergyModel, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_23ContinuumElectrostatics_11EnergyModel_EnergyModel, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_23ContinuumElectrostatics_11EnergyModel_EnergyModel, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_23ContinuumElectrostatics_11EnergyModel_EnergyModel, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    __Pyx_NAMESTR("EnergyModel"),
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
-  {&__pyx_kp_s_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 0, 1, 0},
-  {&__pyx_kp_s_18, __pyx_k_18, sizeof(__pyx_k_18), 0, 0, 1, 0},
-  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 0, 1, 0},
-  {&__pyx_kp_s_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 0, 1, 0},
-  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
-  {&__pyx_n_s__CLibraryError, __pyx_k__CLibraryError, sizeof(__pyx_k__CLibraryError), 0, 0, 1, 1},
-  {&__pyx_n_s__Gzero, __pyx_k__Gzero, sizeof(__pyx_k__Gzero), 0, 0, 1, 1},
-  {&__pyx_n_s__LogFileActive, __pyx_k__LogFileActive, sizeof(__pyx_k__LogFileActive), 0, 0, 1, 1},
-  {&__pyx_n_s__StateVector, __pyx_k__StateVector, sizeof(__pyx_k__StateVector), 0, 0, 1, 1},
-  {&__pyx_n_s__Text, __pyx_k__Text, sizeof(__pyx_k__Text), 0, 0, 1, 1},
-  {&__pyx_n_s____lastchanged__, __pyx_k____lastchanged__, sizeof(__pyx_k____lastchanged__), 0, 0, 1, 1},
-  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
-  {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
-  {&__pyx_n_s___instIndexGlobal, __pyx_k___instIndexGlobal, sizeof(__pyx_k___instIndexGlobal), 0, 0, 1, 1},
-  {&__pyx_n_s__ceModel, __pyx_k__ceModel, sizeof(__pyx_k__ceModel), 0, 0, 1, 1},
-  {&__pyx_n_s__instIndexGlobal, __pyx_k__instIndexGlobal, sizeof(__pyx_k__instIndexGlobal), 0, 0, 1, 1},
-  {&__pyx_n_s__instIndexGlobalA, __pyx_k__instIndexGlobalA, sizeof(__pyx_k__instIndexGlobalA), 0, 0, 1, 1},
-  {&__pyx_n_s__instIndexGlobalB, __pyx_k__instIndexGlobalB, sizeof(__pyx_k__instIndexGlobalB), 0, 0, 1, 1},
-  {&__pyx_n_s__instances, __pyx_k__instances, sizeof(__pyx_k__instances), 0, 0, 1, 1},
-  {&__pyx_n_s__isCalculated, __pyx_k__isCalculated, sizeof(__pyx_k__isCalculated), 0, 0, 1, 1},
-  {&__pyx_n_s__log, __pyx_k__log, sizeof(__pyx_k__log), 0, 0, 1, 1},
-  {&__pyx_n_s__logFile, __pyx_k__logFile, sizeof(__pyx_k__logFile), 0, 0, 1, 1},
-  {&__pyx_n_s__pCore, __pyx_k__pCore, sizeof(__pyx_k__pCore), 0, 0, 1, 1},
-  {&__pyx_n_s__pH, __pyx_k__pH, sizeof(__pyx_k__pH), 0, 0, 1, 1},
-  {&__pyx_n_s__sites, __pyx_k__sites, sizeof(__pyx_k__sites), 0, 0, 1, 1},
-  {&__pyx_n_s__temperature, __pyx_k__temperature, sizeof(__pyx_k__temperature), 0, 0, 1, 1},
-  {&__pyx_n_s__tolerance, __pyx_k__tolerance, sizeof(__pyx_k__tolerance), 0, 0, 1, 1},
-  {&__pyx_n_s__totalInstances, __pyx_k__totalInstances, sizeof(__pyx_k__totalInstances), 0, 0, 1, 1},
-  {&__pyx_n_s__totalSites, __pyx_k__totalSites, sizeof(__pyx_k__totalSites), 0, 0, 1, 1},
-  {&__pyx_n_s__value, __pyx_k__value, sizeof(__pyx_k__value), 0, 0, 1, 1},
-  {&__pyx_n_s__vector, __pyx_k__vector, sizeof(__pyx_k__vector), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  return 0;
-}
-
-static int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":78
- *         self.cObject  = EnergyModel_Allocate (totalSites, totalInstances, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate energy model.")             # <<<<<<<<<<<<<<
- * 
- *         self.cObject.temperature = ceModel.temperature
- */
-  __pyx_k_tuple_3 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_3));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_2));
-  PyTuple_SET_ITEM(__pyx_k_tuple_3, 0, ((PyObject *)__pyx_kp_s_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_3));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":126
- *         EnergyModel_SymmetrizeInteractions (self.cObject, &status)
- *         if LogFileActive (log):
- *             log.Text ("\nSymmetrizing interactions complete.\n")             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_k_tuple_6 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_6));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_5));
-  PyTuple_SET_ITEM(__pyx_k_tuple_6, 0, ((PyObject *)__pyx_kp_s_5));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_5));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_6));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":145
- * 
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")             # <<<<<<<<<<<<<<
- *         Gmicro = EnergyModel_CalculateMicrostateEnergy (self.cObject, vector.cObject, pH)
- *         return Gmicro
- */
-  __pyx_k_tuple_8 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_8));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_7));
-  PyTuple_SET_ITEM(__pyx_k_tuple_8, 0, ((PyObject *)__pyx_kp_s_7));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_7));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_8));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":159
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")             # <<<<<<<<<<<<<<
- * 
- *         EnergyModel_CalculateProbabilitiesAnalytically (self.cObject, pH, &status)
- */
-  __pyx_k_tuple_10 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_10));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_7));
-  PyTuple_SET_ITEM(__pyx_k_tuple_10, 0, ((PyObject *)__pyx_kp_s_7));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_7));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_10));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":163
- *         EnergyModel_CalculateProbabilitiesAnalytically (self.cObject, pH, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")             # <<<<<<<<<<<<<<
- *         return self.cObject.nstates
- * 
- */
-  __pyx_k_tuple_12 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_12));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
-  PyTuple_SET_ITEM(__pyx_k_tuple_12, 0, ((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_12));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":176
- *             raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")             # <<<<<<<<<<<<<<
- * 
- *         EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (self.cObject, pH, &status)
- */
-  __pyx_k_tuple_13 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_13));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_7));
-  PyTuple_SET_ITEM(__pyx_k_tuple_13, 0, ((PyObject *)__pyx_kp_s_7));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_7));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_13));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":180
- *         EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (self.cObject, pH, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")             # <<<<<<<<<<<<<<
- *         return self.cObject.nstates
- * 
- */
-  __pyx_k_tuple_14 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_14));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
-  PyTuple_SET_ITEM(__pyx_k_tuple_14, 0, ((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_14));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":189
- *         ceModel = self.owner
- *         if not ceModel.isCalculated:
- *             raise CLibraryError ("First calculate electrostatic energies.")             # <<<<<<<<<<<<<<
- *         Gmicro = EnergyModel_CalculateMicrostateEnergyUnfolded (self.cObject, vector.cObject, pH)
- *         return Gmicro
- */
-  __pyx_k_tuple_15 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_15));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_7));
-  PyTuple_SET_ITEM(__pyx_k_tuple_15, 0, ((PyObject *)__pyx_kp_s_7));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_7));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_15));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":203
- *         Zfolded = EnergyModel_CalculateZfolded (self.cObject, pH, Gzero, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")             # <<<<<<<<<<<<<<
- *         return Zfolded
- * 
- */
-  __pyx_k_tuple_16 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_16));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
-  PyTuple_SET_ITEM(__pyx_k_tuple_16, 0, ((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_16));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":216
- *         Zunfolded = EnergyModel_CalculateZunfolded (self.cObject, pH, Gzero, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate Boltzmann factors.")             # <<<<<<<<<<<<<<
- *         return Zunfolded
- */
-  __pyx_k_tuple_17 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_17));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
-  PyTuple_SET_ITEM(__pyx_k_tuple_17, 0, ((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_17));
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_67108864 = PyInt_FromLong(67108864); if (unlikely(!__pyx_int_67108864)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC initEnergyModel(void); /*proto*/
-PyMODINIT_FUNC initEnergyModel(void)
-#else
-PyMODINIT_FUNC PyInit_EnergyModel(void); /*proto*/
-PyMODINIT_FUNC PyInit_EnergyModel(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannyDeclarations
-  #if CYTHON_REFNANNY
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  #endif
-  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit_EnergyModel(void)");
-  if ( __Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #ifdef __pyx_binding_PyCFunctionType_USED
-  if (__pyx_binding_PyCFunctionType_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("EnergyModel"), __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  #if PY_MAJOR_VERSION < 3
-  Py_INCREF(__pyx_m);
-  #endif
-  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_module_is_main_ContinuumElectrostatics__EnergyModel) {
-    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  }
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Constants init code ---*/
-  if (unlikely(__Pyx_InitCachedConstants() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Variable export code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_23ContinuumElectrostatics_11EnergyModel_EnergyModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  {
-    PyObject *wrapper = __Pyx_GetAttrString((PyObject *)&__pyx_type_23ContinuumElectrostatics_11EnergyModel_EnergyModel, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
-      __pyx_wrapperbase_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
-      __pyx_wrapperbase_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__.doc = __pyx_doc_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__;
-      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_23ContinuumElectrostatics_11EnergyModel_11EnergyModel_14__init__;
-    }
-  }
-  if (__Pyx_SetAttrString(__pyx_m, "EnergyModel", (PyObject *)&__pyx_type_23ContinuumElectrostatics_11EnergyModel_EnergyModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_23ContinuumElectrostatics_11EnergyModel_EnergyModel = &__pyx_type_23ContinuumElectrostatics_11EnergyModel_EnergyModel;
-  /*--- Type import code ---*/
-  __pyx_ptype_5pCore_11Real1DArray_Real1DArray = __Pyx_ImportType("pCore.Real1DArray", "Real1DArray", sizeof(struct __pyx_obj_5pCore_11Real1DArray_Real1DArray), 1); if (unlikely(!__pyx_ptype_5pCore_11Real1DArray_Real1DArray)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5pCore_21RandomNumberGenerator_RandomNumberGenerator = __Pyx_ImportType("pCore.RandomNumberGenerator", "RandomNumberGenerator", sizeof(struct __pyx_obj_5pCore_21RandomNumberGenerator_RandomNumberGenerator), 1); if (unlikely(!__pyx_ptype_5pCore_21RandomNumberGenerator_RandomNumberGenerator)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_23ContinuumElectrostatics_11StateVector_StateVector = __Pyx_ImportType("ContinuumElectrostatics.StateVector", "StateVector", sizeof(struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector), 1); if (unlikely(!__pyx_ptype_23ContinuumElectrostatics_11StateVector_StateVector)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Variable import code ---*/
-  /*--- Function import code ---*/
-  __pyx_t_1 = __Pyx_ImportModule("pCore.BPData"); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_Allocate", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_Allocate, "__pyx_t_5pCore_6BPData_BPData *(Integer)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_CopyToView", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_CopyToView, "void (__pyx_t_5pCore_6BPData_BPData *, Py_buffer *)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_Deallocate", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_Deallocate, "__pyx_t_5pCore_6BPData_BPData *(__pyx_t_5pCore_6BPData_BPData *)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_InitializeView", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_InitializeView, "void (Py_buffer *, char *, Py_ssize_t)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_Set", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_Set, "void (__pyx_t_5pCore_6BPData_BPData *, void *, char *, Py_ssize_t, Py_ssize_t, Integer *, Integer *)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  /*--- Execution code ---*/
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":8
- * # . License   : CeCILL French Free Software License     (http://www.cecill.info)
- * #-------------------------------------------------------------------------------
- * from pCore        import logFile, LogFileActive, CLibraryError             # <<<<<<<<<<<<<<
- * from StateVector  import StateVector
- * 
- */
-  __pyx_t_2 = PyList_New(3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__logFile));
-  PyList_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__logFile));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__logFile));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__LogFileActive));
-  PyList_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_n_s__LogFileActive));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__LogFileActive));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__CLibraryError));
-  PyList_SET_ITEM(__pyx_t_2, 2, ((PyObject *)__pyx_n_s__CLibraryError));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__CLibraryError));
-  __pyx_t_3 = __Pyx_Import(((PyObject *)__pyx_n_s__pCore), ((PyObject *)__pyx_t_2), -1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__logFile); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__logFile, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__LogFileActive); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__LogFileActive, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__CLibraryError, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":9
- * #-------------------------------------------------------------------------------
- * from pCore        import logFile, LogFileActive, CLibraryError
- * from StateVector  import StateVector             # <<<<<<<<<<<<<<
- * 
- * DEF ANALYTIC_STATES = 67108864
- */
-  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__StateVector));
-  PyList_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_n_s__StateVector));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__StateVector));
-  __pyx_t_2 = __Pyx_Import(((PyObject *)__pyx_n_s__StateVector), ((PyObject *)__pyx_t_3), -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":12
- * 
- * DEF ANALYTIC_STATES = 67108864
- * __lastchanged__ = "$Id: $"             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____lastchanged__, ((PyObject *)__pyx_kp_s_18)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":121
- * 
- * 
- *     def SymmetrizeInteractions (self, log=logFile):             # <<<<<<<<<<<<<<
- *         """Symmetrize the matrix of interactions."""
- *         cdef Status status = Status_Continue
- */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__logFile); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_k_4 = __pyx_t_2;
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.EnergyModel.pyx":1
- * #-------------------------------------------------------------------------------             # <<<<<<<<<<<<<<
- * # . File      : ContinuumElectrostatics.EnergyModel.pyx
- * # . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
- */
-  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_2)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  if (__pyx_m) {
-    __Pyx_AddTraceback("init ContinuumElectrostatics.EnergyModel", __pyx_clineno, __pyx_lineno, __pyx_filename);
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init ContinuumElectrostatics.EnergyModel");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-}
-
-/* Runtime support code */
-
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-}
-#endif /* CYTHON_REFNANNY */
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    PyErr_Format(PyExc_TypeError,
-                 "%s() takes %s %"PY_FORMAT_SIZE_T"d positional argument%s (%"PY_FORMAT_SIZE_T"d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
-}
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AS_STRING(kw_name));
-        #endif
-}
-
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-        } else {
-            #if PY_MAJOR_VERSION < 3
-            if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
-            #else
-            if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key))) {
-            #endif
-                goto invalid_keyword_type;
-            } else {
-                for (name = first_kw_arg; *name; name++) {
-                    #if PY_MAJOR_VERSION >= 3
-                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                        PyUnicode_Compare(**name, key) == 0) break;
-                    #else
-                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                        _PyString_Eq(**name, key)) break;
-                    #endif
-                }
-                if (*name) {
-                    values[name-argnames] = value;
-                } else {
-                    /* unexpected keyword found */
-                    for (name=argnames; name != first_kw_arg; name++) {
-                        if (**name == key) goto arg_passed_twice;
-                        #if PY_MAJOR_VERSION >= 3
-                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
-                        #else
-                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                            _PyString_Eq(**name, key)) goto arg_passed_twice;
-                        #endif
-                    }
-                    if (kwds2) {
-                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-                    } else {
-                        goto invalid_keyword;
-                    }
-                }
-            }
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result) {
-        if (dict != __pyx_b) {
-            PyErr_Clear();
-            result = PyObject_GetAttr(__pyx_b, name);
-        }
-        if (!result) {
-            PyErr_SetObject(PyExc_NameError, name);
-        }
-    }
-    return result;
-}
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    /* cause is unused */
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-#else /* Python 3+ */
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-
-    if (cause) {
-        PyObject *fixed_cause;
-        if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        }
-        else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        }
-        else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        if (!value) {
-            value = PyObject_CallObject(type, NULL);
-        }
-        PyException_SetCause(value, fixed_cause);
-    }
-
-    PyErr_SetObject(type, value);
-
-    if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-    }
-
-bad:
-    return;
-}
-#endif
-
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (!type) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (Py_TYPE(obj) == type) return 1;
-    }
-    else {
-        if (PyObject_TypeCheck(obj, type)) return 1;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%s' has incorrect type (expected %s, got %s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
-}
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level) {
-    PyObject *py_import = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    py_import = __Pyx_GetAttrString(__pyx_b, "__import__");
-    if (!py_import)
-        goto bad;
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    #if PY_VERSION_HEX >= 0x02050000
-    {
-        PyObject *py_level = PyInt_FromLong(level);
-        if (!py_level)
-            goto bad;
-        module = PyObject_CallFunctionObjArgs(py_import,
-            name, global_dict, empty_dict, list, py_level, NULL);
-        Py_DECREF(py_level);
-    }
-    #else
-    if (level>0) {
-        PyErr_SetString(PyExc_RuntimeError, "Relative import is not supported for Python <=2.4.");
-        goto bad;
-    }
-    module = PyObject_CallFunctionObjArgs(py_import,
-        name, global_dict, empty_dict, list, NULL);
-    #endif
-bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(py_import);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_Integer(Integer val) {
-    const Integer neg_one = (Integer)-1, const_zero = (Integer)0;
-    const int is_unsigned = const_zero < neg_one;
-    if ((sizeof(Integer) == sizeof(char))  ||
-        (sizeof(Integer) == sizeof(short))) {
-        return PyInt_FromLong((long)val);
-    } else if ((sizeof(Integer) == sizeof(int)) ||
-               (sizeof(Integer) == sizeof(long))) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLong((unsigned long)val);
-        else
-            return PyInt_FromLong((long)val);
-    } else if (sizeof(Integer) == sizeof(PY_LONG_LONG)) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG)val);
-        else
-            return PyLong_FromLongLong((PY_LONG_LONG)val);
-    } else {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&val;
-        return _PyLong_FromByteArray(bytes, sizeof(Integer),
-                                     little, !is_unsigned);
-    }
-}
-
-static CYTHON_INLINE Integer __Pyx_PyInt_from_py_Integer(PyObject* x) {
-    const Integer neg_one = (Integer)-1, const_zero = (Integer)0;
-    const int is_unsigned = const_zero < neg_one;
-    if (sizeof(Integer) == sizeof(char)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedChar(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedChar(x);
-    } else if (sizeof(Integer) == sizeof(short)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedShort(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedShort(x);
-    } else if (sizeof(Integer) == sizeof(int)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedInt(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedInt(x);
-    } else if (sizeof(Integer) == sizeof(long)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedLong(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedLong(x);
-    } else if (sizeof(Integer) == sizeof(PY_LONG_LONG)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedLongLong(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedLongLong(x);
-    }  else {
-        Integer val;
-        PyObject *v = __Pyx_PyNumber_Int(x);
-        #if PY_VERSION_HEX < 0x03000000
-        if (likely(v) && !PyLong_Check(v)) {
-            PyObject *tmp = v;
-            v = PyNumber_Long(tmp);
-            Py_DECREF(tmp);
-        }
-        #endif
-        if (likely(v)) {
-            int one = 1; int is_little = (int)*(unsigned char *)&one;
-            unsigned char *bytes = (unsigned char *)&val;
-            int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                          bytes, sizeof(val),
-                                          is_little, !is_unsigned);
-            Py_DECREF(v);
-            if (likely(!ret))
-                return val;
-        }
-        return (Integer)-1;
-    }
-}
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
-    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned char" :
-                    "value too large to convert to unsigned char");
-            }
-            return (unsigned char)-1;
-        }
-        return (unsigned char)val;
-    }
-    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
-    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned short" :
-                    "value too large to convert to unsigned short");
-            }
-            return (unsigned short)-1;
-        }
-        return (unsigned short)val;
-    }
-    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
-    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned int" :
-                    "value too large to convert to unsigned int");
-            }
-            return (unsigned int)-1;
-        }
-        return (unsigned int)val;
-    }
-    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
-    const char neg_one = (char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to char" :
-                    "value too large to convert to char");
-            }
-            return (char)-1;
-        }
-        return (char)val;
-    }
-    return (char)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
-    const short neg_one = (short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to short" :
-                    "value too large to convert to short");
-            }
-            return (short)-1;
-        }
-        return (short)val;
-    }
-    return (short)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
-    }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
-    const signed char neg_one = (signed char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed char" :
-                    "value too large to convert to signed char");
-            }
-            return (signed char)-1;
-        }
-        return (signed char)val;
-    }
-    return (signed char)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
-    const signed short neg_one = (signed short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed short" :
-                    "value too large to convert to signed short");
-            }
-            return (signed short)-1;
-        }
-        return (signed short)val;
-    }
-    return (signed short)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
-    const signed int neg_one = (signed int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed int" :
-                    "value too large to convert to signed int");
-            }
-            return (signed int)-1;
-        }
-        return (signed int)val;
-    }
-    return (signed int)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE int __Pyx_PyInt_AsLongDouble(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
-    }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
-    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned long");
-            return (unsigned long)-1;
-        }
-        return (unsigned long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned long");
-                return (unsigned long)-1;
-            }
-            return (unsigned long)PyLong_AsUnsignedLong(x);
-        } else {
-            return (unsigned long)PyLong_AsLong(x);
-        }
-    } else {
-        unsigned long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned long)-1;
-        val = __Pyx_PyInt_AsUnsignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
-    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned PY_LONG_LONG");
-            return (unsigned PY_LONG_LONG)-1;
-        }
-        return (unsigned PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned PY_LONG_LONG");
-                return (unsigned PY_LONG_LONG)-1;
-            }
-            return (unsigned PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
-        } else {
-            return (unsigned PY_LONG_LONG)PyLong_AsLongLong(x);
-        }
-    } else {
-        unsigned PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
-    const long neg_one = (long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to long");
-            return (long)-1;
-        }
-        return (long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to long");
-                return (long)-1;
-            }
-            return (long)PyLong_AsUnsignedLong(x);
-        } else {
-            return (long)PyLong_AsLong(x);
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long)-1;
-        val = __Pyx_PyInt_AsLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
-    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to PY_LONG_LONG");
-            return (PY_LONG_LONG)-1;
-        }
-        return (PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to PY_LONG_LONG");
-                return (PY_LONG_LONG)-1;
-            }
-            return (PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
-        } else {
-            return (PY_LONG_LONG)PyLong_AsLongLong(x);
-        }
-    } else {
-        PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
-    const signed long neg_one = (signed long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed long");
-            return (signed long)-1;
-        }
-        return (signed long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed long");
-                return (signed long)-1;
-            }
-            return (signed long)PyLong_AsUnsignedLong(x);
-        } else {
-            return (signed long)PyLong_AsLong(x);
-        }
-    } else {
-        signed long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed long)-1;
-        val = __Pyx_PyInt_AsSignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
-    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed PY_LONG_LONG");
-            return (signed PY_LONG_LONG)-1;
-        }
-        return (signed PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed PY_LONG_LONG");
-                return (signed PY_LONG_LONG)-1;
-            }
-            return (signed PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
-        } else {
-            return (signed PY_LONG_LONG)PyLong_AsLongLong(x);
-        }
-    } else {
-        signed PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsSignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
-        char message[200];
-        PyOS_snprintf(message, sizeof(message),
-                      "compiletime version %s of module '%.100s' "
-                      "does not match runtime version %s",
-                      ctversion, __Pyx_MODULE_NAME, rtversion);
-        #if PY_VERSION_HEX < 0x02050000
-        return PyErr_Warn(NULL, message);
-        #else
-        return PyErr_WarnEx(NULL, message, 1);
-        #endif
-    }
-    return 0;
-}
-
-#ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
-    size_t size, int strict)
-{
-    PyObject *py_module = 0;
-    PyObject *result = 0;
-    PyObject *py_name = 0;
-    char warning[200];
-
-    py_module = __Pyx_ImportModule(module_name);
-    if (!py_module)
-        goto bad;
-    #if PY_MAJOR_VERSION < 3
-    py_name = PyString_FromString(class_name);
-    #else
-    py_name = PyUnicode_FromString(class_name);
-    #endif
-    if (!py_name)
-        goto bad;
-    result = PyObject_GetAttr(py_module, py_name);
-    Py_DECREF(py_name);
-    py_name = 0;
-    Py_DECREF(py_module);
-    py_module = 0;
-    if (!result)
-        goto bad;
-    if (!PyType_Check(result)) {
-        PyErr_Format(PyExc_TypeError,
-            "%s.%s is not a type object",
-            module_name, class_name);
-        goto bad;
-    }
-    if (!strict && ((PyTypeObject *)result)->tp_basicsize > (Py_ssize_t)size) {
-        PyOS_snprintf(warning, sizeof(warning),
-            "%s.%s size changed, may indicate binary incompatibility",
-            module_name, class_name);
-        #if PY_VERSION_HEX < 0x02050000
-        if (PyErr_Warn(NULL, warning) < 0) goto bad;
-        #else
-        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
-        #endif
-    }
-    else if (((PyTypeObject *)result)->tp_basicsize != (Py_ssize_t)size) {
-        PyErr_Format(PyExc_ValueError,
-            "%s.%s has the wrong size, try recompiling",
-            module_name, class_name);
-        goto bad;
-    }
-    return (PyTypeObject *)result;
-bad:
-    Py_XDECREF(py_module);
-    Py_XDECREF(result);
-    return NULL;
-}
-#endif
-
-#ifndef __PYX_HAVE_RT_ImportModule
-#define __PYX_HAVE_RT_ImportModule
-static PyObject *__Pyx_ImportModule(const char *name) {
-    PyObject *py_name = 0;
-    PyObject *py_module = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_name = PyString_FromString(name);
-    #else
-    py_name = PyUnicode_FromString(name);
-    #endif
-    if (!py_name)
-        goto bad;
-    py_module = PyImport_Import(py_name);
-    Py_DECREF(py_name);
-    return py_module;
-bad:
-    Py_XDECREF(py_name);
-    return 0;
-}
-#endif
-
-#ifndef __PYX_HAVE_RT_ImportFunction
-#define __PYX_HAVE_RT_ImportFunction
-static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
-    PyObject *d = 0;
-    PyObject *cobj = 0;
-    union {
-        void (*fp)(void);
-        void *p;
-    } tmp;
-
-    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
-    if (!d)
-        goto bad;
-    cobj = PyDict_GetItemString(d, funcname);
-    if (!cobj) {
-        PyErr_Format(PyExc_ImportError,
-            "%s does not export expected C function %s",
-                PyModule_GetName(module), funcname);
-        goto bad;
-    }
-#if PY_VERSION_HEX >= 0x02070000 && !(PY_MAJOR_VERSION==3&&PY_MINOR_VERSION==0)
-    if (!PyCapsule_IsValid(cobj, sig)) {
-        PyErr_Format(PyExc_TypeError,
-            "C function %s.%s has wrong signature (expected %s, got %s)",
-             PyModule_GetName(module), funcname, sig, PyCapsule_GetName(cobj));
-        goto bad;
-    }
-    tmp.p = PyCapsule_GetPointer(cobj, sig);
-#else
-    {const char *desc, *s1, *s2;
-    desc = (const char *)PyCObject_GetDesc(cobj);
-    if (!desc)
-        goto bad;
-    s1 = desc; s2 = sig;
-    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
-    if (*s1 != *s2) {
-        PyErr_Format(PyExc_TypeError,
-            "C function %s.%s has wrong signature (expected %s, got %s)",
-             PyModule_GetName(module), funcname, sig, desc);
-        goto bad;
-    }
-    tmp.p = PyCObject_AsVoidPtr(cobj);}
-#endif
-    *f = tmp.fp;
-    if (!(*f))
-        goto bad;
-    Py_DECREF(d);
-    return 0;
-bad:
-    Py_XDECREF(d);
-    return -1;
-}
-#endif
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-
-static void __Pyx_AddTraceback(const char *funcname, int __pyx_clineno,
-                               int __pyx_lineno, const char *__pyx_filename) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(__pyx_filename);
-    #else
-    py_srcfile = PyUnicode_FromString(__pyx_filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (__pyx_clineno) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        #if PY_MAJOR_VERSION >= 3
-        0,            /*int kwonlyargcount,*/
-        #endif
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple,  /*PyObject *consts,*/
-        __pyx_empty_tuple,  /*PyObject *names,*/
-        __pyx_empty_tuple,  /*PyObject *varnames,*/
-        __pyx_empty_tuple,  /*PyObject *freevars,*/
-        __pyx_empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else  /* Python 3+ has unicode identifiers */
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-/* Type Conversion Functions */
-
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   int is_true = x == Py_True;
-   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
-   else return PyObject_IsTrue(x);
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
-  PyNumberMethods *m;
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(x) || PyLong_Check(x))
-#else
-  if (PyLong_Check(x))
-#endif
-    return Py_INCREF(x), x;
-  m = Py_TYPE(x)->tp_as_number;
-#if PY_VERSION_HEX < 0x03000000
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = PyNumber_Long(x);
-  }
-#else
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Long(x);
-  }
-#endif
-  if (res) {
-#if PY_VERSION_HEX < 0x03000000
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
-#else
-    if (!PyLong_Check(res)) {
-#endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%s__ returned non-%s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject* x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-#if PY_VERSION_HEX < 0x02050000
-   if (ival <= LONG_MAX)
-       return PyInt_FromLong((long)ival);
-   else {
-       unsigned char *bytes = (unsigned char *) &ival;
-       int one = 1; int little = (int)*(unsigned char*)&one;
-       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
-   }
-#else
-   return PyInt_FromSize_t(ival);
-#endif
-}
-
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
-   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
-   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
-       return (size_t)-1;
-   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
-       PyErr_SetString(PyExc_OverflowError,
-                       "value too large to convert to size_t");
-       return (size_t)-1;
-   }
-   return (size_t)val;
-}
-
-
-#endif /* Py_PYTHON_H */
@@ -8,19 +8,23 @@
 from pCore.cDefinitions                  cimport Boolean, CFalse, CTrue, Integer, Real
 from pCore.Status                        cimport Status, Status_Continue, Status_IndexOutOfRange, Status_ValueError
 from pCore.Real1DArray                   cimport CReal1DArray, Real1DArray
-from ContinuumElectrostatics.StateVector cimport CStateVector, StateVector, StateVector_SetSite
+from ContinuumElectrostatics.StateVector cimport CStateVector, CTitrSite, StateVector, StateVector_SetSite
 
 __lastchanged__ = "$Id: $"
 
 
 # Include EnergyModel.h in the generated C code
 cdef extern from "EnergyModel.h":
+    ctypedef struct CEnergyModelWorkspace "EnergyModelWorkspace":
+        Real          *probabilities
+
     ctypedef struct CEnergyModel "EnergyModel":
         Integer        nstates
         Integer        ninstances
         Real           temperature
         CStateVector  *vector
         CReal1DArray  *probabilities
+        Integer        npairs
 
     # Allocation and deallocation
     cdef CEnergyModel *EnergyModel_Allocate                          (Integer nsites, Integer ninstances, Status *status)
@@ -30,12 +34,24 @@ cdef extern from "EnergyModel.h":
     cdef void          EnergyModel_SymmetrizeInteractions            (CEnergyModel *self, Status *status)
     cdef void          EnergyModel_ResetInteractions                 (CEnergyModel *self)
     cdef void          EnergyModel_ScaleInteractions                 (CEnergyModel *self, Real scale)
+    # Joint probabilities of instances of pairs of sites
+    cdef void          EnergyModel_AllocatePairs                     (CEnergyModel *self, Integer npairs, Status *status)
+    cdef void          EnergyModel_DeallocatePairs                   (CEnergyModel *self)
+    cdef void          EnergyModel_SetPair                           (CEnergyModel *self, Integer indexPair, Integer indexSiteA, Integer indexSiteB, Status *status)
+    cdef void          EnergyModel_GetPair                           (CEnergyModel *self, Integer indexPair, Integer *indexSiteA, Integer *indexSiteB, Status *status)
+    cdef Integer       EnergyModel_FindPairs                         (CEnergyModel *self, Real limit, Integer npairs, Status *status)
+    cdef void          EnergyModel_IndexPairs                        (CEnergyModel *self, Status *status)
+    cdef Integer       EnergyModel_FindPair                          (CEnergyModel *self, Integer indexSiteA, Integer indexSiteB)
+    cdef void          EnergyModel_ResetPairProbabilities            (CEnergyModel *self)
+    cdef void          EnergyModel_ScalePairProbabilities            (CEnergyModel *self, Real scale)
+    cdef Real          EnergyModel_GetPairProbability                (CEnergyModel *self, Integer indexPair, Integer instIndexGlobalA, Integer instIndexGlobalB)
     # Calculation of energies
     cdef Real          EnergyModel_CalculateMicrostateEnergy         (CEnergyModel *self, CStateVector *vector, Real pH)
     cdef Real          EnergyModel_CalculateMicrostateEnergyUnfolded (CEnergyModel *self, CStateVector *vector, Real pH)
     # Calculation of partition functions
     cdef Real          EnergyModel_CalculateZunfolded                (CEnergyModel *self, Real pH, Real Gzero, Status *status)
     cdef Real          EnergyModel_CalculateZfolded                  (CEnergyModel *self, Real pH, Real Gzero, Status *status)
+    cdef void          EnergyModel_CalculateBindingPolynomial        (CEnergyModel *self, Boolean unfolded, CReal1DArray *logTerms, Status *status)
     # Functions for getting items
     cdef Real          EnergyModel_GetGmodel                         (CEnergyModel *self, Integer instIndexGlobal)
     cdef Real          EnergyModel_GetGintr                          (CEnergyModel *self, Integer instIndexGlobal)
@@ -54,6 +70,13 @@ cdef extern from "EnergyModel.h":
     # Calculation of probabilities
     cdef void EnergyModel_CalculateProbabilitiesAnalytically (CEnergyModel *self, Real pH, Status *status)
     cdef void EnergyModel_CalculateProbabilitiesAnalyticallyUnfolded (CEnergyModel *self, Real pH, Status *status)
+    cdef Integer EnergyModel_CalculateProbabilitiesPruned (CEnergyModel *self, Real pH, Real tolerance, Real *logZ, Status *status)
+
+    # Calculation of probabilities in private workspaces
+    cdef CEnergyModelWorkspace *EnergyModel_AllocateWorkspace   (CEnergyModel *self, Boolean unfolded, Status *status)
+    cdef void                   EnergyModel_DeallocateWorkspace (CEnergyModelWorkspace *workspace)
+    cdef void EnergyModel_CalculateWorkspaceProbabilities         (CEnergyModel *self, Real pH, CEnergyModelWorkspace *workspace) nogil
+    cdef void EnergyModel_CalculateWorkspaceProbabilitiesUnfolded (CEnergyModel *self, Real pH, CEnergyModelWorkspace *workspace) nogil
 
 
 #-------------------------------------------------------------------------------
@@ -7,6 +7,7 @@
 #-------------------------------------------------------------------------------
 from pCore        import logFile, LogFileActive, CLibraryError
 from StateVector  import StateVector
+from Constants    import PRUNING_TOLERANCE, PAIR_LIMIT
 
 DEF ANALYTIC_STATES = 67108864
 __lastchanged__ = "$Id: $"
@@ -136,6 +137,97 @@ cdef class EnergyModel:
         EnergyModel_ScaleInteractions (self.cObject, scale)
 
 
+    def SelectPairs (self, pairs=None, Real limit=PAIR_LIMIT):
+        """Select pairs of sites for which joint probabilities of instances are calculated.
+
+        |pairs| is a sequence of pairs of indices of sites. By default, pairs of sites whose
+        maximum interaction energy (kcal/mol) is at least |limit| are selected. All pairs of sites
+        are only selected with an explicit zero limit. An empty sequence of pairs disables joint
+        probabilities.
+
+        Only the selected pairs are stored, ordered by their lower index of site.
+
+        Returns the number of selected pairs."""
+        cdef Status  status = Status_Continue
+        cdef Integer npairs, indexPair, indexSiteA, indexSiteB
+
+        if limit < 0.:
+            raise CLibraryError ("Limit of interaction energies cannot be negative.")
+        if pairs is None:
+            npairs = EnergyModel_FindPairs (self.cObject, limit, -1, &status)
+            if npairs > 0:
+                EnergyModel_FindPairs (self.cObject, limit, npairs, &status)
+            else:
+                EnergyModel_DeallocatePairs (self.cObject)
+        else:
+            npairs = len (pairs)
+            EnergyModel_AllocatePairs (self.cObject, npairs, &status)
+            for indexPair from 0 <= indexPair < npairs:
+                if status != Status_Continue:
+                    break
+                indexSiteA, indexSiteB = pairs[indexPair]
+                EnergyModel_SetPair (self.cObject, indexPair, indexSiteA, indexSiteB, &status)
+        if status == Status_Continue:
+            EnergyModel_IndexPairs (self.cObject, &status)
+        if status == Status_IndexOutOfRange:
+            EnergyModel_DeallocatePairs (self.cObject)
+            raise CLibraryError ("Invalid pair of sites.")
+        if status == Status_ValueError:
+            EnergyModel_DeallocatePairs (self.cObject)
+            raise CLibraryError ("Repeated pair of sites.")
+        if status != Status_Continue:
+            EnergyModel_DeallocatePairs (self.cObject)
+            raise CLibraryError ("Cannot allocate joint probabilities.")
+        return npairs
+
+
+    def FindPair (self, Integer indexSiteA, Integer indexSiteB):
+        """Find the index of the selected pair of two sites, given in either order.
+
+        Returns None if the pair is not selected."""
+        cdef Integer indexPair
+        indexPair = EnergyModel_FindPair (self.cObject, indexSiteA, indexSiteB)
+        if indexPair < 0:
+            return None
+        return indexPair
+
+
+    property npairs:
+        def __get__ (self):
+            """Number of pairs of sites selected for joint probabilities."""
+            return self.cObject.npairs
+
+
+    def GetPair (self, Integer indexPair):
+        """Get indices of sites of a selected pair."""
+        cdef Status  status = Status_Continue
+        cdef Integer indexSiteA, indexSiteB
+        EnergyModel_GetPair (self.cObject, indexPair, &indexSiteA, &indexSiteB, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Pair index out of range.")
+        return (indexSiteA, indexSiteB)
+
+
+    def GetPairProbability (self, Integer indexPair, Integer instIndexGlobalA, Integer instIndexGlobalB):
+        """Get the joint probability of an instance of the first site and an instance of the second site of a selected pair."""
+        cdef Real       prob
+        cdef Status     status = Status_Continue
+        cdef Integer    indexSiteA, indexSiteB
+        cdef CTitrSite *siteA
+        cdef CTitrSite *siteB
+        EnergyModel_GetPair (self.cObject, indexPair, &indexSiteA, &indexSiteB, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Pair index out of range.")
+        siteA = &self.cObject.vector.sites[indexSiteA]
+        siteB = &self.cObject.vector.sites[indexSiteB]
+        if (instIndexGlobalA < siteA.indexFirst) or (instIndexGlobalA > siteA.indexLast):
+            raise CLibraryError ("Instance %d does not belong to the first site of the pair." % instIndexGlobalA)
+        if (instIndexGlobalB < siteB.indexFirst) or (instIndexGlobalB > siteB.indexLast):
+            raise CLibraryError ("Instance %d does not belong to the second site of the pair." % instIndexGlobalB)
+        prob = EnergyModel_GetPairProbability (self.cObject, indexPair, instIndexGlobalA, instIndexGlobalB)
+        return prob
+
+
     def CalculateMicrostateEnergy (self, StateVector vector, Real pH=7.0):
         """Calculate energy of a protonation state (=microstate)."""
         cdef Real Gmicro
@@ -165,13 +257,13 @@ cdef class EnergyModel:
 
 
     def CalculateProbabilitiesAnalyticallyUnfolded (self, Real pH=7.0):
-        """Calculate probabilities of protonation states analytically (unfolded protein)."""
+        """Calculate probabilities of protonation states analytically (unfolded protein).
+
+        Sites of an unfolded protein are independent, so there is no limit on the number of states."""
         cdef Status status
         status   = Status_Continue
         ceModel  = self.owner
 
-        if self.cObject.nstates > ANALYTIC_STATES:
-            raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
         if not ceModel.isCalculated:
             raise CLibraryError ("First calculate electrostatic energies.")
 
@@ -181,6 +273,59 @@ cdef class EnergyModel:
         return self.cObject.nstates
 
 
+    def CalculateWorkspaceProbabilities (self, Real pH=7.0, unfolded=False):
+        """Calculate probabilities of protonation states analytically in a private workspace.
+
+        The calculation runs without holding the GIL and does not modify the energy model, so that
+        several pH-values can be calculated in parallel threads. Joint probabilities of pairs are not
+        calculated. Returns probabilities of instances, ordered by their global indices."""
+        cdef CEnergyModelWorkspace *workspace
+        cdef CEnergyModel          *energyModel = self.cObject
+        cdef Boolean                isUnfolded  = CTrue if unfolded else CFalse
+        cdef Status                 status      = Status_Continue
+        cdef Integer                index
+        ceModel = self.owner
+
+        if (not unfolded) and (self.cObject.nstates > ANALYTIC_STATES):
+            raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
+        if not ceModel.isCalculated:
+            raise CLibraryError ("First calculate electrostatic energies.")
+
+        workspace = EnergyModel_AllocateWorkspace (energyModel, isUnfolded, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate workspace.")
+        with nogil:
+            if isUnfolded:
+                EnergyModel_CalculateWorkspaceProbabilitiesUnfolded (energyModel, pH, workspace)
+            else:
+                EnergyModel_CalculateWorkspaceProbabilities (energyModel, pH, workspace)
+        probabilities = [workspace.probabilities[index] for index from 0 <= index < energyModel.ninstances]
+        EnergyModel_DeallocateWorkspace (workspace)
+        return probabilities
+
+
+    def CalculateProbabilitiesPruned (self, Real pH=7.0, Real tolerance=PRUNING_TOLERANCE):
+        """Calculate probabilities of protonation states by enumeration, skipping states of negligible weight.
+
+        A branch of states is skipped if its largest possible contribution to the partition function,
+        relative to the partition function accumulated so far, is below |tolerance|.
+
+        Returns the number of visited states and the logarithm of the partition function."""
+        cdef Status  status
+        cdef Integer nvisited
+        cdef Real    logZ
+        status   = Status_Continue
+        ceModel  = self.owner
+
+        if not ceModel.isCalculated:
+            raise CLibraryError ("First calculate electrostatic energies.")
+
+        nvisited = EnergyModel_CalculateProbabilitiesPruned (self.cObject, pH, tolerance, &logZ, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate workspace for enumeration.")
+        return (nvisited, logZ)
+
+
     def CalculateMicrostateEnergyUnfolded (self, StateVector vector, Real pH=7.0):
         """Calculate energy of a protonation state (=microstate) in an unfolded protein."""
         cdef Real Gmicro
@@ -208,10 +353,33 @@ cdef class EnergyModel:
         """Calculate partition function of an unfolded protein."""
         cdef Status  status = Status_Continue
         cdef Real    Zunfolded
-        if self.cObject.nstates > ANALYTIC_STATES:
-            raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
 
         Zunfolded = EnergyModel_CalculateZunfolded (self.cObject, pH, Gzero, &status)
         if status != Status_Continue:
             raise CLibraryError ("Cannot allocate Boltzmann factors.")
         return Zunfolded
+
+
+    def CalculateBindingPolynomial (self, unfolded=False):
+        """Calculate logarithms of terms of the binding polynomial.
+
+        The n-th term is the partition function at pH 0 of states with n bound protons."""
+        cdef Status       status = Status_Continue
+        cdef Real1DArray  logTerms
+        cdef Integer      nterms
+        ceModel = self.owner
+
+        if (not unfolded) and (self.cObject.nstates > ANALYTIC_STATES):
+            raise CLibraryError ("Maximum number of states for analytic treatment (%d) exceeded." % ANALYTIC_STATES)
+        if not ceModel.isCalculated:
+            raise CLibraryError ("First calculate electrostatic energies.")
+
+        nterms = 1
+        for site in ceModel.sites:
+            nterms = nterms + max ([instance.protons for instance in site.instances])
+        logTerms = Real1DArray.WithExtent (nterms)
+
+        EnergyModel_CalculateBindingPolynomial (self.cObject, CTrue if unfolded else CFalse, logTerms.cObject, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot calculate binding polynomial.")
+        return [logTerms[index] for index in range (nterms)]
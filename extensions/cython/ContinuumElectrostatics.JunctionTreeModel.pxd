@@ -0,0 +1,38 @@
+#-------------------------------------------------------------------------------
+# . File      : ContinuumElectrostatics.JunctionTreeModel.pxd
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+from pCore.cDefinitions                  cimport Boolean, CFalse, CTrue, Integer, Real
+from pCore.Status                        cimport Status, Status_Continue
+from ContinuumElectrostatics.EnergyModel cimport CEnergyModel, EnergyModel
+
+__lastchanged__ = "$Id: $"
+
+
+cdef extern from "JunctionTreeModel.h":
+    ctypedef struct CJunctionTreeModel "JunctionTreeModel":
+        Real           cutoff
+        Integer        maxStates
+        Integer        width
+        Integer        largest
+        Integer        nedges
+        Integer        ncliques
+        Real           logZ
+        Boolean        isTractable
+        CEnergyModel  *energyModel
+
+
+    cdef CJunctionTreeModel *JunctionTreeModel_Allocate               (Real cutoff, Integer maxStates, Status *status)
+    cdef void                JunctionTreeModel_Deallocate             (CJunctionTreeModel *self)
+    cdef Boolean             JunctionTreeModel_LinkToEnergyModel      (CJunctionTreeModel *self, CEnergyModel *energyModel, Status *status)
+    cdef Real                JunctionTreeModel_CalculateProbabilities (CJunctionTreeModel *self, Real pH)
+
+#-------------------------------------------------------------------------------
+cdef class JunctionTreeModel:
+    cdef CJunctionTreeModel  *cObject
+    cdef public object  isOwner
+    cdef public object  owner
+    cdef public object  fallback
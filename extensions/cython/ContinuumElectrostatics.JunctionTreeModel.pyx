@@ -0,0 +1,108 @@
+#-------------------------------------------------------------------------------
+# . File      : ContinuumElectrostatics.JunctionTreeModel.pyx
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+from pCore  import logFile, LogFileActive, CLibraryError
+from ContinuumElectrostatics.MCModelDefault import MCModelDefault
+
+_DefaultCutoff    = 0.
+_DefaultMaxStates = 1048576
+
+
+cdef class JunctionTreeModel:
+    """A class defining the exact model for proteins with sparse interactions.
+
+    Sites interacting weaker than |cutoff| are treated as independent of each other.
+    If the graph of sites cannot be decomposed into cliques of at most |maxStates| states,
+    the calculation is passed to the |fallback| sampler (by default, the Monte Carlo model)."""
+
+    def __getmodule__ (self):
+        """Return the module name."""
+        return "ContinuumElectrostatics.JunctionTreeModel"
+
+    def __dealloc__ (self):
+        """Deallocate."""
+        JunctionTreeModel_Deallocate (self.cObject)
+
+
+    def __init__ (self, Real cutoff=_DefaultCutoff, Integer maxStates=_DefaultMaxStates, fallback=None):
+        """Constructor."""
+        cdef Status  status
+        status        = Status_Continue
+        self.isOwner  = True
+        self.fallback = fallback
+        self.cObject  = JunctionTreeModel_Allocate (cutoff, maxStates, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate junction tree model.")
+
+
+    def Initialize (self, ceModel):
+        """Link junction tree and energy models, and decompose the graph of sites."""
+        cdef EnergyModel energyModel = ceModel.energyModel
+        cdef Status      status      = Status_Continue
+        cdef Boolean     tractable
+
+        tractable = JunctionTreeModel_LinkToEnergyModel (self.cObject, energyModel.cObject, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot initialize junction tree model.")
+        if tractable == CFalse:
+            if self.fallback is None:
+                self.fallback = MCModelDefault ()
+            self.fallback.Initialize (ceModel)
+        self.isOwner = False
+        self.owner   = ceModel
+
+
+    property isTractable:
+        def __get__ (self):
+            return (self.cObject.isTractable != CFalse)
+
+    property logZ:
+        def __get__ (self):
+            return self.cObject.logZ
+
+
+    def CalculateOwnerProbabilities (self, Real pH=7.0, Integer logFrequency=0, trajectoryFilename="", log=logFile):
+        """Calculate probabilities of the owner."""
+        owner = self.owner
+        if (not owner.isCalculated):
+            raise CLibraryError ("First calculate electrostatic energies.")
+
+        if self.cObject.isTractable == CFalse:
+            self.fallback.CalculateOwnerProbabilities (pH=pH, logFrequency=logFrequency, trajectoryFilename=trajectoryFilename, log=log)
+        else:
+            if (trajectoryFilename != ""):
+                raise CLibraryError ("Writing trajectories unsupported.")
+            JunctionTreeModel_CalculateProbabilities (self.cObject, pH)
+            if (logFrequency > 0) and LogFileActive (log):
+                log.Text ("\nCompleted message passing over %d cliques.\n" % self.cObject.ncliques)
+
+
+    def Summary (self, log=logFile):
+        """Summary."""
+        cdef Boolean tractable = self.cObject.isTractable
+        if LogFileActive (log):
+            summary = log.GetSummary ()
+            summary.Start ("Junction tree model")
+            summary.Entry ("Interaction cutoff"     , "%.2f" % self.cObject.cutoff)
+            summary.Entry ("Max. clique states"     , "%d"   % self.cObject.maxStates)
+            summary.Entry ("Coupled pairs"          , "%d"   % self.cObject.nedges)
+            summary.Entry ("Tractable"              , "%s"   % ("True" if (tractable != CFalse) else "False"))
+            if tractable != CFalse:
+                summary.Entry ("Treewidth"          , "%d"   % self.cObject.width)
+                summary.Entry ("Largest clique"     , "%d"   % self.cObject.largest)
+            summary.Stop ()
+            if (tractable == CFalse) and (self.fallback is not None):
+                self.fallback.Summary (log=log)
+
+
+    def PrintPairs (self, log=logFile):
+        """Summary of strongly interacting pairs."""
+        if self.cObject.isTractable == CFalse:
+            if self.fallback is not None:
+                self.fallback.PrintPairs (log=log)
+        elif LogFileActive (log):
+            log.Text ("\nFound %d pair%s of sites coupled above the cutoff.\n" % (self.cObject.nedges, "s" if self.cObject.nedges != 1 else ""))
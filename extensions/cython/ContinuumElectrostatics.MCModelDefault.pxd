@@ -5,34 +5,114 @@
 #                          Mikolaj J. Feliks (2014-2018)
 # . License   : CeCILL French Free Software License     (http://www.cecill.info)
 #-------------------------------------------------------------------------------
-from pCore.cDefinitions                  cimport Boolean, CFalse, CTrue, Integer, Real
+from pCore.cDefinitions                  cimport Boolean, CFalse, CTrue, Cardinal, Integer, Real
 from pCore.Status                        cimport Status, Status_Continue, Status_IndexOutOfRange, Status_ValueError
-from pCore.Real1DArray                   cimport Real1DArray_Set, Real1DArray_Scale
+from pCore.Real1DArray                   cimport CReal1DArray, Real1DArray, Real1DArray_Set, Real1DArray_Scale
 from pCore.RandomNumberGenerator         cimport CRandomNumberGenerator as CGenerator
 from ContinuumElectrostatics.StateVector cimport CStateVector, StateVector, StateVector_GetPair, StateVector_Randomize
-from ContinuumElectrostatics.EnergyModel cimport CEnergyModel, EnergyModel
+from ContinuumElectrostatics.EnergyModel cimport CEnergyModel, EnergyModel, EnergyModel_ResetPairProbabilities, EnergyModel_ScalePairProbabilities
 
 __lastchanged__ = "$Id: $"
 
 
+cdef extern from "MicrostateHistogram.h":
+    ctypedef struct CMicrostateKey "MicrostateKey":
+        Cardinal      *digits
+
+    ctypedef struct CMicrostateHistogram "MicrostateHistogram":
+        Integer         nsites
+        Boolean         isExact
+        Integer         maxStates
+        Integer         nstates
+        CMicrostateKey *keys
+        Real           *counts
+        Real           *energies
+        Integer        *protons
+        Integer        *instances
+        Real            nsamples
+        Real            nevicted
+        Integer         nevictions
+
+    cdef CMicrostateHistogram *MicrostateHistogram_Allocate   (CStateVector *vector, Integer maxStates, Status *status)
+    cdef void                  MicrostateHistogram_Deallocate (CMicrostateHistogram *self)
+    cdef void                  MicrostateHistogram_Reset      (CMicrostateHistogram *self)
+    cdef void                  MicrostateHistogram_Record     (CMicrostateHistogram *self, CStateVector *vector, Real G, Integer nprotons)
+
 cdef extern from "MCModelDefault.h":
+    # Convergence-based stopping
+    cdef enum:
+        MCMODELDEFAULT_BLOCK_SCANS
+        MCMODELDEFAULT_MIN_BLOCKS
+
     ctypedef struct CMCModelDefault "MCModelDefault":
         Real           limit
         Integer        nprod
         Integer        nequil
+        Integer        nequilWarm
+        Integer        nchains
+        Integer        nthreads
+        Boolean        lockstep
+        Boolean        heatBath
+        Boolean        raoBlackwell
+        Real           clusterLimit
+        Integer        maxClusterSize
+        Integer        nclusters
+        Integer       *clusterSites
+        Integer       *clusterOffsets
+        Real           targetError
+        Integer        maxScans
+        Integer        nscansDiscarded
+        Integer        nscansUsed
+        Boolean        accumulatePairs
+        CMicrostateHistogram *microstates
+        Integer        maxMicrostates
+        Boolean        reweighting
+        Integer        maxProtons
+        Real          *protonCounts
+        Real          *protonInstances
+        Integer        checkpointFrequency
+        Real          *privateProbabilities
+        Cardinal       seed
         CEnergyModel  *energyModel
         CStateVector  *vector
         CGenerator    *generator
+        Real          *rhat
+        Real          *errors
+        Real          *chainProbabilities
+        Integer       *swapsAttempted
+        Integer       *swapsAccepted
 
 
-    cdef CMCModelDefault *MCModelDefault_Allocate               (Real limit, Integer nequil, Integer nprod, Integer randomSeed, Status *status)
+    cdef CMCModelDefault *MCModelDefault_Allocate               (Real limit, Integer nequil, Integer nprod, Integer randomSeed, Integer nchains, Integer nthreads, Status *status)
     cdef void             MCModelDefault_Deallocate             (CMCModelDefault *self)
     cdef void             MCModelDefault_LinkToEnergyModel      (CMCModelDefault *self, CEnergyModel *energyModel, Status *status)
+    cdef void             MCModelDefault_LinkChains             (CMCModelDefault *self, Status *status)
     cdef Real             MCModelDefault_MCScan                 (CMCModelDefault *self, Real pH, Integer nmoves, Integer *movesDone, Integer *movesAccepted, Integer *flipsDone, Integer *flipsAccepted)
     cdef Integer          MCModelDefault_FindPairs              (CMCModelDefault *self, Integer npairs, Status *status)
-    cdef void             MCModelDefault_UpdateProbabilities    (CMCModelDefault *self)
+    cdef Integer          MCModelDefault_FindClusters           (CMCModelDefault *self, Status *status)
+    cdef void             MCModelDefault_UpdateProbabilities    (CMCModelDefault *self, Real pH)
+    cdef Integer          MCModelDefault_CountProtons           (CMCModelDefault *self)
+    cdef void             MCModelDefault_ResetProtonHistogram   (CMCModelDefault *self)
+    cdef void             MCModelDefault_UpdateProtonHistogram  (CMCModelDefault *self)
+    cdef void             MCModelDefault_CalculateField         (CMCModelDefault *self)
     cdef void             MCModelDefault_Equilibration          (CMCModelDefault *self, Real pH)
+    cdef void             MCModelDefault_WarmEquilibration      (CMCModelDefault *self, Real pH)
     cdef void             MCModelDefault_Production             (CMCModelDefault *self, Real pH)
+    cdef Boolean          MCModelDefault_ConvergedProduction    (CMCModelDefault *self, Real pH)
+    cdef void             MCModelDefault_RunChains              (CMCModelDefault *self, Real pH)
+    cdef void             MCModelDefault_ReplicaExchange        (CMCModelDefault *self, CReal1DArray *pHs, Integer frequency, Status *status)
+    cdef void             MCModelDefault_AllocatePrivateProbabilities (CMCModelDefault *self, Status *status)
+    cdef void             MCModelDefault_CalculateProbabilities (CMCModelDefault *self, Real pH, Boolean warmStart) nogil
+    cdef Integer          MCModelDefault_ReadCheckpoint         (CMCModelDefault *self, char *filename, Real pH, Status *status)
+    cdef Boolean          MCModelDefault_CheckpointedProduction (CMCModelDefault *self, Real pH, Integer nscans, char *filename)
+
+cdef extern from "StateTrajectory.h":
+    ctypedef struct CStateTrajectory "StateTrajectory":
+        Integer        ntotal
+
+    cdef CStateTrajectory *StateTrajectory_Open                 (char *filename, CStateVector *vector, Integer blockSize, Status *status)
+    cdef Boolean           StateTrajectory_Close                (CStateTrajectory *self)
+    cdef Boolean           StateTrajectory_Write                (CStateTrajectory *self, CStateVector *vector, Integer nprotons, Real G)
 
 #-------------------------------------------------------------------------------
 cdef class MCModelDefault:
@@ -10,10 +10,73 @@ from pCore  import logFile, LogFileActive, CLibraryError
 _DefaultDoubleFlip         = 2.
 _DefaultProductionScans    = 20000
 _DefaultEquilibrationScans = 500
+_DefaultWarmScans          = 50
+_DefaultChains             = 1
+_DefaultThreads            = 0
+_DefaultExchangeFrequency  = 10
+_DefaultClusterLimit       = 2.
+_DefaultClusterSize        = 0
+_DefaultMaxScans           = 200000
+_DefaultMicrostates        = 10
+_DefaultCheckpointFrequency = 10000
+
+DEF MICROSTATE_KEY_DIGITS  = 8
+DEF MICROSTATE_DIGIT_BITS  = 16
 
 
 cdef class MCModelDefault:
-    """A class defining the default Monte Carlo model."""
+    """A class defining the default Monte Carlo model.
+
+    With |nchains| greater than one, independent chains are run in parallel on |nthreads|
+    threads (by default, as many as OpenMP allows). Each chain has its own state vector
+    and random number generator. Probabilities from the chains are averaged and for each
+    instance, the potential scale reduction factor (R-hat) and the standard error are
+    calculated.
+
+    With |lockstep|, the chains are instead advanced together in a single thread. Each
+    move is made on the same site in all chains, so that the interactions of its instances
+    stay in cache while the fields of the chains that accepted the move are updated. This
+    only improves cache locality: on a single core, it is about 5-30% faster than running
+    the chains one after another, and it is not a vectorized kernel.
+
+    With |heatBath|, single moves draw the new instance of a site from its conditional
+    Boltzmann distribution, given the "active" instances of other sites. This helps for
+    sites with many instances, such as histidines with tautomers. With |raoBlackwell|,
+    the conditional probabilities of instances are accumulated instead of counts, which
+    lowers the variance of probabilities from the same number of production scans.
+
+    With |maxClusterSize| of two or more, sites coupled by at least |clusterLimit| are
+    grouped into clusters of up to |maxClusterSize| sites. A cluster move enumerates all
+    states of a cluster and draws a new one from the exact conditional distribution.
+
+    With |targetError| greater than zero, the number of production scans is not fixed.
+    Production continues until the standard errors of all probabilities, estimated by
+    block averaging, fall below |targetError|, or until |maxScans| scans are done. Scans
+    from before the energy has equilibrated are detected and discarded. |maxScans| has to
+    allow for enough blocks to estimate the errors.
+
+    A run with |warmStart| continues from the state vector of the previous run and does
+    only |nequilWarm| equilibration scans. This is used for neighbouring pH-steps of
+    titration curves. With multiple chains, every run starts from random states.
+
+    With |maxMicrostates| greater than zero, runs also keep a histogram of sampled microstates,
+    i.e. protonation states of the whole system, with at most |maxMicrostates| entries. This is
+    only possible with a single chain and without convergence-based stopping. When the
+    histogram is full, the rarer half of the entries is evicted. Populations of the dominant
+    microstates are then available directly, without enumeration.
+
+    With |reweighting|, runs also keep a histogram of numbers of bound protons, together with
+    counts of instances at each number of protons. These are used to reweight probabilities
+    to other pH-values (see ProtonReweighting). This is only possible with a single chain
+    and without convergence-based stopping.
+
+    A run of a single chain with a fixed number of production scans can write checkpoints
+    every |checkpointFrequency| production scans. A run killed before completion continues
+    from its last checkpoint and gives exactly the same probabilities as an uninterrupted run.
+
+    Workspaces of a model have their own state vector, random number generator and
+    probabilities. They calculate probabilities without holding the GIL and without
+    changing the energy model, so that several pH-values can run in parallel threads."""
 
     def __getmodule__ (self):
         """Return the module name."""
@@ -24,14 +87,33 @@ cdef class MCModelDefault:
         MCModelDefault_Deallocate (self.cObject)
 
 
-    def __init__ (self, Real doubleFlip=_DefaultDoubleFlip, Integer nequil=_DefaultEquilibrationScans, Integer nprod=_DefaultProductionScans, Integer randomSeed=-1):
+    def __init__ (self, Real doubleFlip=_DefaultDoubleFlip, Integer nequil=_DefaultEquilibrationScans, Integer nprod=_DefaultProductionScans, Integer randomSeed=-1, Integer nchains=_DefaultChains, Integer nthreads=_DefaultThreads, lockstep=False, heatBath=False, raoBlackwell=False, Real clusterLimit=_DefaultClusterLimit, Integer maxClusterSize=_DefaultClusterSize, Real targetError=0., Integer maxScans=_DefaultMaxScans, Integer nequilWarm=_DefaultWarmScans, Integer maxMicrostates=0, reweighting=False, Integer checkpointFrequency=_DefaultCheckpointFrequency):
         """Constructor."""
         cdef Status  status
         status        = Status_Continue
         self.isOwner  = True
-        self.cObject  = MCModelDefault_Allocate (doubleFlip, nequil, nprod, randomSeed, &status)
+        self.cObject  = MCModelDefault_Allocate (doubleFlip, nequil, nprod, randomSeed, nchains, nthreads, &status)
         if status != Status_Continue:
             raise CLibraryError ("Cannot allocate Monte Carlo model.")
+        self.cObject.lockstep     = CTrue if lockstep     else CFalse
+        self.cObject.heatBath     = CTrue if heatBath     else CFalse
+        self.cObject.raoBlackwell = CTrue if raoBlackwell else CFalse
+        self.cObject.clusterLimit   = clusterLimit
+        self.cObject.maxClusterSize = maxClusterSize
+        self.cObject.targetError    = targetError
+        self.cObject.maxScans       = maxScans
+        self.cObject.nequilWarm     = nequilWarm
+        self.cObject.maxMicrostates = maxMicrostates
+        self.cObject.reweighting    = CTrue if reweighting else CFalse
+        self.cObject.checkpointFrequency = checkpointFrequency
+        if (targetError > 0.) and (self.cObject.nchains > 1):
+            raise CLibraryError ("Convergence-based stopping is only possible with a single chain.")
+        if (targetError > 0.) and (maxScans < MCMODELDEFAULT_MIN_BLOCKS * MCMODELDEFAULT_BLOCK_SCANS):
+            raise CLibraryError ("Convergence-based stopping needs at least %d scans to estimate errors." % (MCMODELDEFAULT_MIN_BLOCKS * MCMODELDEFAULT_BLOCK_SCANS))
+        if (maxMicrostates > 0) and ((self.cObject.nchains > 1) or (targetError > 0.)):
+            raise CLibraryError ("Histograms of microstates are only kept in runs of a single chain without convergence-based stopping.")
+        if reweighting and ((self.cObject.nchains > 1) or (targetError > 0.)):
+            raise CLibraryError ("Histograms for reweighting are only kept in runs of a single chain without convergence-based stopping.")
 
 
     def Initialize (self, ceModel):
@@ -44,42 +126,129 @@ cdef class MCModelDefault:
         if status != Status_Continue:
             raise CLibraryError ("Cannot initialize Monte Carlo model.")
 
+        if self.cObject.maxMicrostates > 0:
+            if self.cObject.microstates != NULL:
+                MicrostateHistogram_Deallocate (self.cObject.microstates)
+            self.cObject.microstates = MicrostateHistogram_Allocate (self.cObject.vector, self.cObject.maxMicrostates, &status)
+            if status != Status_Continue:
+                raise CLibraryError ("Cannot allocate histogram of microstates.")
+
         npairs = MCModelDefault_FindPairs (self.cObject, -1, &status)
         if npairs > 0:
             MCModelDefault_FindPairs (self.cObject, npairs, &status)
             if status != Status_Continue:
                 raise CLibraryError ("Cannot allocate pairs.")
+
+        MCModelDefault_FindClusters (self.cObject, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate clusters.")
+
+        MCModelDefault_LinkChains (self.cObject, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate independent chains.")
         self.isOwner = False
         self.owner   = ceModel
 
 
-    def CalculateOwnerProbabilities (self, Real pH=7.0, Integer logFrequency=0, trajectoryFilename="", log=logFile):
-        """Calculate probabilities of the owner."""
+    def CalculateOwnerProbabilities (self, Real pH=7.0, Integer logFrequency=0, trajectoryFilename="", trajectoryFormat="text", warmStart=False, checkpointFilename="", log=logFile):
+        """Calculate probabilities of the owner.
+
+        With |trajectoryFormat| "text", the energy of each production scan is written to
+        |trajectoryFilename|. With "binary", the state vectors of production scans are also
+        written, together with energies and numbers of protons, in a compact binary format
+        (see StateTrajectoryFileReader).
+
+        With |warmStart|, the run continues from the state vector of the previous run.
+
+        If pairs of sites are selected in the energy model, their joint probabilities are also
+        accumulated. This is only possible in runs of a single chain without convergence-based stopping.
+
+        With |checkpointFilename|, checkpoints of the production are written to this file. If the file
+        already exists, the run continues from it instead of starting anew. The checkpoint has to be
+        written for the same model, pH and number of production scans. Each run needs its own file."""
         cdef CMCModelDefault   *mcModel
+        cdef CStateTrajectory  *trajectory = NULL
+        cdef Status   status = Status_Continue
         cdef Integer  moves, movesAcc, flips, flipsAcc
-        cdef Integer  nmoves, i, j
+        cdef Integer  nmoves, nequil, nscans, i, j
         cdef Real     scale, Gmicro
-        cdef Boolean  active, writing
+        cdef Boolean  active, writing, binary
 
         owner = self.owner
         if (not owner.isCalculated):
             raise CLibraryError ("First calculate electrostatic energies.")
+        nequil = self.cObject.nequilWarm if warmStart else self.cObject.nequil
+        if trajectoryFormat not in ("text", "binary"):
+            raise CLibraryError ("Unknown trajectory format: %s" % trajectoryFormat)
+        self.cObject.accumulatePairs = CFalse
+        if self.cObject.energyModel.npairs > 0:
+            if (self.cObject.nchains > 1) or (self.cObject.targetError > 0.):
+                raise CLibraryError ("Joint probabilities of pairs are only accumulated in runs of a single chain without convergence-based stopping.")
+            self.cObject.accumulatePairs = CTrue
+        if self.cObject.microstates != NULL:
+            MicrostateHistogram_Reset (self.cObject.microstates)
+        if self.cObject.reweighting:
+            MCModelDefault_ResetProtonHistogram (self.cObject)
+
+        if (checkpointFilename != "") and ((self.cObject.nchains > 1) or (self.cObject.targetError > 0.) or (logFrequency > 0) or (trajectoryFilename != "")):
+            raise CLibraryError ("Checkpoints are only written in quiet runs of a single chain without convergence-based stopping.")
 
-        if (logFrequency <= 0) and (trajectoryFilename == ""):
+        if self.cObject.nchains > 1:
+            # . Run independent chains
+            if trajectoryFilename != "":
+                raise CLibraryError ("Writing trajectories is not possible with multiple chains.")
+            MCModelDefault_RunChains (self.cObject, pH)
+            if LogFileActive (log):
+                log.Text ("\nCompleted %d chains of %d equilibration and %d production scans.\n" % (self.cObject.nchains, self.cObject.nequil, self.cObject.nprod))
+                log.Text ("\nLargest R-hat is %.3f, largest standard error of probability is %.4f.\n" % (max (self.rhat), max (self.errors)))
+                if logFrequency > 0:
+                    self.PrintConvergence (log=log)
+
+        elif self.cObject.targetError > 0.:
+            # . Run until probabilities are converged
+            if trajectoryFilename != "":
+                raise CLibraryError ("Writing trajectories is not possible with convergence-based stopping.")
+            if warmStart:
+                MCModelDefault_WarmEquilibration (self.cObject, pH)
+            else:
+                MCModelDefault_Equilibration (self.cObject, pH)
+            converged = MCModelDefault_ConvergedProduction (self.cObject, pH)
+            if LogFileActive (log):
+                log.Text ("\nProduction %s after %d scans, of which %d were discarded as equilibration and %d were used.\n" % ("converged" if converged else "stopped", self.cObject.nscansDiscarded + self.cObject.nscansUsed, self.cObject.nscansDiscarded, self.cObject.nscansUsed))
+                log.Text ("\nLargest standard error of probability is %.4f (target %g).\n" % (max (self.errors), self.cObject.targetError))
+                if logFrequency > 0:
+                    self.PrintConvergence (log=log)
+
+        elif (logFrequency <= 0) and (trajectoryFilename == ""):
             # . Do a quiet run
             active = CTrue if (LogFileActive (log)) else CFalse
+            nscans = -1
+            if checkpointFilename != "":
+                nscans = MCModelDefault_ReadCheckpoint (self.cObject, checkpointFilename, pH, &status)
+                if status != Status_Continue:
+                    raise CLibraryError ("Cannot continue from checkpoint file %s." % checkpointFilename)
 
-            MCModelDefault_Equilibration (self.cObject, pH)
-            if active:
-                log.Text ("\nCompleted %d equilibration scans.\n" % self.cObject.nequil)
+            if nscans < 0:
+                if warmStart:
+                    MCModelDefault_WarmEquilibration (self.cObject, pH)
+                else:
+                    MCModelDefault_Equilibration (self.cObject, pH)
+                if active:
+                    log.Text ("\nCompleted %d equilibration scans.\n" % nequil)
+            elif active:
+                log.Text ("\nContinuing from checkpoint after %d production scans.\n" % nscans)
 
-            MCModelDefault_Production (self.cObject, pH)
+            if checkpointFilename != "":
+                if not MCModelDefault_CheckpointedProduction (self.cObject, pH, nscans, checkpointFilename):
+                    raise CLibraryError ("Cannot write checkpoint file %s." % checkpointFilename)
+            else:
+                MCModelDefault_Production (self.cObject, pH)
             if active:
                 log.Text ("\nCompleted %d production scans.\n" % self.cObject.nprod)
         else:
             # . Do logging or trajectory writing
             mcModel = self.cObject
-            nmoves  = mcModel.vector.nsites + mcModel.vector.npairs
+            nmoves  = mcModel.vector.nsites + mcModel.vector.npairs + mcModel.nclusters
             active  = CTrue if (LogFileActive (log) and (logFrequency > 0)) else CFalse
     
             if active:
@@ -97,9 +266,11 @@ cdef class MCModelDefault:
                 table.Heading ("%10s"  % "F-Acc" )
     
             # . Do equilibration phase
-            StateVector_Randomize (mcModel.vector, mcModel.generator)
+            if not warmStart:
+                StateVector_Randomize (mcModel.vector, mcModel.generator)
+            MCModelDefault_CalculateField (mcModel)
 
-            for i from 0 <= i < mcModel.nequil:
+            for i from 0 <= i < nequil:
                 MCModelDefault_MCScan (mcModel, pH, nmoves, &moves, &movesAcc, &flips, &flipsAcc)
                 if active:
                     j += 1
@@ -124,17 +295,38 @@ cdef class MCModelDefault:
    
             # . Do production phase
             writing = CFalse
+            binary  = CFalse
             if (trajectoryFilename != ""):
                 writing = CTrue
-                output = open (trajectoryFilename, "w")
+                if trajectoryFormat == "binary":
+                    binary     = CTrue
+                    trajectory = StateTrajectory_Open (trajectoryFilename, mcModel.vector, 0, &status)
+                    if status == Status_ValueError:
+                        raise CLibraryError ("Sites with more than 256 instances cannot be written to binary trajectories.")
+                    if trajectory == NULL:
+                        raise CLibraryError ("Cannot open trajectory file %s." % trajectoryFilename)
+                else:
+                    output = open (trajectoryFilename, "w")
             Real1DArray_Set (mcModel.energyModel.probabilities, 0.)
+            if mcModel.accumulatePairs:
+                EnergyModel_ResetPairProbabilities (mcModel.energyModel)
+            MCModelDefault_CalculateField (mcModel)
  
             for i from 0 <= i < mcModel.nprod:
                 Gmicro = MCModelDefault_MCScan (mcModel, pH, nmoves, &moves, &movesAcc, &flips, &flipsAcc)
                 if writing:
-                    output.write ("%f\n" % Gmicro)
+                    if binary:
+                        if not StateTrajectory_Write (trajectory, mcModel.vector, MCModelDefault_CountProtons (mcModel), Gmicro):
+                            StateTrajectory_Close (trajectory)
+                            raise CLibraryError ("Cannot write trajectory file %s." % trajectoryFilename)
+                    else:
+                        output.write ("%f\n" % Gmicro)
 
-                MCModelDefault_UpdateProbabilities (mcModel)
+                MCModelDefault_UpdateProbabilities (mcModel, pH)
+                if mcModel.microstates != NULL:
+                    MicrostateHistogram_Record (mcModel.microstates, mcModel.vector, Gmicro, MCModelDefault_CountProtons (mcModel))
+                if mcModel.reweighting:
+                    MCModelDefault_UpdateProtonHistogram (mcModel)
                 if active:
                     j += 1
                     if j >= logFrequency:
@@ -154,28 +346,274 @@ cdef class MCModelDefault:
 
             # . Finalize
             if writing:
-                output.close ()
+                if binary:
+                    if not StateTrajectory_Close (trajectory):
+                        raise CLibraryError ("Cannot write trajectory file %s." % trajectoryFilename)
+                else:
+                    output.close ()
             scale = 1. / mcModel.nprod
             Real1DArray_Scale (mcModel.energyModel.probabilities, scale)
+            if mcModel.accumulatePairs:
+                EnergyModel_ScalePairProbabilities (mcModel.energyModel, scale)
+
+
+    def Workspace (self, Integer index=0):
+        """Create a workspace of this model.
+
+        Workspaces use consecutive seeds after the seeds of the chains of this model. They run
+        a single chain with a fixed number of production scans and keep no histograms, so that
+        models with multiple chains, convergence-based stopping, reweighting or a histogram of
+        microstates cannot have workspaces."""
+        cdef MCModelDefault  workspace
+        cdef Status          status = Status_Continue
+
+        owner = self.owner
+        if owner is None:
+            raise CLibraryError ("First initialize the Monte Carlo model.")
+        if self.cObject.nchains > 1:
+            raise CLibraryError ("Workspaces are not possible with multiple chains.")
+        if self.cObject.targetError > 0.:
+            raise CLibraryError ("Workspaces are not possible with convergence-based stopping.")
+        if self.cObject.reweighting != CFalse:
+            raise CLibraryError ("Workspaces are not possible with reweighting.")
+        if self.cObject.maxMicrostates > 0:
+            raise CLibraryError ("Workspaces are not possible with a histogram of microstates.")
+        workspace = MCModelDefault (doubleFlip=self.cObject.limit, nequil=self.cObject.nequil, nprod=self.cObject.nprod, randomSeed=(self.cObject.seed + self.cObject.nchains + index), nequilWarm=self.cObject.nequilWarm,
+                                    heatBath=self.cObject.heatBath, raoBlackwell=self.cObject.raoBlackwell, clusterLimit=self.cObject.clusterLimit, maxClusterSize=self.cObject.maxClusterSize,
+                                    checkpointFrequency=self.cObject.checkpointFrequency)
+        workspace.Initialize (owner)
+        MCModelDefault_AllocatePrivateProbabilities (workspace.cObject, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate workspace.")
+        return workspace
+
+
+    def CalculateWorkspaceProbabilities (self, Real pH=7.0, warmStart=False):
+        """Calculate probabilities in a workspace without holding the GIL.
+
+        Returns probabilities of instances, ordered by their global indices. The owner is not modified."""
+        cdef CMCModelDefault *mcModel = self.cObject
+        cdef Boolean          warm    = CTrue if warmStart else CFalse
+        cdef Integer          index
+
+        if mcModel.privateProbabilities == NULL:
+            raise CLibraryError ("Probabilities are only calculated in workspaces.")
+        with nogil:
+            MCModelDefault_CalculateProbabilities (mcModel, pH, warm)
+        return [mcModel.privateProbabilities[index] for index from 0 <= index < mcModel.energyModel.ninstances]
+
+
+    property rhat:
+        def __get__ (self):
+            """Potential scale reduction factors of instances from the last run of independent chains."""
+            cdef Integer index
+            if self.cObject.nchains < 2:
+                raise CLibraryError ("R-hat is only available with multiple chains.")
+            return [self.cObject.rhat[index] for index from 0 <= index < self.cObject.energyModel.ninstances]
+
+    property errors:
+        def __get__ (self):
+            """Standard errors of probabilities of instances from the last run of independent chains or convergence-based run."""
+            cdef Integer index
+            if self.cObject.errors == NULL:
+                raise CLibraryError ("Standard errors are only available with multiple chains or convergence-based stopping.")
+            return [self.cObject.errors[index] for index from 0 <= index < self.cObject.energyModel.ninstances]
+
+
+    def PrintConvergence (self, log=logFile):
+        """Print probabilities of instances with their standard errors and R-hat (only with multiple chains)."""
+        cdef Integer index
+        if LogFileActive (log):
+            owner       = self.owner
+            energyModel = owner.energyModel
+            chains      = self.cObject.nchains > 1
+            table       = log.GetTable (columns=[6, 6, 6, 6, 14, 14, 10] if chains else [6, 6, 6, 6, 14, 14])
+            table.Start ()
+            table.Heading ("Instance of a site", columnSpan=4)
+            table.Heading ("Probability" )
+            table.Heading ("Error"       )
+            if chains:
+                table.Heading ("R-hat"   )
+            for site in owner.sites:
+                for instance in site.instances:
+                    index = instance._instIndexGlobal
+                    table.Entry (site.segName)
+                    table.Entry (site.resName)
+                    table.Entry ("%d" % site.resSerial)
+                    table.Entry (instance.label)
+                    table.Entry ("%14.4f" % energyModel.GetProbability (index))
+                    table.Entry ("%14.4f" % self.cObject.errors[index])
+                    if chains:
+                        table.Entry ("%10.3f" % self.cObject.rhat[index])
+            table.Stop ()
+
+
+    property reweighting:
+        def __get__ (self):
+            """Histograms of numbers of protons are kept for reweighting."""
+            return (self.cObject.reweighting != CFalse)
+
+
+    def ProtonHistogram (self):
+        """Get the histogram of numbers of protons from the last run of a single chain.
+
+        Returns a list of counts of production scans with each number of protons, from zero
+        to the largest possible number, and for each number of protons, a list of counts of
+        instances (ordered by their global indices)."""
+        cdef Integer nprotons, index, ninstances
+        if not self.cObject.reweighting:
+            raise CLibraryError ("Reweighting is not enabled.")
+        ninstances = self.cObject.energyModel.ninstances
+        counts     = [self.cObject.protonCounts[nprotons] for nprotons from 0 <= nprotons <= self.cObject.maxProtons]
+        if sum (counts) <= 0.:
+            raise CLibraryError ("No scans were recorded.")
+        instances  = [[self.cObject.protonInstances[nprotons * ninstances + index] for index from 0 <= index < ninstances] for nprotons from 0 <= nprotons <= self.cObject.maxProtons]
+        return (counts, instances)
+
+
+    def Microstates (self, Integer nstates=_DefaultMicrostates):
+        """Get the most populated microstates from the last run of a single chain.
+
+        Returns a list of at most |nstates| tuples, ordered by decreasing population. Each tuple
+        contains the key of the microstate, its population, energy, number of protons and a list
+        with the local index of the "active" instance of each site. The key is the index of the
+        microstate in the mixed radix system of numbers of instances of sites or, for systems too
+        large for 128-bit keys, a hash."""
+        cdef CMicrostateHistogram *histogram = self.cObject.microstates
+        cdef Integer index, digit, site
+        if (histogram == NULL) or (histogram.nsamples <= 0.):
+            raise CLibraryError ("No microstates were recorded.")
+        order = sorted (range (histogram.nstates), key=lambda index: (-histogram.counts[index], index))
+        microstates = []
+        for index in order[:nstates]:
+            key = 0
+            for digit from MICROSTATE_KEY_DIGITS > digit >= 0:
+                key = (key << MICROSTATE_DIGIT_BITS) | histogram.keys[index].digits[digit]
+            instances = [histogram.instances[index * histogram.nsites + site] for site from 0 <= site < histogram.nsites]
+            microstates.append ((key, histogram.counts[index] / histogram.nsamples, histogram.energies[index], histogram.protons[index], instances))
+        return microstates
+
+
+    def PrintMicrostates (self, Integer nstates=_DefaultMicrostates, log=logFile):
+        """Print the most populated microstates from the last run of a single chain.
+
+        For each microstate other than the first, sites whose instances differ from the first microstate are listed."""
+        cdef CMicrostateHistogram *histogram = self.cObject.microstates
+        if LogFileActive (log):
+            microstates = self.Microstates (nstates=nstates)
+            sites       = self.owner.sites
+            table       = log.GetTable (columns=[8, 12, 14, 10])
+            table.Start ()
+            table.Heading ("Rank"        )
+            table.Heading ("Population"  )
+            table.Heading ("Gmicro"      )
+            table.Heading ("Protons"     )
+            for rank, (key, population, energy, protons, instances) in enumerate (microstates):
+                table.Entry ("%8d"    % (rank + 1))
+                table.Entry ("%12.4f" % population)
+                table.Entry ("%14.4f" % energy)
+                table.Entry ("%10d"   % protons)
+            table.Stop ()
+
+            first = microstates[0][4]
+            for rank, (key, population, energy, protons, instances) in enumerate (microstates[1:]):
+                changes = ["%s %s%d %s" % (site.segName, site.resName, site.resSerial, site.instances[instances[index]].label) for index, site in enumerate (sites) if instances[index] != first[index]]
+                log.Text ("\nMicrostate %d differs from microstate 1 at: %s\n" % (rank + 2, ", ".join (changes)))
+            log.Text ("\nKept %d microstates covering %.1f%% of %d samples (%d evictions).\n" % (histogram.nstates, 100. * (histogram.nsamples - histogram.nevicted) / histogram.nsamples, histogram.nsamples, histogram.nevictions))
+
+
+    def CalculateOwnerCurves (self, pHs, Integer frequency=_DefaultExchangeFrequency, log=logFile):
+        """Calculate probabilities of the owner at several pH-values in a single run of replica exchange.
+
+        Each pH-value is simulated by its own replica, with the number of scans of this model.
+        Replicas run in parallel and every |frequency| scans, swaps between neighbouring pH-values
+        are attempted. Returns, for each pH-value, a list of sites with probabilities of their instances."""
+        cdef MCModelDefault  replicas
+        cdef Real1DArray     values
+        cdef Status          status = Status_Continue
+        cdef Integer         nsteps, step, ninstances
+        cdef Real            ratio
+
+        owner = self.owner
+        if (not owner.isCalculated):
+            raise CLibraryError ("First calculate electrostatic energies.")
+        nsteps = len (pHs)
+        if nsteps < 2:
+            raise CLibraryError ("Replica exchange needs at least two pH-values.")
+
+        # . Replicas are chains of a separate model, so that this model is not modified
+        replicas = MCModelDefault (doubleFlip=self.cObject.limit, nequil=self.cObject.nequil, nprod=self.cObject.nprod, randomSeed=self.cObject.seed, nchains=nsteps, nthreads=self.cObject.nthreads,
+                                   heatBath=self.cObject.heatBath, raoBlackwell=self.cObject.raoBlackwell, clusterLimit=self.cObject.clusterLimit, maxClusterSize=self.cObject.maxClusterSize)
+        replicas.Initialize (owner)
+        values   = Real1DArray.WithExtent (nsteps)
+        for step from 0 <= step < nsteps:
+            values[step] = pHs[step]
+        MCModelDefault_ReplicaExchange (replicas.cObject, values.cObject, frequency, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot run replica exchange.")
+
+        if LogFileActive (log):
+            table = log.GetTable (columns=[10, 10, 10, 10, 10])
+            table.Start ()
+            table.Heading ("pH"       , columnSpan=2)
+            table.Heading ("Attempted")
+            table.Heading ("Accepted" )
+            table.Heading ("Ratio"    )
+            for step from 0 <= step < nsteps - 1:
+                ratio = 0.
+                if replicas.cObject.swapsAttempted[step] > 0:
+                    ratio = replicas.cObject.swapsAccepted[step] / <Real> replicas.cObject.swapsAttempted[step]
+                table.Entry ("%10.2f" % pHs[step])
+                table.Entry ("%10.2f" % pHs[step + 1])
+                table.Entry ("%10d"   % replicas.cObject.swapsAttempted[step])
+                table.Entry ("%10d"   % replicas.cObject.swapsAccepted[step])
+                table.Entry ("%10.3f" % ratio)
+            table.Stop ()
+
+        ninstances = self.cObject.energyModel.ninstances
+        steps      = []
+        for step from 0 <= step < nsteps:
+            sites = []
+            for site in owner.sites:
+                sites.append ([replicas.cObject.chainProbabilities[step * ninstances + instance._instIndexGlobal] for instance in site.instances])
+            steps.append (sites)
+        return steps
 
 
     def Summary (self, log=logFile):
         """Summary."""
         cdef Integer nequil     = self.cObject.nequil
         cdef Integer nprod      = self.cObject.nprod
+        cdef Integer nchains    = self.cObject.nchains
         cdef Real    doubleFlip = self.cObject.limit
         if LogFileActive (log):
             summary = log.GetSummary ()
             summary.Start ("Default Monte Carlo sampling model")
             summary.Entry ("Equilibration scans"    , "%d"   % nequil)
-            summary.Entry ("Production scans"       , "%d"   % nprod)
+            summary.Entry ("Warm-start scans"       , "%d"   % self.cObject.nequilWarm)
+            if self.cObject.targetError > 0.:
+                summary.Entry ("Target error"       , "%g"   % self.cObject.targetError)
+                summary.Entry ("Maximum scans"      , "%d"   % self.cObject.maxScans)
+            else:
+                summary.Entry ("Production scans"   , "%d"   % nprod)
             summary.Entry ("Limit for double moves" , "%.1f" % doubleFlip)
+            summary.Entry ("Independent chains"     , "%d"   % nchains)
+            summary.Entry ("Chains in lockstep"     , "%s"   % ("yes" if self.cObject.lockstep else "no"))
+            summary.Entry ("Heat-bath moves"        , "%s"   % ("yes" if self.cObject.heatBath else "no"))
+            summary.Entry ("Rao-Blackwellization"   , "%s"   % ("yes" if self.cObject.raoBlackwell else "no"))
+            summary.Entry ("Maximum cluster size"   , "%d"   % self.cObject.maxClusterSize)
+            if self.cObject.maxClusterSize > 1:
+                summary.Entry ("Limit for clusters" , "%.1f" % self.cObject.clusterLimit)
+            if self.cObject.maxMicrostates > 0:
+                summary.Entry ("Microstates kept"   , "%d"   % self.cObject.maxMicrostates)
+            summary.Entry ("Reweighting"            , "%s"   % ("yes" if self.cObject.reweighting else "no"))
+            summary.Entry ("Scans between checkpoints" , "%d" % self.cObject.checkpointFrequency)
             summary.Stop ()
 
 
     def PrintPairs (self, log=logFile):
-        """Summary of strongly interacting pairs."""
-        cdef Integer  indexPair, indexSiteA, indexSiteB
+        """Summary of strongly interacting pairs and clusters."""
+        cdef Integer  indexPair, indexSiteA, indexSiteB, indexCluster, index
         cdef Status   status
         cdef Integer  npairs
         cdef Real     Wmax
@@ -192,3 +630,12 @@ cdef class MCModelDefault:
                 siteFirst  = sites[indexSiteA]
                 siteSecond = sites[indexSiteB]
                 log.Text ("%4s %4s %4d -- %4s %4s %4d : %f\n" % (siteFirst.segName, siteFirst.resName, siteFirst.resSerial, siteSecond.segName, siteSecond.resName, siteSecond.resSerial, Wmax))
+
+            if self.cObject.nclusters > 0:
+                log.Text ("\nFound %d cluster%s of strongly interacting sites:\n" % (self.cObject.nclusters, "s" if self.cObject.nclusters != 1 else ""))
+                for indexCluster from 0 <= indexCluster < self.cObject.nclusters:
+                    labels = []
+                    for index from self.cObject.clusterOffsets[indexCluster] <= index < self.cObject.clusterOffsets[indexCluster + 1]:
+                        site = sites[self.cObject.clusterSites[index]]
+                        labels.append ("%s %s %d" % (site.segName, site.resName, site.resSerial))
+                    log.Text ("%s\n" % " -- ".join (labels))
@@ -0,0 +1,36 @@
+#-------------------------------------------------------------------------------
+# . File      : ContinuumElectrostatics.MeanFieldModel.pxd
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+from pCore.cDefinitions                  cimport Boolean, CFalse, CTrue, Integer, Real
+from pCore.Status                        cimport Status, Status_Continue
+from ContinuumElectrostatics.EnergyModel cimport CEnergyModel, EnergyModel
+
+__lastchanged__ = "$Id: $"
+
+
+cdef extern from "MeanFieldModel.h":
+    ctypedef struct CMeanFieldModel "MeanFieldModel":
+        Real           damping
+        Real           tolerance
+        Integer        maxIterations
+        Integer        niterations
+        Real           deviation
+        CEnergyModel  *energyModel
+
+
+    cdef CMeanFieldModel *MeanFieldModel_Allocate               (Real damping, Real tolerance, Integer maxIterations, Status *status)
+    cdef void             MeanFieldModel_Deallocate             (CMeanFieldModel *self)
+    cdef void             MeanFieldModel_LinkToEnergyModel      (CMeanFieldModel *self, CEnergyModel *energyModel, Status *status)
+    cdef void             MeanFieldModel_Reset                  (CMeanFieldModel *self)
+    cdef Real             MeanFieldModel_Iterate                (CMeanFieldModel *self, Real pH)
+    cdef Boolean          MeanFieldModel_CalculateProbabilities (CMeanFieldModel *self, Real pH)
+
+#-------------------------------------------------------------------------------
+cdef class MeanFieldModel:
+    cdef CMeanFieldModel  *cObject
+    cdef public object  isOwner
+    cdef public object  owner
@@ -0,0 +1,108 @@
+#-------------------------------------------------------------------------------
+# . File      : ContinuumElectrostatics.MeanFieldModel.pyx
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+from pCore  import logFile, LogFileActive, CLibraryError
+
+_DefaultDamping       = .5
+_DefaultTolerance     = 1e-6
+_DefaultMaxIterations = 1000
+
+
+cdef class MeanFieldModel:
+    """A class defining the self-consistent mean-field model (Tanford-Roxby).
+
+    Each site feels the interactions with other sites averaged over their probabilities.
+    The model is approximate, but fast enough for very large systems."""
+
+    def __getmodule__ (self):
+        """Return the module name."""
+        return "ContinuumElectrostatics.MeanFieldModel"
+
+    def __dealloc__ (self):
+        """Deallocate."""
+        MeanFieldModel_Deallocate (self.cObject)
+
+
+    def __init__ (self, Real damping=_DefaultDamping, Real tolerance=_DefaultTolerance, Integer maxIterations=_DefaultMaxIterations):
+        """Constructor."""
+        cdef Status  status
+        status        = Status_Continue
+        self.isOwner  = True
+        if (damping < 0.) or (damping >= 1.):
+            raise CLibraryError ("Damping factor must be in the range [0, 1).")
+        self.cObject  = MeanFieldModel_Allocate (damping, tolerance, maxIterations, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate mean-field model.")
+
+
+    def Initialize (self, ceModel):
+        """Link mean-field and energy models."""
+        cdef EnergyModel energyModel = ceModel.energyModel
+        cdef Status      status      = Status_Continue
+
+        MeanFieldModel_LinkToEnergyModel (self.cObject, energyModel.cObject, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot initialize mean-field model.")
+        self.isOwner = False
+        self.owner   = ceModel
+
+
+    def CalculateOwnerProbabilities (self, Real pH=7.0, Integer logFrequency=0, trajectoryFilename="", log=logFile):
+        """Calculate probabilities of the owner."""
+        cdef CMeanFieldModel  *mfModel = self.cObject
+        cdef Integer  i
+        cdef Real     deviation
+        cdef Boolean  converged
+
+        owner = self.owner
+        if (not owner.isCalculated):
+            raise CLibraryError ("First calculate electrostatic energies.")
+        if (trajectoryFilename != ""):
+            raise CLibraryError ("Writing trajectories unsupported.")
+
+        if (logFrequency <= 0) or (not LogFileActive (log)):
+            converged = MeanFieldModel_CalculateProbabilities (mfModel, pH)
+        else:
+            table = log.GetTable (columns=[10, 16])
+            table.Start ()
+            table.Heading ("Iteration")
+            table.Heading ("Max. change")
+
+            converged = CFalse
+            MeanFieldModel_Reset (mfModel)
+            for i from 1 <= i <= mfModel.maxIterations:
+                deviation = MeanFieldModel_Iterate (mfModel, pH)
+                if (i % logFrequency == 0) or (deviation < mfModel.tolerance):
+                    table.Entry ("%10d"   % i)
+                    table.Entry ("%16.8f" % deviation)
+                if deviation < mfModel.tolerance:
+                    converged = CTrue
+                    break
+            table.Stop ()
+            mfModel.niterations = i if (converged != CFalse) else mfModel.maxIterations
+            mfModel.deviation   = deviation
+
+        if converged == CFalse:
+            raise CLibraryError ("Mean-field iterations did not converge in %d steps (max. change %g)." % (mfModel.maxIterations, mfModel.deviation))
+        if LogFileActive (log):
+            log.Text ("\nMean-field iterations converged in %d steps.\n" % mfModel.niterations)
+
+
+    def Summary (self, log=logFile):
+        """Summary."""
+        if LogFileActive (log):
+            summary = log.GetSummary ()
+            summary.Start ("Mean-field model")
+            summary.Entry ("Damping factor"         , "%.2f" % self.cObject.damping)
+            summary.Entry ("Tolerance"              , "%g"   % self.cObject.tolerance)
+            summary.Entry ("Max. iterations"        , "%d"   % self.cObject.maxIterations)
+            summary.Stop ()
+
+
+    def PrintPairs (self, log=logFile):
+        """The mean-field model does not treat pairs of sites separately."""
+        pass
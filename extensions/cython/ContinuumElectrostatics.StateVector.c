@@ -1,4861 +0,0 @@
-/* Generated by Cython 0.15.1 on Thu Jun  9 21:41:07 2016 */
-
-#define PY_SSIZE_T_CLEAN
-#include "Python.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#else
-
-#include <stddef.h> /* For offsetof */
-#ifndef offsetof
-#define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
-#endif
-
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#endif
-
-#ifndef DL_IMPORT
-  #define DL_IMPORT(t) t
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-
-#if PY_VERSION_HEX < 0x02040000
-  #define METH_COEXIST 0
-  #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
-  #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PY_FORMAT_SIZE_T ""
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)   __Pyx_PyInt_AsInt(o)
-  #define PyNumber_Index(o)    PyNumber_Int(o)
-  #define PyIndex_Check(o)     PyNumber_Check(o)
-  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
-  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
-  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
-  #define PyVarObject_HEAD_INIT(type, size) \
-          PyObject_HEAD_INIT(type) size,
-  #define PyType_Modified(t)
-
-  typedef struct {
-     void *buf;
-     PyObject *obj;
-     Py_ssize_t len;
-     Py_ssize_t itemsize;
-     int readonly;
-     int ndim;
-     char *format;
-     Py_ssize_t *shape;
-     Py_ssize_t *strides;
-     Py_ssize_t *suboffsets;
-     void *internal;
-  } Py_buffer;
-
-  #define PyBUF_SIMPLE 0
-  #define PyBUF_WRITABLE 0x0001
-  #define PyBUF_FORMAT 0x0004
-  #define PyBUF_ND 0x0008
-  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
-  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
-  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
-  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
-  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
-
-#endif
-
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define Py_TPFLAGS_CHECKTYPES 0
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-
-#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyStringObject               PyUnicodeObject
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_Check               PyUnicode_Check
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define PyBytesObject                PyStringObject
-  #define PyBytes_Type                 PyString_Type
-  #define PyBytes_Check                PyString_Check
-  #define PyBytes_CheckExact           PyString_CheckExact
-  #define PyBytes_FromString           PyString_FromString
-  #define PyBytes_FromStringAndSize    PyString_FromStringAndSize
-  #define PyBytes_FromFormat           PyString_FromFormat
-  #define PyBytes_DecodeEscape         PyString_DecodeEscape
-  #define PyBytes_AsString             PyString_AsString
-  #define PyBytes_AsStringAndSize      PyString_AsStringAndSize
-  #define PyBytes_Size                 PyString_Size
-  #define PyBytes_AS_STRING            PyString_AS_STRING
-  #define PyBytes_GET_SIZE             PyString_GET_SIZE
-  #define PyBytes_Repr                 PyString_Repr
-  #define PyBytes_Concat               PyString_Concat
-  #define PyBytes_ConcatAndDel         PyString_ConcatAndDel
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define PySet_Check(obj)             PyObject_TypeCheck(obj, &PySet_Type)
-  #define PyFrozenSet_Check(obj)       PyObject_TypeCheck(obj, &PyFrozenSet_Type)
-#endif
-#ifndef PySet_CheckExact
-  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
-#endif
-
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyIntObject                  PyLongObject
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyBoolObject                 PyLongObject
-#endif
-
-#if PY_VERSION_HEX < 0x03020000
-  typedef long Py_hash_t;
-  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
-#else
-  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
-#endif
-
-
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-#endif
-
-#if (PY_MAJOR_VERSION < 3) || (PY_VERSION_HEX >= 0x03010300)
-  #define __Pyx_PySequence_GetSlice(obj, a, b) PySequence_GetSlice(obj, a, b)
-  #define __Pyx_PySequence_SetSlice(obj, a, b, value) PySequence_SetSlice(obj, a, b, value)
-  #define __Pyx_PySequence_DelSlice(obj, a, b) PySequence_DelSlice(obj, a, b)
-#else
-  #define __Pyx_PySequence_GetSlice(obj, a, b) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), (PyObject*)0) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_GetSlice(obj, a, b)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object is unsliceable", (obj)->ob_type->tp_name), (PyObject*)0)))
-  #define __Pyx_PySequence_SetSlice(obj, a, b, value) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), -1) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_SetSlice(obj, a, b, value)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object doesn't support slice assignment", (obj)->ob_type->tp_name), -1)))
-  #define __Pyx_PySequence_DelSlice(obj, a, b) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), -1) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_DelSlice(obj, a, b)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object doesn't support slice deletion", (obj)->ob_type->tp_name), -1)))
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : PyInstanceMethod_New(func))
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
-#else
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_NAMESTR(n) ((char *)(n))
-  #define __Pyx_DOCSTR(n)  ((char *)(n))
-#else
-  #define __Pyx_NAMESTR(n) (n)
-  #define __Pyx_DOCSTR(n)  (n)
-#endif
-
-#ifndef __PYX_EXTERN_C
-  #ifdef __cplusplus
-    #define __PYX_EXTERN_C extern "C"
-  #else
-    #define __PYX_EXTERN_C extern
-  #endif
-#endif
-
-#if defined(WIN32) || defined(MS_WINDOWS)
-#define _USE_MATH_DEFINES
-#endif
-#include <math.h>
-#define __PYX_HAVE__ContinuumElectrostatics__StateVector
-#define __PYX_HAVE_API__ContinuumElectrostatics__StateVector
-#include "Definitions.h"
-#include "Boolean.h"
-#include "Cardinal.h"
-#include "Integer.h"
-#include "Real.h"
-#include "Status.h"
-#include "StatusHandler.h"
-#include "stdlib.h"
-#include "Memory.h"
-#include "Real1DArray.h"
-#include "RandomNumberGenerator.h"
-#include "StateVector.h"
-#ifdef _OPENMP
-#include <omp.h>
-#endif /* _OPENMP */
-
-#ifdef PYREX_WITHOUT_ASSERTIONS
-#define CYTHON_WITHOUT_ASSERTIONS
-#endif
-
-
-/* inline attribute */
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_INLINE inline
-  #else
-    #define CYTHON_INLINE
-  #endif
-#endif
-
-/* unused attribute */
-#ifndef CYTHON_UNUSED
-# if defined(__GNUC__)
-#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define CYTHON_UNUSED __attribute__ ((__unused__))
-#   else
-#     define CYTHON_UNUSED
-#   endif
-# elif defined(__ICC) || defined(__INTEL_COMPILER)
-#   define CYTHON_UNUSED __attribute__ ((__unused__))
-# else
-#   define CYTHON_UNUSED
-# endif
-#endif
-
-typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
-
-
-/* Type Conversion Predeclarations */
-
-#define __Pyx_PyBytes_FromUString(s) PyBytes_FromString((char*)s)
-#define __Pyx_PyBytes_AsUString(s)   ((unsigned char*) PyBytes_AsString(s))
-
-#define __Pyx_Owned_Py_None(b) (Py_INCREF(Py_None), Py_None)
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
-
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-
-
-#ifdef __GNUC__
-  /* Test for GCC > 2.95 */
-  #if __GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95))
-    #define likely(x)   __builtin_expect(!!(x), 1)
-    #define unlikely(x) __builtin_expect(!!(x), 0)
-  #else /* __GNUC__ > 2 ... */
-    #define likely(x)   (x)
-    #define unlikely(x) (x)
-  #endif /* __GNUC__ > 2 ... */
-#else /* __GNUC__ */
-  #define likely(x)   (x)
-  #define unlikely(x) (x)
-#endif /* __GNUC__ */
-    
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-
-
-static const char *__pyx_f[] = {
-  "ContinuumElectrostatics.StateVector.pyx",
-  "pCore.Real1DArray.pxd",
-  "pCore.RandomNumberGenerator.pxd",
-};
-
-/*--- Type declarations ---*/
-struct __pyx_obj_5pCore_11Real1DArray_Real1DArray;
-struct __pyx_obj_5pCore_21RandomNumberGenerator_RandomNumberGenerator;
-struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector;
-struct __pyx_t_5pCore_6BPData_BPData;
-typedef struct __pyx_t_5pCore_6BPData_BPData __pyx_t_5pCore_6BPData_BPData;
-
-/* "/home/mikolaj/local/opt/pDynamo-1.9.0/pCore-1.9.0/extensions/pyrex/pCore.BPData.pxd":17
- * #===================================================================================================================================
- * # . The buffer type.
- * ctypedef struct BPData:             # <<<<<<<<<<<<<<
- *     void       *buf
- * #    PyObject   *obj
- */
-struct __pyx_t_5pCore_6BPData_BPData {
-  void *buf;
-  Py_ssize_t len;
-  Py_ssize_t itemsize;
-  int ndim;
-  char *format;
-  Py_ssize_t *shape;
-  Py_ssize_t *strides;
-  Py_ssize_t *suboffsets;
-};
-
-/* "/home/mikolaj/local/opt/pDynamo-1.9.0/pCore-1.9.0/extensions/pyrex/pCore.Real1DArray.pxd":64
- * # . Class.
- * #===================================================================================================================================
- * cdef class Real1DArray:             # <<<<<<<<<<<<<<
- * 
- *     cdef BPData        *bpData
- */
-struct __pyx_obj_5pCore_11Real1DArray_Real1DArray {
-  PyObject_HEAD
-  __pyx_t_5pCore_6BPData_BPData *bpData;
-  Real1DArray *cObject;
-  PyObject *isOwner;
-  PyObject *owner;
-};
-
-
-/* "/home/mikolaj/local/opt/pDynamo-1.9.0/pCore-1.9.0/extensions/pyrex/pCore.RandomNumberGenerator.pxd":38
- * # . Class.
- * #===================================================================================================================================
- * cdef class RandomNumberGenerator:             # <<<<<<<<<<<<<<
- * 
- *     cdef CRandomNumberGenerator *cObject
- */
-struct __pyx_obj_5pCore_21RandomNumberGenerator_RandomNumberGenerator {
-  PyObject_HEAD
-  RandomNumberGenerator *cObject;
-  PyObject *initialSeed;
-  PyObject *isOwner;
-  PyObject *owner;
-};
-
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pxd":69
- * 
- * #-------------------------------------------------------------------------------
- * cdef class StateVector:             # <<<<<<<<<<<<<<
- *     cdef CStateVector     *cObject
- *     cdef public object  isOwner
- */
-struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector {
-  PyObject_HEAD
-  StateVector *cObject;
-  PyObject *isOwner;
-  PyObject *owner;
-};
-
-
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname); /*proto*/
-  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
-  #define __Pyx_RefNannySetupContext(name)           __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-  #define __Pyx_RefNannyFinishContext()           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
-  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
-  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
-  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
-#else
-  #define __Pyx_RefNannyDeclarations
-  #define __Pyx_RefNannySetupContext(name)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XINCREF(r) Py_XINCREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-  #define __Pyx_XGOTREF(r)
-  #define __Pyx_XGIVEREF(r)
-#endif /* CYTHON_REFNANNY */
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause); /*proto*/
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name, PyObject* kw_name); /*proto*/
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
-
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-
-
-#define __Pyx_GetItemInt_List(o, i, size, to_py_func) (((size) <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_List_Fast(o, i) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i) {
-    if (likely(o != Py_None)) {
-        if (likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-            PyObject *r = PyList_GET_ITEM(o, i);
-            Py_INCREF(r);
-            return r;
-        }
-        else if ((-PyList_GET_SIZE(o) <= i) & (i < 0)) {
-            PyObject *r = PyList_GET_ITEM(o, PyList_GET_SIZE(o) + i);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-#define __Pyx_GetItemInt_Tuple(o, i, size, to_py_func) (((size) <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_Tuple_Fast(o, i) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i) {
-    if (likely(o != Py_None)) {
-        if (likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, i);
-            Py_INCREF(r);
-            return r;
-        }
-        else if ((-PyTuple_GET_SIZE(o) <= i) & (i < 0)) {
-            PyObject *r = PyTuple_GET_ITEM(o, PyTuple_GET_SIZE(o) + i);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-
-#define __Pyx_GetItemInt(o, i, size, to_py_func) (((size) <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_Fast(o, i) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i) {
-    PyObject *r;
-    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-        r = PyList_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (PyTuple_CheckExact(o) && ((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-        r = PyTuple_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_item && (likely(i >= 0))) {
-        r = PySequence_GetItem(o, i);
-    }
-    else {
-        r = __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-    }
-    return r;
-}
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact); /*proto*/
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
-
-static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected); /*proto*/
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level); /*proto*/
-
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_Integer(Integer);
-
-static CYTHON_INLINE Integer __Pyx_PyInt_from_py_Integer(PyObject *);
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
-
-static CYTHON_INLINE int __Pyx_PyInt_AsLongDouble(PyObject *);
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
-
-static int __Pyx_check_binary_version(void);
-
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, size_t size, int strict);  /*proto*/
-
-static PyObject *__Pyx_ImportModule(const char *name); /*proto*/
-
-static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**f)(void), const char *sig); /*proto*/
-
-static void __Pyx_AddTraceback(const char *funcname, int __pyx_clineno,
-                               int __pyx_lineno, const char *__pyx_filename); /*proto*/
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
-
-/* Module declarations from 'pCore.cDefinitions' */
-
-/* Module declarations from 'pCore.Status' */
-
-/* Module declarations from 'libc' */
-
-/* Module declarations from 'libc.stdlib' */
-
-/* Module declarations from 'pCore.Memory' */
-
-/* Module declarations from 'pCore.BPData' */
-static __pyx_t_5pCore_6BPData_BPData *(*__pyx_f_5pCore_6BPData_BPData_Allocate)(Integer); /*proto*/
-static void (*__pyx_f_5pCore_6BPData_BPData_CopyToView)(__pyx_t_5pCore_6BPData_BPData *, Py_buffer *); /*proto*/
-static __pyx_t_5pCore_6BPData_BPData *(*__pyx_f_5pCore_6BPData_BPData_Deallocate)(__pyx_t_5pCore_6BPData_BPData *); /*proto*/
-static void (*__pyx_f_5pCore_6BPData_BPData_InitializeView)(Py_buffer *, char *, Py_ssize_t); /*proto*/
-static void (*__pyx_f_5pCore_6BPData_BPData_Set)(__pyx_t_5pCore_6BPData_BPData *, void *, char *, Py_ssize_t, Py_ssize_t, Integer *, Integer *); /*proto*/
-
-/* Module declarations from 'pCore.Real1DArray' */
-static PyTypeObject *__pyx_ptype_5pCore_11Real1DArray_Real1DArray = 0;
-
-/* Module declarations from 'pCore.RandomNumberGenerator' */
-static PyTypeObject *__pyx_ptype_5pCore_21RandomNumberGenerator_RandomNumberGenerator = 0;
-
-/* Module declarations from 'ContinuumElectrostatics.StateVector' */
-static PyTypeObject *__pyx_ptype_23ContinuumElectrostatics_11StateVector_StateVector = 0;
-#define __Pyx_MODULE_NAME "ContinuumElectrostatics.StateVector"
-int __pyx_module_is_main_ContinuumElectrostatics__StateVector = 0;
-
-/* Implementation of 'ContinuumElectrostatics.StateVector' */
-static char __pyx_k_1[] = "ContinuumElectrostatics.StateVector";
-static char __pyx_k_2[] = "Index (%d) out of range.";
-static char __pyx_k_3[] = "Invalid value (%d).";
-static char __pyx_k_4[] = "Cannot allocate state vector.";
-static char __pyx_k_8[] = "State vector";
-static char __pyx_k_12[] = "@";
-static char __pyx_k_13[] = " ";
-static char __pyx_k_14[] = "%d";
-static char __pyx_k_15[] = "Memory allocation failure.";
-static char __pyx_k_17[] = "Site %s %d not found.";
-static char __pyx_k_18[] = "$Id$";
-static char __pyx_k__log[] = "log";
-static char __pyx_k__Site[] = "Site";
-static char __pyx_k__Stop[] = "Stop";
-static char __pyx_k__Entry[] = "Entry";
-static char __pyx_k__Start[] = "Start";
-static char __pyx_k__Title[] = "Title";
-static char __pyx_k__index[] = "index";
-static char __pyx_k__label[] = "label";
-static char __pyx_k__pCore[] = "pCore";
-static char __pyx_k__sites[] = "sites";
-static char __pyx_k__title[] = "title";
-static char __pyx_k__value[] = "value";
-static char __pyx_k__nsites[] = "nsites";
-static char __pyx_k__Heading[] = "Heading";
-static char __pyx_k__ceModel[] = "ceModel";
-static char __pyx_k__columns[] = "columns";
-static char __pyx_k__logFile[] = "logFile";
-static char __pyx_k__resName[] = "resName";
-static char __pyx_k__segName[] = "segName";
-static char __pyx_k__verbose[] = "verbose";
-static char __pyx_k__GetTable[] = "GetTable";
-static char __pyx_k__Instance[] = "Instance";
-static char __pyx_k____main__[] = "__main__";
-static char __pyx_k____test__[] = "__test__";
-static char __pyx_k__instIndex[] = "instIndex";
-static char __pyx_k__instances[] = "instances";
-static char __pyx_k__resSerial[] = "resSerial";
-static char __pyx_k__columnSpan[] = "columnSpan";
-static char __pyx_k__CLibraryError[] = "CLibraryError";
-static char __pyx_k__LogFileActive[] = "LogFileActive";
-static char __pyx_k____lastchanged__[] = "__lastchanged__";
-static char __pyx_k___instIndexGlobal[] = "_instIndexGlobal";
-static PyObject *__pyx_kp_s_1;
-static PyObject *__pyx_kp_s_12;
-static PyObject *__pyx_kp_s_13;
-static PyObject *__pyx_kp_s_14;
-static PyObject *__pyx_kp_s_15;
-static PyObject *__pyx_kp_s_17;
-static PyObject *__pyx_kp_s_18;
-static PyObject *__pyx_kp_s_2;
-static PyObject *__pyx_kp_s_3;
-static PyObject *__pyx_kp_s_4;
-static PyObject *__pyx_kp_s_8;
-static PyObject *__pyx_n_s__CLibraryError;
-static PyObject *__pyx_n_s__Entry;
-static PyObject *__pyx_n_s__GetTable;
-static PyObject *__pyx_n_s__Heading;
-static PyObject *__pyx_n_s__Instance;
-static PyObject *__pyx_n_s__LogFileActive;
-static PyObject *__pyx_n_s__Site;
-static PyObject *__pyx_n_s__Start;
-static PyObject *__pyx_n_s__Stop;
-static PyObject *__pyx_n_s__Title;
-static PyObject *__pyx_n_s____lastchanged__;
-static PyObject *__pyx_n_s____main__;
-static PyObject *__pyx_n_s____test__;
-static PyObject *__pyx_n_s___instIndexGlobal;
-static PyObject *__pyx_n_s__ceModel;
-static PyObject *__pyx_n_s__columnSpan;
-static PyObject *__pyx_n_s__columns;
-static PyObject *__pyx_n_s__index;
-static PyObject *__pyx_n_s__instIndex;
-static PyObject *__pyx_n_s__instances;
-static PyObject *__pyx_n_s__label;
-static PyObject *__pyx_n_s__log;
-static PyObject *__pyx_n_s__logFile;
-static PyObject *__pyx_n_s__nsites;
-static PyObject *__pyx_n_s__pCore;
-static PyObject *__pyx_n_s__resName;
-static PyObject *__pyx_n_s__resSerial;
-static PyObject *__pyx_n_s__segName;
-static PyObject *__pyx_n_s__sites;
-static PyObject *__pyx_n_s__title;
-static PyObject *__pyx_n_s__value;
-static PyObject *__pyx_n_s__verbose;
-static PyObject *__pyx_int_2;
-static PyObject *__pyx_int_3;
-static PyObject *__pyx_int_7;
-static PyObject *__pyx_int_8;
-static PyObject *__pyx_k_6;
-static PyObject *__pyx_k_7;
-static PyObject *__pyx_k_tuple_5;
-static PyObject *__pyx_k_tuple_9;
-static PyObject *__pyx_k_tuple_10;
-static PyObject *__pyx_k_tuple_11;
-static PyObject *__pyx_k_tuple_16;
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":17
- *     """A class defining the state vector."""
- * 
- *     def __len__ (self):             # <<<<<<<<<<<<<<
- *         """Return the size of the vector."""
- *         return self.cObject.nsites
- */
-
-static Py_ssize_t __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector___len__(PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector___len__[] = "Return the size of the vector.";
-struct wrapperbase __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector___len__;
-static Py_ssize_t __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector___len__(PyObject *__pyx_v_self) {
-  Py_ssize_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__len__");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":19
- *     def __len__ (self):
- *         """Return the size of the vector."""
- *         return self.cObject.nsites             # <<<<<<<<<<<<<<
- * 
- *     def __getmodule__ (self):
- */
-  __pyx_r = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject->nsites;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":21
- *         return self.cObject.nsites
- * 
- *     def __getmodule__ (self):             # <<<<<<<<<<<<<<
- *         """Return the module name."""
- *         return "ContinuumElectrostatics.StateVector"
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_1__getmodule__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_1__getmodule__[] = "Return the module name.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_1__getmodule__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__getmodule__");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":23
- *     def __getmodule__ (self):
- *         """Return the module name."""
- *         return "ContinuumElectrostatics.StateVector"             # <<<<<<<<<<<<<<
- * 
- *     def __dealloc__ (self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  __pyx_r = ((PyObject *)__pyx_kp_s_1);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":25
- *         return "ContinuumElectrostatics.StateVector"
- * 
- *     def __dealloc__ (self):             # <<<<<<<<<<<<<<
- *         """Deallocate."""
- *         StateVector_Deallocate (self.cObject)
- */
-
-static void __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_2__dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_2__dealloc__(PyObject *__pyx_v_self) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__dealloc__");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":27
- *     def __dealloc__ (self):
- *         """Deallocate."""
- *         StateVector_Deallocate (self.cObject)             # <<<<<<<<<<<<<<
- * 
- *     def __copy__ (self):
- */
-  StateVector_Deallocate(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":29
- *         StateVector_Deallocate (self.cObject)
- * 
- *     def __copy__ (self):             # <<<<<<<<<<<<<<
- *         """Copying."""
- *         pass
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_3__copy__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_3__copy__[] = "Copying.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_3__copy__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__copy__");
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":33
- *         pass
- * 
- *     def __deepcopy__ (self):             # <<<<<<<<<<<<<<
- *         """Copying."""
- *         pass
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_4__deepcopy__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_4__deepcopy__[] = "Copying.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_4__deepcopy__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__deepcopy__");
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":38
- * 
- * 
- *     def __getitem__ (self, Integer index):             # <<<<<<<<<<<<<<
- *         """Get an item."""
- *         cdef Integer item
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__(PyObject *__pyx_v_self, PyObject *__pyx_arg_index); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__[] = "Get an item.";
-struct wrapperbase __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__;
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__(PyObject *__pyx_v_self, PyObject *__pyx_arg_index) {
-  Integer __pyx_v_index;
-  Integer __pyx_v_item;
-  Status __pyx_v_status;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__getitem__");
-  assert(__pyx_arg_index); {
-    __pyx_v_index = __Pyx_PyInt_from_py_Integer(__pyx_arg_index); if (unlikely((__pyx_v_index == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.__getitem__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":41
- *         """Get an item."""
- *         cdef Integer item
- *         cdef Status  status = Status_Continue             # <<<<<<<<<<<<<<
- *         item = StateVector_GetItem (self.cObject, index, &status)
- *         if status != Status_Continue:
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":42
- *         cdef Integer item
- *         cdef Status  status = Status_Continue
- *         item = StateVector_GetItem (self.cObject, index, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             raise CLibraryError ("Index (%d) out of range." % index)
- */
-  __pyx_v_item = StateVector_GetItem(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_index, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":43
- *         cdef Status  status = Status_Continue
- *         item = StateVector_GetItem (self.cObject, index, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Index (%d) out of range." % index)
- *         return item
- */
-  __pyx_t_1 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":44
- *         item = StateVector_GetItem (self.cObject, index, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Index (%d) out of range." % index)             # <<<<<<<<<<<<<<
- *         return item
- * 
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyInt_to_py_Integer(__pyx_v_index); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_2), __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_4));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_4));
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":45
- *         if status != Status_Continue:
- *             raise CLibraryError ("Index (%d) out of range." % index)
- *         return item             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = __Pyx_PyInt_to_py_Integer(__pyx_v_item); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.__getitem__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":48
- * 
- * 
- *     def __setitem__ (self, Integer index, Integer value):             # <<<<<<<<<<<<<<
- *         """Set an item."""
- *         cdef Status status = Status_Continue
- */
-
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__(PyObject *__pyx_v_self, PyObject *__pyx_arg_index, PyObject *__pyx_arg_value); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__[] = "Set an item.";
-struct wrapperbase __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__;
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__(PyObject *__pyx_v_self, PyObject *__pyx_arg_index, PyObject *__pyx_arg_value) {
-  Integer __pyx_v_index;
-  Integer __pyx_v_value;
-  Status __pyx_v_status;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setitem__");
-  assert(__pyx_arg_index); {
-    __pyx_v_index = __Pyx_PyInt_from_py_Integer(__pyx_arg_index); if (unlikely((__pyx_v_index == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  assert(__pyx_arg_value); {
-    __pyx_v_value = __Pyx_PyInt_from_py_Integer(__pyx_arg_value); if (unlikely((__pyx_v_value == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.__setitem__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":50
- *     def __setitem__ (self, Integer index, Integer value):
- *         """Set an item."""
- *         cdef Status status = Status_Continue             # <<<<<<<<<<<<<<
- *         StateVector_SetItem (self.cObject, index, value, &status)
- *         if status != Status_Continue:
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":51
- *         """Set an item."""
- *         cdef Status status = Status_Continue
- *         StateVector_SetItem (self.cObject, index, value, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             if status == Status_IndexOutOfRange:
- */
-  StateVector_SetItem(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_index, __pyx_v_value, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":52
- *         cdef Status status = Status_Continue
- *         StateVector_SetItem (self.cObject, index, value, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             if status == Status_IndexOutOfRange:
- *                 raise CLibraryError ("Index (%d) out of range." % index)
- */
-  __pyx_t_1 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":53
- *         StateVector_SetItem (self.cObject, index, value, &status)
- *         if status != Status_Continue:
- *             if status == Status_IndexOutOfRange:             # <<<<<<<<<<<<<<
- *                 raise CLibraryError ("Index (%d) out of range." % index)
- *             else: # Status_ValueError
- */
-    __pyx_t_1 = (__pyx_v_status == Status_IndexOutOfRange);
-    if (__pyx_t_1) {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":54
- *         if status != Status_Continue:
- *             if status == Status_IndexOutOfRange:
- *                 raise CLibraryError ("Index (%d) out of range." % index)             # <<<<<<<<<<<<<<
- *             else: # Status_ValueError
- *                 raise CLibraryError ("Invalid value (%d)." % value)
- */
-      __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = __Pyx_PyInt_to_py_Integer(__pyx_v_index); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_2), __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_4));
-      __Pyx_GIVEREF(((PyObject *)__pyx_t_4));
-      __pyx_t_4 = 0;
-      __pyx_t_4 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L6;
-    }
-    /*else*/ {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":56
- *                 raise CLibraryError ("Index (%d) out of range." % index)
- *             else: # Status_ValueError
- *                 raise CLibraryError ("Invalid value (%d)." % value)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-      __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = __Pyx_PyInt_to_py_Integer(__pyx_v_value); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_3), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_2));
-      __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-      __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_L6:;
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.__setitem__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":59
- * 
- * 
- *     def GetActualItem (self, Integer index):             # <<<<<<<<<<<<<<
- *         """Get an actual item."""
- *         cdef Integer item
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7GetActualItem(PyObject *__pyx_v_self, PyObject *__pyx_arg_index); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_7GetActualItem[] = "Get an actual item.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7GetActualItem(PyObject *__pyx_v_self, PyObject *__pyx_arg_index) {
-  Integer __pyx_v_index;
-  Integer __pyx_v_item;
-  Status __pyx_v_status;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("GetActualItem");
-  assert(__pyx_arg_index); {
-    __pyx_v_index = __Pyx_PyInt_from_py_Integer(__pyx_arg_index); if (unlikely((__pyx_v_index == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.GetActualItem", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":62
- *         """Get an actual item."""
- *         cdef Integer item
- *         cdef Status  status = Status_Continue             # <<<<<<<<<<<<<<
- *         item = StateVector_GetActualItem (self.cObject, index, &status)
- *         if status != Status_Continue:
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":63
- *         cdef Integer item
- *         cdef Status  status = Status_Continue
- *         item = StateVector_GetActualItem (self.cObject, index, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             raise CLibraryError ("Index (%d) out of range." % index)
- */
-  __pyx_v_item = StateVector_GetActualItem(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_index, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":64
- *         cdef Status  status = Status_Continue
- *         item = StateVector_GetActualItem (self.cObject, index, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Index (%d) out of range." % index)
- *         return item
- */
-  __pyx_t_1 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":65
- *         item = StateVector_GetActualItem (self.cObject, index, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Index (%d) out of range." % index)             # <<<<<<<<<<<<<<
- *         return item
- * 
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyInt_to_py_Integer(__pyx_v_index); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_2), __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_4));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_4));
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":66
- *         if status != Status_Continue:
- *             raise CLibraryError ("Index (%d) out of range." % index)
- *         return item             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = __Pyx_PyInt_to_py_Integer(__pyx_v_item); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.GetActualItem", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":69
- * 
- * 
- *     def SetActualItem (self, Integer index, Integer value):             # <<<<<<<<<<<<<<
- *         """Set an actual item."""
- *         cdef Status status = Status_Continue
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_8SetActualItem(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_8SetActualItem[] = "Set an actual item.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_8SetActualItem(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  Integer __pyx_v_index;
-  Integer __pyx_v_value;
-  Status __pyx_v_status;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__index,&__pyx_n_s__value,0};
-  __Pyx_RefNannySetupContext("SetActualItem");
-  {
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__index);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__value);
-        if (likely(values[1])) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("SetActualItem", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "SetActualItem") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_index = __Pyx_PyInt_from_py_Integer(values[0]); if (unlikely((__pyx_v_index == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_value = __Pyx_PyInt_from_py_Integer(values[1]); if (unlikely((__pyx_v_value == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("SetActualItem", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.SetActualItem", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":71
- *     def SetActualItem (self, Integer index, Integer value):
- *         """Set an actual item."""
- *         cdef Status status = Status_Continue             # <<<<<<<<<<<<<<
- *         StateVector_SetActualItem (self.cObject, index, value, &status)
- *         if status != Status_Continue:
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":72
- *         """Set an actual item."""
- *         cdef Status status = Status_Continue
- *         StateVector_SetActualItem (self.cObject, index, value, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             if status == Status_IndexOutOfRange:
- */
-  StateVector_SetActualItem(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_index, __pyx_v_value, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":73
- *         cdef Status status = Status_Continue
- *         StateVector_SetActualItem (self.cObject, index, value, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             if status == Status_IndexOutOfRange:
- *                 raise CLibraryError ("Index (%d) out of range." % index)
- */
-  __pyx_t_1 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":74
- *         StateVector_SetActualItem (self.cObject, index, value, &status)
- *         if status != Status_Continue:
- *             if status == Status_IndexOutOfRange:             # <<<<<<<<<<<<<<
- *                 raise CLibraryError ("Index (%d) out of range." % index)
- *             else: # Status_ValueError
- */
-    __pyx_t_1 = (__pyx_v_status == Status_IndexOutOfRange);
-    if (__pyx_t_1) {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":75
- *         if status != Status_Continue:
- *             if status == Status_IndexOutOfRange:
- *                 raise CLibraryError ("Index (%d) out of range." % index)             # <<<<<<<<<<<<<<
- *             else: # Status_ValueError
- *                 raise CLibraryError ("Invalid value (%d)." % value)
- */
-      __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = __Pyx_PyInt_to_py_Integer(__pyx_v_index); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_2), __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_4));
-      __Pyx_GIVEREF(((PyObject *)__pyx_t_4));
-      __pyx_t_4 = 0;
-      __pyx_t_4 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L7;
-    }
-    /*else*/ {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":77
- *                 raise CLibraryError ("Index (%d) out of range." % index)
- *             else: # Status_ValueError
- *                 raise CLibraryError ("Invalid value (%d)." % value)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-      __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = __Pyx_PyInt_to_py_Integer(__pyx_v_value); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_3), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_2));
-      __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-      __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_L7:;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.SetActualItem", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":80
- * 
- * 
- *     def __init__ (self, ceModel):             # <<<<<<<<<<<<<<
- *         """Constructor."""
- *         cdef Status  status
- */
-
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__[] = "Constructor.";
-struct wrapperbase __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__;
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_ceModel = 0;
-  Status __pyx_v_status;
-  Integer __pyx_v_numberOfSites;
-  Integer __pyx_v_indexSite;
-  Integer __pyx_v_indexDown;
-  Integer __pyx_v_indexUp;
-  Integer __pyx_v_index;
-  PyObject *__pyx_v_site = NULL;
-  PyObject *__pyx_v_instance = NULL;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Integer __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  PyObject *(*__pyx_t_6)(PyObject *);
-  Integer __pyx_t_7;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__ceModel,0};
-  __Pyx_RefNannySetupContext("__init__");
-  {
-    PyObject* values[1] = {0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__ceModel);
-        if (likely(values[0])) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-    }
-    __pyx_v_ceModel = values[0];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":85
- *         cdef Integer numberOfSites
- *         cdef Integer indexSite, indexDown, indexUp, index
- *         status        = Status_Continue             # <<<<<<<<<<<<<<
- *         numberOfSites = ceModel.nsites
- *         self.cObject  = StateVector_Allocate (numberOfSites, &status)
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":86
- *         cdef Integer indexSite, indexDown, indexUp, index
- *         status        = Status_Continue
- *         numberOfSites = ceModel.nsites             # <<<<<<<<<<<<<<
- *         self.cObject  = StateVector_Allocate (numberOfSites, &status)
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__nsites); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_from_py_Integer(__pyx_t_1); if (unlikely((__pyx_t_2 == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_numberOfSites = __pyx_t_2;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":87
- *         status        = Status_Continue
- *         numberOfSites = ceModel.nsites
- *         self.cObject  = StateVector_Allocate (numberOfSites, &status)             # <<<<<<<<<<<<<<
- * 
- *         if status != Status_Continue:
- */
-  ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject = StateVector_Allocate(__pyx_v_numberOfSites, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":89
- *         self.cObject  = StateVector_Allocate (numberOfSites, &status)
- * 
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Cannot allocate state vector.")
- * 
- */
-  __pyx_t_3 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_3) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":90
- * 
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate state vector.")             # <<<<<<<<<<<<<<
- * 
- *         for indexSite from 0 <= indexSite < numberOfSites:
- */
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_k_tuple_5), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":92
- *             raise CLibraryError ("Cannot allocate state vector.")
- * 
- *         for indexSite from 0 <= indexSite < numberOfSites:             # <<<<<<<<<<<<<<
- *             indexUp   = 0
- *             indexDown = 9999
- */
-  __pyx_t_2 = __pyx_v_numberOfSites;
-  for (__pyx_v_indexSite = 0; __pyx_v_indexSite < __pyx_t_2; __pyx_v_indexSite++) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":93
- * 
- *         for indexSite from 0 <= indexSite < numberOfSites:
- *             indexUp   = 0             # <<<<<<<<<<<<<<
- *             indexDown = 9999
- *             site      = ceModel.sites[indexSite]
- */
-    __pyx_v_indexUp = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":94
- *         for indexSite from 0 <= indexSite < numberOfSites:
- *             indexUp   = 0
- *             indexDown = 9999             # <<<<<<<<<<<<<<
- *             site      = ceModel.sites[indexSite]
- *             for instance in site.instances:
- */
-    __pyx_v_indexDown = 9999;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":95
- *             indexUp   = 0
- *             indexDown = 9999
- *             site      = ceModel.sites[indexSite]             # <<<<<<<<<<<<<<
- *             for instance in site.instances:
- *                 index = instance._instIndexGlobal
- */
-    __pyx_t_4 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__sites); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_indexSite, sizeof(Integer), __Pyx_PyInt_to_py_Integer); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_XDECREF(__pyx_v_site);
-    __pyx_v_site = __pyx_t_1;
-    __pyx_t_1 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":96
- *             indexDown = 9999
- *             site      = ceModel.sites[indexSite]
- *             for instance in site.instances:             # <<<<<<<<<<<<<<
- *                 index = instance._instIndexGlobal
- *                 if index < indexDown : indexDown = index
- */
-    __pyx_t_1 = PyObject_GetAttr(__pyx_v_site, __pyx_n_s__instances); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
-      __pyx_t_4 = __pyx_t_1; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
-      __pyx_t_6 = NULL;
-    } else {
-      __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    for (;;) {
-      if (PyList_CheckExact(__pyx_t_4)) {
-        if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++;
-      } else if (PyTuple_CheckExact(__pyx_t_4)) {
-        if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++;
-      } else {
-        __pyx_t_1 = __pyx_t_6(__pyx_t_4);
-        if (unlikely(!__pyx_t_1)) {
-          if (PyErr_Occurred()) {
-            if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) PyErr_Clear();
-            else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          }
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_1);
-      }
-      __Pyx_XDECREF(__pyx_v_instance);
-      __pyx_v_instance = __pyx_t_1;
-      __pyx_t_1 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":97
- *             site      = ceModel.sites[indexSite]
- *             for instance in site.instances:
- *                 index = instance._instIndexGlobal             # <<<<<<<<<<<<<<
- *                 if index < indexDown : indexDown = index
- *                 if index > indexUp   : indexUp   = index
- */
-      __pyx_t_1 = PyObject_GetAttr(__pyx_v_instance, __pyx_n_s___instIndexGlobal); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_7 = __Pyx_PyInt_from_py_Integer(__pyx_t_1); if (unlikely((__pyx_t_7 == (Integer)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_v_index = __pyx_t_7;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":98
- *             for instance in site.instances:
- *                 index = instance._instIndexGlobal
- *                 if index < indexDown : indexDown = index             # <<<<<<<<<<<<<<
- *                 if index > indexUp   : indexUp   = index
- *             StateVector_SetSite (self.cObject, indexSite, indexDown, indexUp, &status)
- */
-      __pyx_t_3 = (__pyx_v_index < __pyx_v_indexDown);
-      if (__pyx_t_3) {
-        __pyx_v_indexDown = __pyx_v_index;
-        goto __pyx_L11;
-      }
-      __pyx_L11:;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":99
- *                 index = instance._instIndexGlobal
- *                 if index < indexDown : indexDown = index
- *                 if index > indexUp   : indexUp   = index             # <<<<<<<<<<<<<<
- *             StateVector_SetSite (self.cObject, indexSite, indexDown, indexUp, &status)
- * 
- */
-      __pyx_t_3 = (__pyx_v_index > __pyx_v_indexUp);
-      if (__pyx_t_3) {
-        __pyx_v_indexUp = __pyx_v_index;
-        goto __pyx_L12;
-      }
-      __pyx_L12:;
-    }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":100
- *                 if index < indexDown : indexDown = index
- *                 if index > indexUp   : indexUp   = index
- *             StateVector_SetSite (self.cObject, indexSite, indexDown, indexUp, &status)             # <<<<<<<<<<<<<<
- * 
- *         self.isOwner = False
- */
-    StateVector_SetSite(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_indexSite, __pyx_v_indexDown, __pyx_v_indexUp, (&__pyx_v_status));
-  }
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":102
- *             StateVector_SetSite (self.cObject, indexSite, indexDown, indexUp, &status)
- * 
- *         self.isOwner = False             # <<<<<<<<<<<<<<
- *         self.owner   = ceModel
- * 
- */
-  __pyx_t_4 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_4);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner = __pyx_t_4;
-  __pyx_t_4 = 0;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":103
- * 
- *         self.isOwner = False
- *         self.owner   = ceModel             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_INCREF(__pyx_v_ceModel);
-  __Pyx_GIVEREF(__pyx_v_ceModel);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner = __pyx_v_ceModel;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_site);
-  __Pyx_XDECREF(__pyx_v_instance);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":106
- * 
- * 
- *     def CopyTo (StateVector self, StateVector other):             # <<<<<<<<<<<<<<
- *         """In-place copy of one state vector to another."""
- *         pass
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_10CopyTo(PyObject *__pyx_v_self, PyObject *__pyx_v_other); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_10CopyTo[] = "In-place copy of one state vector to another.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_10CopyTo(PyObject *__pyx_v_self, PyObject *__pyx_v_other) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("CopyTo");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other), __pyx_ptype_23ContinuumElectrostatics_11StateVector_StateVector, 1, "other", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.CopyTo", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":110
- *         pass
- * 
- *     def Increment (self):             # <<<<<<<<<<<<<<
- *         """Generate a new state incrementing the state vector.
- * 
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_11Increment(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_11Increment[] = "Generate a new state incrementing the state vector.\n\n        Return False after the incrementation has finished.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_11Increment(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  Boolean __pyx_v_moreStates;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("Increment");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":114
- * 
- *         Return False after the incrementation has finished."""
- *         cdef Boolean moreStates = StateVector_Increment (self.cObject)             # <<<<<<<<<<<<<<
- *         if moreStates != CTrue:
- *             return False
- */
-  __pyx_v_moreStates = StateVector_Increment(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":115
- *         Return False after the incrementation has finished."""
- *         cdef Boolean moreStates = StateVector_Increment (self.cObject)
- *         if moreStates != CTrue:             # <<<<<<<<<<<<<<
- *             return False
- *         else:
- */
-  __pyx_t_1 = (__pyx_v_moreStates != True);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":116
- *         cdef Boolean moreStates = StateVector_Increment (self.cObject)
- *         if moreStates != CTrue:
- *             return False             # <<<<<<<<<<<<<<
- *         else:
- *             return True
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
-    goto __pyx_L0;
-    goto __pyx_L5;
-  }
-  /*else*/ {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":118
- *             return False
- *         else:
- *             return True             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
-    goto __pyx_L0;
-  }
-  __pyx_L5:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.Increment", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":121
- * 
- * 
- *     def Reset (self):             # <<<<<<<<<<<<<<
- *         """Set all components of the vector to their minimum values (formerly zeros)."""
- *         StateVector_Reset (self.cObject)
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_12Reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_12Reset[] = "Set all components of the vector to their minimum values (formerly zeros).";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_12Reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("Reset");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":123
- *     def Reset (self):
- *         """Set all components of the vector to their minimum values (formerly zeros)."""
- *         StateVector_Reset (self.cObject)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  StateVector_Reset(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":126
- * 
- * 
- *     def ResetToMaximum (self):             # <<<<<<<<<<<<<<
- *         """Set all components of the vector to their maximum values."""
- *         StateVector_ResetToMaximum (self.cObject)
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_13ResetToMaximum(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_13ResetToMaximum[] = "Set all components of the vector to their maximum values.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_13ResetToMaximum(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("ResetToMaximum");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":128
- *     def ResetToMaximum (self):
- *         """Set all components of the vector to their maximum values."""
- *         StateVector_ResetToMaximum (self.cObject)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  StateVector_ResetToMaximum(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":131
- * 
- * 
- *     def Print (self, verbose=True, title=None, log=logFile):             # <<<<<<<<<<<<<<
- *         """Print the state vector."""
- *         cdef Integer indexSite, indexSiteSubstate, indexActive
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_14Print(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_14Print[] = "Print the state vector.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_14Print(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_verbose = 0;
-  PyObject *__pyx_v_title = 0;
-  PyObject *__pyx_v_log = 0;
-  Integer __pyx_v_indexSite;
-  Integer __pyx_v_indexActive;
-  Boolean __pyx_v_isSubstate;
-  Status __pyx_v_status;
-  PyObject *__pyx_v_tab = NULL;
-  PyObject *__pyx_v_ceModel = NULL;
-  PyObject *__pyx_v_site = NULL;
-  PyObject *__pyx_v_instance = NULL;
-  PyObject *__pyx_v_substate = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  Integer __pyx_t_5;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__verbose,&__pyx_n_s__title,&__pyx_n_s__log,0};
-  __Pyx_RefNannySetupContext("Print");
-  {
-    PyObject* values[3] = {0,0,0};
-    values[0] = __pyx_k_6;
-    values[1] = ((PyObject *)Py_None);
-    values[2] = __pyx_k_7;
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  0:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__verbose);
-          if (value) { values[0] = value; kw_args--; }
-        }
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__title);
-          if (value) { values[1] = value; kw_args--; }
-        }
-        case  2:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__log);
-          if (value) { values[2] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "Print") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_verbose = values[0];
-    __pyx_v_title = values[1];
-    __pyx_v_log = values[2];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("Print", 0, 0, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.Print", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":135
- *         cdef Integer indexSite, indexSiteSubstate, indexActive
- *         cdef Boolean isSubstate
- *         cdef Status  status = Status_Continue             # <<<<<<<<<<<<<<
- * 
- *         if LogFileActive (log):
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":137
- *         cdef Status  status = Status_Continue
- * 
- *         if LogFileActive (log):             # <<<<<<<<<<<<<<
- *             tab = log.GetTable (columns=[7, 7, 7, 8, 8, 2])
- *             tab.Start ()
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__LogFileActive); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __Pyx_INCREF(__pyx_v_log);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_log);
-  __Pyx_GIVEREF(__pyx_v_log);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__pyx_t_4) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":138
- * 
- *         if LogFileActive (log):
- *             tab = log.GetTable (columns=[7, 7, 7, 8, 8, 2])             # <<<<<<<<<<<<<<
- *             tab.Start ()
- *             if title : tab.Title (title)
- */
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_log, __pyx_n_s__GetTable); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-    __pyx_t_1 = PyList_New(6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-    __Pyx_INCREF(__pyx_int_7);
-    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_7);
-    __Pyx_GIVEREF(__pyx_int_7);
-    __Pyx_INCREF(__pyx_int_7);
-    PyList_SET_ITEM(__pyx_t_1, 1, __pyx_int_7);
-    __Pyx_GIVEREF(__pyx_int_7);
-    __Pyx_INCREF(__pyx_int_7);
-    PyList_SET_ITEM(__pyx_t_1, 2, __pyx_int_7);
-    __Pyx_GIVEREF(__pyx_int_7);
-    __Pyx_INCREF(__pyx_int_8);
-    PyList_SET_ITEM(__pyx_t_1, 3, __pyx_int_8);
-    __Pyx_GIVEREF(__pyx_int_8);
-    __Pyx_INCREF(__pyx_int_8);
-    PyList_SET_ITEM(__pyx_t_1, 4, __pyx_int_8);
-    __Pyx_GIVEREF(__pyx_int_8);
-    __Pyx_INCREF(__pyx_int_2);
-    PyList_SET_ITEM(__pyx_t_1, 5, __pyx_int_2);
-    __Pyx_GIVEREF(__pyx_int_2);
-    if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_n_s__columns), ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-    __pyx_t_1 = PyEval_CallObjectWithKeywords(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-    __pyx_v_tab = __pyx_t_1;
-    __pyx_t_1 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":139
- *         if LogFileActive (log):
- *             tab = log.GetTable (columns=[7, 7, 7, 8, 8, 2])
- *             tab.Start ()             # <<<<<<<<<<<<<<
- *             if title : tab.Title (title)
- *             else     : tab.Title ("State vector")
- */
-    __pyx_t_1 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Start); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":140
- *             tab = log.GetTable (columns=[7, 7, 7, 8, 8, 2])
- *             tab.Start ()
- *             if title : tab.Title (title)             # <<<<<<<<<<<<<<
- *             else     : tab.Title ("State vector")
- *             tab.Heading ("Site"     , columnSpan=3)
- */
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_title); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (__pyx_t_4) {
-      __pyx_t_2 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Title); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-      __Pyx_INCREF(__pyx_v_title);
-      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_title);
-      __Pyx_GIVEREF(__pyx_v_title);
-      __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      goto __pyx_L7;
-    }
-    /*else*/ {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":141
- *             tab.Start ()
- *             if title : tab.Title (title)
- *             else     : tab.Title ("State vector")             # <<<<<<<<<<<<<<
- *             tab.Heading ("Site"     , columnSpan=3)
- *             tab.Heading ("Instance" , columnSpan=3)
- */
-      __pyx_t_3 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Title); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_k_tuple_9), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    }
-    __pyx_L7:;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":142
- *             if title : tab.Title (title)
- *             else     : tab.Title ("State vector")
- *             tab.Heading ("Site"     , columnSpan=3)             # <<<<<<<<<<<<<<
- *             tab.Heading ("Instance" , columnSpan=3)
- * 
- */
-    __pyx_t_1 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Heading); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-    if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__columnSpan), __pyx_int_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_2 = PyEval_CallObjectWithKeywords(__pyx_t_1, ((PyObject *)__pyx_k_tuple_10), ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":143
- *             else     : tab.Title ("State vector")
- *             tab.Heading ("Site"     , columnSpan=3)
- *             tab.Heading ("Instance" , columnSpan=3)             # <<<<<<<<<<<<<<
- * 
- *             for indexSite from 0 <= indexSite < self.cObject.nsites:
- */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Heading); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-    if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__columnSpan), __pyx_int_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_1 = PyEval_CallObjectWithKeywords(__pyx_t_2, ((PyObject *)__pyx_k_tuple_11), ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":145
- *             tab.Heading ("Instance" , columnSpan=3)
- * 
- *             for indexSite from 0 <= indexSite < self.cObject.nsites:             # <<<<<<<<<<<<<<
- *                 indexActive = StateVector_GetItem (self.cObject, indexSite, &status)
- *                 isSubstate  = StateVector_IsSubstate (self.cObject, indexSite, &status)
- */
-    __pyx_t_5 = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject->nsites;
-    for (__pyx_v_indexSite = 0; __pyx_v_indexSite < __pyx_t_5; __pyx_v_indexSite++) {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":146
- * 
- *             for indexSite from 0 <= indexSite < self.cObject.nsites:
- *                 indexActive = StateVector_GetItem (self.cObject, indexSite, &status)             # <<<<<<<<<<<<<<
- *                 isSubstate  = StateVector_IsSubstate (self.cObject, indexSite, &status)
- *                 ceModel     = self.owner
- */
-      __pyx_v_indexActive = StateVector_GetItem(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_indexSite, (&__pyx_v_status));
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":147
- *             for indexSite from 0 <= indexSite < self.cObject.nsites:
- *                 indexActive = StateVector_GetItem (self.cObject, indexSite, &status)
- *                 isSubstate  = StateVector_IsSubstate (self.cObject, indexSite, &status)             # <<<<<<<<<<<<<<
- *                 ceModel     = self.owner
- *                 site        = ceModel.sites[indexSite]
- */
-      __pyx_v_isSubstate = StateVector_IsSubstate(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_indexSite, (&__pyx_v_status));
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":148
- *                 indexActive = StateVector_GetItem (self.cObject, indexSite, &status)
- *                 isSubstate  = StateVector_IsSubstate (self.cObject, indexSite, &status)
- *                 ceModel     = self.owner             # <<<<<<<<<<<<<<
- *                 site        = ceModel.sites[indexSite]
- *                 instance    = site.instances[indexActive]
- */
-      __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-      __Pyx_XDECREF(__pyx_v_ceModel);
-      __pyx_v_ceModel = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":149
- *                 isSubstate  = StateVector_IsSubstate (self.cObject, indexSite, &status)
- *                 ceModel     = self.owner
- *                 site        = ceModel.sites[indexSite]             # <<<<<<<<<<<<<<
- *                 instance    = site.instances[indexActive]
- *                 substate    = "@" if isSubstate == CTrue else " "
- */
-      __pyx_t_1 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__sites); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_indexSite, sizeof(Integer), __Pyx_PyInt_to_py_Integer); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_XDECREF(__pyx_v_site);
-      __pyx_v_site = __pyx_t_3;
-      __pyx_t_3 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":150
- *                 ceModel     = self.owner
- *                 site        = ceModel.sites[indexSite]
- *                 instance    = site.instances[indexActive]             # <<<<<<<<<<<<<<
- *                 substate    = "@" if isSubstate == CTrue else " "
- * 
- */
-      __pyx_t_3 = PyObject_GetAttr(__pyx_v_site, __pyx_n_s__instances); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_indexActive, sizeof(Integer), __Pyx_PyInt_to_py_Integer); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_v_instance);
-      __pyx_v_instance = __pyx_t_1;
-      __pyx_t_1 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":151
- *                 site        = ceModel.sites[indexSite]
- *                 instance    = site.instances[indexActive]
- *                 substate    = "@" if isSubstate == CTrue else " "             # <<<<<<<<<<<<<<
- * 
- *                 tab.Entry (site.segName)
- */
-      if ((__pyx_v_isSubstate == True)) {
-        __Pyx_INCREF(((PyObject *)__pyx_kp_s_12));
-        __pyx_t_1 = __pyx_kp_s_12;
-      } else {
-        __Pyx_INCREF(((PyObject *)__pyx_kp_s_13));
-        __pyx_t_1 = __pyx_kp_s_13;
-      }
-      __Pyx_XDECREF(__pyx_v_substate);
-      __pyx_v_substate = ((PyObject *)__pyx_t_1);
-      __pyx_t_1 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":153
- *                 substate    = "@" if isSubstate == CTrue else " "
- * 
- *                 tab.Entry (site.segName)             # <<<<<<<<<<<<<<
- *                 tab.Entry (site.resName)
- *                 tab.Entry ("%d" % site.resSerial)
- */
-      __pyx_t_1 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Entry); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = PyObject_GetAttr(__pyx_v_site, __pyx_n_s__segName); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":154
- * 
- *                 tab.Entry (site.segName)
- *                 tab.Entry (site.resName)             # <<<<<<<<<<<<<<
- *                 tab.Entry ("%d" % site.resSerial)
- *                 tab.Entry (instance.label)
- */
-      __pyx_t_3 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Entry); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_2 = PyObject_GetAttr(__pyx_v_site, __pyx_n_s__resName); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":155
- *                 tab.Entry (site.segName)
- *                 tab.Entry (site.resName)
- *                 tab.Entry ("%d" % site.resSerial)             # <<<<<<<<<<<<<<
- *                 tab.Entry (instance.label)
- *                 tab.Entry ("%d" % instance.instIndex)
- */
-      __pyx_t_2 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Entry); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_1 = PyObject_GetAttr(__pyx_v_site, __pyx_n_s__resSerial); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_14), __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-      PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_t_3));
-      __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":156
- *                 tab.Entry (site.resName)
- *                 tab.Entry ("%d" % site.resSerial)
- *                 tab.Entry (instance.label)             # <<<<<<<<<<<<<<
- *                 tab.Entry ("%d" % instance.instIndex)
- *                 tab.Entry (substate)
- */
-      __pyx_t_3 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Entry); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = PyObject_GetAttr(__pyx_v_instance, __pyx_n_s__label); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-      __Pyx_GIVEREF(__pyx_t_1);
-      __pyx_t_1 = 0;
-      __pyx_t_1 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":157
- *                 tab.Entry ("%d" % site.resSerial)
- *                 tab.Entry (instance.label)
- *                 tab.Entry ("%d" % instance.instIndex)             # <<<<<<<<<<<<<<
- *                 tab.Entry (substate)
- *             tab.Stop ()
- */
-      __pyx_t_1 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Entry); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = PyObject_GetAttr(__pyx_v_instance, __pyx_n_s__instIndex); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_14), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
-      __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":158
- *                 tab.Entry (instance.label)
- *                 tab.Entry ("%d" % instance.instIndex)
- *                 tab.Entry (substate)             # <<<<<<<<<<<<<<
- *             tab.Stop ()
- * 
- */
-      __pyx_t_3 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Entry); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-      __Pyx_INCREF(__pyx_v_substate);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_substate);
-      __Pyx_GIVEREF(__pyx_v_substate);
-      __pyx_t_1 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    }
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":159
- *                 tab.Entry ("%d" % instance.instIndex)
- *                 tab.Entry (substate)
- *             tab.Stop ()             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_t_1 = PyObject_GetAttr(__pyx_v_tab, __pyx_n_s__Stop); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.Print", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_tab);
-  __Pyx_XDECREF(__pyx_v_ceModel);
-  __Pyx_XDECREF(__pyx_v_site);
-  __Pyx_XDECREF(__pyx_v_instance);
-  __Pyx_XDECREF(__pyx_v_substate);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":163
- * 
- * # Try to further improve this method with data types from C
- *     def DefineSubstate (self, selectedSites):             # <<<<<<<<<<<<<<
- *         """Define a substate.
- * 
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_15DefineSubstate(PyObject *__pyx_v_self, PyObject *__pyx_v_selectedSites); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_15DefineSubstate[] = "Define a substate.\n\n        |selectedSites| is a sequence of two-element sequences (segmentName, residueSerial)";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_15DefineSubstate(PyObject *__pyx_v_self, PyObject *__pyx_v_selectedSites) {
-  Integer __pyx_v_siteIndex;
-  Integer __pyx_v_substateSiteIndex;
-  Integer __pyx_v_nselected;
-  Integer __pyx_v_nsites;
-  Boolean __pyx_v_foundSite;
-  Status __pyx_v_status;
-  PyObject *__pyx_v_ceModel = NULL;
-  PyObject *__pyx_v_selectedSegment = NULL;
-  PyObject *__pyx_v_selectedSerial = NULL;
-  PyObject *__pyx_v_site = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  Integer __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *(*__pyx_t_8)(PyObject *);
-  Integer __pyx_t_9;
-  int __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("DefineSubstate");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":170
- *         cdef Boolean foundSite
- *         cdef Status  status
- *         ceModel    = self.owner             # <<<<<<<<<<<<<<
- *         nsites     = len (ceModel.sites)
- *         nselected  = len (selectedSites)
- */
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-  __pyx_v_ceModel = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":171
- *         cdef Status  status
- *         ceModel    = self.owner
- *         nsites     = len (ceModel.sites)             # <<<<<<<<<<<<<<
- *         nselected  = len (selectedSites)
- *         status     = Status_Continue
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__sites); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_nsites = __pyx_t_2;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":172
- *         ceModel    = self.owner
- *         nsites     = len (ceModel.sites)
- *         nselected  = len (selectedSites)             # <<<<<<<<<<<<<<
- *         status     = Status_Continue
- * 
- */
-  __pyx_t_2 = PyObject_Length(__pyx_v_selectedSites); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_nselected = __pyx_t_2;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":173
- *         nsites     = len (ceModel.sites)
- *         nselected  = len (selectedSites)
- *         status     = Status_Continue             # <<<<<<<<<<<<<<
- * 
- *         StateVector_AllocateSubstate (self.cObject, nselected, &status)
- */
-  __pyx_v_status = Status_Continue;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":175
- *         status     = Status_Continue
- * 
- *         StateVector_AllocateSubstate (self.cObject, nselected, &status)             # <<<<<<<<<<<<<<
- *         if status != Status_Continue:
- *             raise CLibraryError ("Memory allocation failure.")
- */
-  StateVector_AllocateSubstate(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_nselected, (&__pyx_v_status));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":176
- * 
- *         StateVector_AllocateSubstate (self.cObject, nselected, &status)
- *         if status != Status_Continue:             # <<<<<<<<<<<<<<
- *             raise CLibraryError ("Memory allocation failure.")
- * 
- */
-  __pyx_t_3 = (__pyx_v_status != Status_Continue);
-  if (__pyx_t_3) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":177
- *         StateVector_AllocateSubstate (self.cObject, nselected, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Memory allocation failure.")             # <<<<<<<<<<<<<<
- * 
- *         for substateSiteIndex from 0 <= substateSiteIndex < nselected:
- */
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_k_tuple_16), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":179
- *             raise CLibraryError ("Memory allocation failure.")
- * 
- *         for substateSiteIndex from 0 <= substateSiteIndex < nselected:             # <<<<<<<<<<<<<<
- *             selectedSegment, selectedSerial = selectedSites[substateSiteIndex]
- *             foundSite = CFalse
- */
-  __pyx_t_5 = __pyx_v_nselected;
-  for (__pyx_v_substateSiteIndex = 0; __pyx_v_substateSiteIndex < __pyx_t_5; __pyx_v_substateSiteIndex++) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":180
- * 
- *         for substateSiteIndex from 0 <= substateSiteIndex < nselected:
- *             selectedSegment, selectedSerial = selectedSites[substateSiteIndex]             # <<<<<<<<<<<<<<
- *             foundSite = CFalse
- * 
- */
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_selectedSites, __pyx_v_substateSiteIndex, sizeof(Integer), __Pyx_PyInt_to_py_Integer); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    if ((likely(PyTuple_CheckExact(__pyx_t_4))) || (PyList_CheckExact(__pyx_t_4))) {
-      PyObject* sequence = __pyx_t_4;
-      if (likely(PyTuple_CheckExact(sequence))) {
-        if (unlikely(PyTuple_GET_SIZE(sequence) != 2)) {
-          if (PyTuple_GET_SIZE(sequence) > 2) __Pyx_RaiseTooManyValuesError(2);
-          else __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(sequence));
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
-        __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
-      } else {
-        if (unlikely(PyList_GET_SIZE(sequence) != 2)) {
-          if (PyList_GET_SIZE(sequence) > 2) __Pyx_RaiseTooManyValuesError(2);
-          else __Pyx_RaiseNeedMoreValuesError(PyList_GET_SIZE(sequence));
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
-        __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
-      }
-      __Pyx_INCREF(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    } else {
-      Py_ssize_t index = -1;
-      __pyx_t_7 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_8 = Py_TYPE(__pyx_t_7)->tp_iternext;
-      index = 0; __pyx_t_1 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_1)) goto __pyx_L8_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_1);
-      index = 1; __pyx_t_6 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_6)) goto __pyx_L8_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_6);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_7), 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      goto __pyx_L9_unpacking_done;
-      __pyx_L8_unpacking_failed:;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (PyErr_Occurred() && PyErr_ExceptionMatches(PyExc_StopIteration)) PyErr_Clear();
-      if (!PyErr_Occurred()) __Pyx_RaiseNeedMoreValuesError(index);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_L9_unpacking_done:;
-    }
-    __Pyx_XDECREF(__pyx_v_selectedSegment);
-    __pyx_v_selectedSegment = __pyx_t_1;
-    __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_v_selectedSerial);
-    __pyx_v_selectedSerial = __pyx_t_6;
-    __pyx_t_6 = 0;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":181
- *         for substateSiteIndex from 0 <= substateSiteIndex < nselected:
- *             selectedSegment, selectedSerial = selectedSites[substateSiteIndex]
- *             foundSite = CFalse             # <<<<<<<<<<<<<<
- * 
- *             for siteIndex from 0 <= siteIndex < nsites:
- */
-    __pyx_v_foundSite = False;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":183
- *             foundSite = CFalse
- * 
- *             for siteIndex from 0 <= siteIndex < nsites:             # <<<<<<<<<<<<<<
- *                 site = ceModel.sites[siteIndex]
- *                 if site.segName == selectedSegment and site.resSerial == selectedSerial:
- */
-    __pyx_t_9 = __pyx_v_nsites;
-    for (__pyx_v_siteIndex = 0; __pyx_v_siteIndex < __pyx_t_9; __pyx_v_siteIndex++) {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":184
- * 
- *             for siteIndex from 0 <= siteIndex < nsites:
- *                 site = ceModel.sites[siteIndex]             # <<<<<<<<<<<<<<
- *                 if site.segName == selectedSegment and site.resSerial == selectedSerial:
- *                     StateVector_SetSubstateItem (self.cObject, siteIndex, substateSiteIndex, &status)
- */
-      __pyx_t_4 = PyObject_GetAttr(__pyx_v_ceModel, __pyx_n_s__sites); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_siteIndex, sizeof(Integer), __Pyx_PyInt_to_py_Integer); if (!__pyx_t_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_XDECREF(__pyx_v_site);
-      __pyx_v_site = __pyx_t_6;
-      __pyx_t_6 = 0;
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":185
- *             for siteIndex from 0 <= siteIndex < nsites:
- *                 site = ceModel.sites[siteIndex]
- *                 if site.segName == selectedSegment and site.resSerial == selectedSerial:             # <<<<<<<<<<<<<<
- *                     StateVector_SetSubstateItem (self.cObject, siteIndex, substateSiteIndex, &status)
- *                     foundSite = CTrue
- */
-      __pyx_t_6 = PyObject_GetAttr(__pyx_v_site, __pyx_n_s__segName); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_t_6, __pyx_v_selectedSegment, Py_EQ); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (__pyx_t_3) {
-        __pyx_t_4 = PyObject_GetAttr(__pyx_v_site, __pyx_n_s__resSerial); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_6 = PyObject_RichCompare(__pyx_t_4, __pyx_v_selectedSerial, Py_EQ); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_11 = __pyx_t_10;
-      } else {
-        __pyx_t_11 = __pyx_t_3;
-      }
-      if (__pyx_t_11) {
-
-        /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":186
- *                 site = ceModel.sites[siteIndex]
- *                 if site.segName == selectedSegment and site.resSerial == selectedSerial:
- *                     StateVector_SetSubstateItem (self.cObject, siteIndex, substateSiteIndex, &status)             # <<<<<<<<<<<<<<
- *                     foundSite = CTrue
- *                     break
- */
-        StateVector_SetSubstateItem(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject, __pyx_v_siteIndex, __pyx_v_substateSiteIndex, (&__pyx_v_status));
-
-        /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":187
- *                 if site.segName == selectedSegment and site.resSerial == selectedSerial:
- *                     StateVector_SetSubstateItem (self.cObject, siteIndex, substateSiteIndex, &status)
- *                     foundSite = CTrue             # <<<<<<<<<<<<<<
- *                     break
- * 
- */
-        __pyx_v_foundSite = True;
-
-        /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":188
- *                     StateVector_SetSubstateItem (self.cObject, siteIndex, substateSiteIndex, &status)
- *                     foundSite = CTrue
- *                     break             # <<<<<<<<<<<<<<
- * 
- *             if foundSite == CFalse:
- */
-        goto __pyx_L11_break;
-        goto __pyx_L12;
-      }
-      __pyx_L12:;
-    }
-    __pyx_L11_break:;
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":190
- *                     break
- * 
- *             if foundSite == CFalse:             # <<<<<<<<<<<<<<
- *                 raise CLibraryError ("Site %s %d not found." % (selectedSegment, selectedSerial))
- * 
- */
-    __pyx_t_11 = (__pyx_v_foundSite == False);
-    if (__pyx_t_11) {
-
-      /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":191
- * 
- *             if foundSite == CFalse:
- *                 raise CLibraryError ("Site %s %d not found." % (selectedSegment, selectedSerial))             # <<<<<<<<<<<<<<
- * 
- * 
- */
-      __pyx_t_6 = __Pyx_GetName(__pyx_m, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-      __Pyx_INCREF(__pyx_v_selectedSegment);
-      PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_selectedSegment);
-      __Pyx_GIVEREF(__pyx_v_selectedSegment);
-      __Pyx_INCREF(__pyx_v_selectedSerial);
-      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_selectedSerial);
-      __Pyx_GIVEREF(__pyx_v_selectedSerial);
-      __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_17), ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-      __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
-      __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_1));
-      __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-      __pyx_t_1 = 0;
-      __pyx_t_1 = PyObject_Call(__pyx_t_6, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
-      __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L13;
-    }
-    __pyx_L13:;
-  }
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.DefineSubstate", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ceModel);
-  __Pyx_XDECREF(__pyx_v_selectedSegment);
-  __Pyx_XDECREF(__pyx_v_selectedSerial);
-  __Pyx_XDECREF(__pyx_v_site);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":194
- * 
- * 
- *     def IncrementSubstate (self):             # <<<<<<<<<<<<<<
- *         """Generate a new substate.
- * 
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_16IncrementSubstate(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_16IncrementSubstate[] = "Generate a new substate.\n\n        Return False after the incrementation has finished.";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_16IncrementSubstate(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  Boolean __pyx_v_moreStates;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("IncrementSubstate");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":198
- * 
- *         Return False after the incrementation has finished."""
- *         cdef Boolean moreStates = StateVector_IncrementSubstate (self.cObject)             # <<<<<<<<<<<<<<
- *         if moreStates != CTrue:
- *             return False
- */
-  __pyx_v_moreStates = StateVector_IncrementSubstate(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject);
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":199
- *         Return False after the incrementation has finished."""
- *         cdef Boolean moreStates = StateVector_IncrementSubstate (self.cObject)
- *         if moreStates != CTrue:             # <<<<<<<<<<<<<<
- *             return False
- *         else:
- */
-  __pyx_t_1 = (__pyx_v_moreStates != True);
-  if (__pyx_t_1) {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":200
- *         cdef Boolean moreStates = StateVector_IncrementSubstate (self.cObject)
- *         if moreStates != CTrue:
- *             return False             # <<<<<<<<<<<<<<
- *         else:
- *             return True
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
-    goto __pyx_L0;
-    goto __pyx_L5;
-  }
-  /*else*/ {
-
-    /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":202
- *             return False
- *         else:
- *             return True             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
-    goto __pyx_L0;
-  }
-  __pyx_L5:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("ContinuumElectrostatics.StateVector.StateVector.IncrementSubstate", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":205
- * 
- * 
- *     def ResetSubstate (self):             # <<<<<<<<<<<<<<
- *         """Set all components of the substate to their minimum values (formerly zeros)."""
- *         StateVector_ResetSubstate (self.cObject)
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_17ResetSubstate(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_17ResetSubstate[] = "Set all components of the substate to their minimum values (formerly zeros).";
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_17ResetSubstate(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("ResetSubstate");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":207
- *     def ResetSubstate (self):
- *         """Set all components of the substate to their minimum values (formerly zeros)."""
- *         StateVector_ResetSubstate (self.cObject)             # <<<<<<<<<<<<<<
- */
-  StateVector_ResetSubstate(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->cObject);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pxd":71
- * cdef class StateVector:
- *     cdef CStateVector     *cObject
- *     cdef public object  isOwner             # <<<<<<<<<<<<<<
- *     cdef public object  owner
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__get__");
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner);
-  __pyx_r = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner_1__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner_1__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__set__");
-  __Pyx_INCREF(__pyx_v_value);
-  __Pyx_GIVEREF(__pyx_v_value);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner = __pyx_v_value;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner_2__del__(PyObject *__pyx_v_self); /*proto*/
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner_2__del__(PyObject *__pyx_v_self) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__del__");
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->isOwner = Py_None;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pxd":72
- *     cdef CStateVector     *cObject
- *     cdef public object  isOwner
- *     cdef public object  owner             # <<<<<<<<<<<<<<
- */
-
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__get__");
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-  __pyx_r = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner_1__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner_1__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__set__");
-  __Pyx_INCREF(__pyx_v_value);
-  __Pyx_GIVEREF(__pyx_v_value);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner = __pyx_v_value;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner_2__del__(PyObject *__pyx_v_self); /*proto*/
-static int __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner_2__del__(PyObject *__pyx_v_self) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__del__");
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-  __Pyx_DECREF(((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner);
-  ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)__pyx_v_self)->owner = Py_None;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_tp_new_23ContinuumElectrostatics_11StateVector_StateVector(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)o);
-  p->isOwner = Py_None; Py_INCREF(Py_None);
-  p->owner = Py_None; Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_23ContinuumElectrostatics_11StateVector_StateVector(PyObject *o) {
-  struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *p = (struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)o;
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_2__dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_XDECREF(p->isOwner);
-  Py_XDECREF(p->owner);
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_23ContinuumElectrostatics_11StateVector_StateVector(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *p = (struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)o;
-  if (p->isOwner) {
-    e = (*v)(p->isOwner, a); if (e) return e;
-  }
-  if (p->owner) {
-    e = (*v)(p->owner, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_23ContinuumElectrostatics_11StateVector_StateVector(PyObject *o) {
-  struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *p = (struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->isOwner);
-  p->isOwner = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->owner);
-  p->owner = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-static PyObject *__pyx_sq_item_23ContinuumElectrostatics_11StateVector_StateVector(PyObject *o, Py_ssize_t i) {
-  PyObject *r;
-  PyObject *x = PyInt_FromSsize_t(i); if(!x) return 0;
-  r = Py_TYPE(o)->tp_as_mapping->mp_subscript(o, x);
-  Py_DECREF(x);
-  return r;
-}
-
-static int __pyx_mp_ass_subscript_23ContinuumElectrostatics_11StateVector_StateVector(PyObject *o, PyObject *i, PyObject *v) {
-  if (v) {
-    return __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__(o, i, v);
-  }
-  else {
-    PyErr_Format(PyExc_NotImplementedError,
-      "Subscript deletion not supported by %s", Py_TYPE(o)->tp_name);
-    return -1;
-  }
-}
-
-static PyObject *__pyx_getprop_23ContinuumElectrostatics_11StateVector_11StateVector_isOwner(PyObject *o, void *x) {
-  return __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner___get__(o);
-}
-
-static int __pyx_setprop_23ContinuumElectrostatics_11StateVector_11StateVector_isOwner(PyObject *o, PyObject *v, void *x) {
-  if (v) {
-    return __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner_1__set__(o, v);
-  }
-  else {
-    return __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7isOwner_2__del__(o);
-  }
-}
-
-static PyObject *__pyx_getprop_23ContinuumElectrostatics_11StateVector_11StateVector_owner(PyObject *o, void *x) {
-  return __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner___get__(o);
-}
-
-static int __pyx_setprop_23ContinuumElectrostatics_11StateVector_11StateVector_owner(PyObject *o, PyObject *v, void *x) {
-  if (v) {
-    return __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner_1__set__(o, v);
-  }
-  else {
-    return __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5owner_2__del__(o);
-  }
-}
-
-static PyMethodDef __pyx_methods_23ContinuumElectrostatics_11StateVector_StateVector[] = {
-  {__Pyx_NAMESTR("__getmodule__"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_1__getmodule__, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_1__getmodule__)},
-  {__Pyx_NAMESTR("__copy__"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_3__copy__, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_3__copy__)},
-  {__Pyx_NAMESTR("__deepcopy__"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_4__deepcopy__, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_4__deepcopy__)},
-  {__Pyx_NAMESTR("GetActualItem"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_7GetActualItem, METH_O, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_7GetActualItem)},
-  {__Pyx_NAMESTR("SetActualItem"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_8SetActualItem, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_8SetActualItem)},
-  {__Pyx_NAMESTR("CopyTo"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_10CopyTo, METH_O, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_10CopyTo)},
-  {__Pyx_NAMESTR("Increment"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_11Increment, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_11Increment)},
-  {__Pyx_NAMESTR("Reset"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_12Reset, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_12Reset)},
-  {__Pyx_NAMESTR("ResetToMaximum"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_13ResetToMaximum, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_13ResetToMaximum)},
-  {__Pyx_NAMESTR("Print"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_14Print, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_14Print)},
-  {__Pyx_NAMESTR("DefineSubstate"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_15DefineSubstate, METH_O, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_15DefineSubstate)},
-  {__Pyx_NAMESTR("IncrementSubstate"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_16IncrementSubstate, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_16IncrementSubstate)},
-  {__Pyx_NAMESTR("ResetSubstate"), (PyCFunction)__pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_17ResetSubstate, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_17ResetSubstate)},
-  {0, 0, 0, 0}
-};
-
-static struct PyGetSetDef __pyx_getsets_23ContinuumElectrostatics_11StateVector_StateVector[] = {
-  {(char *)"isOwner", __pyx_getprop_23ContinuumElectrostatics_11StateVector_11StateVector_isOwner, __pyx_setprop_23ContinuumElectrostatics_11StateVector_11StateVector_isOwner, 0, 0},
-  {(char *)"owner", __pyx_getprop_23ContinuumElectrostatics_11StateVector_11StateVector_owner, __pyx_setprop_23ContinuumElectrostatics_11StateVector_11StateVector_owner, 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_StateVector = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_long*/
-  #else
-  0, /*reserved*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if PY_VERSION_HEX >= 0x02050000
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_StateVector = {
-  __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector___len__, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  __pyx_sq_item_23ContinuumElectrostatics_11StateVector_StateVector, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_StateVector = {
-  __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector___len__, /*mp_length*/
-  __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__, /*mp_subscript*/
-  __pyx_mp_ass_subscript_23ContinuumElectrostatics_11StateVector_StateVector, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_StateVector = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-static PyTypeObject __pyx_type_23ContinuumElectrostatics_11StateVector_StateVector = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ContinuumElectrostatics.StateVector.StateVector"), /*tp_name*/
-  sizeof(struct __pyx_obj_23ContinuumElectrostatics_11StateVector_StateVector), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_23ContinuumElectrostatics_11StateVector_StateVector, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #else
-  0, /*reserved*/
-  #endif
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_StateVector, /*tp_as_number*/
-  &__pyx_tp_as_sequence_StateVector, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_StateVector, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_StateVector, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  __Pyx_DOCSTR("A class defining the state vector."), /*tp_doc*/
-  __pyx_tp_traverse_23ContinuumElectrostatics_11StateVector_StateVector, /*tp_traverse*/
-  __pyx_tp_clear_23ContinuumElectrostatics_11StateVector_StateVector, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_23ContinuumElectrostatics_11StateVector_StateVector, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_23ContinuumElectrostatics_11StateVector_StateVector, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_23ContinuumElectrostatics_11StateVector_StateVector, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    __Pyx_NAMESTR("StateVector"),
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
-  {&__pyx_kp_s_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 0, 1, 0},
-  {&__pyx_kp_s_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 0, 1, 0},
-  {&__pyx_kp_s_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 0, 1, 0},
-  {&__pyx_kp_s_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 0, 1, 0},
-  {&__pyx_kp_s_17, __pyx_k_17, sizeof(__pyx_k_17), 0, 0, 1, 0},
-  {&__pyx_kp_s_18, __pyx_k_18, sizeof(__pyx_k_18), 0, 0, 1, 0},
-  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 0, 1, 0},
-  {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
-  {&__pyx_n_s__CLibraryError, __pyx_k__CLibraryError, sizeof(__pyx_k__CLibraryError), 0, 0, 1, 1},
-  {&__pyx_n_s__Entry, __pyx_k__Entry, sizeof(__pyx_k__Entry), 0, 0, 1, 1},
-  {&__pyx_n_s__GetTable, __pyx_k__GetTable, sizeof(__pyx_k__GetTable), 0, 0, 1, 1},
-  {&__pyx_n_s__Heading, __pyx_k__Heading, sizeof(__pyx_k__Heading), 0, 0, 1, 1},
-  {&__pyx_n_s__Instance, __pyx_k__Instance, sizeof(__pyx_k__Instance), 0, 0, 1, 1},
-  {&__pyx_n_s__LogFileActive, __pyx_k__LogFileActive, sizeof(__pyx_k__LogFileActive), 0, 0, 1, 1},
-  {&__pyx_n_s__Site, __pyx_k__Site, sizeof(__pyx_k__Site), 0, 0, 1, 1},
-  {&__pyx_n_s__Start, __pyx_k__Start, sizeof(__pyx_k__Start), 0, 0, 1, 1},
-  {&__pyx_n_s__Stop, __pyx_k__Stop, sizeof(__pyx_k__Stop), 0, 0, 1, 1},
-  {&__pyx_n_s__Title, __pyx_k__Title, sizeof(__pyx_k__Title), 0, 0, 1, 1},
-  {&__pyx_n_s____lastchanged__, __pyx_k____lastchanged__, sizeof(__pyx_k____lastchanged__), 0, 0, 1, 1},
-  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
-  {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
-  {&__pyx_n_s___instIndexGlobal, __pyx_k___instIndexGlobal, sizeof(__pyx_k___instIndexGlobal), 0, 0, 1, 1},
-  {&__pyx_n_s__ceModel, __pyx_k__ceModel, sizeof(__pyx_k__ceModel), 0, 0, 1, 1},
-  {&__pyx_n_s__columnSpan, __pyx_k__columnSpan, sizeof(__pyx_k__columnSpan), 0, 0, 1, 1},
-  {&__pyx_n_s__columns, __pyx_k__columns, sizeof(__pyx_k__columns), 0, 0, 1, 1},
-  {&__pyx_n_s__index, __pyx_k__index, sizeof(__pyx_k__index), 0, 0, 1, 1},
-  {&__pyx_n_s__instIndex, __pyx_k__instIndex, sizeof(__pyx_k__instIndex), 0, 0, 1, 1},
-  {&__pyx_n_s__instances, __pyx_k__instances, sizeof(__pyx_k__instances), 0, 0, 1, 1},
-  {&__pyx_n_s__label, __pyx_k__label, sizeof(__pyx_k__label), 0, 0, 1, 1},
-  {&__pyx_n_s__log, __pyx_k__log, sizeof(__pyx_k__log), 0, 0, 1, 1},
-  {&__pyx_n_s__logFile, __pyx_k__logFile, sizeof(__pyx_k__logFile), 0, 0, 1, 1},
-  {&__pyx_n_s__nsites, __pyx_k__nsites, sizeof(__pyx_k__nsites), 0, 0, 1, 1},
-  {&__pyx_n_s__pCore, __pyx_k__pCore, sizeof(__pyx_k__pCore), 0, 0, 1, 1},
-  {&__pyx_n_s__resName, __pyx_k__resName, sizeof(__pyx_k__resName), 0, 0, 1, 1},
-  {&__pyx_n_s__resSerial, __pyx_k__resSerial, sizeof(__pyx_k__resSerial), 0, 0, 1, 1},
-  {&__pyx_n_s__segName, __pyx_k__segName, sizeof(__pyx_k__segName), 0, 0, 1, 1},
-  {&__pyx_n_s__sites, __pyx_k__sites, sizeof(__pyx_k__sites), 0, 0, 1, 1},
-  {&__pyx_n_s__title, __pyx_k__title, sizeof(__pyx_k__title), 0, 0, 1, 1},
-  {&__pyx_n_s__value, __pyx_k__value, sizeof(__pyx_k__value), 0, 0, 1, 1},
-  {&__pyx_n_s__verbose, __pyx_k__verbose, sizeof(__pyx_k__verbose), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  return 0;
-}
-
-static int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants");
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":90
- * 
- *         if status != Status_Continue:
- *             raise CLibraryError ("Cannot allocate state vector.")             # <<<<<<<<<<<<<<
- * 
- *         for indexSite from 0 <= indexSite < numberOfSites:
- */
-  __pyx_k_tuple_5 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_5));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_k_tuple_5, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_5));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":141
- *             tab.Start ()
- *             if title : tab.Title (title)
- *             else     : tab.Title ("State vector")             # <<<<<<<<<<<<<<
- *             tab.Heading ("Site"     , columnSpan=3)
- *             tab.Heading ("Instance" , columnSpan=3)
- */
-  __pyx_k_tuple_9 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_9));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_9, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_9));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":142
- *             if title : tab.Title (title)
- *             else     : tab.Title ("State vector")
- *             tab.Heading ("Site"     , columnSpan=3)             # <<<<<<<<<<<<<<
- *             tab.Heading ("Instance" , columnSpan=3)
- * 
- */
-  __pyx_k_tuple_10 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_10));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__Site));
-  PyTuple_SET_ITEM(__pyx_k_tuple_10, 0, ((PyObject *)__pyx_n_s__Site));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__Site));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_10));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":143
- *             else     : tab.Title ("State vector")
- *             tab.Heading ("Site"     , columnSpan=3)
- *             tab.Heading ("Instance" , columnSpan=3)             # <<<<<<<<<<<<<<
- * 
- *             for indexSite from 0 <= indexSite < self.cObject.nsites:
- */
-  __pyx_k_tuple_11 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_11));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__Instance));
-  PyTuple_SET_ITEM(__pyx_k_tuple_11, 0, ((PyObject *)__pyx_n_s__Instance));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__Instance));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_11));
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":177
- *         StateVector_AllocateSubstate (self.cObject, nselected, &status)
- *         if status != Status_Continue:
- *             raise CLibraryError ("Memory allocation failure.")             # <<<<<<<<<<<<<<
- * 
- *         for substateSiteIndex from 0 <= substateSiteIndex < nselected:
- */
-  __pyx_k_tuple_16 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_16));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_15));
-  PyTuple_SET_ITEM(__pyx_k_tuple_16, 0, ((PyObject *)__pyx_kp_s_15));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_15));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_16));
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_7 = PyInt_FromLong(7); if (unlikely(!__pyx_int_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC initStateVector(void); /*proto*/
-PyMODINIT_FUNC initStateVector(void)
-#else
-PyMODINIT_FUNC PyInit_StateVector(void); /*proto*/
-PyMODINIT_FUNC PyInit_StateVector(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannyDeclarations
-  #if CYTHON_REFNANNY
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  #endif
-  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit_StateVector(void)");
-  if ( __Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #ifdef __pyx_binding_PyCFunctionType_USED
-  if (__pyx_binding_PyCFunctionType_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("StateVector"), __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  #if PY_MAJOR_VERSION < 3
-  Py_INCREF(__pyx_m);
-  #endif
-  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_module_is_main_ContinuumElectrostatics__StateVector) {
-    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  }
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Constants init code ---*/
-  if (unlikely(__Pyx_InitCachedConstants() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Variable export code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_23ContinuumElectrostatics_11StateVector_StateVector) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  {
-    PyObject *wrapper = __Pyx_GetAttrString((PyObject *)&__pyx_type_23ContinuumElectrostatics_11StateVector_StateVector, "__len__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
-      __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector___len__ = *((PyWrapperDescrObject *)wrapper)->d_base;
-      __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector___len__.doc = __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector___len__;
-      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector___len__;
-    }
-  }
-  {
-    PyObject *wrapper = __Pyx_GetAttrString((PyObject *)&__pyx_type_23ContinuumElectrostatics_11StateVector_StateVector, "__getitem__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
-      __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__ = *((PyWrapperDescrObject *)wrapper)->d_base;
-      __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__.doc = __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__;
-      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_5__getitem__;
-    }
-  }
-  {
-    PyObject *wrapper = __Pyx_GetAttrString((PyObject *)&__pyx_type_23ContinuumElectrostatics_11StateVector_StateVector, "__setitem__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
-      __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__ = *((PyWrapperDescrObject *)wrapper)->d_base;
-      __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__.doc = __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__;
-      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_6__setitem__;
-    }
-  }
-  {
-    PyObject *wrapper = __Pyx_GetAttrString((PyObject *)&__pyx_type_23ContinuumElectrostatics_11StateVector_StateVector, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
-      __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
-      __pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__.doc = __pyx_doc_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__;
-      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_23ContinuumElectrostatics_11StateVector_11StateVector_9__init__;
-    }
-  }
-  if (__Pyx_SetAttrString(__pyx_m, "StateVector", (PyObject *)&__pyx_type_23ContinuumElectrostatics_11StateVector_StateVector) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_23ContinuumElectrostatics_11StateVector_StateVector = &__pyx_type_23ContinuumElectrostatics_11StateVector_StateVector;
-  /*--- Type import code ---*/
-  __pyx_ptype_5pCore_11Real1DArray_Real1DArray = __Pyx_ImportType("pCore.Real1DArray", "Real1DArray", sizeof(struct __pyx_obj_5pCore_11Real1DArray_Real1DArray), 1); if (unlikely(!__pyx_ptype_5pCore_11Real1DArray_Real1DArray)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5pCore_21RandomNumberGenerator_RandomNumberGenerator = __Pyx_ImportType("pCore.RandomNumberGenerator", "RandomNumberGenerator", sizeof(struct __pyx_obj_5pCore_21RandomNumberGenerator_RandomNumberGenerator), 1); if (unlikely(!__pyx_ptype_5pCore_21RandomNumberGenerator_RandomNumberGenerator)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Variable import code ---*/
-  /*--- Function import code ---*/
-  __pyx_t_1 = __Pyx_ImportModule("pCore.BPData"); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_Allocate", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_Allocate, "__pyx_t_5pCore_6BPData_BPData *(Integer)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_CopyToView", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_CopyToView, "void (__pyx_t_5pCore_6BPData_BPData *, Py_buffer *)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_Deallocate", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_Deallocate, "__pyx_t_5pCore_6BPData_BPData *(__pyx_t_5pCore_6BPData_BPData *)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_InitializeView", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_InitializeView, "void (Py_buffer *, char *, Py_ssize_t)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_ImportFunction(__pyx_t_1, "BPData_Set", (void (**)(void))&__pyx_f_5pCore_6BPData_BPData_Set, "void (__pyx_t_5pCore_6BPData_BPData *, void *, char *, Py_ssize_t, Py_ssize_t, Integer *, Integer *)") < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  /*--- Execution code ---*/
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":8
- * # . License   : CeCILL French Free Software License     (http://www.cecill.info)
- * #-------------------------------------------------------------------------------
- * from pCore      import logFile, LogFileActive, CLibraryError             # <<<<<<<<<<<<<<
- * 
- * DEF ANALYTIC_STATES = 67108864
- */
-  __pyx_t_2 = PyList_New(3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__logFile));
-  PyList_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__logFile));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__logFile));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__LogFileActive));
-  PyList_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_n_s__LogFileActive));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__LogFileActive));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__CLibraryError));
-  PyList_SET_ITEM(__pyx_t_2, 2, ((PyObject *)__pyx_n_s__CLibraryError));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__CLibraryError));
-  __pyx_t_3 = __Pyx_Import(((PyObject *)__pyx_n_s__pCore), ((PyObject *)__pyx_t_2), -1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__logFile); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__logFile, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__LogFileActive); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__LogFileActive, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__CLibraryError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__CLibraryError, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":11
- * 
- * DEF ANALYTIC_STATES = 67108864
- * __lastchanged__ = "$Id$"             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____lastchanged__, ((PyObject *)__pyx_kp_s_18)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":131
- * 
- * 
- *     def Print (self, verbose=True, title=None, log=logFile):             # <<<<<<<<<<<<<<
- *         """Print the state vector."""
- *         cdef Integer indexSite, indexSiteSubstate, indexActive
- */
-  __pyx_t_3 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_k_6 = __pyx_t_3;
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__logFile); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_k_7 = __pyx_t_3;
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "/home/mikolaj/devel/pcetk/extensions/cython/ContinuumElectrostatics.StateVector.pyx":1
- * #-------------------------------------------------------------------------------             # <<<<<<<<<<<<<<
- * # . File      : ContinuumElectrostatics.StateVector.pyx
- * # . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
- */
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_3)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  if (__pyx_m) {
-    __Pyx_AddTraceback("init ContinuumElectrostatics.StateVector", __pyx_clineno, __pyx_lineno, __pyx_filename);
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init ContinuumElectrostatics.StateVector");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-}
-
-/* Runtime support code */
-
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-}
-#endif /* CYTHON_REFNANNY */
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result) {
-        if (dict != __pyx_b) {
-            PyErr_Clear();
-            result = PyObject_GetAttr(__pyx_b, name);
-        }
-        if (!result) {
-            PyErr_SetObject(PyExc_NameError, name);
-        }
-    }
-    return result;
-}
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    /* cause is unused */
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-#else /* Python 3+ */
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-
-    if (cause) {
-        PyObject *fixed_cause;
-        if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        }
-        else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        }
-        else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        if (!value) {
-            value = PyObject_CallObject(type, NULL);
-        }
-        PyException_SetCause(value, fixed_cause);
-    }
-
-    PyErr_SetObject(type, value);
-
-    if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-    }
-
-bad:
-    return;
-}
-#endif
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    PyErr_Format(PyExc_TypeError,
-                 "%s() takes %s %"PY_FORMAT_SIZE_T"d positional argument%s (%"PY_FORMAT_SIZE_T"d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
-}
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AS_STRING(kw_name));
-        #endif
-}
-
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-        } else {
-            #if PY_MAJOR_VERSION < 3
-            if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
-            #else
-            if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key))) {
-            #endif
-                goto invalid_keyword_type;
-            } else {
-                for (name = first_kw_arg; *name; name++) {
-                    #if PY_MAJOR_VERSION >= 3
-                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                        PyUnicode_Compare(**name, key) == 0) break;
-                    #else
-                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                        _PyString_Eq(**name, key)) break;
-                    #endif
-                }
-                if (*name) {
-                    values[name-argnames] = value;
-                } else {
-                    /* unexpected keyword found */
-                    for (name=argnames; name != first_kw_arg; name++) {
-                        if (**name == key) goto arg_passed_twice;
-                        #if PY_MAJOR_VERSION >= 3
-                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
-                        #else
-                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                            _PyString_Eq(**name, key)) goto arg_passed_twice;
-                        #endif
-                    }
-                    if (kwds2) {
-                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-                    } else {
-                        goto invalid_keyword;
-                    }
-                }
-            }
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (!type) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (Py_TYPE(obj) == type) return 1;
-    }
-    else {
-        if (PyObject_TypeCheck(obj, type)) return 1;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%s' has incorrect type (expected %s, got %s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-                 "need more than %"PY_FORMAT_SIZE_T"d value%s to unpack",
-                 index, (index == 1) ? "" : "s");
-}
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
-    PyErr_Format(PyExc_ValueError,
-                 "too many values to unpack (expected %"PY_FORMAT_SIZE_T"d)", expected);
-}
-
-static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
-    if (unlikely(retval)) {
-        Py_DECREF(retval);
-        __Pyx_RaiseTooManyValuesError(expected);
-        return -1;
-    } else if (PyErr_Occurred()) {
-        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
-            PyErr_Clear();
-            return 0;
-        } else {
-            return -1;
-        }
-    }
-    return 0;
-}
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level) {
-    PyObject *py_import = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    py_import = __Pyx_GetAttrString(__pyx_b, "__import__");
-    if (!py_import)
-        goto bad;
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    #if PY_VERSION_HEX >= 0x02050000
-    {
-        PyObject *py_level = PyInt_FromLong(level);
-        if (!py_level)
-            goto bad;
-        module = PyObject_CallFunctionObjArgs(py_import,
-            name, global_dict, empty_dict, list, py_level, NULL);
-        Py_DECREF(py_level);
-    }
-    #else
-    if (level>0) {
-        PyErr_SetString(PyExc_RuntimeError, "Relative import is not supported for Python <=2.4.");
-        goto bad;
-    }
-    module = PyObject_CallFunctionObjArgs(py_import,
-        name, global_dict, empty_dict, list, NULL);
-    #endif
-bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(py_import);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_Integer(Integer val) {
-    const Integer neg_one = (Integer)-1, const_zero = (Integer)0;
-    const int is_unsigned = const_zero < neg_one;
-    if ((sizeof(Integer) == sizeof(char))  ||
-        (sizeof(Integer) == sizeof(short))) {
-        return PyInt_FromLong((long)val);
-    } else if ((sizeof(Integer) == sizeof(int)) ||
-               (sizeof(Integer) == sizeof(long))) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLong((unsigned long)val);
-        else
-            return PyInt_FromLong((long)val);
-    } else if (sizeof(Integer) == sizeof(PY_LONG_LONG)) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG)val);
-        else
-            return PyLong_FromLongLong((PY_LONG_LONG)val);
-    } else {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&val;
-        return _PyLong_FromByteArray(bytes, sizeof(Integer),
-                                     little, !is_unsigned);
-    }
-}
-
-static CYTHON_INLINE Integer __Pyx_PyInt_from_py_Integer(PyObject* x) {
-    const Integer neg_one = (Integer)-1, const_zero = (Integer)0;
-    const int is_unsigned = const_zero < neg_one;
-    if (sizeof(Integer) == sizeof(char)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedChar(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedChar(x);
-    } else if (sizeof(Integer) == sizeof(short)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedShort(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedShort(x);
-    } else if (sizeof(Integer) == sizeof(int)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedInt(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedInt(x);
-    } else if (sizeof(Integer) == sizeof(long)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedLong(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedLong(x);
-    } else if (sizeof(Integer) == sizeof(PY_LONG_LONG)) {
-        if (is_unsigned)
-            return (Integer)__Pyx_PyInt_AsUnsignedLongLong(x);
-        else
-            return (Integer)__Pyx_PyInt_AsSignedLongLong(x);
-    }  else {
-        Integer val;
-        PyObject *v = __Pyx_PyNumber_Int(x);
-        #if PY_VERSION_HEX < 0x03000000
-        if (likely(v) && !PyLong_Check(v)) {
-            PyObject *tmp = v;
-            v = PyNumber_Long(tmp);
-            Py_DECREF(tmp);
-        }
-        #endif
-        if (likely(v)) {
-            int one = 1; int is_little = (int)*(unsigned char *)&one;
-            unsigned char *bytes = (unsigned char *)&val;
-            int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                          bytes, sizeof(val),
-                                          is_little, !is_unsigned);
-            Py_DECREF(v);
-            if (likely(!ret))
-                return val;
-        }
-        return (Integer)-1;
-    }
-}
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
-    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned char" :
-                    "value too large to convert to unsigned char");
-            }
-            return (unsigned char)-1;
-        }
-        return (unsigned char)val;
-    }
-    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
-    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned short" :
-                    "value too large to convert to unsigned short");
-            }
-            return (unsigned short)-1;
-        }
-        return (unsigned short)val;
-    }
-    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
-    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned int" :
-                    "value too large to convert to unsigned int");
-            }
-            return (unsigned int)-1;
-        }
-        return (unsigned int)val;
-    }
-    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
-    const char neg_one = (char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to char" :
-                    "value too large to convert to char");
-            }
-            return (char)-1;
-        }
-        return (char)val;
-    }
-    return (char)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
-    const short neg_one = (short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to short" :
-                    "value too large to convert to short");
-            }
-            return (short)-1;
-        }
-        return (short)val;
-    }
-    return (short)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
-    }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
-    const signed char neg_one = (signed char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed char" :
-                    "value too large to convert to signed char");
-            }
-            return (signed char)-1;
-        }
-        return (signed char)val;
-    }
-    return (signed char)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
-    const signed short neg_one = (signed short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed short" :
-                    "value too large to convert to signed short");
-            }
-            return (signed short)-1;
-        }
-        return (signed short)val;
-    }
-    return (signed short)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
-    const signed int neg_one = (signed int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed int" :
-                    "value too large to convert to signed int");
-            }
-            return (signed int)-1;
-        }
-        return (signed int)val;
-    }
-    return (signed int)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE int __Pyx_PyInt_AsLongDouble(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
-    }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
-    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned long");
-            return (unsigned long)-1;
-        }
-        return (unsigned long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned long");
-                return (unsigned long)-1;
-            }
-            return (unsigned long)PyLong_AsUnsignedLong(x);
-        } else {
-            return (unsigned long)PyLong_AsLong(x);
-        }
-    } else {
-        unsigned long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned long)-1;
-        val = __Pyx_PyInt_AsUnsignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
-    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned PY_LONG_LONG");
-            return (unsigned PY_LONG_LONG)-1;
-        }
-        return (unsigned PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned PY_LONG_LONG");
-                return (unsigned PY_LONG_LONG)-1;
-            }
-            return (unsigned PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
-        } else {
-            return (unsigned PY_LONG_LONG)PyLong_AsLongLong(x);
-        }
-    } else {
-        unsigned PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
-    const long neg_one = (long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to long");
-            return (long)-1;
-        }
-        return (long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to long");
-                return (long)-1;
-            }
-            return (long)PyLong_AsUnsignedLong(x);
-        } else {
-            return (long)PyLong_AsLong(x);
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long)-1;
-        val = __Pyx_PyInt_AsLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
-    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to PY_LONG_LONG");
-            return (PY_LONG_LONG)-1;
-        }
-        return (PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to PY_LONG_LONG");
-                return (PY_LONG_LONG)-1;
-            }
-            return (PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
-        } else {
-            return (PY_LONG_LONG)PyLong_AsLongLong(x);
-        }
-    } else {
-        PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
-    const signed long neg_one = (signed long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed long");
-            return (signed long)-1;
-        }
-        return (signed long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed long");
-                return (signed long)-1;
-            }
-            return (signed long)PyLong_AsUnsignedLong(x);
-        } else {
-            return (signed long)PyLong_AsLong(x);
-        }
-    } else {
-        signed long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed long)-1;
-        val = __Pyx_PyInt_AsSignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
-    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed PY_LONG_LONG");
-            return (signed PY_LONG_LONG)-1;
-        }
-        return (signed PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed PY_LONG_LONG");
-                return (signed PY_LONG_LONG)-1;
-            }
-            return (signed PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
-        } else {
-            return (signed PY_LONG_LONG)PyLong_AsLongLong(x);
-        }
-    } else {
-        signed PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsSignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
-        char message[200];
-        PyOS_snprintf(message, sizeof(message),
-                      "compiletime version %s of module '%.100s' "
-                      "does not match runtime version %s",
-                      ctversion, __Pyx_MODULE_NAME, rtversion);
-        #if PY_VERSION_HEX < 0x02050000
-        return PyErr_Warn(NULL, message);
-        #else
-        return PyErr_WarnEx(NULL, message, 1);
-        #endif
-    }
-    return 0;
-}
-
-#ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
-    size_t size, int strict)
-{
-    PyObject *py_module = 0;
-    PyObject *result = 0;
-    PyObject *py_name = 0;
-    char warning[200];
-
-    py_module = __Pyx_ImportModule(module_name);
-    if (!py_module)
-        goto bad;
-    #if PY_MAJOR_VERSION < 3
-    py_name = PyString_FromString(class_name);
-    #else
-    py_name = PyUnicode_FromString(class_name);
-    #endif
-    if (!py_name)
-        goto bad;
-    result = PyObject_GetAttr(py_module, py_name);
-    Py_DECREF(py_name);
-    py_name = 0;
-    Py_DECREF(py_module);
-    py_module = 0;
-    if (!result)
-        goto bad;
-    if (!PyType_Check(result)) {
-        PyErr_Format(PyExc_TypeError,
-            "%s.%s is not a type object",
-            module_name, class_name);
-        goto bad;
-    }
-    if (!strict && ((PyTypeObject *)result)->tp_basicsize > (Py_ssize_t)size) {
-        PyOS_snprintf(warning, sizeof(warning),
-            "%s.%s size changed, may indicate binary incompatibility",
-            module_name, class_name);
-        #if PY_VERSION_HEX < 0x02050000
-        if (PyErr_Warn(NULL, warning) < 0) goto bad;
-        #else
-        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
-        #endif
-    }
-    else if (((PyTypeObject *)result)->tp_basicsize != (Py_ssize_t)size) {
-        PyErr_Format(PyExc_ValueError,
-            "%s.%s has the wrong size, try recompiling",
-            module_name, class_name);
-        goto bad;
-    }
-    return (PyTypeObject *)result;
-bad:
-    Py_XDECREF(py_module);
-    Py_XDECREF(result);
-    return NULL;
-}
-#endif
-
-#ifndef __PYX_HAVE_RT_ImportModule
-#define __PYX_HAVE_RT_ImportModule
-static PyObject *__Pyx_ImportModule(const char *name) {
-    PyObject *py_name = 0;
-    PyObject *py_module = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_name = PyString_FromString(name);
-    #else
-    py_name = PyUnicode_FromString(name);
-    #endif
-    if (!py_name)
-        goto bad;
-    py_module = PyImport_Import(py_name);
-    Py_DECREF(py_name);
-    return py_module;
-bad:
-    Py_XDECREF(py_name);
-    return 0;
-}
-#endif
-
-#ifndef __PYX_HAVE_RT_ImportFunction
-#define __PYX_HAVE_RT_ImportFunction
-static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
-    PyObject *d = 0;
-    PyObject *cobj = 0;
-    union {
-        void (*fp)(void);
-        void *p;
-    } tmp;
-
-    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
-    if (!d)
-        goto bad;
-    cobj = PyDict_GetItemString(d, funcname);
-    if (!cobj) {
-        PyErr_Format(PyExc_ImportError,
-            "%s does not export expected C function %s",
-                PyModule_GetName(module), funcname);
-        goto bad;
-    }
-#if PY_VERSION_HEX >= 0x02070000 && !(PY_MAJOR_VERSION==3&&PY_MINOR_VERSION==0)
-    if (!PyCapsule_IsValid(cobj, sig)) {
-        PyErr_Format(PyExc_TypeError,
-            "C function %s.%s has wrong signature (expected %s, got %s)",
-             PyModule_GetName(module), funcname, sig, PyCapsule_GetName(cobj));
-        goto bad;
-    }
-    tmp.p = PyCapsule_GetPointer(cobj, sig);
-#else
-    {const char *desc, *s1, *s2;
-    desc = (const char *)PyCObject_GetDesc(cobj);
-    if (!desc)
-        goto bad;
-    s1 = desc; s2 = sig;
-    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
-    if (*s1 != *s2) {
-        PyErr_Format(PyExc_TypeError,
-            "C function %s.%s has wrong signature (expected %s, got %s)",
-             PyModule_GetName(module), funcname, sig, desc);
-        goto bad;
-    }
-    tmp.p = PyCObject_AsVoidPtr(cobj);}
-#endif
-    *f = tmp.fp;
-    if (!(*f))
-        goto bad;
-    Py_DECREF(d);
-    return 0;
-bad:
-    Py_XDECREF(d);
-    return -1;
-}
-#endif
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-
-static void __Pyx_AddTraceback(const char *funcname, int __pyx_clineno,
-                               int __pyx_lineno, const char *__pyx_filename) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(__pyx_filename);
-    #else
-    py_srcfile = PyUnicode_FromString(__pyx_filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (__pyx_clineno) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        #if PY_MAJOR_VERSION >= 3
-        0,            /*int kwonlyargcount,*/
-        #endif
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple,  /*PyObject *consts,*/
-        __pyx_empty_tuple,  /*PyObject *names,*/
-        __pyx_empty_tuple,  /*PyObject *varnames,*/
-        __pyx_empty_tuple,  /*PyObject *freevars,*/
-        __pyx_empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else  /* Python 3+ has unicode identifiers */
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-/* Type Conversion Functions */
-
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   int is_true = x == Py_True;
-   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
-   else return PyObject_IsTrue(x);
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
-  PyNumberMethods *m;
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(x) || PyLong_Check(x))
-#else
-  if (PyLong_Check(x))
-#endif
-    return Py_INCREF(x), x;
-  m = Py_TYPE(x)->tp_as_number;
-#if PY_VERSION_HEX < 0x03000000
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = PyNumber_Long(x);
-  }
-#else
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Long(x);
-  }
-#endif
-  if (res) {
-#if PY_VERSION_HEX < 0x03000000
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
-#else
-    if (!PyLong_Check(res)) {
-#endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%s__ returned non-%s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject* x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-#if PY_VERSION_HEX < 0x02050000
-   if (ival <= LONG_MAX)
-       return PyInt_FromLong((long)ival);
-   else {
-       unsigned char *bytes = (unsigned char *) &ival;
-       int one = 1; int little = (int)*(unsigned char*)&one;
-       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
-   }
-#else
-   return PyInt_FromSize_t(ival);
-#endif
-}
-
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
-   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
-   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
-       return (size_t)-1;
-   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
-       PyErr_SetString(PyExc_OverflowError,
-                       "value too large to convert to size_t");
-       return (size_t)-1;
-   }
-   return (size_t)val;
-}
-
-
-#endif /* Py_PYTHON_H */
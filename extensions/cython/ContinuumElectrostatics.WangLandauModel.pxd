@@ -0,0 +1,45 @@
+#-------------------------------------------------------------------------------
+# . File      : ContinuumElectrostatics.WangLandauModel.pxd
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+from pCore.cDefinitions                  cimport Boolean, CFalse, CTrue, Integer, Real
+from pCore.Status                        cimport Status, Status_Continue
+from ContinuumElectrostatics.EnergyModel cimport CEnergyModel, EnergyModel
+
+__lastchanged__ = "$Id: $"
+
+
+cdef extern from "WangLandauModel.h":
+    ctypedef struct CWangLandauModel "WangLandauModel":
+        Integer        nbins
+        Real           flatness
+        Real           lnfFinal
+        Integer        nequil
+        Integer        nprod
+        Integer        maxScans
+        Integer        nscans
+        Real           Emin
+        Real           Emax
+        Integer        nprotonsMin
+        Integer        nprotons
+        Real           temperature
+        Boolean        isConverged
+        CEnergyModel  *energyModel
+
+
+    cdef CWangLandauModel *WangLandauModel_Allocate               (Integer nbins, Real flatness, Real lnfFinal, Integer nequil, Integer nprod, Integer maxScans, Integer randomSeed, Status *status)
+    cdef void              WangLandauModel_Deallocate             (CWangLandauModel *self)
+    cdef void              WangLandauModel_LinkToEnergyModel      (CWangLandauModel *self, CEnergyModel *energyModel, Status *status)
+    cdef Boolean           WangLandauModel_CalculateDensity       (CWangLandauModel *self, Status *status)
+    cdef void              WangLandauModel_Production             (CWangLandauModel *self, Real temperature)
+    cdef Real              WangLandauModel_CalculateProbabilities (CWangLandauModel *self, Real pH)
+
+#-------------------------------------------------------------------------------
+cdef class WangLandauModel:
+    cdef CWangLandauModel  *cObject
+    cdef public object  isOwner
+    cdef public object  owner
+    cdef public object  logZ
@@ -0,0 +1,119 @@
+#-------------------------------------------------------------------------------
+# . File      : ContinuumElectrostatics.WangLandauModel.pyx
+# . Program   : pDynamo-1.8.0                           (http://www.pdynamo.org)
+# . Copyright : CEA, CNRS, Martin  J. Field  (2007-2012),
+#                          Mikolaj J. Feliks (2014-2018)
+# . License   : CeCILL French Free Software License     (http://www.cecill.info)
+#-------------------------------------------------------------------------------
+from pCore  import logFile, LogFileActive, CLibraryError
+
+_DefaultBins               = 100
+_DefaultFlatness           = .8
+_DefaultFinalFactor        = 1e-6
+_DefaultExplorationScans   = 500
+_DefaultProductionScans    = 20000
+_DefaultMaxScans           = 10000000
+
+
+cdef class WangLandauModel:
+    """A class defining the Wang-Landau model.
+
+    The joint density of states over the pH-independent energy and the number of bound
+    protons is estimated once with flat-histogram sampling. A production with the fixed
+    density of states then accumulates the states of each bin, weighted by their Boltzmann
+    factors. Probabilities at any pH are reconstructed from it without further sampling.
+
+    The weights of the production depend on the temperature. At another temperature, the
+    production is repeated, but the density of states is reused. The ranges of energies and
+    protons are found at the temperature of the owner, so that temperatures far from it may
+    need states outside of these ranges and should not be used."""
+
+    def __getmodule__ (self):
+        """Return the module name."""
+        return "ContinuumElectrostatics.WangLandauModel"
+
+    def __dealloc__ (self):
+        """Deallocate."""
+        WangLandauModel_Deallocate (self.cObject)
+
+
+    def __init__ (self, Integer nbins=_DefaultBins, Real flatness=_DefaultFlatness, Real lnfFinal=_DefaultFinalFactor, Integer nequil=_DefaultExplorationScans, Integer nprod=_DefaultProductionScans, Integer maxScans=_DefaultMaxScans, Integer randomSeed=-1):
+        """Constructor."""
+        cdef Status  status
+        status        = Status_Continue
+        self.isOwner  = True
+        self.logZ     = None
+        if (flatness <= 0.) or (flatness >= 1.):
+            raise CLibraryError ("Flatness criterion must be in the range (0, 1).")
+        self.cObject  = WangLandauModel_Allocate (nbins, flatness, lnfFinal, nequil, nprod, maxScans, randomSeed, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate Wang-Landau model.")
+
+
+    def Initialize (self, ceModel):
+        """Link Wang-Landau and energy models."""
+        cdef EnergyModel energyModel = ceModel.energyModel
+        cdef Status      status      = Status_Continue
+
+        WangLandauModel_LinkToEnergyModel (self.cObject, energyModel.cObject, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot initialize Wang-Landau model.")
+        self.isOwner = False
+        self.owner   = ceModel
+
+
+    def CalculateDensity (self, log=logFile):
+        """Estimate the density of states."""
+        cdef Status   status = Status_Continue
+        cdef Boolean  converged
+
+        owner = self.owner
+        if (not owner.isCalculated):
+            raise CLibraryError ("First calculate electrostatic energies.")
+        converged = WangLandauModel_CalculateDensity (self.cObject, &status)
+        if status != Status_Continue:
+            raise CLibraryError ("Cannot allocate density of states.")
+        if converged == CFalse:
+            raise CLibraryError ("Wang-Landau iterations did not converge in %d scans." % self.cObject.maxScans)
+        if LogFileActive (log):
+            log.Text ("\nDensity of states converged in %d scans, energies %.2f to %.2f kcal/mol, %d to %d protons.\n" % (self.cObject.nscans, self.cObject.Emin, self.cObject.Emax, self.cObject.nprotonsMin, self.cObject.nprotonsMin + self.cObject.nprotons - 1))
+
+
+    def CalculateOwnerProbabilities (self, Real pH=7.0, Integer logFrequency=0, trajectoryFilename="", temperature=None, log=logFile):
+        """Calculate probabilities of the owner.
+
+        The density of states is estimated at the first call. By default, the temperature of the owner is used.
+        At a temperature different from that of the last production, the production is repeated."""
+        cdef Real T
+
+        if (trajectoryFilename != ""):
+            raise CLibraryError ("Writing trajectories unsupported.")
+        if self.cObject.isConverged == CFalse:
+            self.CalculateDensity (log=log)
+        T = self.owner.temperature if (temperature is None) else temperature
+        if T <= 0.:
+            raise CLibraryError ("Temperature must be positive.")
+        if T != self.cObject.temperature:
+            WangLandauModel_Production (self.cObject, T)
+            if LogFileActive (log):
+                log.Text ("\nCompleted %d production scans at %.2f K.\n" % (self.cObject.nprod, T))
+        self.logZ = WangLandauModel_CalculateProbabilities (self.cObject, pH)
+
+
+    def Summary (self, log=logFile):
+        """Summary."""
+        if LogFileActive (log):
+            summary = log.GetSummary ()
+            summary.Start ("Wang-Landau model")
+            summary.Entry ("Energy bins"            , "%d"   % self.cObject.nbins)
+            summary.Entry ("Flatness criterion"     , "%.2f" % self.cObject.flatness)
+            summary.Entry ("Final ln(f)"            , "%g"   % self.cObject.lnfFinal)
+            summary.Entry ("Exploration scans"      , "%d"   % self.cObject.nequil)
+            summary.Entry ("Production scans"       , "%d"   % self.cObject.nprod)
+            summary.Entry ("Max. scans"             , "%d"   % self.cObject.maxScans)
+            summary.Stop ()
+
+
+    def PrintPairs (self, log=logFile):
+        """The Wang-Landau model does not treat pairs of sites separately."""
+        pass
@@ -0,0 +1,30 @@
+# Example script: checks of independent chains of in-house MC sampling against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault
+
+
+# . Chains sampling the same distribution have R-hat close to one
+RHAT_TOLERANCE = 0.1
+NCHAINS        = 4
+
+
+logFile.Header ("Check independent chains of in-house MC sampling of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+mc = MCModelDefault (nprod=NPROD / NCHAINS, randomSeed=SEED, nchains=NCHAINS)
+cem.DefineMCModel (mc)
+
+
+logFile.Text ("\n*** Checking probabilities and convergence diagnostics of independent chains ***\n")
+
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Probabilities of %d chains at pH=%.1f" % (NCHAINS, pH), MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), SAMPLED_TOLERANCE)
+    Check ("R-hat of %d chains at pH=%.1f" % (NCHAINS, pH), max ([abs (rhat - 1.0) for rhat in mc.rhat]), RHAT_TOLERANCE)
+    mc.PrintConvergence ()
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,47 @@
+# Example script: checks of restarts of in-house MC sampling from checkpoints against uninterrupted runs and exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, EXACT_TOLERANCE, SAMPLED_TOLERANCE, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault
+import os, time, multiprocessing
+
+
+def InterruptedProduction (cem, filename):
+    """Run a long production with checkpoints, which is killed by the parent process."""
+    mc = MCModelDefault (nprod=50 * NPROD, randomSeed=SEED, checkpointFrequency=NPROD)
+    cem.DefineMCModel (mc, log=None)
+    cem.CalculateProbabilities (pH=7.0, checkpointFilename=filename, log=None)
+
+
+logFile.Header ("Check restarts from checkpoints of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking a restart of in-house MC sampling from a checkpoint ***\n")
+
+filename = "twosites.checkpoint"
+if os.path.exists (filename):
+    os.remove (filename)
+process = multiprocessing.Process (target=InterruptedProduction, args=(cem, filename))
+process.start ()
+while (not os.path.exists (filename)) and process.is_alive ():
+    time.sleep (0.01)
+process.terminate ()
+process.join ()
+Check ("Checkpoint of the interrupted production", 0 if os.path.exists (filename) else 1, 0)
+
+mc = MCModelDefault (nprod=50 * NPROD, randomSeed=SEED, checkpointFrequency=NPROD)
+cem.DefineMCModel (mc)
+continued = cem.CalculateProbabilities (pH=7.0, checkpointFilename=filename, isCalculateCurves=True)
+
+mc = MCModelDefault (nprod=50 * NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+uninterrupted = cem.CalculateProbabilities (pH=7.0, isCalculateCurves=True, log=None)
+Check ("Continued and uninterrupted probabilities", MaximumDeviation (continued, uninterrupted), EXACT_TOLERANCE)
+Check ("Continued and exact probabilities", MaximumDeviation (ExactProbabilities (cem, Enumerate (cem, pH=7.0)), continued), SAMPLED_TOLERANCE)
+if os.path.exists (filename):
+    os.remove (filename)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,23 @@
+# Example script: checks of cluster moves of in-house MC sampling against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault
+
+
+logFile.Header ("Check cluster moves on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking probabilities of sampling with cluster moves ***\n")
+
+# . A zero limit groups both sites into one cluster
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED, clusterLimit=0., maxClusterSize=2)
+cem.DefineMCModel (mc)
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Probabilities with cluster moves at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,116 @@
+# Common part of the check scripts: setup of the two-site peptide and exact enumeration of its protonation states
+from pCore                   import logFile
+from pBabel                  import CHARMMParameterFiles_ToParameters, CHARMMPSFFile_ToSystem, CHARMMCRDFile_ToCoordinates3
+from ContinuumElectrostatics import MEADModel, StateVector, CONSTANT_MOLAR_GAS_KCAL_MOL
+import math
+
+
+# . Deviations of exact solvers are round-off errors, deviations of sampling are statistical errors
+EXACT_TOLERANCE   = 1e-6
+ENERGY_TOLERANCE  = 1e-4
+SAMPLED_TOLERANCE = 0.02
+
+PHS    = (4.0, 7.0, 10.0)
+NPROD  = 100000
+SEED   = 12345
+failed = []
+
+
+def SetupModel ():
+    """Calculate electrostatic energies of the two-site peptide."""
+    parameters = ["charmm/toppar/par_all27_prot_na.inp", ]
+    mol = CHARMMPSFFile_ToSystem ("charmm/testpeptide_xplor.psf", isXPLOR=True, parameters=CHARMMParameterFiles_ToParameters (parameters))
+    mol.coordinates3 = CHARMMCRDFile_ToCoordinates3 ("charmm/testpeptide.crd")
+
+    cem = MEADModel (system=mol, pathMEAD="/home/mikolaj/local/bin/", pathScratch="mead", nthreads=1)
+    cem.Initialize ()
+    cem.Summary ()
+    cem.SummarySites ()
+    cem.WriteJobFiles ()
+    cem.CalculateElectrostaticEnergies ()
+    return cem
+
+
+def _States (cem, pH, unfolded):
+    """Energies and local indices of instances of all protonation states."""
+    Energy = cem.energyModel.CalculateMicrostateEnergyUnfolded if unfolded else cem.CalculateMicrostateEnergy
+    vector = StateVector (cem)
+    vector.Reset ()
+    states    = []
+    increment = True
+    while increment:
+        states.append ((Energy (vector, pH=pH), [vector[index] for index in range (cem.nsites)]))
+        increment = vector.Increment ()
+    return states
+
+
+def Enumerate (cem, pH=7.0, unfolded=False):
+    """Enumerate all protonation states.
+
+    Returns a list of tuples containing the probability, energy and local indices of instances of each state."""
+    beta    = 1.0 / (CONSTANT_MOLAR_GAS_KCAL_MOL * cem.temperature)
+    states  = _States (cem, pH, unfolded)
+    Gmin    = min ([Gmicro for (Gmicro, instances) in states])
+    weights = [math.exp (-beta * (Gmicro - Gmin)) for (Gmicro, instances) in states]
+    Z       = sum (weights)
+    return [(weight / Z, Gmicro, instances) for (weight, (Gmicro, instances)) in zip (weights, states)]
+
+
+def ExactLogZ (cem, pH=7.0, unfolded=False):
+    """Logarithm of the partition function."""
+    beta   = 1.0 / (CONSTANT_MOLAR_GAS_KCAL_MOL * cem.temperature)
+    states = _States (cem, pH, unfolded)
+    Gmin   = min ([Gmicro for (Gmicro, instances) in states])
+    return -beta * Gmin + math.log (sum ([math.exp (-beta * (Gmicro - Gmin)) for (Gmicro, instances) in states]))
+
+
+def ExactProbabilities (cem, states):
+    """Probabilities of instances, as a list of lists for each site."""
+    probabilities = [[0.0] * len (site.instances) for site in cem.sites]
+    for (probability, Gmicro, instances) in states:
+        for (index, instance) in enumerate (instances):
+            probabilities[index][instance] += probability
+    return probabilities
+
+
+def ExactPairProbabilities (cem, states, pairs):
+    """Joint probabilities of instances of the given pairs of sites, as in CEModel.PairProbabilities."""
+    joint = {}
+    for (indexSiteA, indexSiteB) in pairs:
+        table = [[0.0] * len (cem.sites[indexSiteB].instances) for instance in cem.sites[indexSiteA].instances]
+        for (probability, Gmicro, instances) in states:
+            table[instances[indexSiteA]][instances[indexSiteB]] += probability
+        joint[(indexSiteA, indexSiteB)] = table
+    return joint
+
+
+def ExactCurves (cem, pHs, unfolded=False):
+    """Probabilities of instances at each pH-value, as in TitrationCurves.steps."""
+    return [ExactProbabilities (cem, Enumerate (cem, pH=pH, unfolded=unfolded)) for pH in pHs]
+
+
+def MaximumDeviation (first, second):
+    """Maximum deviation between two lists of lists."""
+    return max ([abs (a - b) for (rowA, rowB) in zip (first, second) for (a, b) in zip (rowA, rowB)])
+
+
+def CurvesDeviation (first, second):
+    """Maximum deviation between two sets of curves."""
+    return max ([MaximumDeviation (a, b) for (a, b) in zip (first, second)])
+
+
+def Check (title, deviation, tolerance):
+    """Log the result of a check."""
+    passed = (deviation <= tolerance)
+    if not passed:
+        failed.append (title)
+    logFile.Text ("\n%-60s max. deviation %12.8f (tolerance %g): %s\n" % (title, deviation, tolerance, "passed" if passed else "FAILED"))
+
+
+def Finish ():
+    """Log the failed checks and close the log."""
+    if failed:
+        logFile.Text ("\nFailed checks: %s.\n" % ", ".join (failed))
+    else:
+        logFile.Text ("\nAll checks passed.\n")
+    logFile.Footer ()
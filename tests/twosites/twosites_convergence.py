@@ -0,0 +1,29 @@
+# Example script: checks of convergence-based stopping of in-house MC sampling against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, SAMPLED_TOLERANCE, PHS, SEED
+from ContinuumElectrostatics import MCModelDefault
+
+
+TARGET_ERROR = 0.005
+
+
+logFile.Header ("Check convergence-based stopping on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+mc = MCModelDefault (randomSeed=SEED, targetError=TARGET_ERROR)
+cem.DefineMCModel (mc)
+
+
+logFile.Text ("\n*** Checking probabilities and standard errors of convergence-based runs ***\n")
+
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), SAMPLED_TOLERANCE)
+    Check ("Standard errors at pH=%.1f" % pH, max (mc.errors), TARGET_ERROR)
+    Check ("Nonzero standard errors at pH=%.1f" % pH, 0 if min (mc.errors) > 0. else 1, 0)
+    mc.PrintConvergence ()
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,44 @@
+# Example script: checks of titration curves written to a single file against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, ExactCurves, Check, Finish, EXACT_TOLERANCE
+from ContinuumElectrostatics import TitrationCurves
+import os, numpy
+
+
+logFile.Header ("Check files of titration curves of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+curves = TitrationCurves (cem, curveSampling=0.5)
+curves.CalculateCurves ()
+
+# . Columns of files follow the order of sites and their instances
+columns = [(site, instance) for site in cem.sites for instance in site.instances]
+exact   = numpy.array ([[probability for site in step for probability in site] for step in ExactCurves (cem, curves.pHs.tolist ())])
+
+
+logFile.Text ("\n*** Checking a text file of titration curves ***\n")
+
+filename = "twosites_curves.dat"
+curves.WriteCurvesFile (filename)
+data = numpy.loadtxt (filename)
+Check ("pH-values in the text file", numpy.abs (data[:, 0] - curves.pHs).max (), EXACT_TOLERANCE)
+Check ("Titration curves in the text file", numpy.abs (data[:, 1:] - exact).max (), EXACT_TOLERANCE)
+os.remove (filename)
+
+
+logFile.Text ("\n*** Checking an NPZ file of titration curves ***\n")
+
+filename = "twosites_curves.npz"
+curves.WriteCurvesFile (filename)
+data = numpy.load (filename)
+Check ("pH-values in the NPZ file", numpy.abs (data["pH"] - curves.pHs).max (), EXACT_TOLERANCE)
+Check ("Titration curves in the NPZ file", numpy.abs (data["curves"] - exact).max (), EXACT_TOLERANCE)
+Check ("Labels of instances in the NPZ file", len ([label for (label, (site, instance)) in zip (data["labels"].tolist (), columns) if label != instance.label]), 0)
+Check ("Residues of instances in the NPZ file", len ([serial for (serial, (site, instance)) in zip (data["resSerials"].tolist (), columns) if serial != site.resSerial]), 0)
+data.close ()
+os.remove (filename)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,37 @@
+# Example script: checks of the dense rows of interactions and of double moves of in-house MC sampling
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, ENERGY_TOLERANCE, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault, CONSTANT_MOLAR_GAS_KCAL_MOL, CONSTANT_LN10
+
+
+def PackedEnergy (cem, instances, pH):
+    """Energy of a protonation state from the symmetric matrix of interactions, which is kept next to the dense rows."""
+    energyModel = cem.energyModel
+    indices     = [site.instances[instance]._instIndexGlobal for (site, instance) in zip (cem.sites, instances)]
+    Gmicro      = 0.0
+    for (position, index) in enumerate (indices):
+        Gmicro += energyModel.GetGintr (index) + energyModel.GetProtons (index) * CONSTANT_MOLAR_GAS_KCAL_MOL * cem.temperature * CONSTANT_LN10 * pH
+        for other in indices[:position]:
+            Gmicro += energyModel.GetInteractionSymmetric (index, other)
+    return Gmicro
+
+
+logFile.Header ("Check the dense rows of interactions and double moves on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+# . A zero limit makes a pair of all pairs of sites, so that double moves are tried
+mc = MCModelDefault (doubleFlip=0., nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+
+for (title, scale) in (("", 1.0), (" (scaled)", 0.5)):
+    logFile.Text ("\n*** Checking energies and probabilities of double moves%s ***\n" % title)
+    cem.energyModel.ScaleInteractions (scale)
+    for pH in PHS:
+        states = Enumerate (cem, pH=pH)
+        Check ("Energies from dense rows%s at pH=%.1f" % (title, pH), max ([abs (PackedEnergy (cem, instances, pH) - Gmicro) for (probability, Gmicro, instances) in states]), ENERGY_TOLERANCE)
+        Check ("Sampled probabilities%s at pH=%.1f" % (title, pH), MaximumDeviation (ExactProbabilities (cem, states), cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
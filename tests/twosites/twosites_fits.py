@@ -0,0 +1,82 @@
+# Example script: checks of Hill and Henderson-Hasselbalch fits of titration curves against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactCurves, Check, Finish
+from ContinuumElectrostatics import TitrationCurves
+import math
+
+
+FIT_TOLERANCE  = 1e-4
+HILL_TOLERANCE = 0.2
+
+
+def ExactFractions (cem, pH):
+    """Exact protonated fractions of sites, scaled between their least and most protonated instances."""
+    fractions = [0.] * cem.nsites
+    for (probability, Gmicro, instances) in Enumerate (cem, pH=pH):
+        for (index, instance) in enumerate (instances):
+            fractions[index] += probability * cem.sites[index].instances[instance].protons
+    for (index, site) in enumerate (cem.sites):
+        protons = [instance.protons for instance in site.instances]
+        if max (protons) > min (protons):
+            fractions[index] = (fractions[index] - min (protons)) / float (max (protons) - min (protons))
+    return fractions
+
+
+def ExactHalfpK (cem, index, a, b, tolerance=1e-8):
+    """pK1/2 of the protonated fraction of a site, by bisection between pH-values |a| and |b|."""
+    fa = ExactFractions (cem, a)[index]
+    while (b - a) > tolerance:
+        pH = .5 * (a + b)
+        f  = ExactFractions (cem, pH)[index]
+        if ((fa - .5) * (f - .5)) < 0.:
+            b = pH
+        else:
+            (a, fa) = (pH, f)
+    return .5 * (a + b)
+
+
+logFile.Header ("Check fits of titration curves of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking Hill fits against exact pK1/2 values ***\n")
+
+curves = TitrationCurves (cem, curveSampling=0.25)
+curves.CalculateCurves ()
+curves.FitCurves ()
+pHs       = curves.pHs.tolist ()
+fractions = [ExactFractions (cem, pH) for pH in pHs]
+for (index, site) in enumerate (cem.sites):
+    fit = curves.fits[index]
+    if fit is None:
+        continue
+    (pKa, hill, pKaHH, rmsd, multiple) = fit
+    crossings = [step for step in range (len (pHs) - 1) if ((fractions[step][index] - .5) * (fractions[step + 1][index] - .5)) < 0.]
+    Check ("Number of transitions of site %d" % index, 0 if multiple == (len (crossings) > 1 or rmsd > .05) else 1, 0)
+    if (not multiple) and crossings:
+        halfpK = ExactHalfpK (cem, index, pHs[crossings[0]], pHs[crossings[0] + 1])
+        Check ("Hill pKa and exact pK1/2 of site %d" % index, abs (pKa - halfpK), HILL_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking Henderson-Hasselbalch fits of non-interacting sites ***\n")
+
+# . Without interactions, the fraction of a site whose instances differ by one proton follows the Henderson-Hasselbalch
+# . equation, so that its pKa follows from the fraction at any pH
+cem.energyModel.ScaleInteractions (0.)
+curves = TitrationCurves (cem, curveSampling=0.25)
+curves.CalculateCurves ()
+curves.FitCurves ()
+for (index, site) in enumerate (cem.sites):
+    protons = [instance.protons for instance in site.instances]
+    if (curves.fits[index] is None) or (max (protons) - min (protons) != 1):
+        continue
+    (pKa, hill, pKaHH, rmsd, multiple) = curves.fits[index]
+    Check ("Hill coefficient of non-interacting site %d" % index, abs (hill - 1.), FIT_TOLERANCE)
+    Check ("Hill and Henderson-Hasselbalch pKa of site %d" % index, abs (pKa - pKaHH), FIT_TOLERANCE)
+    (fraction, pH) = min ([(ExactFractions (cem, pH)[index], pH) for pH in curves.pHs.tolist ()], key=lambda item: abs (item[0] - .5))
+    Check ("Henderson-Hasselbalch and exact pKa of site %d" % index, abs (pKaHH - (pH + math.log10 (fraction / (1. - fraction)))), FIT_TOLERANCE)
+
+
+#===========================================
+Finish ()
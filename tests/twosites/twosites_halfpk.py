@@ -0,0 +1,68 @@
+# Example script: checks of pK1/2 values refined on a coarse pH grid against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, ExactCurves, Check, Finish, EXACT_TOLERANCE
+from ContinuumElectrostatics import TitrationCurves
+
+
+HALFPK_TOLERANCE = 1e-4
+LINEAR_TOLERANCE = 0.05
+
+
+def ExactHalfpKs (cem, pHs, tolerance):
+    """pK1/2 values of instances by bisection on exact probabilities, in the pH-steps where exact curves cross 1/2."""
+    curves = ExactCurves (cem, pHs)
+    halves = [[[] for instance in site.instances] for site in cem.sites]
+    for (indexSite, site) in enumerate (cem.sites):
+        for indexInstance in range (len (site.instances)):
+            for step in range (len (pHs) - 1):
+                (a, b)   = (pHs[step], pHs[step + 1])
+                (pa, pb) = (curves[step][indexSite][indexInstance], curves[step + 1][indexSite][indexInstance])
+                if ((pa - .5) * (pb - .5)) >= 0.:
+                    continue
+                while (b - a) > tolerance:
+                    pH = .5 * (a + b)
+                    p  = ExactProbabilities (cem, Enumerate (cem, pH=pH))[indexSite][indexInstance]
+                    if ((pa - .5) * (p - .5)) < 0.:
+                        (b, pb) = (pH, p)
+                    else:
+                        (a, pa) = (pH, p)
+                halves[indexSite][indexInstance].append (.5 * (a + b))
+    return halves
+
+
+def HalvesDeviation (first, second):
+    """Maximum deviation between two sets of pK1/2 values, or infinity if the numbers of pK1/2 values differ."""
+    deviation = 0.
+    for (siteA, siteB) in zip (first, second):
+        for (pKsA, pKsB) in zip (siteA, siteB):
+            if len (pKsA) != len (pKsB):
+                return float ("inf")
+            for (pKA, pKB) in zip (pKsA, pKsB):
+                deviation = max (deviation, abs (pKA - pKB))
+    return deviation
+
+
+logFile.Header ("Check pK1/2 values of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking pK1/2 values refined by bisection on a coarse grid ***\n")
+
+curves = TitrationCurves (cem, curveSampling=2.0)
+curves.CalculateCurves ()
+curves.CalculateHalfpKs (tolerance=HALFPK_TOLERANCE)
+exact = ExactHalfpKs (cem, curves.pHs.tolist (), EXACT_TOLERANCE)
+Check ("Refined pK1/2 values", HalvesDeviation (exact, curves.halves), HALFPK_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking interpolated pK1/2 values on a fine grid ***\n")
+
+curves = TitrationCurves (cem, curveSampling=0.1)
+curves.CalculateCurves ()
+curves.CalculateHalfpKs ()
+Check ("Interpolated pK1/2 values", HalvesDeviation (ExactHalfpKs (cem, curves.pHs.tolist (), EXACT_TOLERANCE), curves.halves), LINEAR_TOLERANCE)
+
+
+#===========================================
+Finish ()
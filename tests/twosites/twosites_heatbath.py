@@ -0,0 +1,22 @@
+# Example script: checks of heat-bath moves and Rao-Blackwellized accumulation against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault
+
+
+logFile.Header ("Check heat-bath moves and Rao-Blackwellization on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+for (title, heatBath, raoBlackwell) in (("Heat-bath", True, False), ("Rao-Blackwellized", False, True), ("Heat-bath and Rao-Blackwellized", True, True)):
+    logFile.Text ("\n*** Checking probabilities of %s sampling ***\n" % title.lower ())
+
+    mc = MCModelDefault (nprod=NPROD, randomSeed=SEED, heatBath=heatBath, raoBlackwell=raoBlackwell)
+    cem.DefineMCModel (mc)
+    for pH in PHS:
+        exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+        Check ("%s probabilities at pH=%.1f" % (title, pH), MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,34 @@
+# Example script: checks of the junction tree model and its fallback against exact enumeration
+from pCore                   import logFile
+from ContinuumElectrostatics import JunctionTreeModel, MCModelDefault
+from twosites_common         import SetupModel, Enumerate, ExactLogZ, ExactProbabilities, MaximumDeviation, Check, Finish, EXACT_TOLERANCE, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+
+
+logFile.Header ("Check the junction tree model on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking the junction tree model ***\n")
+
+jt = JunctionTreeModel ()
+cem.DefineMCModel (jt)
+Check ("Tractable junction tree", 0 if jt.isTractable else 1, 0)
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Junction tree probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), EXACT_TOLERANCE)
+    Check ("Junction tree log Z at pH=%.1f" % pH, abs (jt.logZ - ExactLogZ (cem, pH=pH)), EXACT_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking the fallback of an intractable junction tree ***\n")
+
+jt = JunctionTreeModel (maxStates=1, fallback=MCModelDefault (nprod=NPROD, randomSeed=SEED))
+cem.DefineMCModel (jt)
+Check ("Intractable junction tree", 1 if jt.isTractable else 0, 0)
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Fallback probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,23 @@
+# Example script: checks of in-house MC sampling against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault
+
+
+logFile.Header ("Check in-house MC sampling of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking probabilities of in-house MC sampling with single moves ***\n")
+
+# . A high limit for double moves leaves only single moves, which read the cached local field
+mc = MCModelDefault (doubleFlip=100., nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Sampled probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,37 @@
+# Example script: checks of the mean-field model against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, PHS
+from ContinuumElectrostatics import MeanFieldModel
+
+
+# . Mean-field probabilities are approximate for interacting sites and converge to this tolerance for independent sites
+MEANFIELD_TOLERANCE = 0.1
+CONVERGED_TOLERANCE = 1e-5
+
+
+logFile.Header ("Check the mean-field model on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+mf = MeanFieldModel (tolerance=1e-8)
+cem.DefineMCModel (mf)
+
+
+logFile.Text ("\n*** Checking mean-field probabilities of interacting sites ***\n")
+
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Mean-field probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), MEANFIELD_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking mean-field probabilities of independent sites ***\n")
+
+# . Without interactions, the mean-field model is exact
+cem.energyModel.ScaleInteractions (0.)
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Mean-field probabilities without interactions at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), CONVERGED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,39 @@
+# Example script: checks of histograms of microstates of in-house MC sampling against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, Check, Finish, EXACT_TOLERANCE, ENERGY_TOLERANCE, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault
+
+
+logFile.Header ("Check histograms of microstates of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED, maxMicrostates=64)
+cem.DefineMCModel (mc)
+
+
+def Key (instances):
+    """Index of the microstate in the mixed radix system, with the first site as the least significant digit."""
+    key = 0
+    for (site, instance) in reversed (zip (cem.sites, instances)):
+        key = key * len (site.instances) + instance
+    return key
+
+
+logFile.Text ("\n*** Checking populations, energies and keys of microstates ***\n")
+
+for pH in PHS:
+    states = Enumerate (cem, pH=pH)
+    exact  = dict ([(tuple (instances), (probability, Gmicro)) for (probability, Gmicro, instances) in states])
+    cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)
+    microstates = mc.Microstates (nstates=len (states))
+    Check ("Total population of microstates at pH=%.1f" % pH, abs (sum ([population for (key, population, Gmicro, protons, instances) in microstates]) - 1.), EXACT_TOLERANCE)
+    Check ("Populations of microstates at pH=%.1f" % pH, max ([abs (exact[tuple (instances)][0] - population) for (key, population, Gmicro, protons, instances) in microstates]), SAMPLED_TOLERANCE)
+    Check ("Energies of microstates at pH=%.1f" % pH, max ([abs (exact[tuple (instances)][1] - Gmicro) for (key, population, Gmicro, protons, instances) in microstates]), ENERGY_TOLERANCE)
+    Check ("Numbers of protons of microstates at pH=%.1f" % pH, len ([protons for (key, population, Gmicro, protons, instances) in microstates if protons != sum ([site.instances[instance].protons for (site, instance) in zip (cem.sites, instances)])]), 0)
+    Check ("Keys of microstates at pH=%.1f" % pH, len ([key for (key, population, Gmicro, protons, instances) in microstates if key != Key (instances)]), 0)
+    mc.PrintMicrostates ()
+
+
+#===========================================
+Finish ()
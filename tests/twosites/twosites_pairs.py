@@ -0,0 +1,68 @@
+# Example script: checks of joint probabilities of pairs of sites against exact enumeration
+from pCore                             import logFile, CLibraryError
+from twosites_common                   import SetupModel, Enumerate, ExactPairProbabilities, MaximumDeviation, Check, Finish, EXACT_TOLERANCE, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+from ContinuumElectrostatics           import MCModelDefault
+from ContinuumElectrostatics.Constants import PAIR_LIMIT
+
+
+logFile.Header ("Check joint probabilities of pairs of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+pairs = [(indexSiteA, indexSiteB) for indexSiteA in range (cem.nsites) for indexSiteB in range (indexSiteA + 1, cem.nsites)]
+
+
+logFile.Text ("\n*** Checking the default selection of strongly coupled pairs ***\n")
+
+GetInteraction = cem.energyModel.GetInteraction
+strong = [(indexSiteA, indexSiteB) for (indexSiteA, indexSiteB) in pairs if max ([abs (GetInteraction (instanceA._instIndexGlobal, instanceB._instIndexGlobal)) for instanceA in cem.sites[indexSiteA].instances for instanceB in cem.sites[indexSiteB].instances]) >= PAIR_LIMIT]
+cem.SelectPairs ()
+selected = [cem.energyModel.GetPair (indexPair) for indexPair in range (cem.energyModel.npairs)]
+Check ("Selected strongly coupled pairs", 0 if sorted (selected) == strong else 1, 0)
+
+
+logFile.Text ("\n*** Checking analytic joint probabilities of pairs of sites ***\n")
+
+cem.SelectPairs (limit=0.)
+for pH in PHS:
+    exact = ExactPairProbabilities (cem, Enumerate (cem, pH=pH), pairs)
+    cem.CalculateProbabilities (pH=pH, log=None)
+    joint = cem.PairProbabilities ()
+    Check ("Analytic joint probabilities at pH=%.1f" % pH, max ([MaximumDeviation (exact[pair], joint[pair]) for pair in pairs]), EXACT_TOLERANCE)
+    Check ("Joint probabilities of pairs in given order at pH=%.1f" % pH, max ([MaximumDeviation (exact[(indexSiteA, indexSiteB)], cem.PairProbability (indexSiteA, indexSiteB)) for (indexSiteA, indexSiteB) in pairs]), EXACT_TOLERANCE)
+    Check ("Joint probabilities of pairs in reverse order at pH=%.1f" % pH, max ([MaximumDeviation (zip (*exact[(indexSiteA, indexSiteB)]), cem.PairProbability (indexSiteB, indexSiteA)) for (indexSiteA, indexSiteB) in pairs]), EXACT_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking explicitly selected and repeated pairs ***\n")
+
+reverse = [(indexSiteB, indexSiteA) for (indexSiteA, indexSiteB) in pairs]
+cem.SelectPairs (pairs=reverse)
+exact = ExactPairProbabilities (cem, Enumerate (cem, pH=7.0), pairs)
+cem.CalculateProbabilities (pH=7.0, log=None)
+joint = cem.PairProbabilities ()
+Check ("Joint probabilities of pairs selected in reverse order", max ([MaximumDeviation (zip (*exact[(indexSiteA, indexSiteB)]), joint[(indexSiteB, indexSiteA)]) for (indexSiteA, indexSiteB) in pairs]), EXACT_TOLERANCE)
+
+try:
+    cem.SelectPairs (pairs=pairs + reverse)
+    repeated = 1
+except CLibraryError:
+    repeated = 0
+Check ("Rejected repeated pairs", repeated, 0)
+
+
+logFile.Text ("\n*** Checking sampled joint probabilities of pairs of sites ***\n")
+
+cem.SelectPairs (limit=0.)
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+for pH in PHS:
+    exact = ExactPairProbabilities (cem, Enumerate (cem, pH=pH), pairs)
+    cem.CalculateProbabilities (pH=pH, log=None)
+    joint = cem.PairProbabilities ()
+    Check ("Sampled joint probabilities at pH=%.1f" % pH, max ([MaximumDeviation (exact[pair], joint[pair]) for pair in pairs]), SAMPLED_TOLERANCE)
+cem.SelectPairs (pairs=[])
+Check ("Disabled joint probabilities", cem.energyModel.npairs, 0)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,42 @@
+# Example script: checks of titration curves calculated in worker processes against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, ExactCurves, CurvesDeviation, Check, Finish, EXACT_TOLERANCE, SAMPLED_TOLERANCE, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault, JunctionTreeModel, TitrationCurves
+
+
+NPROCESSES = 2
+
+
+logFile.Header ("Check titration curves calculated in worker processes of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking exact titration curves calculated in worker processes ***\n")
+
+curves = TitrationCurves (cem, curveSampling=1.0, nprocesses=NPROCESSES)
+curves.CalculateCurves ()
+exact = ExactCurves (cem, curves.pHs.tolist ())
+Check ("Analytic titration curves in processes", CurvesDeviation (exact, curves.steps), EXACT_TOLERANCE)
+
+curves = TitrationCurves (cem, curveSampling=1.0, nprocesses=NPROCESSES, unfolded=True)
+curves.CalculateCurves ()
+Check ("Unfolded titration curves in processes", CurvesDeviation (ExactCurves (cem, curves.pHs.tolist (), unfolded=True), curves.steps), EXACT_TOLERANCE)
+
+cem.DefineMCModel (JunctionTreeModel ())
+curves = TitrationCurves (cem, curveSampling=1.0, nprocesses=NPROCESSES)
+curves.CalculateCurves ()
+Check ("Junction tree titration curves in processes", CurvesDeviation (exact, curves.steps), EXACT_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking titration curves of in-house MC sampling in worker processes ***\n")
+
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+curves = TitrationCurves (cem, curveSampling=1.0, nprocesses=NPROCESSES)
+curves.CalculateCurves ()
+Check ("Sampled titration curves in processes", CurvesDeviation (exact, curves.steps), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,33 @@
+# Example script: checks of enumeration with pruning against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactLogZ, ExactProbabilities, MaximumDeviation, Check, Finish, EXACT_TOLERANCE, PHS
+
+
+logFile.Header ("Check enumeration with pruning on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking analytic and pruned probabilities ***\n")
+
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Analytic probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), EXACT_TOLERANCE)
+
+    cem.pruning = True
+    Check ("Pruned probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), EXACT_TOLERANCE)
+    cem.pruning = False
+
+
+logFile.Text ("\n*** Checking the partition function of pruned enumeration ***\n")
+
+for pH in PHS:
+    (nstates, logZ) = cem.energyModel.CalculateProbabilitiesPruned (pH=pH, tolerance=0.)
+    Check ("Log Z without pruning at pH=%.1f" % pH, abs (logZ - ExactLogZ (cem, pH=pH)), EXACT_TOLERANCE)
+
+    (nstates, logZ) = cem.energyModel.CalculateProbabilitiesPruned (pH=pH)
+    Check ("Log Z with the default tolerance at pH=%.1f" % pH, abs (logZ - ExactLogZ (cem, pH=pH)), EXACT_TOLERANCE)
+
+
+#===========================================
+Finish ()
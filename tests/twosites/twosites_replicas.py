@@ -0,0 +1,23 @@
+# Example script: checks of titration curves from pH replica exchange against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, ExactCurves, CurvesDeviation, Check, Finish, SAMPLED_TOLERANCE, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault, TitrationCurves
+
+
+logFile.Header ("Check pH replica exchange on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+
+
+logFile.Text ("\n*** Checking titration curves from pH replica exchange ***\n")
+
+curves = TitrationCurves (cem, curveSampling=1.0, replicaExchange=True)
+curves.CalculateCurves ()
+Check ("Titration curves from replica exchange", CurvesDeviation (ExactCurves (cem, curves.pHs.tolist ()), curves.steps), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,39 @@
+# Example script: checks of reweighting of in-house MC sampling to other pH-values against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, ExactCurves, MaximumDeviation, CurvesDeviation, Check, Finish, SAMPLED_TOLERANCE, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault, ProtonReweighting, TitrationCurves
+
+
+logFile.Header ("Check reweighting of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED, reweighting=True)
+cem.DefineMCModel (mc)
+
+
+logFile.Text ("\n*** Checking reweighting of runs at three pH-values ***\n")
+
+reweighting = ProtonReweighting ()
+for pH in (5.0, 9.0, 7.0):
+    cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)
+    reweighting.AddSampler (mc, pH)
+reweighting.Solve ()
+
+for pH in (5.0, 6.0, 7.0, 8.0, 9.0):
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    reweighted, effective, unsampled = reweighting.CalculateProbabilities (pH)
+    logFile.Text ("\nReweighting to pH=%.1f: %.0f effective samples, unsampled probability %g.\n" % (pH, effective, unsampled))
+    Check ("Reweighted probabilities at pH=%.1f" % pH, MaximumDeviation (exact, [[reweighted[instance._instIndexGlobal] for instance in site.instances] for site in cem.sites]), SAMPLED_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking titration curves from reweighting ***\n")
+
+# . pH-steps with fewer effective samples than needed for two standard errors within the tolerance are calculated directly
+curves = TitrationCurves (cem, curveSampling=0.5, reweightingSteps=3, minimumSamples=1. / (SAMPLED_TOLERANCE * SAMPLED_TOLERANCE))
+curves.CalculateCurves ()
+Check ("Titration curves from reweighting", CurvesDeviation (ExactCurves (cem, curves.pHs.tolist ()), curves.steps), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,41 @@
+# Example script: checks of stability curves against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, ExactLogZ, Check, Finish, EXACT_TOLERANCE
+from ContinuumElectrostatics import StabilityCurves, CONSTANT_MOLAR_GAS_KCAL_MOL
+
+
+# . The linkage method integrates over pH with the trapezoidal rule
+LINKAGE_TOLERANCE = 0.01
+
+
+logFile.Header ("Check stability curves of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+RT  = CONSTANT_MOLAR_GAS_KCAL_MOL * cem.temperature
+
+
+logFile.Text ("\n*** Checking stability curves of the analytic method ***\n")
+
+curves = StabilityCurves (cem, curveSampling=0.5)
+curves.CalculateCurves (method="analytic")
+pHs      = curves.pH.tolist ()
+folded   = [-RT * ExactLogZ (cem, pH=pH) for pH in pHs]
+unfolded = [-RT * ExactLogZ (cem, pH=pH, unfolded=True) for pH in pHs]
+Check ("Free energies of the folded protein", max ([abs (a - b) for (a, b) in zip (folded, curves.Gfolded.tolist ())]), EXACT_TOLERANCE)
+Check ("Free energies of the unfolded protein", max ([abs (a - b) for (a, b) in zip (unfolded, curves.Gunfolded.tolist ())]), EXACT_TOLERANCE)
+Check ("Folding free energies", max ([abs ((a - b) - c) for (a, b, c) in zip (folded, unfolded, curves.stability.tolist ())]), EXACT_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking stability curves of the linkage method ***\n")
+
+cem.pruning = True
+curves = StabilityCurves (cem, curveSampling=0.1)
+curves.CalculateCurves (method="linkage")
+cem.pruning = False
+pHs    = curves.pH.tolist ()
+exact  = [-RT * (ExactLogZ (cem, pH=pH) - ExactLogZ (cem, pH=pH, unfolded=True)) for pH in pHs]
+Check ("Relative folding free energies", max ([abs ((a - exact[0]) - b) for (a, b) in zip (exact, curves.stability.tolist ())]), LINKAGE_TOLERANCE)
+
+
+#===========================================
+Finish ()
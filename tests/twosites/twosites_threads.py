@@ -0,0 +1,41 @@
+# Example script: checks of titration curves calculated in threads against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, ExactCurves, CurvesDeviation, Check, Finish, EXACT_TOLERANCE, SAMPLED_TOLERANCE, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault, TitrationCurves
+
+
+logFile.Header ("Check titration curves calculated in threads of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+cem.nthreads = 2
+
+
+logFile.Text ("\n*** Checking analytic titration curves calculated in threads ***\n")
+
+curves = TitrationCurves (cem, curveSampling=1.0)
+curves.CalculateCurves (forceSerial=False)
+exact = ExactCurves (cem, curves.pHs.tolist ())
+Check ("Analytic titration curves in threads", CurvesDeviation (exact, curves.steps), EXACT_TOLERANCE)
+
+cem.pruning = True
+curves = TitrationCurves (cem, curveSampling=1.0)
+curves.CalculateCurves (forceSerial=False)
+Check ("Pruned titration curves in threads", CurvesDeviation (exact, curves.steps), EXACT_TOLERANCE)
+cem.pruning = False
+
+curves = TitrationCurves (cem, curveSampling=1.0, unfolded=True)
+curves.CalculateCurves (forceSerial=False)
+Check ("Unfolded titration curves in threads", CurvesDeviation (ExactCurves (cem, curves.pHs.tolist (), unfolded=True), curves.steps), EXACT_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking titration curves of in-house MC sampling in workspaces of threads ***\n")
+
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+curves = TitrationCurves (cem, curveSampling=1.0)
+curves.CalculateCurves (forceSerial=False)
+Check ("Sampled titration curves in threads", CurvesDeviation (exact, curves.steps), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,49 @@
+# Example script: checks of a binary trajectory of in-house MC sampling against the sampled probabilities and exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactProbabilities, MaximumDeviation, Check, Finish, EXACT_TOLERANCE, ENERGY_TOLERANCE, SAMPLED_TOLERANCE, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault, StateVector, StateTrajectoryFileReader
+import os
+
+
+logFile.Header ("Check binary trajectories of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+
+
+logFile.Text ("\n*** Checking a binary trajectory of in-house MC sampling ***\n")
+
+filename      = "twosites.traj"
+probabilities = cem.CalculateProbabilities (pH=7.0, trajectoryFilename=filename, trajectoryFormat="binary", isCalculateCurves=True)
+
+reader = StateTrajectoryFileReader (filename)
+reader.Parse ()
+Check ("Number of scans in the trajectory", abs (reader.nscans - NPROD), 0)
+flat = reader.Probabilities ([len (site.instances) for site in cem.sites])
+Check ("Probabilities from the trajectory", max ([abs (flat[instance._instIndexGlobal] - probabilities[index][instance.instIndex]) for (index, site) in enumerate (cem.sites) for instance in site.instances]), EXACT_TOLERANCE)
+exact = ExactProbabilities (cem, Enumerate (cem, pH=7.0))
+Check ("Exact and trajectory probabilities", MaximumDeviation (exact, [[flat[instance._instIndexGlobal] for instance in site.instances] for site in cem.sites]), SAMPLED_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking energies and protons of states from the trajectory ***\n")
+
+vector     = StateVector (cem)
+energies   = reader.Energies (stop=1000)
+protons    = reader.Protons  (stop=1000)
+deviation  = 0.0
+mismatches = 0
+for (scan, instances) in enumerate (reader.States (stop=1000)):
+    for (index, instance) in enumerate (instances):
+        vector[index] = int (instance)
+    deviation = max (deviation, abs (cem.CalculateMicrostateEnergy (vector, pH=7.0) - energies[scan]))
+    if sum ([site.instances[instance].protons for (site, instance) in zip (cem.sites, instances)]) != protons[scan]:
+        mismatches += 1
+Check ("Energies of states from the trajectory", deviation, ENERGY_TOLERANCE)
+Check ("Numbers of protons of states from the trajectory", mismatches, 0)
+os.remove (filename)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,38 @@
+# Example script: checks of the factorized unfolded protein against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactLogZ, ExactProbabilities, ExactCurves, MaximumDeviation, CurvesDeviation, Check, Finish, EXACT_TOLERANCE, PHS
+from ContinuumElectrostatics import TitrationCurves, CONSTANT_MOLAR_GAS_KCAL_MOL
+import math
+
+
+logFile.Header ("Check the unfolded protein on two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+
+logFile.Text ("\n*** Checking probabilities of the unfolded protein ***\n")
+
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH, unfolded=True))
+    Check ("Factorized unfolded probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, unfolded=True, isCalculateCurves=True, log=None)), EXACT_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking the partition function of the unfolded protein ***\n")
+
+# . The partition function of the unfolded protein is relative to its lowest energy state
+beta = 1.0 / (CONSTANT_MOLAR_GAS_KCAL_MOL * cem.temperature)
+for pH in PHS:
+    Gmin = min ([Gmicro for (probability, Gmicro, instances) in Enumerate (cem, pH=pH, unfolded=True)])
+    logZ = math.log (cem.energyModel.CalculateZunfolded (pH=pH)) - beta * Gmin
+    Check ("Unfolded log Z at pH=%.1f" % pH, abs (logZ - ExactLogZ (cem, pH=pH, unfolded=True)), EXACT_TOLERANCE)
+
+
+logFile.Text ("\n*** Checking titration curves of the unfolded protein ***\n")
+
+curves = TitrationCurves (cem, curveSampling=1.0, unfolded=True)
+curves.CalculateCurves (log=None)
+Check ("Unfolded titration curves", CurvesDeviation (ExactCurves (cem, curves.pHs.tolist (), unfolded=True), curves.steps), EXACT_TOLERANCE)
+
+
+#===========================================
+Finish ()
@@ -0,0 +1,30 @@
+# Example script: checks of Wang-Landau sampling against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, Enumerate, ExactLogZ, ExactProbabilities, MaximumDeviation, Check, Finish, SAMPLED_TOLERANCE, PHS, NPROD, SEED
+from ContinuumElectrostatics import WangLandauModel
+
+
+logFile.Header ("Check Wang-Landau sampling of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+wl = WangLandauModel (nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (wl)
+
+
+logFile.Text ("\n*** Checking probabilities from the density of states ***\n")
+
+# . The partition function is known up to a constant, which cancels between pH-values
+reference = None
+for pH in PHS:
+    exact = ExactProbabilities (cem, Enumerate (cem, pH=pH))
+    Check ("Wang-Landau probabilities at pH=%.1f" % pH, MaximumDeviation (exact, cem.CalculateProbabilities (pH=pH, isCalculateCurves=True, log=None)), SAMPLED_TOLERANCE)
+    if reference is None:
+        reference = (pH, wl.logZ)
+    else:
+        (pHzero, logZzero) = reference
+        Check ("Wang-Landau log Z from pH=%.1f to pH=%.1f" % (pHzero, pH), abs ((wl.logZ - logZzero) - (ExactLogZ (cem, pH=pH) - ExactLogZ (cem, pH=pHzero))), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()
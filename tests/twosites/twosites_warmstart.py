@@ -0,0 +1,23 @@
+# Example script: checks of titration curves from warm-started in-house MC sampling against exact enumeration
+from pCore                   import logFile
+from twosites_common         import SetupModel, ExactCurves, CurvesDeviation, Check, Finish, SAMPLED_TOLERANCE, NPROD, SEED
+from ContinuumElectrostatics import MCModelDefault, TitrationCurves
+
+
+logFile.Header ("Check warm starts of titration curves of two titratable sites in a hypothetical peptide.")
+
+cem = SetupModel ()
+
+mc = MCModelDefault (nprod=NPROD, randomSeed=SEED)
+cem.DefineMCModel (mc)
+
+
+logFile.Text ("\n*** Checking titration curves with warm starts ***\n")
+
+curves = TitrationCurves (cem, curveSampling=1.0, warmStart=True)
+curves.CalculateCurves ()
+Check ("Titration curves with warm starts", CurvesDeviation (ExactCurves (cem, curves.pHs.tolist ()), curves.steps), SAMPLED_TOLERANCE)
+
+
+#===========================================
+Finish ()